@@ -7,15 +7,20 @@ in constrained environments.
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import json
 import os
 import re
 import shlex
 import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
@@ -61,8 +66,26 @@ def _load_orchestration_runtime() -> Any:
     return module
 
 
+@lru_cache(maxsize=1)
+def _load_op_timing() -> Any:
+    """`tools.op_timing`, imported from this server's checkout — the module the runtime
+    loaded above imports too, so their phase accounting meets."""
+    root = str(_server_checkout_root())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    from tools import op_timing
+
+    return op_timing
+
+
 _WORKFLOW_MODE_ENV_VARS = ("METDSL_WORKFLOW_MODE", "METDSL_ORCHESTRATION_ID")
 
+# The runtime's MCP phase-gate verdicts for this server's calls, reused while the documents
+# they read are unchanged (`validate_mcp_build_tool_invocation(verdict_cache=...)`).
+_MCP_GATE_VERDICTS: dict[Any, Any] = {}
+# Gated calls run on worker threads; the first two must not both execute the runtime module.
+_RUNTIME_LOAD_LOCK = threading.Lock()
+
 
 def _workflow_mode_env_signal() -> str | None:
     """The workflow environment variable that puts this server under a run, if any.
@@ -118,7 +141,8 @@ def _maybe_enforce_orchestration_mcp_gate(
     if cap_raw is None or not str(cap_raw).strip():
         raise ValueError(f"{tool_name} requires capability_token when orchestration_id is set")
     repo_root = _repo_root_for_call(args, project_dir)
-    rt = _load_orchestration_runtime()
+    with _RUNTIME_LOAD_LOCK:
+        rt = _load_orchestration_runtime()
     rt.validate_mcp_build_tool_invocation(
         repo_root,
         orchestration_id=orch_id,
@@ -126,6 +150,7 @@ def _maybe_enforce_orchestration_mcp_gate(
         capability_token=str(cap_raw).strip(),
         tool_name=tool_name,
         mcp_args=args,
+        verdict_cache=_MCP_GATE_VERDICTS,
     )
 
 
@@ -553,11 +578,16 @@ class Tool:
     handler: Callable[[dict[str, Any]], dict[str, Any]]
 
 
+# Tool-call workers finish in any order; one response is written at a time.
+_WRITE_LOCK = threading.Lock()
+
+
 def _write_message(payload: dict[str, Any]) -> None:
     # The MCP stdio transport frames messages as newline-delimited JSON.
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False))
-    sys.stdout.write("\n")
-    sys.stdout.flush()
+    line = json.dumps(payload, ensure_ascii=False) + "\n"
+    with _WRITE_LOCK:
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
 
 def _read_message() -> dict[str, Any] | None:
@@ -659,11 +689,118 @@ def _path_to_ref(path: Path) -> str | None:
     return relative.as_posix()
 
 
+# In-process callers (the conductor's generate.gate) run run_linter and run_syntax_check on
+# two threads against the same command_log.jsonl; a record larger than the stream buffer is
+# flushed in several writes, so appends are serialized to keep each JSONL line whole.
+_COMMAND_LOG_LOCK = threading.Lock()
+
+
 def _append_command_log(log_path: Path, entry: dict[str, Any]) -> None:
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as stream:
-        stream.write(json.dumps(entry, ensure_ascii=False))
-        stream.write("\n")
+    line = json.dumps(entry, ensure_ascii=False) + "\n"
+    with _COMMAND_LOG_LOCK, log_path.open("a", encoding="utf-8") as stream:
+        stream.write(line)
+
+
+class _CallCancelled(Exception):
+    """The client cancelled the `tools/call` a command was about to run for."""
+
+
+class _ToolCall:
+    """One `tools/call` the stdio loop dispatched: whether the client cancelled it, and the
+    command process it is running, so a cancellation stops that process's group."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._process: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self._process is not None:
+                _kill_process_group(self._process)
+
+    def attach(self, process: subprocess.Popen[str]) -> bool:
+        """Track `process` until `detach`; False when the call is already cancelled."""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._process = process
+            return True
+
+    def detach(self) -> None:
+        with self._lock:
+            self._process = None
+
+
+# The call the current worker thread serves; unset for in-process callers of the tools.
+_ACTIVE_CALL: contextvars.ContextVar[_ToolCall | None] = contextvars.ContextVar(
+    "build_runtime_active_call", default=None
+)
+
+
+def _kill_process_group(process: subprocess.Popen[str]) -> None:
+    """SIGKILL the group `_communicate` started `process` as the leader of, so the
+    compilers and test binaries a build or make run spawned stop with it."""
+    if process.returncode is not None:
+        return  # reaped: its pid, and so the group id, may belong to someone else now
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, AttributeError):
+        with contextlib.suppress(OSError):
+            process.kill()
+
+
+def _communicate(
+    command: list[str], cwd: str, env: dict[str, str], timeout_sec: int
+) -> subprocess.CompletedProcess[str]:
+    """`subprocess.run(command, capture_output=True, timeout=timeout_sec)`.
+
+    Under a call `main()` dispatched, `command` runs in a process group of its own, so a
+    timeout or a cancellation of the call stops the whole group, not only its leader.
+    In-process callers (the conductor) keep a plain `subprocess.run` in their own group.
+    Raises `subprocess.TimeoutExpired` like `run`."""
+    call = _ACTIVE_CALL.get()
+    if call is None:
+        return subprocess.run(
+            command,
+            cwd=cwd,
+            env=env,
+            text=True,
+            capture_output=True,
+            timeout=timeout_sec,
+            check=False,
+        )
+    if call.cancelled:
+        raise _CallCancelled("cancelled by the client")
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+    tracked = call.attach(process)
+    if not tracked:
+        _kill_process_group(process)
+    try:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout_sec)
+        except subprocess.TimeoutExpired as exc:
+            _kill_process_group(process)
+            exc.stdout, exc.stderr = process.communicate()
+            raise
+        except BaseException:
+            _kill_process_group(process)
+            process.wait()
+            raise
+    finally:
+        if tracked:
+            call.detach()
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
 
 
 def _run_command(
@@ -694,15 +831,7 @@ def _run_command(
     started = time.monotonic()
 
     try:
-        proc = subprocess.run(
-            command,
-            cwd=str(path),
-            env=merged_env,
-            text=True,
-            capture_output=True,
-            timeout=timeout_sec,
-            check=False,
-        )
+        proc = _communicate(command, str(path), merged_env, timeout_sec)
         elapsed_ms = int((time.monotonic() - started) * 1000)
         result = {
             "ok": proc.returncode == 0,
@@ -729,6 +858,9 @@ def _run_command(
             "ok": result["ok"],
             "return_code": result["return_code"],
         }
+        call = _ACTIVE_CALL.get()
+        if call is not None and call.cancelled:
+            result["error"] = entry["error"] = "cancelled by the client"
         _append_command_log(log_path, entry)
         result["command_id"] = command_id
         result["command_log_path"] = str(log_path)
@@ -803,6 +935,40 @@ def _parse_threads_per_rank(args: dict[str, Any]) -> int | None:
     return threads_per_rank
 
 
+@lru_cache(maxsize=1)
+def _load_affinity_grammar() -> tuple[Any, Any]:
+    """The `OMP_PLACES` / `OMP_PROC_BIND` value patterns, from `tools.spec_input_gates` in this
+    server's checkout — the same grammar the pipeline validator enforces at Compile, so a
+    value this server would refuse never gets past Compile."""
+    root = str(_server_checkout_root())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    from tools.spec_input_gates import OMP_PLACES_RE, OMP_PROC_BIND_RE
+
+    return OMP_PLACES_RE, OMP_PROC_BIND_RE
+
+
+def _parse_omp_affinity(args: dict[str, Any]) -> dict[str, str]:
+    """The optional `omp_places` / `omp_proc_bind` policy, as the environment it sets."""
+    affinity: dict[str, str] = {}
+    places_re, proc_bind_re = _load_affinity_grammar()
+    for key, env_name, pattern in (("omp_places", "OMP_PLACES", places_re),
+                                   ("omp_proc_bind", "OMP_PROC_BIND", proc_bind_re)):
+        raw = args.get(key)
+        if raw is None:
+            continue
+        value = str(raw).strip().lower()
+        if not pattern.match(value):
+            raise ValueError(f"{key} is not an OpenMP {env_name} value: {raw!r}")
+        affinity[env_name] = value
+    return affinity
+
+
+def _openmp_env(threads_per_rank: int, affinity: dict[str, str]) -> dict[str, str]:
+    thread_count = str(threads_per_rank)
+    return {"OMP_NUM_THREADS": thread_count, "OMP_THREAD_LIMIT": thread_count, **affinity}
+
+
 def _recommended_build_system(project_dir: str, language: str) -> dict[str, str]:
     root = Path(project_dir)
     lang = (language or "").strip().lower()
@@ -1003,6 +1169,7 @@ def tool_run_program(args: dict[str, Any]) -> dict[str, Any]:
     env = args.get("env")
     target_class = _resolve_target_class(args)
     threads_per_rank = _parse_threads_per_rank(args)
+    affinity = _parse_omp_affinity(args)
     command = args.get("command")
     if not isinstance(command, list) or not command:
         raise ValueError("command must be a non-empty string array")
@@ -1019,14 +1186,11 @@ def tool_run_program(args: dict[str, Any]) -> dict[str, Any]:
     else:
         run_env = {str(k): str(v) for k, v in env.items()}
 
-    openmp_env_applied = False
+    openmp_env: dict[str, str] = {}
     if target_class == "cpu" and threads_per_rank is not None:
-        if run_env is None:
-            run_env = {}
-        thread_count = str(threads_per_rank)
-        run_env["OMP_NUM_THREADS"] = thread_count
-        run_env["OMP_THREAD_LIMIT"] = thread_count
-        openmp_env_applied = True
+        openmp_env = _openmp_env(threads_per_rank, affinity)
+        run_env = {**(run_env or {}), **openmp_env}
+    openmp_env_applied = bool(openmp_env)
 
     result = _run_command(
         command=command,
@@ -1041,10 +1205,7 @@ def tool_run_program(args: dict[str, Any]) -> dict[str, Any]:
     result["threads_per_rank"] = threads_per_rank
     result["openmp_env_applied"] = openmp_env_applied
     if openmp_env_applied:
-        result["openmp_env"] = {
-            "OMP_NUM_THREADS": str(threads_per_rank),
-            "OMP_THREAD_LIMIT": str(threads_per_rank),
-        }
+        result["openmp_env"] = openmp_env
     return result
 
 
@@ -1067,6 +1228,7 @@ def tool_run_quality_checks(args: dict[str, Any]) -> dict[str, Any]:
     _validate_env_overrides(
         env, "run_quality_checks", orchestrated=_is_orchestrated_call(args),
         repo_root=_repo_root_for_call(args, project_dir))
+    threads_per_rank = _parse_threads_per_rank(args)
     preset = str(args.get("preset", "make_test"))
 
     presets: dict[str, list[str]] = {
@@ -1091,6 +1253,13 @@ def tool_run_quality_checks(args: dict[str, Any]) -> dict[str, Any]:
     else:
         run_env = {str(k): str(v) for k, v in env.items()}
 
+    # Pins the re-run's thread count (otherwise whatever the test target and the OpenMP
+    # runtime default to), so a caller can compare a serial re-run against a threaded primary run.
+    openmp_env: dict[str, str] = {}
+    if threads_per_rank is not None:
+        openmp_env = _openmp_env(threads_per_rank, {})
+        run_env = {**(run_env or {}), **openmp_env}
+
     if preset == "pytest":
         if run_env is None:
             run_env = {}
@@ -1113,6 +1282,8 @@ def tool_run_quality_checks(args: dict[str, Any]) -> dict[str, Any]:
         command_log_path=command_log_path,
     )
     result["preset"] = preset
+    if openmp_env:
+        result["openmp_env"] = openmp_env
     return result
 
 
@@ -1554,7 +1725,8 @@ TOOLS: dict[str, Tool] = {
         description=(
             "Run a program without shell expansion and capture stdout/stderr. "
             "When target_class is cpu and threads_per_rank is specified, "
-            "set OpenMP thread env vars."
+            "set OpenMP thread env vars (and OMP_PLACES / OMP_PROC_BIND from "
+            "omp_places / omp_proc_bind)."
         ),
         input_schema={
             "type": "object",
@@ -1581,6 +1753,8 @@ TOOLS: dict[str, Tool] = {
                     "additionalProperties": True,
                 },
                 "threads_per_rank": {"type": "integer", "minimum": 1},
+                "omp_places": {"type": "string"},
+                "omp_proc_bind": {"type": "string"},
                 "env": _env_property_schema("run_program"),
                 **_ORCHESTRATION_GATE_PROPERTIES,
             },
@@ -1609,6 +1783,7 @@ TOOLS: dict[str, Tool] = {
                         "under the repository root."
                     ),
                 },
+                "threads_per_rank": {"type": "integer", "minimum": 1},
                 "env": _env_property_schema("run_quality_checks"),
                 **_ORCHESTRATION_GATE_PROPERTIES,
             },
@@ -1730,6 +1905,30 @@ def _success_response(message_id: Any, result: dict[str, Any]) -> dict[str, Any]
     }
 
 
+# `main()` runs `tools/call` requests on a pool of this many worker threads and answers each
+# as it finishes, so an hour-long `run_program` does not hold up a leaf's syntax checks and
+# lint runs. Every other method is answered in arrival order on the reading thread.
+_TOOL_WORKERS_ENV = "METDSL_MCP_TOOL_WORKERS"
+_DEFAULT_TOOL_WORKERS = 4
+
+# The dispatched calls not yet answered, by JSON-RPC id, for `notifications/cancelled`.
+_IN_FLIGHT: dict[Any, _ToolCall] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# One lock per resolved project_dir: two calls on one tree (a build and the make-test
+# re-run that rebuilds its objects) run one after the other; calls on different trees
+# run side by side.
+_PROJECT_DIR_LOCKS: dict[str, threading.Lock] = {}
+_PROJECT_DIR_LOCKS_GUARD = threading.Lock()
+
+
+def _project_dir_lock(arguments: dict[str, Any]) -> threading.Lock:
+    # Spelled as the tool handlers read it, absent meaning the server's working directory.
+    key = os.path.realpath(str(arguments.get("project_dir", ".")))
+    with _PROJECT_DIR_LOCKS_GUARD:
+        return _PROJECT_DIR_LOCKS.setdefault(key, threading.Lock())
+
+
 def _handle_request(message: dict[str, Any]) -> dict[str, Any] | None:
     method = message.get("method")
     message_id = message.get("id")
@@ -1771,46 +1970,129 @@ def _handle_request(message: dict[str, Any]) -> dict[str, Any] | None:
         if tool_name not in TOOLS:
             return _error_response(message_id, -32602, f"unknown tool: {tool_name}")
         tool = TOOLS[tool_name]
-        try:
-            data = tool.handler(arguments)
-            text = json.dumps(data, ensure_ascii=False, indent=2)
-            return _success_response(
-                message_id,
-                {
-                    "content": [{"type": "text", "text": text}],
-                    "structuredContent": data,
-                    "isError": False,
-                },
-            )
-        except Exception as exc:  # noqa: BLE001
-            error_data = {
-                "error": str(exc),
-            }
-            text = json.dumps(error_data, ensure_ascii=False, indent=2)
-            return _success_response(
-                message_id,
-                {
-                    "content": [{"type": "text", "text": text}],
-                    "structuredContent": error_data,
-                    "isError": True,
-                },
-            )
+        op_timing = _load_op_timing()
+        with op_timing.operation("mcp", tool_name) as timer:
+            timer.bind(repo_root=_server_checkout_root(),
+                       orchestration_id=os.environ.get("METDSL_ORCHESTRATION_ID"))
+            try:
+                with _project_dir_lock(arguments):
+                    data = tool.handler(arguments)
+                text = json.dumps(data, ensure_ascii=False, indent=2)
+                timer.exit = 0
+                return _success_response(
+                    message_id,
+                    {
+                        "content": [{"type": "text", "text": text}],
+                        "structuredContent": data,
+                        "isError": False,
+                    },
+                )
+            except Exception as exc:  # noqa: BLE001
+                error_data = {
+                    "error": str(exc),
+                }
+                text = json.dumps(error_data, ensure_ascii=False, indent=2)
+                timer.exit = 1
+                return _success_response(
+                    message_id,
+                    {
+                        "content": [{"type": "text", "text": text}],
+                        "structuredContent": error_data,
+                        "isError": True,
+                    },
+                )
 
     if message_id is None:
         return None
     return _error_response(message_id, -32601, f"method not found: {method}")
 
 
+def _request_key(message_id: Any) -> Any:
+    """A JSON-RPC id usable as an `_IN_FLIGHT` key (a string or an integer), else None."""
+    if isinstance(message_id, bool) or not isinstance(message_id, (str, int)):
+        return None
+    return message_id
+
+
+def _serve_tool_call(message: dict[str, Any], call: _ToolCall) -> None:
+    key = _request_key(message.get("id"))
+    token = _ACTIVE_CALL.set(call)
+    try:
+        response = None if call.cancelled else _handle_request(message)
+    finally:
+        _ACTIVE_CALL.reset(token)
+        if key is not None:
+            with _IN_FLIGHT_LOCK:
+                if _IN_FLIGHT.get(key) is call:
+                    del _IN_FLIGHT[key]
+    # A cancelled request is not answered (MCP cancellation); a command it had started is
+    # in the command log with `error: cancelled by the client`.
+    if response is not None and not call.cancelled:
+        _write_message(response)
+
+
+def _cancel_request(params: Any) -> None:
+    key = _request_key(params.get("requestId")) if isinstance(params, dict) else None
+    if key is None:
+        return
+    with _IN_FLIGHT_LOCK:
+        call = _IN_FLIGHT.get(key)
+    if call is not None:
+        call.cancel()
+
+
+def _cancel_all_calls() -> None:
+    with _IN_FLIGHT_LOCK:
+        calls = list(_IN_FLIGHT.values())
+    for call in calls:
+        call.cancel()
+
+
+def _tool_workers() -> int:
+    raw = os.environ.get(_TOOL_WORKERS_ENV, "").strip()
+    try:
+        return _bounded_int(raw or None, _DEFAULT_TOOL_WORKERS, 1, _TOOL_WORKERS_ENV)
+    except ValueError:
+        return _DEFAULT_TOOL_WORKERS
+
+
+def _terminate(signum: int, _frame: Any) -> None:
+    # Commands run in process groups of their own, so a signal to this server no longer
+    # reaches them; stop them on the way out.
+    _cancel_all_calls()
+    raise SystemExit(128 + signum)
+
+
 def main() -> int:
-    while True:
-        message = _read_message()
-        if message is None:
-            return 0
-        if not isinstance(message, dict):
-            continue
-        response = _handle_request(message)
-        if response is not None:
-            _write_message(response)
+    # Tool calls are timed one by one; the server's own start is not any call's.
+    _load_op_timing().claim_startup()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _terminate)
+    with ThreadPoolExecutor(
+        max_workers=_tool_workers(), thread_name_prefix="tools-call"
+    ) as pool:
+        while True:
+            message = _read_message()
+            if message is None:
+                # Leaving the pool waits for the calls still running, as the serial loop did.
+                return 0
+            if not isinstance(message, dict):
+                continue
+            method = message.get("method")
+            if method == "notifications/cancelled":
+                _cancel_request(message.get("params"))
+                continue
+            if method == "tools/call":
+                call = _ToolCall()
+                key = _request_key(message.get("id"))
+                if key is not None:
+                    with _IN_FLIGHT_LOCK:
+                        _IN_FLIGHT[key] = call
+                pool.submit(_serve_tool_call, message, call)
+                continue
+            response = _handle_request(message)
+            if response is not None:
+                _write_message(response)
 
 
 if __name__ == "__main__":
@@ -17,10 +17,17 @@ output tokens and latencies are not inflated.
 
 Usage:
   python3 analyze_timing.py [orchestration_id] [--json] [--project-dir DIR]
+  python3 analyze_timing.py [orchestration_id] --ops [--top N] [--json]
 
   orchestration_id  Target under workspace/orchestrations/. Omit to auto-pick
                     the most recent orch_* directory.
   --json            Emit machine-readable JSON instead of the text report.
+  --ops             Report mode for the DETERMINISTIC operations instead: ranks
+                    the runtime subcommands, gate runs, hook invocations and MCP
+                    tool calls recorded in audit/timings.jsonl (tools/op_timing.py)
+                    by total time, with each one's import / lock-wait / I/O /
+                    compute split, then the N slowest single calls (--top,
+                    default 15). Reads no transcript.
   --project-dir     Claude transcript dir. Default: BOTH the orchestration's private
                     home (orchestration_meta.json#claude_workflow_home +
                     /projects/<slug>, issue #63) and ~/.claude/projects/<slug>,
@@ -419,10 +426,121 @@ def summarize(raw, seen_ids):
     }
 
 
+def load_op_timings(orch_path):
+    """The records of audit/timings.jsonl, in write order.
+
+    The file is appended by many processes, some inside the leaf sandbox, so a
+    line that is torn or is not a record is skipped rather than trusted.
+    """
+    path = os.path.join(orch_path, "audit", "timings.jsonl")
+    records = []
+    if not os.path.exists(path):
+        return records
+    for line in open(path, encoding="utf-8", errors="replace"):
+        try:
+            d = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(d, dict) and isinstance(d.get("total_s"), (int, float)):
+            records.append(d)
+    return records
+
+
+OP_PARTS = ("import_s", "lock_wait_s", "io_s", "compute_s")
+
+
+def summarize_ops(records, top):
+    """Rank (kind, op) groups by their summed total time.
+
+    An operation run INSIDE another (a gate under `run-gate`) carries `within`;
+    it is ranked in its own row but left out of the headline total, which
+    already contains it through its parent.
+    """
+    groups = {}
+    for d in records:
+        key = (str(d.get("kind") or ""), str(d.get("op") or ""))
+        g = groups.setdefault(key, {"kind": key[0], "op": key[1], "calls": 0,
+                                    "totals": [], "nested": bool(d.get("within")),
+                                    "nonzero_exit": 0, **{p: 0.0 for p in OP_PARTS}})
+        g["calls"] += 1
+        g["totals"].append(float(d["total_s"]))
+        if d.get("exit") not in (0, None):
+            g["nonzero_exit"] += 1
+        for p in OP_PARTS:
+            v = d.get(p)
+            if isinstance(v, (int, float)):
+                g[p] += float(v)
+    rows = []
+    for g in groups.values():
+        t = sorted(g.pop("totals"))
+        g["total_s"] = sum(t)
+        g["mean_s"] = g["total_s"] / len(t)
+        g["p95_s"] = t[min(len(t) - 1, int(0.95 * len(t)))]
+        g["max_s"] = t[-1]
+        rows.append(g)
+    rows.sort(key=lambda g: -g["total_s"])
+    outer = [d for d in records if not d.get("within")]
+    by_kind = {}
+    for d in outer:
+        k = str(d.get("kind") or "")
+        by_kind[k] = by_kind.get(k, 0.0) + float(d["total_s"])
+    return {
+        "records": len(records),
+        "nested_records": len(records) - len(outer),
+        "total_s": sum(float(d["total_s"]) for d in outer),
+        "parts_s": {p: sum(float(d.get(p) or 0.0) for d in outer) for p in OP_PARTS},
+        "by_kind_s": by_kind,
+        "by_op": rows,
+        "slowest_calls": sorted(records, key=lambda d: -float(d["total_s"]))[:top],
+    }
+
+
+def render_ops(r):
+    o = r["ops"]
+    print(f"orchestration: {r['orchestration_id']}  deterministic operations "
+          f"(audit/timings.jsonl)")
+    if not o["records"]:
+        print("  no timing records (a run recorded before tools/op_timing.py, or "
+              "METDSL_TIMINGS=0)")
+        return
+    total = o["total_s"]
+    print(f"  {o['records']} records ({o['nested_records']} nested in another, "
+          f"ranked below but not added to the total)")
+    print(f"  total {total:.1f}s = " + " + ".join(
+        f"{p[:-2]} {o['parts_s'][p]:.1f}s ({pct(o['parts_s'][p], total)})" for p in OP_PARTS))
+    print("  by kind: " + ", ".join(
+        f"{k} {v:.1f}s" for k, v in sorted(o["by_kind_s"].items(), key=lambda x: -x[1])))
+    print("    NOTE hook and mcp time is spent INSIDE a leaf's wall clock (the leaf "
+          "waits on it); runtime time is between leaves.")
+    print()
+    print("slowest operations by total time:")
+    print(f"  {'kind':8s} {'op':28s} {'calls':>5s} {'total':>8s} {'mean':>7s} {'p95':>7s} "
+          f"{'max':>7s} {'import':>7s} {'lock':>6s} {'io':>6s} {'exit≠0':>6s}")
+    for g in o["by_op"]:
+        nested = "  (nested)" if g["nested"] else ""
+        print(f"  {g['kind']:8s} {g['op'][:28]:28s} {g['calls']:>5d} {g['total_s']:7.1f}s "
+              f"{g['mean_s']:6.3f}s {g['p95_s']:6.3f}s {g['max_s']:6.3f}s "
+              f"{pct(g['import_s'], g['total_s']):>7s} {pct(g['lock_wait_s'], g['total_s']):>6s} "
+              f"{pct(g['io_s'], g['total_s']):>6s} {g['nonzero_exit']:>6d}{nested}")
+    print()
+    print("slowest single calls:")
+    for d in o["slowest_calls"]:
+        parts = "  ".join(f"{p[:-2]}={d.get(p) if d.get(p) is not None else '—'}"
+                          for p in OP_PARTS)
+        print(f"  {float(d['total_s']):7.3f}s  {d.get('kind')}:{d.get('op')}  "
+              f"{d.get('ts')}  exit={d.get('exit')}  {parts}")
+
+
 def main():
     args = sys.argv[1:]
     as_json = "--json" in args
-    args = [a for a in args if a != "--json"]
+    ops_mode = "--ops" in args
+    args = [a for a in args if a not in ("--json", "--ops")]
+    top = 15
+    if "--top" in args:
+        i = args.index("--top")
+        top = int(args[i + 1])
+        del args[i:i + 2]
     project_dir = None
     if "--project-dir" in args:
         i = args.index("--project-dir")
@@ -435,6 +553,15 @@ def main():
     orch_id = pick_orch(orch_dir, requested)
     orch_path = os.path.join(orch_dir, orch_id)
 
+    if ops_mode:
+        result = {"orchestration_id": orch_id,
+                  "ops": summarize_ops(load_op_timings(orch_path), top)}
+        if as_json:
+            print(json.dumps(result, indent=2))
+        else:
+            render_ops(result)
+        return
+
     project_dirs = [project_dir] if project_dir else []
     if project_dir is None:
         slug = repo_root.replace("/", "-")
@@ -39,6 +39,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from tools import lazy_re
 from tools.backends.language.fortran import lines as fortran_lines
 
 # --- §5.1 canonical interface block: stanza parsing + comparison atoms ---------------------------
@@ -56,19 +57,19 @@ from tools.backends.language.fortran import lines as fortran_lines
 # matter (`docs/BACKEND_BOUNDARY.md`, the blocking sub-item of TODO.md's validator area). The
 # gates that consume it are neutral and reach it here, through the language backend.
 
-_IFACE_PROC_START = re.compile(
+_IFACE_PROC_START = lazy_re.compile(
     r"^\s*(?:pure\s+|elemental\s+|recursive\s+)*(subroutine|function)\s+([A-Za-z0-9_]+)",
     re.IGNORECASE,
 )
 # ``end\s*`` (space optional) accepts the legal no-space free-form keywords endsubroutine /
 # endfunction / endtype as well as the spaced forms.
-_IFACE_PROC_END = re.compile(r"^\s*end\s*(?:subroutine|function)\b", re.IGNORECASE)
+_IFACE_PROC_END = lazy_re.compile(r"^\s*end\s*(?:subroutine|function)\b", re.IGNORECASE)
 # The type DEFINITION header is `_TYPE_HEADER_RE`, defined with the other header patterns below
 # and used here rather than restated: moving the stanza layer into this module put a byte-identical
 # copy of it beside the original, which is the drift shape this file already carries a warning
 # about. The stanza parser and `_parse_type` must agree on what a type header IS — a header the
 # splitter accepts and the parser rejects is a stanza with no lowering — so they read one pattern.
-_IFACE_TYPE_END = re.compile(r"^\s*end\s*type\b", re.IGNORECASE)
+_IFACE_TYPE_END = lazy_re.compile(r"^\s*end\s*type\b", re.IGNORECASE)
 
 # The `subroutine` / `function` alternatives are REACHED — `source_atoms` runs
 # `canonicalize_end_line` over every logical line of real model source, which rewrites
@@ -77,7 +78,7 @@ _IFACE_TYPE_END = re.compile(r"^\s*end\s*type\b", re.IGNORECASE)
 # procedure stanza excludes its own terminator by construction. Recorded with the right
 # predicate: an earlier note said "no consumer reaches", which is measurably false and
 # would mislead anyone pruning the pattern.
-_END_STMT_RE = re.compile(r"^\s*end\s*(type|subroutine|function)\b", re.IGNORECASE)
+_END_STMT_RE = lazy_re.compile(r"^\s*end\s*(type|subroutine|function)\b", re.IGNORECASE)
 
 
 def canonicalize_end_line(line: str) -> str:
@@ -318,22 +319,22 @@ _FORTRAN_LEN_TO_NEUTRAL = {v: k for k, v in _NEUTRAL_LEN_TO_FORTRAN.items()}
 _NEUTRAL_KIND_VALUES = {"float64": "real64", "float32": "real32"}   # module-parameter kind value
 _FORTRAN_KIND_VALUES = {v: k for k, v in _NEUTRAL_KIND_VALUES.items()}
 
-_INTENT_RE = re.compile(r"^intent\(\s*(in|out|inout)\s*\)$", re.IGNORECASE)
-_MODULE_PARAM_RE = re.compile(
+_INTENT_RE = lazy_re.compile(r"^intent\(\s*(in|out|inout)\s*\)$", re.IGNORECASE)
+_MODULE_PARAM_RE = lazy_re.compile(
     r"^\s*integer\s*,\s*parameter\s*::\s*([A-Za-z0-9_]+)\s*=\s*(.+?)\s*$", re.IGNORECASE
 )
 # A strict extension of the stanza splitter's `_IFACE_PROC_START`: same prefix rule, plus the
 # argument list and `result(...)`. It cannot be collapsed into one pattern (the group numbering
 # differs), so `test_the_two_procedure_header_patterns_agree` pins that every header one accepts
 # the other accepts.
-_PROC_HEADER_RE = re.compile(
+_PROC_HEADER_RE = lazy_re.compile(
     r"^\s*(?:pure\s+|elemental\s+|recursive\s+)*(subroutine|function)\s+"
     r"([A-Za-z0-9_]+)\s*(?:\((.*?)\))?\s*(?:result\s*\(\s*([A-Za-z0-9_]+)\s*\))?\s*$",
     re.IGNORECASE,
 )
 # Also the stanza splitter's type-header test (see the stanza layer above): one pattern, so the
 # splitter and the parser cannot disagree about what a type header is.
-_TYPE_HEADER_RE = re.compile(
+_TYPE_HEADER_RE = lazy_re.compile(
     r"^\s*type\s*(?:,\s*[^:()]*?)?::\s*([A-Za-z0-9_]+)\s*$", re.IGNORECASE
 )
 
@@ -575,7 +576,7 @@ def _reject_unknown_keys(mapping: dict[str, Any], allowed: frozenset[str], ctx:
 # Fortran 2008 caps array rank at 15; a larger value is malformed and, unbounded, would let
 # ``_render_dims`` amplify one integer into a multi-GB string (OOM/hang) instead of failing closed.
 _MAX_RANK = 15
-_IDENTIFIER_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+_IDENTIFIER_RE = lazy_re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
 
 
 def _require_identifier(value: Any, ctx: str) -> str:
@@ -60,9 +60,10 @@ the fact that this repository declares no dependencies at all.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 FORTRAN_STRUCTURE_UNAVAILABLE_MARKER = "[fortran-structure-unavailable]"
+_front_end_version: str | None = None
 
 #: The node types tree-sitter-fortran gives a procedure DEFINITION, mapped to this module's kind.
 #: `module_procedure` is the abbreviated separate module subprogram (`module procedure solve`);
@@ -379,3 +380,48 @@ def blank_interface_spans(view: str, spans: tuple[tuple[int, int], ...]) -> str:
             if characters[index] != "\n":
                 characters[index] = " "
     return "".join(characters)
+
+
+def front_end_version() -> str:
+    """The loaded tree-sitter / tree-sitter-fortran pair, e.g.
+    ``tree-sitter==0.26.0;tree-sitter-fortran==0.6.0``.
+
+    Part of the key of every persisted parse (`validate_pipeline_semantics`'s Fortran memo), so a
+    grammar bump retires them all. It LOADS the front end first (once per process) and raises
+    `FortranStructureUnavailableError` as `parse_view` would: package metadata survives a broken
+    or shadowed install, and a replayed parse must not be how a machine without a working front
+    end passes a gate it cannot evaluate."""
+    global _front_end_version
+    if _front_end_version is None:
+        _load_parser()
+        from importlib import metadata
+
+        def installed(name: str) -> str:
+            try:
+                return metadata.version(name)
+            except metadata.PackageNotFoundError:
+                return "unknown"
+
+        _front_end_version = (f"tree-sitter=={installed('tree-sitter')};"
+                              f"tree-sitter-fortran=={installed('tree-sitter-fortran')}")
+    return _front_end_version
+
+
+def tree_to_json(tree: StructureTree) -> dict:
+    """``tree`` as JSON, without its view (the caller keys the entry by the view)."""
+    return {
+        "procedures": [asdict(procedure) for procedure in tree.procedures],
+        "interface_spans": [list(span) for span in tree.interface_spans],
+        "errors": [asdict(error) for error in tree.errors],
+    }
+
+
+def tree_from_json(view: str, doc: dict) -> StructureTree:
+    """Inverse of `tree_to_json` over the same ``view``; a malformed ``doc`` raises
+    ``KeyError`` / ``TypeError``."""
+    return StructureTree(
+        view=view,
+        procedures=tuple(Procedure(**item) for item in doc["procedures"]),
+        interface_spans=tuple((int(start), int(end)) for start, end in doc["interface_spans"]),
+        errors=tuple(StructureError(**item) for item in doc["errors"]),
+    )
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""Content-addressed store of dependency compile artifacts (``workspace/.build_cache/``).
+
+Build stages every certified dependency source of a node's closure into the per-run build
+directory, and the conductor-authored control file compiles the closure there from scratch
+on every Build attempt of every dependent node. A *unit* here is one staged dependency: its
+source, its object, and the interface files its compile writes beside them (named with the
+object's stem — the conductor's `<spec_id>_model` convention). A unit's artifacts are stored
+under a key over
+
+  * the unit's source bytes,
+  * the compiler identity (resolved executable, its size and mtime, and the first line of
+    its ``--version``), and
+  * the compile-rule flags as the control file spells them, unexpanded,
+
+as one *variant* per set of interface files the compile could read: the manifest records the
+name and digest of every deeper unit's interface file present in the build directory. A
+variant is reused when each recorded interface is byte-identical in the new build directory
+or absent from it — a closure is transitive, so an interface the unit really reads is always
+present, and one that is absent was never read. Keying on the interfaces rather than the
+closure order lets two dependents with different closures share one dependency's objects.
+
+`CompileCache.prime` copies hit units into a fresh build directory before the build, deepest
+first, stamped newer than their staged sources so the build tool considers them up to date.
+The walk stops at the first miss: a rebuilt unit makes every unit after it out of date anyway.
+After a successful build, `CompileCache.store` keeps the units that missed and evicts
+least-recently-used variants past the size limit (``METDSL_BUILD_CACHE_MAX_BYTES``; ``0``
+turns the cache off). `CompileCache.report` is the hit/miss record Build writes into
+``binary_meta.json``.
+
+A node's Build also *publishes* its own model unit, in the same manifest format, beside its
+``binary_meta.json`` (`ARTIFACT_SET_DIR`, `CompileCache.publish`), carrying the key it was
+compiled under. A dependent's Build takes a dependency from that set ahead of the cache when
+the key recomputed over the staged certified source and its own compiler and flags is the
+same, the files match their digests and the interfaces agree; a different toolchain simply
+misses, and the staged source is compiled as before.
+
+Only the trusted host process writes entries, the same terms as ``tools/gate_cache.py``:
+the runtime exempts this subtree from the unauthorized-write diff
+(``orchestration_runtime._HOST_BUILD_CACHE_PREFIX``) and never makes it leaf-writable, since
+a planted object would be linked into a certified binary. Every hit is re-digested against
+its manifest before it is copied out. Stdlib-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Repo-relative root of the cache. Mirrored by orchestration_runtime._HOST_BUILD_CACHE_PREFIX
+# and by the `.build_cache` entry of validate_workspace_root.ALLOWED_WORKSPACE_TOP_LEVEL_DIRS.
+CACHE_DIR = "workspace/.build_cache"
+SCHEMA_VERSION = 1
+MANIFEST_NAME = "entry.json"
+MAX_BYTES_ENV = "METDSL_BUILD_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 1 << 30
+# Directory, beside a node's binary_meta.json, holding its published model artifact set.
+ARTIFACT_SET_DIR = "artifacts"
+
+# (resolved path, size, mtime_ns) -> `--version` line; a compiler is asked its version once per
+# process and again only when its executable changes.
+_compiler_versions: dict[tuple[str, int, int], str | None] = {}
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    return _sha256(path.read_bytes())
+
+
+def _canonical_digest(value: Any) -> str:
+    return _sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+def compiler_identity(compiler: str) -> str | None:
+    """What a cached object is a function of on the compiler side, or None when the
+    compiler cannot be resolved or does not answer ``--version`` (the cache is then off:
+    an object keyed on an unknown compiler could be replayed across an upgrade)."""
+    resolved = shutil.which(compiler)
+    if resolved is None:
+        return None
+    real = os.path.realpath(resolved)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return None
+    probe = (real, st.st_size, st.st_mtime_ns)
+    if probe not in _compiler_versions:
+        try:
+            proc = subprocess.run(
+                [resolved, "--version"], capture_output=True, text=True, timeout=30,
+                check=False)
+        except (OSError, subprocess.SubprocessError):
+            version = None
+        else:
+            lines = (proc.stdout or proc.stderr).strip().splitlines()
+            version = lines[0].strip() if proc.returncode == 0 and lines else None
+        _compiler_versions[probe] = version
+    version = _compiler_versions[probe]
+    if version is None:
+        return None
+    return f"{real}\0{st.st_size}\0{st.st_mtime_ns}\0{version}"
+
+
+def max_bytes_from_env() -> int:
+    """The size limit, from ``METDSL_BUILD_CACHE_MAX_BYTES``; a malformed value keeps the
+    default rather than failing the build."""
+    raw = os.environ.get(MAX_BYTES_ENV, "").strip()
+    try:
+        value = int(raw) if raw else DEFAULT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+    return max(0, value)
+
+
+def unit_artifacts(build_dir: Path, source_name: str, object_name: str) -> list[str]:
+    """The names a unit's compile left in `build_dir`: the object, then every other file
+    sharing its stem (the interface files), sorted. The staged source is not an artifact."""
+    stem = Path(object_name).stem
+    names = [object_name]
+    try:
+        entries = sorted(os.listdir(build_dir))
+    except OSError:
+        return names
+    for name in entries:
+        if name in (object_name, source_name) or Path(name).stem != stem:
+            continue
+        if (build_dir / name).is_file():
+            names.append(name)
+    return names
+
+
+def _plain_name(name: Any) -> bool:
+    return (isinstance(name, str) and bool(name) and "/" not in name
+            and not name.startswith(".") and name != MANIFEST_NAME)
+
+
+def load_artifact_set(entry: Path, object_name: str) -> dict[str, Any] | None:
+    """The manifest of a stored unit whose every file still has its recorded digest, else
+    None. Shared with the certified artifact sets a dependency publishes beside its binary."""
+    try:
+        manifest = json.loads((entry / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("schema_version") != SCHEMA_VERSION:
+        return None
+    files = manifest.get("files")
+    interfaces = manifest.get("interfaces")
+    if (not isinstance(files, dict) or object_name not in files
+            or not isinstance(interfaces, dict)):
+        return None
+    if not all(_plain_name(name) for name in [*files, *interfaces]):
+        return None
+    for name, digest in files.items():
+        try:
+            if _file_digest(entry / name) != digest:
+                return None
+        except OSError:
+            return None
+    return manifest
+
+
+def interfaces_match(build_dir: Path, interfaces: dict[str, str]) -> bool:
+    """Whether every interface a unit was compiled against is, in `build_dir`, either the
+    same bytes or absent (see the module docstring for why absent is safe)."""
+    for name, digest in interfaces.items():
+        path = build_dir / name
+        try:
+            if path.exists() and _file_digest(path) != digest:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def write_artifact_set(target: Path, build_dir: Path, manifest: dict[str, Any]) -> bool:
+    """Copy `manifest["files"]` from `build_dir` into a new directory `target`, atomically
+    (staged beside it, then renamed). False when `target` exists or the write fails."""
+    if target.is_dir():
+        return False
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}."))
+    except OSError:
+        return False
+    try:
+        for name in manifest["files"]:
+            shutil.copyfile(build_dir / name, staging / name)
+        (staging / MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        os.rename(staging, target)
+    except OSError:
+        # Includes a concurrent Build having stored the same variant first.
+        shutil.rmtree(staging, ignore_errors=True)
+        return False
+    return True
+
+
+def _last_used(variant: Path) -> int:
+    try:
+        return (variant / MANIFEST_NAME).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def materialize(entry: Path, manifest: dict[str, Any], build_dir: Path, mtime_ns: int) -> None:
+    """Copy a verified artifact set into `build_dir`, every file stamped `mtime_ns`."""
+    for name in sorted(manifest["files"]):
+        target = build_dir / name
+        shutil.copyfile(entry / name, target)
+        os.utime(target, ns=(mtime_ns, mtime_ns))
+
+
+def _materialize_or_withdraw(entry: Path, manifest: dict[str, Any], build_dir: Path,
+                             mtime_ns: int) -> bool:
+    """`materialize`, except that a failed copy removes whatever of the unit it had already
+    copied and returns False, so make rebuilds the unit instead of finding part of it fresh."""
+    try:
+        materialize(entry, manifest, build_dir, mtime_ns)
+    except OSError:
+        for name in manifest["files"]:
+            try:
+                (build_dir / name).unlink()
+            except OSError:
+                pass
+        return False
+    return True
+
+
+class CompileCache:
+    """One Build's view of the cache over one closure. `units` is the closure in compile
+    order (deepest first), each a (staged source name, object name) pair."""
+
+    def __init__(
+        self,
+        repo_root: Path,
+        units: list[tuple[str, str]],
+        *,
+        compiler: str,
+        flags: str,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.repo_root = repo_root
+        self.root = repo_root / CACHE_DIR
+        self.units = list(units)
+        self.flags = flags
+        self.max_bytes = max_bytes_from_env() if max_bytes is None else max(0, max_bytes)
+        self.hits: list[str] = []
+        self.published: list[str] = []
+        self.misses: list[str] = []
+        self.stored = 0
+        self.evicted = 0
+        self.disabled_reason: str | None = None
+        self.compiler_id = compiler_identity(compiler) if compiler else None
+        if self.max_bytes == 0:
+            self.disabled_reason = f"{MAX_BYTES_ENV}=0"
+        elif self.compiler_id is None:
+            self.disabled_reason = f"compiler {compiler!r} has no resolvable identity"
+        # A symlinked cache root (or workspace/) could point into a leaf-writable tree, where a
+        # planted object would be linked into a certified binary. Refuse it rather than follow it.
+        elif any(p.is_symlink() for p in (self.root, self.root.parent)):
+            self.disabled_reason = f"{CACHE_DIR} is a symlink"
+
+    @property
+    def enabled(self) -> bool:
+        return self.disabled_reason is None
+
+    def key(self, source: Path) -> str:
+        return _canonical_digest(
+            {"schema": SCHEMA_VERSION, "source": _file_digest(source),
+             "compiler": self.compiler_id, "flags": self.flags})
+
+    def _variants(self, key: str) -> list[Path]:
+        try:
+            found = [p for p in (self.root / key[:2] / key).iterdir()
+                     if not p.name.startswith(".")]
+        except OSError:
+            return []
+        # Most recently used first: the variant the last Build of this closure took.
+        return sorted(found, key=_last_used, reverse=True)
+
+    def _lookup(self, build_dir: Path, key: str,
+                object_name: str) -> tuple[Path, dict[str, Any]] | None:
+        for variant in self._variants(key):
+            manifest = load_artifact_set(variant, object_name)
+            if manifest is not None and interfaces_match(build_dir, manifest["interfaces"]):
+                return variant, manifest
+        return None
+
+    def _published(self, build_dir: Path, entry: Path | None, key: str,
+                   object_name: str) -> dict[str, Any] | None:
+        if entry is None:
+            return None
+        manifest = load_artifact_set(entry, object_name)
+        if (manifest is None or manifest.get("key") != key
+                or not interfaces_match(build_dir, manifest["interfaces"])):
+            return None
+        return manifest
+
+    def prime(self, build_dir: Path, published: dict[str, Path] | None = None) -> None:
+        """Copy the longest prefix of the closure that is published or cached into
+        `build_dir` (where the sources are already staged), and record every unit as
+        published, a hit or a miss. `published` maps a staged source name to the
+        `ARTIFACT_SET_DIR` of the dependency binary it was staged from."""
+        if self.compiler_id is None:
+            return
+        published = published or {}
+        stamp = time.time_ns()
+        for index, (source_name, object_name) in enumerate(self.units):
+            if self.misses:
+                self.misses.append(source_name)
+                continue
+            try:
+                key = self.key(build_dir / source_name)
+                manifest = self._published(
+                    build_dir, published.get(source_name), key, object_name)
+                found = None if manifest is not None or not self.enabled else self._lookup(
+                    build_dir, key, object_name)
+            except OSError:
+                manifest = found = None
+            # Strictly increasing stamps, all newer than the staged sources, so each object is
+            # up to date against its source and against every deeper object it depends on.
+            if manifest is not None:
+                if _materialize_or_withdraw(
+                        published[source_name], manifest, build_dir, stamp + index + 1):
+                    self.published.append(source_name)
+                else:
+                    self.misses.append(source_name)
+                continue
+            if found is None:
+                self.misses.append(source_name)
+                continue
+            variant, manifest = found
+            if not _materialize_or_withdraw(variant, manifest, build_dir, stamp + index + 1):
+                # Evicted or replaced by another Build since the lookup verified it.
+                self.misses.append(source_name)
+                continue
+            # The manifest's mtime is the variant's last use, which eviction orders by.
+            try:
+                os.utime(variant / MANIFEST_NAME)
+            except OSError:
+                pass
+            self.hits.append(source_name)
+
+    def interface_digests(self, build_dir: Path, upto: int) -> dict[str, str]:
+        """Name -> digest of the interface files the first `upto` units left in `build_dir`:
+        what the next unit's compile could read."""
+        found: dict[str, str] = {}
+        for source_name, object_name in self.units[:upto]:
+            for name in unit_artifacts(build_dir, source_name, object_name)[1:]:
+                found[name] = _file_digest(build_dir / name)
+        return found
+
+    def store(self, build_dir: Path) -> None:
+        """After a successful build, keep every unit that missed, then evict past the limit.
+        A failure to write is swallowed: the cache never fails a build."""
+        if not self.enabled or not self.misses:
+            return
+        missed = set(self.misses)
+        try:
+            for index, (source_name, object_name) in enumerate(self.units):
+                if source_name not in missed:
+                    continue
+                manifest = {
+                    "schema_version": SCHEMA_VERSION,
+                    "source": source_name,
+                    "files": {name: _file_digest(build_dir / name) for name in
+                              unit_artifacts(build_dir, source_name, object_name)},
+                    "interfaces": self.interface_digests(build_dir, index),
+                }
+                key = self.key(build_dir / source_name)
+                variant = _canonical_digest(manifest["interfaces"])
+                if write_artifact_set(self.root / key[:2] / key / variant, build_dir, manifest):
+                    self.stored += 1
+        except OSError:
+            return
+        self._evict()
+
+    def publish(self, target: Path, build_dir: Path, source: Path, object_name: str) -> bool:
+        """Replace `target` with the artifact set of the unit `source` compiled to in
+        `build_dir` after every unit of the closure: the node's own model, as a dependent
+        will stage it. False (and no set) when the compiler has no identity or the object
+        is missing."""
+        if self.compiler_id is None:
+            return False
+        shutil.rmtree(target, ignore_errors=True)
+        try:
+            manifest = {
+                "schema_version": SCHEMA_VERSION,
+                "source": source.name,
+                "key": self.key(source),
+                "files": {name: _file_digest(build_dir / name) for name in
+                          unit_artifacts(build_dir, source.name, object_name)},
+                "interfaces": self.interface_digests(build_dir, len(self.units)),
+            }
+        except OSError:
+            return False
+        return write_artifact_set(target, build_dir, manifest)
+
+    def _evict(self) -> None:
+        variants: list[tuple[int, int, Path]] = []
+        total = 0
+        for variant in self.root.glob("*/*/*"):
+            if variant.name.startswith(".") or variant.parent.name.startswith("."):
+                continue
+            try:
+                size = sum(p.stat().st_size for p in variant.iterdir())
+            except OSError:
+                continue
+            variants.append((_last_used(variant), size, variant))
+            total += size
+        for _used, size, variant in sorted(variants, key=lambda row: (row[0], str(row[2]))):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(variant, ignore_errors=True)
+            try:
+                variant.parent.rmdir()
+            except OSError:
+                pass
+            total -= size
+            self.evicted += 1
+
+    def report(self) -> dict[str, Any]:
+        """The ``binary_meta.json#compile_cache`` record."""
+        if not self.enabled:
+            return {"status": "off", "reason": self.disabled_reason,
+                    "published": list(self.published),
+                    "units": [source for source, _obj in self.units]}
+        return {"status": "on", "published": list(self.published), "hits": list(self.hits),
+                "misses": list(self.misses), "stored": self.stored, "evicted": self.evicted}
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Content-hash derivation keys for spec nodes (R6 proper, host-authored sidecar).
+
+A node's *derivation key* is a Merkle hash over the contract inputs that decide what
+the workflow certifies for it:
+
+  * its own ``controlled_spec.md``, ``tests.md`` and ``deps.yaml``, and
+  * the derivation keys of the dependencies its ``deps.yaml`` resolves to — the harness
+    node (and with it the harness version's content) and any profile node included.
+
+The ``spec_version`` meta lines (``- `spec_version`: ...`` and
+``- `spec_ref.spec_version`: ...``) are stripped before hashing, so a version bump that
+changes nothing else leaves the key — and every key above it in the graph — unchanged.
+A one-line spec fix changes that node's key and, through the chain, exactly the keys of
+its dependents.
+
+The conductor records the key, its per-input digests, and the digests of the certified
+outputs it was bound to (the IR, and the target profile the IR carries as
+``impl_defaults``) in ``<ir_ref>/content_digest.json`` when Compile passes
+(``workflow_conductor._write_content_digest``). Readiness
+(``orchestration_runtime._dependency_resolution_freshness``) re-derives the key from
+today's files and compares; a node with no record falls back to the R6-lite
+version-granularity comparison.
+
+Like ``tools/dependency_graph.py`` this is a pure function of the on-disk registry, and it
+reuses the runtime's canonical deps/catalog helpers so both resolve the same edges.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+SIDECAR_NAME = "content_digest.json"
+SCHEMA_VERSION = 1
+SPEC_INPUTS = ("controlled_spec.md", "tests.md", "deps.yaml")
+IR_FILENAME = "spec.ir.yaml"
+
+_VERSION_LINE_RE = re.compile(
+    r"^[ \t]*-[ \t]*`(?:spec_ref\.)?spec_version`[ \t]*:[^\n]*(?:\n|\Z)", re.MULTILINE)
+# (path, mtime_ns, size) -> digest. Readiness re-derives every node's key once per closure
+# node, so an unchanged file is hashed once per process rather than once per caller.
+_FILE_DIGEST_CACHE: dict[str, tuple[int, int, str]] = {}
+_FILE_DIGEST_CACHE_MAX = 4096
+
+
+def _sha256(data: bytes) -> str:
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+def spec_file_digest(path: Path) -> str | None:
+    """Digest of one spec input with its `spec_version` meta lines removed, or None when the
+    file cannot be read as UTF-8."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = str(path)
+    cached = _FILE_DIGEST_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeError):
+        return None
+    digest = _sha256(_VERSION_LINE_RE.sub("", text).encode("utf-8"))
+    if len(_FILE_DIGEST_CACHE) >= _FILE_DIGEST_CACHE_MAX:
+        _FILE_DIGEST_CACHE.pop(next(iter(_FILE_DIGEST_CACHE)))
+    _FILE_DIGEST_CACHE[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def derivation_inputs(
+    repo_root: Path,
+    spec_ref: str,
+    *,
+    spec_kind: str,
+    spec_id: str,
+    memo: dict[str, dict[str, Any] | None] | None = None,
+) -> dict[str, Any] | None:
+    """The derivation key of the node at `spec_ref` and the digests it was built from:
+    ``{derivation_key, inputs: {<spec input>: digest}, dependencies: {"<kind>/<id>": key}}``.
+
+    ``None`` when any input in the closure cannot be read or resolved (an unreadable spec
+    file, a malformed deps.yaml, a constraint with no catalog match, an ambiguous or missing
+    spec directory, a cycle). The caller then has no key to compare and falls back to the
+    version-granularity check, whose own gates name the registry defect. `memo` may be
+    shared across calls over one closure so each node is derived once."""
+    from tools.orchestration_runtime import (
+        SpecCatalogCorruption,
+        _load_spec_catalog,
+        _matching_dep_versions,
+        _parse_dep_entries,
+        _read_deps_yaml,
+        resolve_spec_ref_for,
+    )
+
+    memo = {} if memo is None else memo
+    visiting: set[str] = set()
+
+    def derive(ref: str, kind: str, sid: str) -> dict[str, Any] | None:
+        if ref in memo:
+            return memo[ref]
+        if ref in visiting:
+            return None
+        visiting.add(ref)
+        result = None
+        try:
+            inputs: dict[str, str] = {}
+            for name in SPEC_INPUTS:
+                digest = spec_file_digest(repo_root / ref / name)
+                if digest is None:
+                    return None
+                inputs[name] = digest
+            deps_doc = _read_deps_yaml(repo_root, ref)
+            if not isinstance(deps_doc, dict):
+                return None
+            entries, well_formed = _parse_dep_entries(deps_doc)
+            if not well_formed:
+                return None
+            dependencies: dict[str, str] = {}
+            for dep_kind, dep_sid, constraint in entries:
+                if not _matching_dep_versions(
+                        _load_spec_catalog(str(repo_root.resolve())), dep_kind, dep_sid,
+                        constraint):
+                    return None
+                dep_ref = resolve_spec_ref_for(repo_root, dep_kind, dep_sid)
+                if not dep_ref:
+                    return None
+                dep = derive(dep_ref, dep_kind, dep_sid)
+                if dep is None:
+                    return None
+                dependencies[f"{dep_kind}/{dep_sid}"] = dep["derivation_key"]
+            body = json.dumps(
+                {"schema": SCHEMA_VERSION, "node": f"{kind}/{sid}", "inputs": inputs,
+                 "dependencies": dependencies},
+                sort_keys=True, separators=(",", ":"),
+            ).encode("utf-8")
+            result = {"derivation_key": _sha256(body), "inputs": inputs,
+                      "dependencies": dependencies}
+            return result
+        except (SpecCatalogCorruption, RecursionError):
+            return None
+        finally:
+            visiting.discard(ref)
+            memo[ref] = result
+
+    return derive(spec_ref, spec_kind, spec_id)
+
+
+def certified_output_digests(ir_dir: Path) -> dict[str, str] | None:
+    """Digests of the certified outputs a record binds: the IR bytes, and the canonical JSON
+    of the target profile (`impl_defaults`) the IR carries. ``None`` when the IR is absent."""
+    try:
+        raw = (ir_dir / IR_FILENAME).read_bytes()
+    except OSError:
+        return None
+    out = {"ir": _sha256(raw)}
+    try:
+        import yaml
+
+        doc = yaml.safe_load(raw.decode("utf-8"))
+        profile = doc.get("impl_defaults") if isinstance(doc, dict) else None
+    except Exception:
+        profile = None
+    out["target_profile"] = _sha256(
+        json.dumps(profile, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+    return out
+
+
+def build_record(
+    repo_root: Path, spec_ref: str, *, node_key: str, ir_dir: Path,
+    derived: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """The `content_digest.json` document for the node certified at `ir_dir`, or ``None`` when
+    its inputs or its IR cannot be read. `derived` lets the caller bind inputs it captured
+    earlier (the conductor snapshots them at Compile start, before the leaf reads them)."""
+    kind, _, rest = node_key.partition("/")
+    spec_id = rest.rpartition("@")[0] or rest
+    if derived is None:
+        derived = derivation_inputs(repo_root, spec_ref, spec_kind=kind, spec_id=spec_id)
+    outputs = certified_output_digests(ir_dir)
+    if derived is None or outputs is None:
+        return None
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "node_key": node_key,
+        "derivation_key": derived["derivation_key"],
+        "inputs": derived["inputs"],
+        "dependencies": derived["dependencies"],
+        "outputs": outputs,
+        "generated_by": "conductor",
+    }
+
+
+def stale_reasons(recorded: Any, derived: dict[str, Any], ir_dir: Path) -> list[str] | None:
+    """Why a certified record no longer matches today's derivation; ``[]`` when it does.
+
+    ``None`` when `recorded` is not a well-formed record of this schema — the caller reports
+    that separately. Reasons name the changed input, the dependency whose key moved, or the
+    certified IR that was replaced after the record was written."""
+    if not isinstance(recorded, dict) or recorded.get("schema_version") != SCHEMA_VERSION:
+        return None
+    rec_inputs = recorded.get("inputs")
+    rec_deps = recorded.get("dependencies")
+    rec_outputs = recorded.get("outputs")
+    if not (isinstance(recorded.get("derivation_key"), str) and isinstance(rec_inputs, dict)
+            and isinstance(rec_deps, dict) and isinstance(rec_outputs, dict)):
+        return None
+    reasons: list[str] = []
+    if recorded["derivation_key"] != derived["derivation_key"]:
+        for name in SPEC_INPUTS:
+            if rec_inputs.get(name) != derived["inputs"].get(name):
+                reasons.append(f"{name} changed")
+        for dep in sorted(set(rec_deps) | set(derived["dependencies"])):
+            if dep not in derived["dependencies"]:
+                reasons.append(f"dependency {dep} was removed")
+            elif dep not in rec_deps:
+                reasons.append(f"dependency {dep} was added")
+            elif rec_deps[dep] != derived["dependencies"][dep]:
+                reasons.append(f"dependency {dep} content changed")
+        if not reasons:
+            reasons.append("derivation key changed")
+    outputs = certified_output_digests(ir_dir)
+    if outputs is None or outputs.get("ir") != rec_outputs.get("ir"):
+        reasons.append(f"certified {IR_FILENAME} differs from the one the record was bound to")
+    return reasons
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Content-addressed memo of validator rule results (``workspace/.gate_cache/``).
+
+The conductor runs ``validate_pipeline_semantics.py`` at Generate.gate, Execute, pre_judge
+and post_judge over sources, IRs and evidence that mostly did not change in between. A
+*rule* here is one contiguous group of checks whose every read is declared up front: the
+caller names the files and directory trees it reads, and the result — the violation lines
+the group appended, in order — is stored under a key over
+
+  * the rule id and the rule's own version,
+  * a fingerprint of the validator code (every ``tools/**/*.py`` outside ``tests/``), so
+    editing any rule or helper retires every entry,
+  * the caller's parameters (violation lines carry absolute paths, so the paths are part of
+    what the result is a function of), and
+  * the content digest of every declared input (a missing path digests as absent).
+
+A rerun over untouched inputs replays the stored violations instead of recomputing them.
+The cache is engaged only through the validator CLI (``main``), never by a library call, and
+has three modes: ``on`` (replay hits, store misses), ``off`` (``--no-cache``), and ``check``
+(``--cache-check``: always recompute, compare with any stored entry, and record a mismatch —
+a rule that reads an input it did not declare shows up here).
+
+`RuleCache.memo` is the same store for VALUES rather than violation lists: a pure function of one
+text (the validator's masked source view, logical lines, parsed structure and procedure
+envelopes of a source) keyed by that text's digest, under ``_memo/<kind>/``.
+
+Only the trusted host process writes entries. A bwrap-confined leaf that runs the validator
+reads them but gets EROFS on write, which is swallowed; the runtime exempts this subtree from
+the unauthorized-write diff on the same terms as the host bytecode cache
+(``orchestration_runtime._HOST_GATE_CACHE_PREFIX``). Like ``tools/content_digest.py`` this is
+stdlib-only, so the validator imports it without crossing its module boundary.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# Repo-relative root of the cache. Mirrored by orchestration_runtime._HOST_GATE_CACHE_PREFIX and
+# by the `.gate_cache` entry of validate_workspace_root.ALLOWED_WORKSPACE_TOP_LEVEL_DIRS.
+CACHE_DIR = "workspace/.gate_cache"
+SCHEMA_VERSION = 1
+MODES = ("on", "off", "check")
+
+_TOOLS_DIR = Path(__file__).resolve().parent
+_code_fingerprint: str | None = None
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def code_fingerprint() -> str:
+    """Digest over (path, size, mtime_ns) of the validator code. Computed once per process:
+    the validator is a short-lived CLI, and a stat-level key errs only towards a miss."""
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        rows: list[str] = []
+        for dirpath, dirnames, filenames in os.walk(_TOOLS_DIR):
+            dirnames[:] = sorted(d for d in dirnames if d not in ("tests", "__pycache__"))
+            for name in sorted(filenames):
+                if not name.endswith(".py"):
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                rel = path.relative_to(_TOOLS_DIR).as_posix()
+                rows.append(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}")
+        _code_fingerprint = _sha256("\n".join(rows).encode("utf-8"))
+    return _code_fingerprint
+
+
+def input_digest(path: Path) -> str:
+    """Digest of one declared input: a file's bytes, a directory's whole tree (relative
+    names, file bytes and symlink targets, without following links), or ``absent``."""
+    try:
+        if path.is_symlink():
+            return "symlink:" + os.readlink(path)
+        if path.is_file():
+            return "file:" + _sha256(path.read_bytes())
+        if not path.is_dir():
+            return "absent"
+        rows: list[str] = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            base = Path(dirpath)
+            for name in sorted(filenames) + [d for d in dirnames if (base / d).is_symlink()]:
+                entry = base / name
+                rel = entry.relative_to(path).as_posix()
+                if entry.is_symlink():
+                    rows.append(f"{rel}\0symlink:{os.readlink(entry)}")
+                else:
+                    rows.append(f"{rel}\0{_sha256(entry.read_bytes())}")
+        return "tree:" + _sha256("\n".join(rows).encode("utf-8"))
+    except OSError as exc:
+        # An input that cannot be read is keyed by the error, so the rule still runs and
+        # reports it, and nothing is replayed over it.
+        return f"unreadable:{exc.errno}"
+
+
+class RuleCache:
+    """One validator invocation's view of the cache. ``mismatches`` collects the
+    ``check``-mode disagreements for the caller to report."""
+
+    def __init__(
+        self,
+        repo_root: Path,
+        mode: str = "on",
+        *,
+        violation_types: dict[str, type[str]] | None = None,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"gate cache mode must be one of {MODES} (got {mode!r})")
+        self.repo_root = repo_root
+        self.mode = mode
+        self.root = repo_root / CACHE_DIR
+        # A symlinked cache root (or workspace/) could point into a leaf-writable tree, where a
+        # planted entry would replay a clean verdict. Refuse it rather than follow it.
+        if self.mode != "off" and any(
+                p.is_symlink() for p in (self.root, self.root.parent)):
+            self.mode = "off"
+        # `str` subclasses a caller branches on by TYPE (the validator's
+        # StaleDependencyIRViolation decides an exit code), restored on replay.
+        self._violation_types = dict(violation_types or {})
+        self.hits = 0
+        self.misses = 0
+        self.mismatches: list[str] = []
+
+    def _key(
+        self, rule_id: str, rule_version: int, params: dict[str, str],
+        inputs: Iterable[Path],
+    ) -> tuple[str, dict[str, str]]:
+        digests = {str(p): input_digest(p) for p in sorted(set(inputs), key=str)}
+        body = json.dumps(
+            {"schema": SCHEMA_VERSION, "rule": rule_id, "rule_version": rule_version,
+             "code": code_fingerprint(), "params": params, "inputs": digests},
+            sort_keys=True, separators=(",", ":"),
+        ).encode("utf-8")
+        return _sha256(body), digests
+
+    def _entry_path(self, rule_id: str, key: str) -> Path:
+        return self.root / rule_id / key[:2] / f"{key}.json"
+
+    def _encode(self, violations: list[str]) -> list[dict[str, str]]:
+        out = []
+        for v in violations:
+            kind = type(v).__name__
+            out.append({"text": str(v),
+                        "type": kind if kind in self._violation_types else "str"})
+        return out
+
+    def _decode(self, entry: Any) -> list[str] | None:
+        if not isinstance(entry, dict) or entry.get("schema_version") != SCHEMA_VERSION:
+            return None
+        rows = entry.get("violations")
+        if not isinstance(rows, list):
+            return None
+        out: list[str] = []
+        for row in rows:
+            if not isinstance(row, dict) or not isinstance(row.get("text"), str):
+                return None
+            kind = row.get("type")
+            if kind == "str":
+                out.append(row["text"])
+            elif kind in self._violation_types:
+                out.append(self._violation_types[kind](row["text"]))
+            else:
+                return None
+        return out
+
+    def _load(self, path: Path) -> list[str] | None:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return self._decode(entry)
+
+    def _store(self, path: Path, rule_id: str, rule_version: int,
+               digests: dict[str, str], violations: list[str]) -> None:
+        self._write(path, json.dumps(
+            {"schema_version": SCHEMA_VERSION, "rule": rule_id, "rule_version": rule_version,
+             "inputs": digests, "violations": self._encode(violations)},
+            ensure_ascii=False, indent=1, sort_keys=True,
+        ) + "\n")
+
+    def _write(self, path: Path, body: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                    stream.write(body)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # Best effort: a read-only checkout (a confined leaf) or a full disk costs only
+            # the memo, never the verdict.
+            pass
+
+    def run(
+        self,
+        rule_id: str,
+        rule_version: int,
+        *,
+        params: dict[str, str],
+        inputs: Iterable[Path],
+        compute: Callable[[list[str]], Any],
+    ) -> list[str]:
+        """The violations `compute` appends to the list it is given, replayed from the cache
+        when every declared input is unchanged. An exception from `compute` propagates and
+        nothing is stored."""
+        if self.mode == "off":
+            fresh: list[str] = []
+            compute(fresh)
+            return fresh
+        key, digests = self._key(rule_id, rule_version, params, inputs)
+        path = self._entry_path(rule_id, key)
+        cached = self._load(path)
+        if cached is not None and self.mode == "on":
+            self.hits += 1
+            return cached
+        self.misses += 1
+        fresh = []
+        compute(fresh)
+        if cached is not None and self._encode(cached) != self._encode(fresh):
+            self.mismatches.append(
+                f"{rule_id} v{rule_version} {params}: cached {len(cached)} violation(s) "
+                f"differ from {len(fresh)} recomputed (entry {path})")
+        self._store(path, rule_id, rule_version, digests, fresh)
+        return fresh
+
+    def memo(
+        self,
+        kind: str,
+        version: int,
+        text: str,
+        *,
+        compute: Callable[[str], Any],
+        encode: Callable[[Any], Any],
+        decode: Callable[[str, Any], Any],
+        extra: str = "",
+    ) -> Any:
+        """``compute(text)`` for a pure function of one text, replayed across processes.
+
+        The rule cache's sibling for values rather than violation lists: the validator's parsed
+        source views are functions of a source's bytes alone, so the key is the digest of
+        `text` (plus `kind`, `version`, the code fingerprint and `extra`, e.g. a parser version)
+        and nothing has to be declared. Entries live under ``_memo/<kind>/``; `encode` must
+        return JSON, and `decode(text, doc)` rebuilds the value (raising on a malformed entry,
+        which then counts as a miss). The modes are those of `run`."""
+        if self.mode == "off":
+            return compute(text)
+        body = json.dumps(
+            {"schema": SCHEMA_VERSION, "kind": kind, "version": version,
+             "code": code_fingerprint(), "extra": extra,
+             "text": _sha256(text.encode("utf-8", "surrogatepass"))},
+            sort_keys=True, separators=(",", ":"),
+        ).encode("utf-8")
+        key = _sha256(body)
+        path = self.root / "_memo" / kind / key[:2] / f"{key}.json"
+        cached: Any = None
+        found = False
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(entry, dict) and entry.get("schema_version") == SCHEMA_VERSION:
+                cached = decode(text, entry["value"])
+                found = True
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if found and self.mode == "on":
+            self.hits += 1
+            return cached
+        self.misses += 1
+        value = compute(text)
+        encoded = encode(value)
+        if found and encode(cached) != encoded:
+            self.mismatches.append(
+                f"_memo/{kind} v{version}: cached value differs from the recomputed one "
+                f"(entry {path})")
+        self._write(path, json.dumps(
+            {"schema_version": SCHEMA_VERSION, "kind": kind, "version": version,
+             "value": encoded},
+            separators=(",", ":"),
+        ) + "\n")
+        return value
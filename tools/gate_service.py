@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Resident execution of the `run-gate` validator scripts.
+
+`orchestration_runtime.run_gate` translates a leaf's `args_json` into an argv
+(`_gate_script_command`) and, by default, runs it as a fresh
+`sys.executable tools/<gate>.py ...` per gate. For `validate_pipeline_semantics` that
+is an interpreter start plus a cold import of a 14k-line validator, PyYAML and, where
+reached, the tree-sitter front end — usually far more than the rules themselves cost.
+
+`METDSL_GATE_MODE=resident` keeps the argv and drops the import. A worker process
+(`python3 tools/gate_service.py serve`) imports every gate script's module when it
+starts, then runs `main(argv)` of the requested one per call over the same line-delimited
+JSON pipe as `tools/runtime_service.py`, with the same per-call reset of environment,
+working directory and stdio (`runtime_service._dispatch`). The caller gets the
+`subprocess.CompletedProcess` the script would have produced, so violation extraction
+and the persisted gate document do not change.
+
+Isolation is that of the subprocess mode: the gate runs in a separate process started
+with the gate environment (`_gate_python_env`: no bytecode in the repository), never in
+the runtime's own interpreter. `prestart` lets `run_gate` start the worker before its
+permission checks, so the import overlaps them even for a one-shot CLI call; a
+long-lived caller reuses the warm worker for later gates. The worker is recycled after
+`RESIDENT_MAX_GATES` gates so process-level memo (the validator's code fingerprint, the
+schema pattern cache) cannot outlive a short run of edits, and a worker that dies
+mid-gate fails that gate and is replaced on the next one. `subprocess` stays the default.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Mapping, Sequence
+
+GATE_MODE_ENV = "METDSL_GATE_MODE"
+GATE_MODE_SUBPROCESS = "subprocess"
+GATE_MODE_RESIDENT = "resident"
+GATE_MODES = (GATE_MODE_SUBPROCESS, GATE_MODE_RESIDENT)
+SERVICE_SCRIPT = "tools/gate_service.py"
+# Script file name -> module whose `main(argv)` it runs. The keys are the scripts
+# `_gate_script_command` resolves, so a gate the runtime adds without a module here is
+# refused by the worker instead of silently run some other way.
+GATE_MODULES = {
+    "validate_pipeline_semantics.py": "tools.validate_pipeline_semantics",
+    "check_artifact_syntax.py": "tools.check_artifact_syntax",
+    "validate_workspace_root.py": "tools.validate_workspace_root",
+}
+# Gates one worker serves before it is replaced: a node's gate calls share one import,
+# and an edited validator is picked up within a few dozen gates at most.
+RESIDENT_MAX_GATES = 32
+
+
+def gate_mode(env: Mapping[str, str]) -> str:
+    """The gate execution mode named by `env`; unset means `subprocess`. An unknown value
+    is an error, as for `runtime_service.runtime_mode`."""
+    value = str(env.get(GATE_MODE_ENV) or "").strip().lower()
+    if not value:
+        return GATE_MODE_SUBPROCESS
+    if value not in GATE_MODES:
+        raise ValueError(f"{GATE_MODE_ENV}={value!r} is not one of {', '.join(GATE_MODES)}")
+    return value
+
+
+class ResidentGateWorker:
+    """One warm `gate_service.py serve` worker for one repository root."""
+
+    def __init__(self, repo_root: Path, env: Mapping[str, str]) -> None:
+        self.repo_root = Path(repo_root)
+        self.env = dict(env)
+        self.gates = 0
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve"],
+            cwd=self.repo_root, env=self.env, text=True,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def call(self, cmd: Sequence[str], *, env: Mapping[str, str]) -> subprocess.CompletedProcess[str]:
+        script = Path(cmd[1]).name
+        request = {"script": script, "argv": list(cmd[2:]), "env": dict(env),
+                   "cwd": str(self.repo_root)}
+        with self._lock:
+            self.gates += 1
+            assert self._proc.stdin is not None and self._proc.stdout is not None
+            try:
+                self._proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (BrokenPipeError, OSError):
+                line = ""
+            if not line:
+                self.close()
+                return subprocess.CompletedProcess(
+                    list(cmd), 1, "", "resident gate worker exited before replying")
+            reply = json.loads(line)
+        return subprocess.CompletedProcess(
+            list(cmd), int(reply["returncode"]), str(reply["stdout"]), str(reply["stderr"]))
+
+    def close(self) -> None:
+        proc = self._proc
+        if proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def release(self) -> None:
+        """Forget this worker in a forked child without talking to it: the child's copies
+        of the pipe ends are pointed at /dev/null, so it neither joins the parent's
+        conversation nor holds the worker's stdin open once the parent closes it."""
+        devnull = os.open(os.devnull, os.O_RDWR)
+        try:
+            for stream in (self._proc.stdin, self._proc.stdout):
+                if stream is not None:
+                    with contextlib.suppress(OSError, ValueError):
+                        os.dup2(devnull, stream.fileno())
+        finally:
+            os.close(devnull)
+
+
+_WORKERS: dict[Path, ResidentGateWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def _resident_worker(repo_root: Path, env: Mapping[str, str]) -> ResidentGateWorker:
+    key = Path(repo_root).resolve()
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is not None and (
+                not worker.alive() or worker.gates >= RESIDENT_MAX_GATES
+                or worker.env != dict(env)):
+            # A changed gate environment (a different bytecode redirect, say) must not be
+            # served by a worker that imported under the old one.
+            worker.close()
+            worker = None
+        if worker is None:
+            worker = ResidentGateWorker(key, env)
+            _WORKERS[key] = worker
+        return worker
+
+
+def shutdown_resident_workers() -> None:
+    """Stop every resident gate worker this process started (also run at exit)."""
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_resident_workers)
+
+
+def _forget_inherited_workers() -> None:
+    """After fork, in the child: drop the parent's gate workers, as
+    `runtime_service._forget_inherited_workers` does."""
+    global _WORKERS_LOCK
+    _WORKERS_LOCK = threading.Lock()
+    for worker in _WORKERS.values():
+        worker.release()
+    _WORKERS.clear()
+
+
+os.register_at_fork(after_in_child=_forget_inherited_workers)
+
+
+def prestart(repo_root: Path, env: Mapping[str, str]) -> None:
+    """Start (or keep) the resident worker for `repo_root` when `env` selects it, so its
+    imports run while the caller does other work. A no-op in the subprocess mode."""
+    if gate_mode(env) == GATE_MODE_RESIDENT:
+        _resident_worker(repo_root, env)
+
+
+def run_gate_command(
+    repo_root: Path, env: Mapping[str, str], cmd: Sequence[str]
+) -> subprocess.CompletedProcess[str]:
+    """Run one `_gate_script_command` argv in the mode `env` selects; the result is what
+    `subprocess.run(cmd, cwd=repo_root, env=env, capture_output=True, text=True)`
+    returns."""
+    if gate_mode(env) == GATE_MODE_RESIDENT:
+        return _resident_worker(repo_root, env).call(cmd, env=env)
+    return subprocess.run(
+        list(cmd), cwd=str(repo_root), env=dict(env), text=True, capture_output=True,
+        check=False,
+    )
+
+
+def serve() -> int:
+    """Worker loop. Imports every gate module up front (the point of the worker), then
+    answers one JSON request per stdin line with one JSON reply per stdout line; the
+    pipes are moved off fd 0/1 first, as in `runtime_service.serve`."""
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.dup2(2, 1)
+    repo_root = Path(__file__).resolve().parent.parent
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from tools.runtime_service import _dispatch
+
+    mains = {script: importlib.import_module(module).main
+             for script, module in GATE_MODULES.items()}
+    for line in requests:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        script = str(request.get("script") or "")
+        if script not in mains:
+            reply = {"returncode": 2, "stdout": "",
+                     "stderr": f"gate_service: no resident gate for script {script!r}"}
+        else:
+            reply = _dispatch(mains[script], request, script=f"tools/{script}")
+        replies.write(json.dumps(reply, ensure_ascii=False) + "\n")
+        replies.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["serve"]:
+        print(f"usage: python3 {SERVICE_SCRIPT} serve", file=sys.stderr)
+        raise SystemExit(2)
+    raise SystemExit(serve())
@@ -14,6 +14,7 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from tools import op_timing
 from tools.hooks.adapters import ClaudeHookAdapter, CodexHookAdapter
 from tools.hooks.codex_feature import read_codex_feature_cache
 from tools.hooks.common import (
@@ -30,12 +31,14 @@ from tools.hooks.common import (
     _strip_quoted_strings,
     _utc_now_iso,
     append_hook_access_log,
+    append_hook_log_line,
     _braces_to_glob,
     BRACE_EXPAND_MAX_RESULTS,
     check_cli_managed_path,
     evaluate_common_policy,
     expand_bash_braces,
     extract_bash_read_targets,
+    load_policy_json,
     normalize_hook_event_name,
     READ_HINT,
     WRITE_HINT,
@@ -297,8 +300,7 @@ def _append_hook_audit(
         entry["payload_summary"] = payload_summary
     if decision.audit_detail is not None:
         entry["audit_detail"] = _sanitize_audit_detail(decision.audit_detail)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    append_hook_log_line(path, json.dumps(entry, ensure_ascii=False) + "\n")
 
 
 def _resolve_repo_root(payload: dict[str, Any], backend: str = "") -> Path:
@@ -914,7 +916,7 @@ def _get_agent_role_from_capability(
     )
     if cap_path.is_file():
         try:
-            doc = json.loads(cap_path.read_text(encoding="utf-8"))
+            doc = load_policy_json(cap_path)
         except (OSError, json.JSONDecodeError):
             doc = None
         if isinstance(doc, dict):
@@ -944,7 +946,7 @@ def _is_pure_readonly_capability(
         / "capabilities" / f"{agent_run_id}.json"
     )
     try:
-        doc = json.loads(cap_path.read_text(encoding="utf-8"))
+        doc = load_policy_json(cap_path)
     except (OSError, json.JSONDecodeError):
         return False
     return isinstance(doc, dict) and str(doc.get("mode") or "").strip() == "pure_readonly"
@@ -1725,6 +1727,12 @@ def _emit_hook_response(
 
 
 def main(argv: list[str] | None = None) -> int:
+    with op_timing.operation("hook") as timer:
+        timer.exit = _main(argv)
+        return timer.exit
+
+
+def _main(argv: list[str] | None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--backend", required=True, choices=["codex", "claude"])
     parser.add_argument("--event")
@@ -1751,6 +1759,10 @@ def main(argv: list[str] | None = None) -> int:
             return _emit_hook_response(exit_code, stdout_text, event_name=event_name)
 
         repo_root = _resolve_repo_root(payload, backend=args.backend)
+        tool_name = _payload_value(payload, "tool_name")
+        op_timing.bind(op=event_name.value, repo_root=repo_root,
+                       orchestration_id=orchestration_id,
+                       tool=tool_name if isinstance(tool_name, str) else None)
 
         if args.backend == "codex":
             require_flag = os.environ.get("METDSL_REQUIRE_CODEX_HOOKS_FEATURE", "1").strip().lower()
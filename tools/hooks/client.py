@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Hook entrypoint shim: forward to a warm hook server, else run the policy CLI cold.
+
+Every leaf tool call runs the hook wrapper, and the wrapper used to import the whole
+policy (`tools/hooks/cli.py` + `tools/hooks/common.py`) from scratch before deciding
+anything. This module is what the wrapper invokes now, and it imports nothing of the
+policy itself: when the conductor started a per-orchestration hook server
+(`tools/hooks/server.py`, opt-in with `METDSL_HOOK_SERVER=1`), the leaf's environment
+carries its socket path in `METDSL_HOOK_SERVER_SOCKET`, and the shim sends the hook's
+argv, stdin payload and environment there and replays the server's exit code, stdout and
+stderr verbatim.
+
+Anything short of a well-formed reply — no socket variable, no socket, a refused or
+timed-out connection, a server that declines the request — runs
+`tools.hooks.cli.main` in this process on the same argv and payload. That is exactly
+the pre-server path, so the server can only ever make a decision faster, never make a
+different one, and its absence fails closed to the policy the cold CLI enforces.
+
+Kept deliberately free of any import beyond the standard library's socket/json layer:
+its whole purpose is the import it does not do.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+HOOK_SERVER_ENV = "METDSL_HOOK_SERVER"
+HOOK_SERVER_SOCKET_ENV = "METDSL_HOOK_SERVER_SOCKET"
+# Connecting is local and immediate when the server is up; a slow connect means it is
+# not, and the cold path is cheaper than waiting.
+CONNECT_TIMEOUT_SECONDS = 0.5
+# An evaluation on the warm server is milliseconds; this bounds a wedged server, after
+# which the call is re-evaluated cold rather than left hanging on the leaf's tool call.
+REPLY_TIMEOUT_SECONDS = 30.0
+_REPLY_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _recv_line(sock: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    size = 0
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if b"\n" in chunk or size > _REPLY_MAX_BYTES:
+            break
+    return b"".join(chunks)
+
+
+def _ask_server(socket_path: str, argv: list[str], raw: str) -> dict[str, Any] | None:
+    """The server's reply for this call, or None when the cold path must decide."""
+    request = {"argv": argv, "stdin": raw, "env": dict(os.environ), "cwd": os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            sock.connect(socket_path)
+            sock.settimeout(REPLY_TIMEOUT_SECONDS)
+            sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            line = _recv_line(sock)
+    except (OSError, ValueError):
+        return None
+    try:
+        reply = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(reply, dict)
+        or reply.get("fallback")
+        or not isinstance(reply.get("returncode"), int)
+        or not isinstance(reply.get("stdout"), str)
+        or not isinstance(reply.get("stderr"), str)
+    ):
+        return None
+    return reply
+
+
+def _run_cold(argv: list[str], raw: str) -> int:
+    from tools.hooks.cli import main as cli_main
+
+    sys.stdin = io.StringIO(raw)
+    return cli_main(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    # `--input-json` carries the payload on the argv; stdin is then never read by the
+    # CLI and must not be consumed here either.
+    raw = "" if "--input-json" in args else sys.stdin.read()
+    socket_path = os.environ.get(HOOK_SERVER_SOCKET_ENV, "").strip()
+    if socket_path:
+        reply = _ask_server(socket_path, args, raw)
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            return reply["returncode"]
+    return _run_cold(args, raw)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
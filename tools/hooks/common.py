@@ -12,10 +12,13 @@ import json
 import os
 import re
 import shlex
+import stat
 import time
 from pathlib import Path
 from typing import Any, Callable, Protocol, Sequence
 
+from tools import lazy_re, op_timing
+
 # fcntl is POSIX-only.  On Windows we fall through to fail-closed when the
 # auto-read seen-set needs an exclusive lock — there is no portable
 # equivalent, and Claude Code on Windows has no direct call sites for the
@@ -427,14 +430,14 @@ _BASH_LEADING_SYNTAX_TOKENS: frozenset[str] = frozenset({
 # Output redirections (`> f`, `2>> f`, `&> f`, `>& f`) — their operand is a
 # WRITE target and must never be reported as a read.  `<` is deliberately not
 # here: its operand really is read.
-_BASH_REDIRECT_OUT_EXACT_RE = re.compile(r"^\d*(?:>>|>&|&>|>)$")
-_BASH_REDIRECT_OUT_GLUED_RE = re.compile(r"^\d*(?:>>|>&|&>|>).+$")
+_BASH_REDIRECT_OUT_EXACT_RE = lazy_re.compile(r"^\d*(?:>>|>&|&>|>)$")
+_BASH_REDIRECT_OUT_GLUED_RE = lazy_re.compile(r"^\d*(?:>>|>&|&>|>).+$")
 
 # `<<[-]DELIM` / `<<[-]'DELIM'` — the body that follows is DATA, not commands.
 # `(?<!<)` excludes a `<<<` here-string, whose operand is a word on the SAME
 # line and which has no body to blank. A quoted delimiter may be any word
 # (`'PY-END'`, `'1EOF'`), so the charset is only constrained for the bare form.
-_BASH_HEREDOC_RE = re.compile(
+_BASH_HEREDOC_RE = lazy_re.compile(
     r"(?<!<)<<(?P<dash>-?)\s*"
     r"(?:'(?P<sq>[^']*)'|\"(?P<dq>[^\"]*)\"|\\?(?P<bare>[A-Za-z_][A-Za-z0-9_]*))"
 )
@@ -545,25 +548,25 @@ _GREP_RECURSIVE_LONG_FLAGS: frozenset[str] = frozenset({
 
 # Shell separators that end one command fragment.  `&&`/`||` must precede the
 # single-character forms in the alternation.
-_BASH_FRAGMENT_SEPARATOR_RE = re.compile(r"\|\||&&|;|&|\||\n")
+_BASH_FRAGMENT_SEPARATOR_RE = lazy_re.compile(r"\|\||&&|;|&|\||\n")
 
 # fd-duplication redirects (`2>&1`, `>&2`). Their `&` is NOT a separator: it
 # split `cat 2>&1 file` into a reader with no operand plus an operand with no
 # reader, so the read vanished. The RHS digits must be the whole token — bash
 # treats `n>&word` as a dup only when `word` is all digits.
-_BASH_FD_DUP_RE = re.compile(r"\d*>&\d+(?![\w./-])")
+_BASH_FD_DUP_RE = lazy_re.compile(r"\d*>&\d+(?![\w./-])")
 # A backslash-escaped separator is a literal character, not a separator.
-_BASH_ESCAPED_SEPARATOR_RE = re.compile(r"\\[&|;]")
+_BASH_ESCAPED_SEPARATOR_RE = lazy_re.compile(r"\\[&|;]")
 
 # ANSI-C (`$'…'`) and locale (`$"…"`) quoting at a word start. Both are purely
 # LEXICAL — bash reads the literal inside — but shlex turns them into a bare
 # `$word`, indistinguishable from a `$VAR` expansion, so the residue filter
 # dropped them and `cat $'secret/s.md'` reached the auto-approve. Stripping
 # the `$` before tokenizing keeps the distinction.
-_ANSI_C_QUOTE_PREFIX_RE = re.compile(r"(?<![\w$])\$(?=['\"])")
+_ANSI_C_QUOTE_PREFIX_RE = lazy_re.compile(r"(?<![\w$])\$(?=['\"])")
 
 # Leading `VAR=value` command prefix (`FOO=1 cat x`).
-_BASH_ASSIGNMENT_PREFIX_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+_BASH_ASSIGNMENT_PREFIX_RE = lazy_re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
 
 
 # Short options whose VALUE is glued to the rest of the cluster (`-eerror`,
@@ -1821,26 +1824,26 @@ def _protected_root_marker_regex(root: Path) -> re.Pattern[str]:
 # `${NAME…}` / `${!NAME…}` — a parameter expansion with any operator body. The
 # `[^}]*` tail is deliberately opaque: this guard only needs to know the
 # expansion is of NAME.
-_PARAM_EXPANSION_RE = re.compile(r"\$\{(!?)([A-Za-z_][A-Za-z0-9_]*)([^}]*)\}")
+_PARAM_EXPANSION_RE = lazy_re.compile(r"\$\{(!?)([A-Za-z_][A-Za-z0-9_]*)([^}]*)\}")
 # The word after a `:-` / `:=` / `:+` / `-` / `=` / `+` / `#` / `%` operator.
-_PARAM_EXPANSION_OPERATOR_RE = re.compile(r"^(?::?[-=+]|#{1,2}|%{1,2})(.*)$")
-_ASSIGNMENT_TOKEN_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
+_PARAM_EXPANSION_OPERATOR_RE = lazy_re.compile(r"^(?::?[-=+]|#{1,2}|%{1,2})(.*)$")
+_ASSIGNMENT_TOKEN_RE = lazy_re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
 # Any `$NAME` / `${NAME…}` reference, used to keep only the assignments that
 # something in the command actually reads.
-_VAR_REFERENCE_SCAN_RE = re.compile(r"\$\{?!?([A-Za-z_][A-Za-z0-9_]*)")
+_VAR_REFERENCE_SCAN_RE = lazy_re.compile(r"\$\{?!?([A-Za-z_][A-Za-z0-9_]*)")
 # `${NAME}` or `$NAME`, for one-pass substitution from a resolved value map.
 # A `$` that cannot begin a variable reference and is not a trailing regex
 # anchor — i.e. one left behind by a stripped `$'…'` / `$"…"` construct.
-_OBFUSCATING_DOLLAR_RE = re.compile(r"\$[^A-Za-z_{\s]")
-_SIMPLE_VAR_REFERENCE_RE = re.compile(
+_OBFUSCATING_DOLLAR_RE = lazy_re.compile(r"\$[^A-Za-z_{\s]")
+_SIMPLE_VAR_REFERENCE_RE = lazy_re.compile(
     r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)"
 )
 # `$'…'` — ANSI-C quoting. bash decodes the escapes inside, so `$'\057etc'` IS
 # `/etc`: a spelling in which no protected path appears literally anywhere.
-_ANSI_C_QUOTE_RE = re.compile(r"\$'((?:[^'\\]|\\.)*)'")
+_ANSI_C_QUOTE_RE = lazy_re.compile(r"\$'((?:[^'\\]|\\.)*)'")
 # `$"…"` — locale translation. With no catalogue it is the string itself, so it
 # is pure obfuscation: `~/$".claude.json"` is `~/.claude.json`.
-_LOCALE_QUOTE_RE = re.compile(r'\$"((?:[^"\\]|\\.)*)"')
+_LOCALE_QUOTE_RE = lazy_re.compile(r'\$"((?:[^"\\]|\\.)*)"')
 _ANSI_C_SIMPLE_ESCAPES = {
     "a": "\a", "b": "\b", "e": "\x1b", "E": "\x1b", "f": "\f", "n": "\n",
     "r": "\r", "t": "\t", "v": "\v", "\\": "\\", "'": "'", '"': '"', "?": "?",
@@ -1884,17 +1887,17 @@ _CD_OPTION_TOKENS = frozenset({"--", "-L", "-P", "-e", "-@", "-LP", "-PL", "-n"}
 # deleted the NEXT token (the real read target) from the ancestor rule.
 # `${NAME/pat/rep}` / `${NAME//pat/rep}` / `${NAME/#pat/rep}` / `${NAME/%pat/rep}`
 # — pattern substitution; the pattern may carry a backslash-escaped `/`.
-_PARAM_PATTERN_SUB_RE = re.compile(r"^(//|/#|/%|/)((?:\\.|[^/])*)(?:/(.*))?$")
+_PARAM_PATTERN_SUB_RE = lazy_re.compile(r"^(//|/#|/%|/)((?:\\.|[^/])*)(?:/(.*))?$")
 # `${NAME^^}` / `${NAME,,}` / `${NAME^}` / `${NAME,}`, with an optional glob
 # selecting which characters convert.
-_PARAM_CASE_RE = re.compile(r"^(\^\^|,,|\^|,)(.*)$")
+_PARAM_CASE_RE = lazy_re.compile(r"^(\^\^|,,|\^|,)(.*)$")
 # `${NAME#pfx}` / `${NAME##pfx}` / `${NAME%sfx}` / `${NAME%%sfx}` — affix strip.
-_PARAM_AFFIX_RE = re.compile(r"^(#{1,2}|%{1,2})(.*)$")
+_PARAM_AFFIX_RE = lazy_re.compile(r"^(#{1,2}|%{1,2})(.*)$")
 # `${NAME:off}` / `${NAME:off:len}` — substring. The negative lookahead keeps the
 # alternate-word operators (`:-`, `:+`, `:=`, `:?`) out; bash needs a space
 # before a negative offset. The offset is an arithmetic expression.
-_PARAM_SUBSTRING_RE = re.compile(r"^:(?![-+=?])([\d +-]*?)(?::([\d +-]+))?$")
-_ARITH_TERM_RE = re.compile(r"([+-]?)\s*(\d+)")
+_PARAM_SUBSTRING_RE = lazy_re.compile(r"^:(?![-+=?])([\d +-]*?)(?::([\d +-]+))?$")
+_ARITH_TERM_RE = lazy_re.compile(r"([+-]?)\s*(\d+)")
 _SHELL_SEPARATOR_TOKENS = frozenset({"&&", "||", ";", "|", "&"})
 _SHELL_SEPARATOR_CHARS = ";|&"
 _DIRECTORY_OPTION_TOKENS = frozenset({"-C", "--directory", "--cd", "--chdir"})
@@ -4222,48 +4225,48 @@ class _CliManagedPath:
 
 _CLI_MANAGED_PATHS: list[_CliManagedPath] = [
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/launches/[^/]+\.(?:response\.json|reply\.txt|prompt\.txt|request\.json)$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/launches/[^/]+\.(?:response\.json|reply\.txt|prompt\.txt|request\.json)$"),
         "python3 tools/orchestration_runtime.py record-launch ...",
     ),
     # Separate entry, not a widening of the one above: no subcommand produces these. The
     # conductor writes them itself, BEFORE the call, as the evidence of what it sent — so
     # "re-run record-launch" would be the wrong remedy to print.
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/launches/[^/]+\.(?:request|agent_run)\.input\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/launches/[^/]+\.(?:request|agent_run)\.input\.json$"),
         "nothing — these are the payload files the conductor writes for itself before "
         "record-launch / finalize-child, kept as the evidence of what was sent. "
         "They are never authored or edited by an agent",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/agent_runs\.jsonl$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/agent_runs\.jsonl$"),
         "python3 tools/orchestration_runtime.py record-agent-run ...",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/step_results/[^/]+\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/step_results/[^/]+\.json$"),
         "python3 tools/orchestration_runtime.py write-step-result ...",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/orchestration_meta\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/orchestration_meta\.json$"),
         "python3 tools/orchestration_runtime.py init-orchestration / run_workflow.py (auto-generated)",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/(?:output|read)_manifests/[^/]+\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/(?:output|read)_manifests/[^/]+\.json$"),
         "python3 tools/orchestration_runtime.py record-launch (manifests are auto-generated)",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/preflight\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/preflight\.json$"),
         "python3 tools/run_workflow.py ... (preflight is auto-generated)",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/capabilities/[^/]+\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/capabilities/[^/]+\.json$"),
         "python3 tools/orchestration_runtime.py record-launch (capability is auto-generated)",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/orchestration_checkpoint\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/orchestration_checkpoint\.json$"),
         "python3 tools/orchestration_runtime.py write-step-result (checkpoint is auto-updated)",
     ),
     _CliManagedPath(
-        re.compile(r"workspace/orchestrations/[^/]+/phase_state\.json$"),
+        lazy_re.compile(r"workspace/orchestrations/[^/]+/phase_state\.json$"),
         "python3 tools/orchestration_runtime.py (phase_state is managed by the runtime)",
     ),
 ]
@@ -4309,6 +4312,40 @@ def _detect_tmpdir_fallback_or_hardcode(bash_command: str | None) -> bool:
     return False
 
 
+# Parsed policy documents keyed by path, each stored with the stat identity it was
+# parsed at. Only a warm process (`tools/hooks/server.py`) ever gets a second lookup; a
+# cold hook pays one stat for nothing.
+_POLICY_JSON_CACHE: dict[str, tuple[tuple[int, int, int, int, int], Any]] = {}
+_POLICY_JSON_CACHE_MAX = 512
+
+
+def load_policy_json(path: Path) -> Any:
+    """`json.loads(path.read_text())`, memoized on the file's stat identity.
+
+    Raises exactly what the uncached read raises (OSError, json.JSONDecodeError). The
+    identity is (device, inode, size, mtime_ns, ctime_ns): the runtime replaces these
+    documents by atomic rename, which always yields a new inode, and an in-place rewrite
+    moves ctime — so a document that changed is re-parsed, and the memo only ever saves
+    the parse of one that did not. Callers get a deep copy and may mutate it.
+    """
+    import copy
+
+    key = str(path)
+    with op_timing.phase("io"):
+        st = os.stat(path)
+    identity = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    cached = _POLICY_JSON_CACHE.get(key)
+    if cached is not None and cached[0] == identity:
+        return copy.deepcopy(cached[1])
+    with op_timing.phase("io"):
+        text = Path(path).read_text(encoding="utf-8")
+    loaded = json.loads(text)
+    if len(_POLICY_JSON_CACHE) >= _POLICY_JSON_CACHE_MAX:
+        _POLICY_JSON_CACHE.clear()
+    _POLICY_JSON_CACHE[key] = (identity, loaded)
+    return copy.deepcopy(loaded)
+
+
 def validate_write_access(
     repo_root: Path,
     orchestration_id: str,
@@ -4336,7 +4373,7 @@ def validate_write_access(
             continue_processing=False,
         )
     try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = load_policy_json(manifest_path)
     except (OSError, json.JSONDecodeError):
         return HookDecision(
             action=HookDecisionAction.BLOCK,
@@ -4920,10 +4957,14 @@ def _record_and_check_first_auto_read(
     try:
         # O_RDWR | O_CREAT — open existing or create empty; flock then
         # truncate-and-write the updated set under exclusive lock.
-        fd = os.open(str(state_path), os.O_RDWR | os.O_CREAT, 0o644)
+        # O_NOFOLLOW: `audit/` is leaf-writable, and the warm hook server runs this on
+        # the host, where a planted symlink would be truncated and rewritten.
+        fd = os.open(str(state_path), os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o644)
     except OSError:
         return False  # fail-closed: cannot acquire state file
     try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return False  # fail-closed: not a state file this hook wrote
         # Acquire the exclusive lock with a bounded retry — a stuck holder
         # (zombie sibling, NFS lock-server hiccup, debugger-paused process)
         # would otherwise hang every subsequent Read hook on this
@@ -5030,7 +5071,7 @@ def _load_read_manifest_allowed_roots(
             continue_processing=False,
         )
     try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = load_policy_json(manifest_path)
     except (OSError, json.JSONDecodeError):
         return None, HookDecision(
             action=HookDecisionAction.BLOCK,
@@ -5074,6 +5115,26 @@ def _read_target_in_allowed_roots(
     return False
 
 
+def append_hook_log_line(path: Path, line: str) -> None:
+    """Append `line` to a hook-side log at `path`, refusing a symlink or non-regular file.
+
+    These logs sit in leaf-writable directories (`hooks/`, the per-arid `access_logs/`
+    file). Inside the leaf's sandbox a planted symlink could reach nothing the leaf
+    cannot write itself, but the warm hook server (tools/hooks/server.py) evaluates on
+    the host, where following it would append wherever the leaf pointed. `O_NOFOLLOW`
+    refuses the link itself, `S_ISREG` a FIFO or device left in its place; either is
+    raised as OSError, as a plain `open("a")` failure was.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_NOFOLLOW | os.O_NONBLOCK,
+                 0o644)
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            raise OSError(f"hook log is not a regular file: {path}")
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
 def append_hook_access_log(
     repo_root: Path,
     orchestration_id: str,
@@ -5110,8 +5171,7 @@ def append_hook_access_log(
             / "access_logs"
             / f"{agent_run_id}.jsonl"
         )
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        append_hook_log_line(log_path, json.dumps(entry, ensure_ascii=False) + "\n")
     except OSError:
         pass
 
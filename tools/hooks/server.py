@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""Warm per-orchestration hook server behind the `tools.hooks.client` shim.
+
+A busy generate leaf makes hundreds of tool calls and every one of them runs the hook
+wrapper, whose cost used to be dominated by a cold import of the policy modules. With
+`METDSL_HOOK_SERVER=1` in the driver's environment the conductor starts ONE server per
+orchestration (`python3 -m tools.hooks.server serve`), which imports the policy once and
+answers the shim over a Unix socket at the orchestration-dir root
+(`workspace/orchestrations/<oid>/hook_server.sock`). The leaf's environment names the
+socket in `METDSL_HOOK_SERVER_SOCKET`.
+
+Each request is evaluated by `tools.hooks.cli.main` itself, with the caller's argv,
+payload, environment and working directory installed for the call, so the reply is the
+`HookDecision` encoding the cold CLI would have produced for the same input. Requests are
+served one at a time: the CLI reads `os.environ`, and two evaluations must never see each
+other's.
+
+Why the socket lives where it does: the orchestration-dir ROOT is read-only inside the
+leaf's bwrap sandbox (the same property `codex_feature_check.json` relies on), whereas
+`hooks/` and `audit/` are leaf-writable. A socket in a writable directory could be
+unlinked and re-bound by the leaf, which would then answer its own hooks.
+
+What the server refuses, so that running on the host cannot widen what a hook may touch:
+a request whose repository root or orchestration id is not the one it was started for, or
+whose `METDSL_CHILD_AGENT_RUN_ID` is not the leaf the connecting process belongs to, is
+declined with `{"fallback": ...}`, and the shim evaluates it cold, inside the caller's own
+sandbox. The conductor registers each launch's agent_run_id over the server's stdin — a
+pipe only the conductor holds — before the leaf starts, and binds it to the pid it spawned
+right after. The claimed id is then checked against the connection itself, never the
+environment the request carries: the `SO_PEERCRED` pid of the caller must descend from
+the launch that id is bound to (`peer_lineage`). The hook-side logs the CLI appends
+to live in leaf-writable directories, so they are opened without following a symlink
+(`common.append_hook_log_line`). Policy documents (read/output manifests, capabilities) are re-read on every call
+through `common.load_policy_json`, whose stat-keyed memo only saves the parse — a document
+the runtime rewrites is seen on the next call, exactly as by a fresh process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Collection, Mapping
+
+from tools.hooks.client import HOOK_SERVER_ENV, HOOK_SERVER_SOCKET_ENV
+
+HOOK_SERVER_SOCKET_NAME = "hook_server.sock"
+# sockaddr_un.sun_path is 108 bytes including the terminating NUL.
+UNIX_SOCKET_PATH_MAX = 107
+# How long the conductor waits for a freshly started server to bind its socket before
+# launching the leaf without it (the cold path then decides every call).
+SERVER_START_TIMEOUT_SECONDS = 10.0
+# A connection that has not delivered its request by then is dropped; the shim that
+# opened it (if it was one) falls back to the cold path.
+REQUEST_READ_TIMEOUT_SECONDS = 5.0
+_REQUEST_MAX_BYTES = 16 * 1024 * 1024
+# The checkout this module is imported from; the server child imports the policy from it.
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def hook_server_enabled(env: Mapping[str, str]) -> bool:
+    """Whether `env` opts this orchestration into a warm hook server."""
+    return str(env.get(HOOK_SERVER_ENV) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def hook_server_socket_path(repo_root: Path, orchestration_id: str) -> Path:
+    return (
+        Path(repo_root) / "workspace" / "orchestrations" / orchestration_id
+        / HOOK_SERVER_SOCKET_NAME
+    )
+
+
+def _argv_repo_root(argv: list[str]) -> str | None:
+    for index, token in enumerate(argv):
+        if token == "--repo-root" and index + 1 < len(argv):
+            return argv[index + 1]
+        if token.startswith("--repo-root="):
+            return token.split("=", 1)[1]
+    return None
+
+
+def _argv_input_json(argv: list[str]) -> str | None:
+    for index, token in enumerate(argv):
+        if token == "--input-json" and index + 1 < len(argv):
+            return argv[index + 1]
+        if token.startswith("--input-json="):
+            return token.split("=", 1)[1]
+    return None
+
+
+def _same_root(raw: Any, repo_root: Path) -> bool:
+    if not isinstance(raw, str) or not raw.strip():
+        return True
+    try:
+        return Path(raw).resolve() == repo_root
+    except (OSError, RuntimeError, ValueError):
+        return False
+
+
+def _proc_parent_and_start(pid: int) -> tuple[int, str] | None:
+    """`(ppid, starttime)` from `/proc/<pid>/stat`, or None when it cannot be read.
+
+    The comm field may hold spaces and parentheses, so the fields are split after its
+    LAST `)`; starttime (field 22) is what tells a recycled pid from the process it was.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as fh:
+            raw = fh.read().decode("utf-8", "replace")
+        fields = raw.rsplit(")", 1)[1].split()
+        return int(fields[1]), fields[19]
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _proc_start(pid: int) -> str | None:
+    parent_and_start = _proc_parent_and_start(pid)
+    return parent_and_start[1] if parent_and_start is not None else None
+
+
+def peer_lineage(conn: socket.socket) -> frozenset[tuple[int, str]]:
+    """`(pid, starttime)` of the process on the other end of `conn` and of each of its
+    ancestors, from the kernel's `SO_PEERCRED` rather than anything the request says.
+
+    Empty when the credentials are unavailable or the peer runs as another user: such a
+    connection matches no launch. The pid is the one in this server's pid namespace, so
+    a leaf behind `bwrap --unshare-pid` still resolves to the host-side launch process.
+    """
+    try:
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    except (AttributeError, OSError):
+        return frozenset()
+    pid, uid, _gid = struct.unpack("3i", creds)
+    if pid <= 0 or uid != os.getuid():
+        return frozenset()
+    lineage: set[tuple[int, str]] = set()
+    while pid > 1 and len(lineage) < 256:
+        parent_and_start = _proc_parent_and_start(pid)
+        if parent_and_start is None:
+            break
+        lineage.add((pid, parent_and_start[1]))
+        pid = parent_and_start[0]
+    return frozenset(lineage)
+
+
+def out_of_scope_reason(
+    request: Mapping[str, Any], *, repo_root: Path, orchestration_id: str,
+    launches: Mapping[str, tuple[int, str] | None],
+    lineage: Collection[tuple[int, str]],
+) -> str | None:
+    """Why this server must not evaluate `request`, or None when it may.
+
+    Every spelling of the repository root and orchestration id the CLI could act on —
+    argv, environment, payload and the payload's nested `payload` — must name this
+    server's own; an absent spelling defers to the others, as it does in the CLI. The
+    caller's `METDSL_CHILD_AGENT_RUN_ID` names its `access_logs/` file and the scope it is
+    judged under, so it must be one of the `launches` the conductor registered, and the
+    `(pid, starttime)` that launch is bound to must be in the connecting process's
+    `lineage` — the caller is that launch or runs below it.
+    """
+    argv = [str(a) for a in request.get("argv") or []]
+    env = request.get("env") if isinstance(request.get("env"), dict) else {}
+    if str(env.get("METDSL_ORCHESTRATION_ID") or "").strip() != orchestration_id:
+        return "METDSL_ORCHESTRATION_ID is not this server's orchestration"
+    claimed = str(env.get("METDSL_CHILD_AGENT_RUN_ID") or "").strip()
+    if claimed not in launches:
+        return "METDSL_CHILD_AGENT_RUN_ID is not a launch this server was registered for"
+    if launches[claimed] not in lineage:
+        return "METDSL_CHILD_AGENT_RUN_ID is not the launch this connection comes from"
+    if not _same_root(env.get("METDSL_HOOK_REPO_ROOT"), repo_root):
+        return "METDSL_HOOK_REPO_ROOT is not this server's repository"
+    if not _same_root(_argv_repo_root(argv), repo_root):
+        return "--repo-root is not this server's repository"
+    raw = _argv_input_json(argv)
+    if raw is None:
+        raw = str(request.get("stdin") or "")
+    if raw.strip():
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            # The CLI reports a malformed payload itself; nothing in it can redirect.
+            return None
+        for layer in (payload, payload.get("payload") if isinstance(payload, dict) else None):
+            if not isinstance(layer, dict):
+                continue
+            oid = layer.get("orchestration_id")
+            if isinstance(oid, str) and oid.strip() and oid.strip() != orchestration_id:
+                return "payload orchestration_id is not this server's orchestration"
+            if not _same_root(layer.get("repo_root"), repo_root):
+                return "payload repo_root is not this server's repository"
+    return None
+
+
+def dispatch(cli_main: Any, request: Mapping[str, Any]) -> dict[str, Any]:
+    """Run one hook call through `cli_main` the way `python3 -m tools.hooks.cli` would."""
+    argv = [str(a) for a in request.get("argv") or []]
+    os.environ.clear()
+    os.environ.update({str(k): str(v) for k, v in (request.get("env") or {}).items()})
+    with contextlib.suppress(OSError):
+        os.chdir(str(request.get("cwd") or "."))
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv, saved_stdin = sys.argv, sys.stdin
+    sys.argv = ["tools.hooks.cli", *argv]
+    sys.stdin = io.StringIO(str(request.get("stdin") or ""))
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                code = cli_main(argv)
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    code = exc.code or 0
+                else:
+                    print(exc.code, file=sys.stderr)
+                    code = 1
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.argv, sys.stdin = saved_argv, saved_stdin
+    return {"returncode": int(code or 0), "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue()}
+
+
+class _HookRequestHandler(socketserver.StreamRequestHandler):
+    timeout = REQUEST_READ_TIMEOUT_SECONDS
+
+    def handle(self) -> None:
+        server: HookUnixServer = self.server  # type: ignore[assignment]
+        try:
+            line = self.rfile.readline(_REQUEST_MAX_BYTES)
+            request = json.loads(line.decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if not isinstance(request, dict):
+            return
+        reason = out_of_scope_reason(
+            request, repo_root=server.repo_root, orchestration_id=server.orchestration_id,
+            launches=server.launches, lineage=peer_lineage(self.request))
+        if reason is not None:
+            reply: dict[str, Any] = {"fallback": reason}
+        else:
+            with server.dispatch_lock:
+                reply = dispatch(server.cli_main, request)
+        with contextlib.suppress(OSError):
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+class HookUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, *, repo_root: Path, orchestration_id: str,
+                 cli_main: Any) -> None:
+        self.repo_root = repo_root
+        self.orchestration_id = orchestration_id
+        self.cli_main = cli_main
+        # agent_run_id -> the `(pid, starttime)` of its launch, None until bound. Written
+        # by the stdin loop in `serve`, read by the handler threads.
+        self.launches: dict[str, tuple[int, str] | None] = {}
+        self.dispatch_lock = threading.Lock()
+        super().__init__(str(socket_path), _HookRequestHandler)
+
+
+def serve(repo_root: Path, orchestration_id: str) -> int:
+    """Bind the socket, print `ready`, and serve until stdin closes (the parent exited).
+
+    A stdin line `<id>` registers an agent_run_id, acknowledged with `registered <id>`;
+    `<id> <pid>` binds a registered id to the launch process, acknowledged with
+    `bound <id> <pid>`, or `unbound <id>` when the id is unknown or the pid gone."""
+    repo_root = repo_root.resolve()
+    socket_path = hook_server_socket_path(repo_root, orchestration_id)
+    if len(os.fsencode(str(socket_path))) > UNIX_SOCKET_PATH_MAX:
+        print(f"hook server socket path too long: {socket_path}", file=sys.stderr)
+        return 2
+    from tools import op_timing
+    from tools.hooks.cli import main as cli_main
+
+    op_timing.claim_startup()
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()
+    server = HookUnixServer(socket_path, repo_root=repo_root,
+                            orchestration_id=orchestration_id, cli_main=cli_main)
+    try:
+        os.chmod(socket_path, 0o600)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        sys.stdout.write("ready\n")
+        sys.stdout.flush()
+        # Lifetime is the parent's: it holds our stdin and closes it (or dies).
+        for line in sys.stdin:
+            fields = line.split()
+            if len(fields) == 1:
+                server.launches.setdefault(fields[0], None)
+                sys.stdout.write(f"registered {fields[0]}\n")
+            elif len(fields) == 2:
+                agent_run_id, pid = fields
+                start = _proc_start(int(pid)) if pid.isdigit() else None
+                if agent_run_id in server.launches and start is not None:
+                    server.launches[agent_run_id] = (int(pid), start)
+                    sys.stdout.write(f"bound {agent_run_id} {pid}\n")
+                else:
+                    sys.stdout.write(f"unbound {agent_run_id}\n")
+            else:
+                continue
+            sys.stdout.flush()
+    finally:
+        server.shutdown()
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            socket_path.unlink()
+    return 0
+
+
+class HookServerProcess:
+    """A running `tools.hooks.server serve` child owned by the conductor."""
+
+    def __init__(self, repo_root: Path, orchestration_id: str, env: Mapping[str, str]) -> None:
+        self.socket_path = hook_server_socket_path(repo_root, orchestration_id)
+        pythonpath = env.get("PYTHONPATH")
+        child_env = dict(env)
+        child_env["PYTHONPATH"] = (
+            f"{_SOURCE_ROOT}{os.pathsep}{pythonpath}" if pythonpath else str(_SOURCE_ROOT))
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "tools.hooks.server", "serve",
+             "--repo-root", str(repo_root), "--orchestration-id", orchestration_id],
+            cwd=repo_root, env=child_env, text=True,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        self._borrowed = False
+
+    def _read_reply(self, timeout: float) -> str | None:
+        assert self._proc.stdout is not None
+        reply: list[str] = []
+        reader = threading.Thread(
+            target=lambda: reply.append(self._proc.stdout.readline()), daemon=True)  # type: ignore[union-attr]
+        reader.start()
+        reader.join(timeout)
+        return reply[0].strip() if reply else None
+
+    def wait_ready(self, timeout: float = SERVER_START_TIMEOUT_SECONDS) -> bool:
+        return self._read_reply(timeout) == "ready"
+
+    def _command(self, line: str, expected: str, timeout: float) -> bool:
+        if self._borrowed or self._proc.stdin is None:
+            return False
+        try:
+            self._proc.stdin.write(f"{line}\n")
+            self._proc.stdin.flush()
+        except (OSError, ValueError):
+            return False
+        return self._read_reply(timeout) == expected
+
+    def register(self, agent_run_id: str,
+                 timeout: float = SERVER_START_TIMEOUT_SECONDS) -> bool:
+        """Let the server answer hooks for `agent_run_id` once it is bound. False for a
+        borrowed handle, whose pipe ends are /dev/null: that launch's hooks then take the
+        cold path."""
+        return self._command(agent_run_id, f"registered {agent_run_id}", timeout)
+
+    def bind(self, agent_run_id: str, pid: int,
+             timeout: float = SERVER_START_TIMEOUT_SECONDS) -> bool:
+        """Tie a registered `agent_run_id` to the process its leaf was launched as."""
+        return self._command(f"{agent_run_id} {pid}", f"bound {agent_run_id} {pid}", timeout)
+
+    def alive(self) -> bool:
+        if self._borrowed:
+            try:
+                os.kill(self._proc.pid, 0)
+            except OSError:
+                return False
+            return True
+        return self._proc.poll() is None
+
+    def release(self) -> None:
+        """In a forked child: keep using the parent's socket, but drop the child's copies
+        of the pipe ends, so the server still stops when the parent closes its stdin."""
+        devnull = os.open(os.devnull, os.O_RDWR)
+        try:
+            for stream in (self._proc.stdin, self._proc.stdout):
+                if stream is not None:
+                    with contextlib.suppress(OSError, ValueError):
+                        os.dup2(devnull, stream.fileno())
+        finally:
+            os.close(devnull)
+        self._borrowed = True
+
+    def close(self) -> None:
+        if self._borrowed:
+            return
+        proc = self._proc
+        if proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+
+_SERVERS: dict[tuple[Path, str], HookServerProcess] = {}
+_SERVERS_LOCK = threading.Lock()
+
+
+def ensure_hook_server(repo_root: Path, orchestration_id: str, env: Mapping[str, str],
+                       *, agent_run_id: str) -> Path | None:
+    """The socket of this orchestration's warm hook server, starting it if needed and
+    registering the leaf `agent_run_id` about to launch against it.
+
+    None means the leaf runs without one — the socket path does not fit `sun_path`, the
+    server failed to come up, or it could not be told about this launch — and every hook
+    call takes the cold path.
+    """
+    repo_root = Path(repo_root).resolve()
+    socket_path = hook_server_socket_path(repo_root, orchestration_id)
+    if len(os.fsencode(str(socket_path))) > UNIX_SOCKET_PATH_MAX:
+        return None
+    key = (repo_root, orchestration_id)
+    with _SERVERS_LOCK:
+        server = _SERVERS.get(key)
+        if server is not None and not server.alive():
+            server.close()
+            del _SERVERS[key]
+            server = None
+        if server is None:
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            server = HookServerProcess(repo_root, orchestration_id, env)
+            if not server.wait_ready():
+                server.close()
+                return None
+            _SERVERS[key] = server
+        if not server.register(agent_run_id):
+            return None
+        return server.socket_path
+
+
+def bind_hook_server_launch(repo_root: Path, orchestration_id: str, agent_run_id: str,
+                            pid: int) -> bool:
+    """Bind a launch `ensure_hook_server` registered to the pid it was spawned as.
+
+    Until this succeeds every hook call claiming `agent_run_id` takes the cold path, so a
+    False here costs speed, never a decision.
+    """
+    with _SERVERS_LOCK:
+        server = _SERVERS.get((Path(repo_root).resolve(), orchestration_id))
+        return server is not None and server.bind(agent_run_id, pid)
+
+
+def stop_hook_servers() -> None:
+    """Stop every hook server this process started (also run at exit)."""
+    with _SERVERS_LOCK:
+        servers = list(_SERVERS.values())
+        _SERVERS.clear()
+    for server in servers:
+        server.close()
+
+
+atexit.register(stop_hook_servers)
+
+
+def _borrow_inherited_servers() -> None:
+    """After fork, in the child: the parent's servers stay the parent's. The socket is
+    safe to share, so the child keeps calling them, but it neither owns their lifetime
+    nor starts a rival server that would unlink the parent's socket."""
+    global _SERVERS_LOCK
+    _SERVERS_LOCK = threading.Lock()
+    for server in _SERVERS.values():
+        server.release()
+
+
+os.register_at_fork(after_in_child=_borrow_inherited_servers)
+
+
+def bench(repo_root: Path, orchestration_id: str, *, calls: int) -> dict[str, Any]:
+    """Per-call latency of a PreToolUse hook, cold vs through a warm server, in ms."""
+    import statistics
+
+    payload = json.dumps({"tool_name": "Bash", "tool_input": {"command": "echo bench"}})
+    argv = [sys.executable, "-m", "tools.hooks.client", "--backend", "claude",
+            "--event", "PreToolUse", "--repo-root", str(repo_root)]
+    base_env = {k: v for k, v in os.environ.items() if k != HOOK_SERVER_SOCKET_ENV}
+    base_env.update({"PYTHONPATH": str(_SOURCE_ROOT), "METDSL_HOOK_REPO_ROOT": str(repo_root),
+                     "METDSL_ORCHESTRATION_ID": orchestration_id,
+                     "METDSL_CHILD_AGENT_RUN_ID": "bench_hook_server_run"})
+    results: dict[str, Any] = {"calls": calls}
+    socket_path = ensure_hook_server(repo_root, orchestration_id, base_env,
+                                     agent_run_id=base_env["METDSL_CHILD_AGENT_RUN_ID"])
+    # The bench process launches every client itself, so it stands in for the leaf.
+    if socket_path is None or not bind_hook_server_launch(
+            repo_root, orchestration_id, base_env["METDSL_CHILD_AGENT_RUN_ID"], os.getpid()):
+        raise RuntimeError("bench: hook server did not start")
+    for mode, env in (("cold", base_env),
+                      ("server", {**base_env, HOOK_SERVER_SOCKET_ENV: str(socket_path)})):
+        samples = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            subprocess.run(argv, cwd=_SOURCE_ROOT, env=env, input=payload, text=True,
+                           capture_output=True, check=False)
+            samples.append((time.perf_counter() - started) * 1000.0)
+        results[mode] = {"median_ms": round(statistics.median(samples), 3),
+                         "min_ms": round(min(samples), 3), "max_ms": round(max(samples), 3)}
+    stop_hook_servers()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("serve", "Serve hook calls on the orchestration socket (internal)."),
+                            ("bench", "Compare per-call hook latency cold and via the server.")):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--repo-root", default=".")
+        sub.add_argument("--orchestration-id", required=(name == "serve"),
+                         default="bench_hook_server")
+        if name == "bench":
+            sub.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args(argv)
+    repo_root = Path(args.repo_root).resolve()
+    if args.command == "serve":
+        return serve(repo_root, args.orchestration_id)
+    json.dump(bench(repo_root, args.orchestration_id, calls=max(1, args.calls)), sys.stdout,
+              indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
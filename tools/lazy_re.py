@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Module-level regular expressions compiled on first use rather than at import.
+
+`orchestration_runtime`, `validate_pipeline_semantics` and `hooks/common` are imported by
+every short-lived CLI process, hook and gate of a workflow, and each compiles dozens of
+module-level patterns at import — about a quarter of their own import time — although a
+given subcommand or stage touches only a few of them. ``lazy_re.compile`` has the signature
+of ``re.compile`` and returns a stand-in that compiles on its first attribute read, then keeps
+the compiled pattern's attributes (bound ``match`` / ``search`` / ..., ``pattern``, ``flags``)
+on itself, so every later call is a plain instance-attribute lookup.
+
+Use it only for a pattern that is read through its methods and attributes. It is not an
+``re.Pattern`` instance, so a consumer that tests ``isinstance(p, re.Pattern)`` or hands it to
+``re.match(p, ...)`` needs the real object from `compiled`.
+
+Stdlib-only, so any module can import it without crossing its own boundary.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+
+class LazyPattern:
+    """Stands in for ``re.compile(pattern, flags)`` until first used."""
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        self._lazy_source = pattern
+        self._lazy_flags = flags
+        self._lazy_compiled: re.Pattern[str] | None = None
+
+    def compiled(self) -> re.Pattern[str]:
+        if self._lazy_compiled is None:
+            self._lazy_compiled = re.compile(self._lazy_source, self._lazy_flags)
+        return self._lazy_compiled
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not yet cached below; dunder probes (copy, pickle) are not
+        # forwarded, so they see a plain object rather than half of a Pattern.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = getattr(self.compiled(), name)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self) -> str:
+        return f"lazy_re.compile({self._lazy_source!r}, {self._lazy_flags!r})"
+
+
+def compile(pattern: str, flags: int = 0) -> re.Pattern[str]:  # noqa: A001 - mirrors re.compile
+    """``re.compile``, deferred: the stand-in is typed as the pattern it becomes."""
+    return LazyPattern(pattern, flags)  # type: ignore[return-value]
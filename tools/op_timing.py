@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Per-operation timing records for the deterministic hops of a workflow run.
+
+Between two leaves the conductor pays for many short processes — `orchestration_runtime.py`
+subcommands, run gates, hook invocations, MCP tool calls — and none of them said where its
+time went. Each of those entry points now runs inside `operation(kind, op)`, which appends ONE
+JSON line per call to ``workspace/orchestrations/<oid>/audit/timings.jsonl``:
+
+  * ``import_s`` — process start to entry (interpreter start-up plus imports), on the first
+    operation of a process only. A long-lived worker (resident runtime, hook server, MCP
+    server) takes it at start with `claim_startup`, so its calls report ``null``;
+  * ``lock_wait_s`` / ``io_s`` — time spent in `phase("lock_wait")` / `phase("io")` blocks
+    (an inner phase inside an outer one is not counted twice);
+  * ``compute_s`` — the rest of the operation's own wall time;
+  * ``total_s`` — ``import_s`` plus the operation's wall time, and ``exit``.
+
+An operation started inside another (a gate run by the `run-gate` subcommand) names its parent
+in ``within``, so a report can rank it without adding its time to the parent's twice.
+`skills/workflow-timing-audit/scripts/analyze_timing.py --ops` ranks the records.
+
+The log is diagnostic, not evidence: ``audit/`` is writable from inside the leaf sandbox, so a
+leaf's hooks and MCP server can append to it and so can the leaf. The writer therefore opens the
+file without following a symlink and appends only to a regular file. Recording is best effort —
+an unwritable log never fails the operation — and ``METDSL_TIMINGS=0`` turns it off.
+
+Stdlib-only, so the hooks and the MCP server import it without crossing their module
+boundary.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import stat
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+TIMINGS_ENV = "METDSL_TIMINGS"
+TIMINGS_FILENAME = "timings.jsonl"
+PHASES = ("lock_wait", "io")
+
+_active: contextvars.ContextVar["OpTimer | None"] = contextvars.ContextVar(
+    "op_timing_active", default=None)
+# Only the first operation of a process paid for its start-up.
+_STARTUP_CLAIMED = False
+
+
+def timings_enabled(env: Any = None) -> bool:
+    raw = (os.environ if env is None else env).get(TIMINGS_ENV, "1")
+    return str(raw).strip().lower() not in {"0", "false", "no", "off"}
+
+
+def timings_path(repo_root: Path, orchestration_id: str) -> Path:
+    return (Path(repo_root) / "workspace" / "orchestrations" / orchestration_id / "audit"
+            / TIMINGS_FILENAME)
+
+
+def _seconds_since_process_start() -> float | None:
+    """Boot-clock seconds since this process was created (Linux ``/proc``; 10 ms ticks)."""
+    try:
+        with open("/proc/self/stat", "rb") as handle:
+            fields = handle.read().rsplit(b")", 1)[1].split()
+        start_ticks = int(fields[19])
+        elapsed = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf(
+            "SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return max(0.0, elapsed)
+
+
+def claim_startup() -> float | None:
+    """Keep this process's start-up out of its next operation's record and return it.
+
+    For a long-lived worker (resident runtime or gate worker, hook server, MCP server),
+    whose first request can arrive long after it started."""
+    global _STARTUP_CLAIMED
+    if _STARTUP_CLAIMED:
+        return None
+    _STARTUP_CLAIMED = True
+    return _seconds_since_process_start()
+
+
+class _Phase:
+    __slots__ = ("_timer", "_name")
+
+    def __init__(self, timer: OpTimer, name: str) -> None:
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self) -> None:
+        timer = self._timer
+        if timer._depth == 0:
+            timer._phase_started = time.perf_counter()
+        timer._depth += 1
+
+    def __exit__(self, *exc: object) -> None:
+        timer = self._timer
+        timer._depth -= 1
+        if timer._depth == 0:
+            timer.phase_s[self._name] += time.perf_counter() - timer._phase_started
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+class OpTimer:
+    """The timing of one operation; `operation` creates it and writes its record."""
+
+    def __init__(self, kind: str, op: str = "", *, within: OpTimer | None = None) -> None:
+        self.kind = kind
+        self.op = op
+        self.within = f"{within.kind}:{within.op}" if within is not None else None
+        self.repo_root: Path | None = within.repo_root if within is not None else None
+        self.orchestration_id: str | None = (
+            within.orchestration_id if within is not None else None)
+        self.extra: dict[str, Any] = {}
+        self.exit: int | None = None
+        self.import_s = claim_startup()
+        self.phase_s = dict.fromkeys(PHASES, 0.0)
+        self._depth = 0
+        self._phase_started = 0.0
+        self._wall_started = time.time()
+        self._started = time.perf_counter()
+
+    def bind(self, *, op: str | None = None, repo_root: Path | str | None = None,
+             orchestration_id: str | None = None, **extra: Any) -> None:
+        """Name the operation and where its record goes, once the entry point knows."""
+        if op:
+            self.op = op
+        if repo_root:
+            self.repo_root = Path(repo_root)
+        if isinstance(orchestration_id, str) and orchestration_id.strip():
+            self.orchestration_id = orchestration_id.strip()
+        self.extra.update({k: v for k, v in extra.items() if v is not None})
+
+    def record(self) -> dict[str, Any]:
+        wall = time.perf_counter() - self._started
+        spent = sum(self.phase_s.values())
+        started = self._wall_started - (self.import_s or 0.0)
+        doc: dict[str, Any] = {
+            "ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "started_at": datetime.fromtimestamp(started, timezone.utc).isoformat()
+                          .replace("+00:00", "Z"),
+            "kind": self.kind,
+            "op": self.op,
+            "pid": os.getpid(),
+            "import_s": None if self.import_s is None else round(self.import_s, 6),
+            "lock_wait_s": round(self.phase_s["lock_wait"], 6),
+            "io_s": round(self.phase_s["io"], 6),
+            "compute_s": round(max(0.0, wall - spent), 6),
+            "total_s": round(wall + (self.import_s or 0.0), 6),
+            "exit": self.exit,
+        }
+        if self.within is not None:
+            doc["within"] = self.within
+        doc.update(self.extra)
+        return doc
+
+    def write(self) -> None:
+        if self.repo_root is None or not self.orchestration_id:
+            return
+        if not timings_enabled() or "/" in self.orchestration_id or \
+                self.orchestration_id in {".", ".."}:
+            return
+        path = timings_path(self.repo_root, self.orchestration_id)
+        if not path.parent.parent.is_dir():
+            return
+        line = (json.dumps(self.record(), ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_NOFOLLOW
+                         | os.O_NONBLOCK, 0o644)
+        except OSError:
+            return
+        try:
+            if stat.S_ISREG(os.fstat(fd).st_mode):
+                os.write(fd, line)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class operation:  # noqa: N801 - used as a context manager, like contextlib's
+    """``with operation(kind, op) as timer:`` times one entry-point call and appends its
+    record on exit. `SystemExit` sets the exit code it carries; another exception records 1."""
+
+    def __init__(self, kind: str, op: str = "") -> None:
+        self._kind = kind
+        self._op = op
+
+    def __enter__(self) -> OpTimer:
+        self._timer = OpTimer(self._kind, self._op, within=_active.get())
+        self._token = _active.set(self._timer)
+        return self._timer
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        timer = self._timer
+        _active.reset(self._token)
+        if exc_type is SystemExit:
+            code = exc.code
+            timer.exit = code if isinstance(code, int) else (0 if code is None else 1)
+        elif exc_type is not None:
+            timer.exit = 1
+        timer.write()
+
+
+def current() -> OpTimer | None:
+    return _active.get()
+
+
+def bind(**fields: Any) -> None:
+    """`OpTimer.bind` on the active operation, if any."""
+    timer = _active.get()
+    if timer is not None:
+        timer.bind(**fields)
+
+
+def phase(name: str) -> _Phase | _NoPhase:
+    """A block whose time counts as `name` (one of `PHASES`) in the active operation."""
+    timer = _active.get()
+    return _NO_PHASE if timer is None else _Phase(timer, name)
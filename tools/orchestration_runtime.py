@@ -5,23 +5,23 @@ from __future__ import annotations
 
 import argparse
 import contextlib
+import contextvars
+import errno
 import hashlib
 import json
 import os
 import re
-import secrets
 import shlex
 import shutil
 import stat
 import subprocess
 import sys
 import tempfile
-import traceback
+import time
 import types
-import uuid
 from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, Callable, Iterator, Mapping, Sequence
 
 # fcntl is POSIX-only. Used by Adv-24 to serialize agent_runs.jsonl
@@ -62,6 +62,7 @@ def _require_yaml() -> Any:
     return _yaml_mod
 
 try:
+    from tools import lazy_re, op_timing
     from tools.backends import registry as backend_registry
     from tools.backends.language.fortran import lines as fortran_lines
     from tools.hooks.common import (
@@ -94,6 +95,7 @@ except ModuleNotFoundError:  # pragma: no cover - import bootstrap for direct CL
     _REPO_ROOT = _THIS_FILE.parent.parent
     if str(_REPO_ROOT) not in sys.path:
         sys.path.insert(0, str(_REPO_ROOT))
+    from tools import lazy_re, op_timing
     from tools.backends import registry as backend_registry
     from tools.backends.language.fortran import lines as fortran_lines
     from tools.hooks.common import (
@@ -157,6 +159,18 @@ IDEMPOTENT_TERMINAL_STATUSES = TERMINAL_STATUSES | {"fail_closed"}
 # assertions, all keyed on this constant.
 _HOST_PYCACHE_REDIRECT_PREFIX = "workspace/.pycache"
 
+# Repo-relative root of the validator's rule-result cache (tools/gate_cache.CACHE_DIR), written by
+# `validate_pipeline_semantics.py` when the trusted host runs it. Same terms as the bytecode
+# redirect above: `_is_host_gate_cache_write` exempts it from the terminal write-diff,
+# render_bwrap_command refuses to make it leaf-writable (a forged entry would replay a clean
+# verdict), and validate_workspace_root.ALLOWED_WORKSPACE_TOP_LEVEL_DIRS lists `.gate_cache`.
+_HOST_GATE_CACHE_PREFIX = "workspace/.gate_cache"
+
+# Repo-relative root of Build's dependency compile cache (tools/compile_cache.CACHE_DIR), written
+# by the conductor's in-process Build. Same terms again (`_is_host_build_cache_write`), and the
+# leaf-writable refusal matters more here: a forged entry would be LINKED into a certified binary.
+_HOST_BUILD_CACHE_PREFIX = "workspace/.build_cache"
+
 
 _DEPENDENCY_READINESS_STAGES: tuple[str, ...] = (
     "ir_ref",
@@ -188,7 +202,7 @@ def _read_deps_yaml(repo_root: Path, spec_ref: Any) -> dict[str, Any] | None:
 
 # A single canonical empty-deps line: `  <key>: []` for one of the deps keys (2-space indent,
 # empty list). Keyed on the same key vocabulary as `_parse_dep_entries` (byte-level, no parse).
-_EMPTY_DEPS_LINE_RE = re.compile(r"^  (components|profiles|infrastructure): \[\]$")
+_EMPTY_DEPS_LINE_RE = lazy_re.compile(r"^  (components|profiles|infrastructure): \[\]$")
 
 
 def _deps_yaml_bytes_are_canonical_empty(deps_bytes: bytes) -> bool:
@@ -446,7 +460,7 @@ def _spec_ref_candidates(
     return found
 
 
-_SEMVER_RE = re.compile(
+_SEMVER_RE = lazy_re.compile(
     r"^(?P<core>\d+(?:\.\d+)*)"
     r"(?:-(?P<pre>[0-9A-Za-z.-]+))?"
     r"(?:\+(?P<build>[0-9A-Za-z.-]+))?$"
@@ -493,7 +507,7 @@ def _parse_semver(
 
 # Accept any version syntax `_parse_semver` can handle: numeric core plus
 # optional `-prerelease` / `+build` suffix.
-_CONSTRAINT_OP_RE = re.compile(
+_CONSTRAINT_OP_RE = lazy_re.compile(
     r"^\s*(>=|<=|==|!=|>|<)?"
     r"\s*(\d+(?:\.\d+)*(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?)\s*$"
 )
@@ -631,7 +645,7 @@ _DEPS_KEY_KIND_FIELDS: tuple[tuple[str, str], ...] = (
 # would let the verifier walk out of the dependency subtree and treat
 # unrelated files as readiness evidence. Reject anything outside this strict
 # safe-token grammar before path construction or fingerprint inclusion.
-_SAFE_ID_TOKEN_RE = re.compile(r"^[A-Za-z0-9._+-]+$")
+_SAFE_ID_TOKEN_RE = lazy_re.compile(r"^[A-Za-z0-9._+-]+$")
 
 
 def _is_safe_path_token(s: Any) -> bool:
@@ -729,7 +743,7 @@ def _parse_dep_entries(
 # This pattern is identical to `_SLUG_DATE_SEQ3_PATTERN` plus capture
 # groups for date and seq; kept in lock-step by construction (see the
 # `assert` at module load below).
-_FRESHNESS_CANONICAL_ID_RE = re.compile(
+_FRESHNESS_CANONICAL_ID_RE = lazy_re.compile(
     r"^[a-z0-9]+(?:-[a-z0-9]+)*_([0-9]{8})_([0-9]{3})$"
 )
 
@@ -1002,9 +1016,15 @@ def _dependency_resolution_freshness(
     regenerated" becomes a mechanism instead of an operator ritual: bumping the harness to
     0.3.0 in the catalog makes every node certified against 0.2.1 resolve differently, so
     each one goes stale and `--with-deps` re-certifies the closure in one run. No
-    content-free version bump of the dependents is needed (that is R6 proper: content-hash
-    invalidation within one version; this is version granularity only, which the respec
-    discipline "content change ⇒ spec_version bump" makes sufficient).
+    content-free version bump of the dependents is needed.
+
+    R6 proper refines this when the certified IR carries a `content_digest.json` record
+    (`tools/content_digest.py`): the node is then fresh iff the Merkle derivation key over its
+    spec inputs and its dependencies' keys still equals the recorded one and the certified IR
+    is the one the record was bound to. That catches a content change within one
+    spec_version, and it keeps a dependent fresh across a dependency's version bump that
+    changed no content. A node certified before the record existed, or whose inputs cannot be
+    derived today, takes the version-granularity comparison below.
 
     Returns `(fresh, detail)`; `detail` is an actionable message when stale.
 
@@ -1022,6 +1042,7 @@ def _dependency_resolution_freshness(
     today. That IS staleness, and reporting it routes the node to a re-run whose own closure
     resolution names the underlying registry defect precisely.
     """
+    from tools import content_digest
     from tools.dependency_graph import build_dependency_graph
 
     if not (
@@ -1083,10 +1104,34 @@ def _dependency_resolution_freshness(
     derived = _closure_signature(graph)
     if derived is None:
         return (True, None)
+
+    ir_dir = _certified_ir_dir(repo_root, kind, spec_id, version)
+    record_path = None if ir_dir is None else ir_dir / content_digest.SIDECAR_NAME
+    if record_path is not None and record_path.is_file():
+        # R6 proper: a node certified with a content-digest record is judged on its derivation
+        # key instead of on version-granularity node_keys — a content change within one
+        # spec_version is stale, a version bump that changed no content is not.
+        current = content_digest.derivation_inputs(
+            repo_root, spec_ref, spec_kind=kind, spec_id=spec_id)
+        if current is not None:
+            try:
+                recorded = json.loads(record_path.read_text(encoding="utf-8"))
+            except Exception:
+                recorded = None
+            reasons = content_digest.stale_reasons(recorded, current, ir_dir)
+            if reasons is None:
+                return (False, f"{node_key}: content_digest.json is unreadable or malformed")
+            if reasons:
+                return (
+                    False,
+                    f"{node_key} was certified against different content: "
+                    + "; ".join(reasons),
+                )
+            return (True, None)
+        # The inputs cannot be derived today; the version-granularity comparison below still can.
     if len(derived[0]) <= 1:
         return (True, None)  # leaf: its closure is only itself, so nothing can drift
 
-    ir_dir = _certified_ir_dir(repo_root, kind, spec_id, version)
     sidecar = None if ir_dir is None else ir_dir / "dependency_graph.json"
     if sidecar is None or not sidecar.is_file():
         return (
@@ -1298,7 +1343,7 @@ def _certified_model_source(pipe_dir: Path, spec_id: str) -> Path | None:
 # still discover it. `lparen` is captured so the extractor can distinguish the two forms.
 # Case-insensitive, name captured for selection. `.match` anchors at the logical-line start,
 # so only declaration lines match (a `call`/`end subroutine` line starts with another token).
-_FORTRAN_SUBROUTINE_RE = re.compile(
+_FORTRAN_SUBROUTINE_RE = lazy_re.compile(
     r"(?:(?:pure|impure|elemental|recursive|module)\s+)*"
     r"subroutine\s+(?P<name>[A-Za-z]\w*)\s*(?P<lparen>\()?",
     re.IGNORECASE,
@@ -2934,7 +2979,7 @@ VALID_REPAIR_STRATEGIES = frozenset({"none", "reuse", "restart"})
 VALID_ISSUE_SEVERITIES = frozenset({"none", "minor", "major", "critical"})
 
 # Must match tools/validate_workspace_root.py (canonical pipeline/plan id directory naming).
-_NODE_KEY_SAFE_PATTERN = re.compile(
+_NODE_KEY_SAFE_PATTERN = lazy_re.compile(
     r"^[a-z][a-z0-9_]*__[a-z0-9][a-z0-9_]*__[0-9][0-9A-Za-z._-]*$"
 )
 # Strict per-component validators for node_key in the canonical
@@ -2942,10 +2987,10 @@ _NODE_KEY_SAFE_PATTERN = re.compile(
 # malformed values before they flow into capability write_roots / path prefixes
 # (a node_key like `../etc/passwd@1.0.0` would otherwise produce a write_root
 # of `releases/../etc/passwd/`, escaping the intended release subtree).
-_NODE_KEY_KIND_RE = re.compile(r"^[a-z][a-z0-9_]*$")
-_NODE_KEY_ID_SEGMENT_RE = re.compile(r"^[a-z0-9][a-z0-9_]*$")
-_NODE_KEY_VERSION_RE = re.compile(r"^[0-9][0-9A-Za-z._-]*$")
-_SLUG_DATE_SEQ3_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*_[0-9]{8}_[0-9]{3}$")
+_NODE_KEY_KIND_RE = lazy_re.compile(r"^[a-z][a-z0-9_]*$")
+_NODE_KEY_ID_SEGMENT_RE = lazy_re.compile(r"^[a-z0-9][a-z0-9_]*$")
+_NODE_KEY_VERSION_RE = lazy_re.compile(r"^[0-9][0-9A-Za-z._-]*$")
+_SLUG_DATE_SEQ3_PATTERN = lazy_re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*_[0-9]{8}_[0-9]{3}$")
 
 # `run_id` is the one id in the family that is NOT a `<slug>_<date>_<seq3>`
 # value: it carries a fixed literal `run_` prefix (`run_<YYYYMMDD>_<seq3>`,
@@ -2960,14 +3005,14 @@ _SLUG_DATE_SEQ3_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*_[0-9]{8}_[0-9]{
 # fails fast at launch (record-launch raises "outside phase contract") instead
 # of a silent downstream no-match. IMPORTANT: keep this in lock-step with the
 # canonical run dir grammar that `post_execute` discovery relies on.
-_RUN_ID_RE = re.compile(r"^run_[0-9]{8}_[0-9]{3}$")
+_RUN_ID_RE = lazy_re.compile(r"^run_[0-9]{8}_[0-9]{3}$")
 # Canonical source_id format for the Generate step: `src_<YYYYMMDD>_<seq3>`.
 # This is the ONLY accepted prefix — unlike ir_id / pipeline_id which use an
 # arbitrary slug, source_id always starts with the literal `src_` prefix.
 # Validated at record-launch time so a malformed source_id (e.g. inheriting
 # the ir_id slug format) fails fast before the generate agent wastes a full
 # substep run that would only be caught by generate.verify.
-_SOURCE_ID_RE = re.compile(r"^src_[0-9]{8}_[0-9]{3}$")
+_SOURCE_ID_RE = lazy_re.compile(r"^src_[0-9]{8}_[0-9]{3}$")
 
 # Codex round 31 F2 → round 36: keep reader (`_FRESHNESS_CANONICAL_ID_RE`)
 # and writer (`_SLUG_DATE_SEQ3_PATTERN`) grammars in lock-step. The capture
@@ -3039,7 +3084,7 @@ def _parse_node_key_strict(node_key: Any) -> tuple[str, str, str]:
 
 # Safe agent_run_id characters: alphanumerics, hyphens, underscores.
 # Rejects path separators (/, \), dots (..), null bytes, and other traversal vectors.
-_AGENT_RUN_ID_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$")
+_AGENT_RUN_ID_RE = lazy_re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$")
 DEFAULT_BACKEND_COMMANDS = {
     "codex": "codex",
     "claude": "claude",
@@ -3089,7 +3134,18 @@ WORKFLOW_PHASE_DOC_BY_STEP: dict[str, str] = {
 
 
 def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    batch = _ACTIVE_JSON_WRITE_BATCH.get()
+    text = batch.pending(path) if batch is not None else None
+    if text is None:
+        with op_timing.phase("io"):
+            text = path.read_text(encoding="utf-8")
+    return json.loads(text)
+
+
+def _document_exists(path: Path) -> bool:
+    """`path.exists()` that also sees a document staged by the active `_json_write_batch`."""
+    batch = _ACTIVE_JSON_WRITE_BATCH.get()
+    return (batch is not None and batch.pending(path) is not None) or path.exists()
 
 
 def _read_json_or_none(path: Path) -> Any:
@@ -3114,37 +3170,51 @@ def _atomic_write_text(path: Path, body: str) -> None:
     orchestration as not-active — falsely flagging sanctioned tmp scripts.
     Writing to a sibling temp file then renaming guarantees readers see
     either the previous full content or the new full content, never partial.
+
+    Inside a `_json_write_batch` covering `path`, the body is only staged: the batch
+    journals it, then renames it into place, at commit. Until then `_read_json` serves the
+    staged body to the rest of the batching operation.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    # Use NamedTemporaryFile in the same directory so os.replace is atomic
-    # (cross-device renames are not). delete=False because we hand the file
-    # off to os.replace explicitly.
-    fd, tmp_name = tempfile.mkstemp(
-        prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
-    )
-    tmp_path = Path(tmp_name)
-    # L-NEW-3: cleanup MUST run on BaseException too (KeyboardInterrupt /
-    # SystemExit), otherwise SIGINT during a long write campaign accumulates
-    # `.tmp` litter under workspace/orchestrations/. try/finally with a
-    # `replaced` flag distinguishes successful rename (no cleanup) from any
-    # failure path including signal-driven exits.
-    replaced = False
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as fh:
-            fh.write(body)
-            fh.flush()
-            try:
-                os.fsync(fh.fileno())
-            except OSError:
-                pass
-        os.replace(str(tmp_path), str(path))
-        replaced = True
-    finally:
-        if not replaced:
-            try:
-                tmp_path.unlink()
-            except OSError:
-                pass
+    batch = _ACTIVE_JSON_WRITE_BATCH.get()
+    if batch is not None and batch.covers(path):
+        batch.stage(path, body)
+        return
+    _replace_text(path, body, sync=True)
+
+
+def _replace_text(path: Path, body: str, *, sync: bool) -> None:
+    with op_timing.phase("io"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Use NamedTemporaryFile in the same directory so os.replace is atomic
+        # (cross-device renames are not). delete=False because we hand the file
+        # off to os.replace explicitly.
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
+        )
+        tmp_path = Path(tmp_name)
+        # L-NEW-3: cleanup MUST run on BaseException too (KeyboardInterrupt /
+        # SystemExit), otherwise SIGINT during a long write campaign accumulates
+        # `.tmp` litter under workspace/orchestrations/. try/finally with a
+        # `replaced` flag distinguishes successful rename (no cleanup) from any
+        # failure path including signal-driven exits.
+        replaced = False
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(body)
+                fh.flush()
+                if sync:
+                    try:
+                        os.fsync(fh.fileno())
+                    except OSError:
+                        pass
+            os.replace(str(tmp_path), str(path))
+            replaced = True
+        finally:
+            if not replaced:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
 
 
 def _write_json(path: Path, payload: Any) -> None:
@@ -3240,6 +3310,10 @@ def _recover_json_transactions_unlocked(transaction_dir: Path) -> None:
             raise RuntimeError(
                 f"cannot recover malformed json transaction journal {journal_path}: {exc}"
             ) from exc
+        if isinstance(journal, dict) and journal.get("kind") == _JSON_WRITE_BATCH_KIND:
+            _replay_json_write_batch(transaction_dir, journal_path, journal)
+            _remove_transaction_tree(tx_dir, tx_root)
+            continue
         if (
             not isinstance(journal, dict)
             or set(journal) != {
@@ -3398,6 +3472,7 @@ def _write_json_transaction(
         if tx_root.is_symlink():
             raise RuntimeError(f"JSON transaction root must not be a symlink: {tx_root}")
         _fsync_directory(transaction_dir)
+        import uuid
         tx_dir = tx_root / uuid.uuid4().hex
         tx_dir.mkdir()
         _fsync_directory(tx_root)
@@ -3467,6 +3542,193 @@ def _write_json_transaction(
             _remove_transaction_tree(tx_dir, tx_root)
 
 
+_JSON_WRITE_BATCH_KIND = "write_batch"
+_ACTIVE_JSON_WRITE_BATCH: contextvars.ContextVar[_JsonWriteBatch | None] = contextvars.ContextVar(
+    "_ACTIVE_JSON_WRITE_BATCH", default=None
+)
+# `syncfs(2)` from the process's own libc, resolved on first use; False when unavailable.
+_LIBC_SYNCFS: Any = None
+
+
+def _sync_filesystem(path: Path) -> None:
+    """One durability barrier for every write already issued on `path`'s filesystem:
+    `syncfs(2)` where the platform has it, `sync(2)` otherwise."""
+    global _LIBC_SYNCFS
+    if _LIBC_SYNCFS is None:
+        _LIBC_SYNCFS = False
+        if sys.platform.startswith("linux"):
+            try:
+                import ctypes
+
+                _LIBC_SYNCFS = ctypes.CDLL(None, use_errno=True).syncfs
+            except (OSError, AttributeError):
+                pass
+    if _LIBC_SYNCFS:
+        fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            if _LIBC_SYNCFS(fd) == 0:
+                return
+        finally:
+            os.close(fd)
+    os.sync()
+
+
+class _JsonWriteBatch:
+    """The documents one runtime operation writes under `transaction_dir`, made durable together.
+
+    Writes are buffered until `commit`, which is write-ahead: ONE journal holding every
+    document's final body is made durable first, then each target is renamed into place
+    without its own fsync, then ONE filesystem barrier covers them all — a constant number of
+    sync round trips however many documents the operation wrote. No target is replaced before
+    a durable journal can restore it, so a crash leaves each document holding its old or its
+    new body; `_recover_json_transactions` rolls a surviving journal forward (see
+    `_replay_json_write_batch`).
+    """
+
+    def __init__(self, transaction_dir: Path) -> None:
+        self.transaction_dir = transaction_dir
+        self._root = Path(os.path.abspath(transaction_dir))
+        self.entries: dict[Path, str] = {}
+
+    def covers(self, path: Path) -> bool:
+        try:
+            rel = Path(os.path.abspath(path)).relative_to(self._root)
+        except ValueError:
+            return False
+        return bool(rel.parts) and rel.parts[0] != _JSON_TRANSACTIONS_DIRNAME
+
+    def stage(self, path: Path, body: str) -> None:
+        self.entries[Path(os.path.abspath(path))] = body
+
+    def pending(self, path: Path) -> str | None:
+        """The body staged for `path`, or None when the batch has not written it."""
+        if not self.entries:
+            return None
+        return self.entries.get(Path(os.path.abspath(path)))
+
+    def commit(self) -> None:
+        if not self.entries:
+            return
+        tx_root = self.transaction_dir / _JSON_TRANSACTIONS_DIRNAME
+        journal = {
+            "version": _JSON_TRANSACTION_VERSION,
+            "kind": _JSON_WRITE_BATCH_KIND,
+            "entries": [
+                {
+                    "path": target.relative_to(self._root).as_posix(),
+                    "new_sha256": hashlib.sha256(body.encode("utf-8")).hexdigest(),
+                    "body": body,
+                }
+                for target, body in self.entries.items()
+            ],
+        }
+        with _json_transaction_exclusive_lock(self.transaction_dir):
+            # A journal a crash left behind is settled before this batch replaces anything;
+            # replayed later, it would write its bodies over this batch's newer ones.
+            _recover_json_transactions_unlocked(self.transaction_dir)
+            tx_root.mkdir(parents=True, exist_ok=True)
+            if tx_root.is_symlink():
+                raise RuntimeError(f"JSON transaction root must not be a symlink: {tx_root}")
+            import uuid
+            tx_dir = tx_root / uuid.uuid4().hex
+            tx_dir.mkdir()
+            # Write-ahead: the journal is durable before any target is replaced, so a crash
+            # anywhere below leaves a complete record to roll the whole batch forward from.
+            _replace_text(
+                tx_dir / "journal.json",
+                json.dumps(journal, ensure_ascii=False) + "\n",
+                sync=True,
+            )
+            _fsync_directory(tx_dir)
+            _fsync_directory(tx_root)
+            for target, body in self.entries.items():
+                _replace_text(target, body, sync=False)
+            _sync_filesystem(self.transaction_dir)
+            # Retiring the journal needs no barrier of its own: a journal that survives a
+            # crash here replays as a rewrite of the bodies every target already holds.
+            shutil.rmtree(tx_dir)
+        self.entries.clear()
+
+
+@contextlib.contextmanager
+def _json_write_batch(transaction_dir: Path) -> Iterator[_JsonWriteBatch | None]:
+    """Group-commit every `_atomic_write_text` under `transaction_dir` made inside the block.
+
+    The batch commits on exit whether or not the block raised, so whatever the operation
+    wrote before failing is as durable as it was when each write synced on its own. Nested
+    blocks join the outermost batch (and yield None). A journal left by an earlier crash is
+    recovered on entry, so the block reads what that batch committed rather than a document
+    its replay would later overwrite."""
+    if _ACTIVE_JSON_WRITE_BATCH.get() is not None:
+        yield None
+        return
+    _recover_json_transactions(transaction_dir)
+    batch = _JsonWriteBatch(transaction_dir)
+    token = _ACTIVE_JSON_WRITE_BATCH.set(batch)
+    try:
+        yield batch
+    except BaseException:
+        _ACTIVE_JSON_WRITE_BATCH.reset(token)
+        with contextlib.suppress(OSError, RuntimeError):
+            batch.commit()
+        raise
+    _ACTIVE_JSON_WRITE_BATCH.reset(token)
+    batch.commit()
+
+
+def _replay_json_write_batch(
+    transaction_dir: Path, journal_path: Path, journal: dict[str, Any]
+) -> None:
+    """Roll a durable write-batch journal forward.
+
+    Every target not already holding its journaled body is rewritten from the journal. The
+    journal is written before any target, and every later batch and registration transaction
+    recovers a surviving journal under the same lock before it writes, so no later writer has
+    replaced a target while it exists: whatever else a target holds — its old body, nothing,
+    or a torn rename whose data never reached the disk — is the batch's own unfinished
+    write."""
+    entries = journal.get("entries")
+    if (
+        set(journal) != {"version", "kind", "entries"}
+        or journal.get("version") != _JSON_TRANSACTION_VERSION
+        or not isinstance(entries, list)
+    ):
+        raise RuntimeError(f"cannot recover invalid json write-batch journal {journal_path}")
+    root = Path(os.path.abspath(transaction_dir))
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise RuntimeError(f"cannot recover invalid json write-batch journal {journal_path}")
+        rel = entry.get("path")
+        body = entry.get("body")
+        new_sha256 = entry.get("new_sha256")
+        if (
+            not isinstance(rel, str)
+            or not isinstance(body, str)
+            or not isinstance(new_sha256, str)
+            or hashlib.sha256(body.encode("utf-8")).hexdigest() != new_sha256
+        ):
+            raise RuntimeError(f"cannot recover invalid json write-batch entry in {journal_path}")
+        parts = PurePosixPath(rel).parts
+        if (
+            not parts
+            or PurePosixPath(rel).is_absolute()
+            or ".." in parts
+            or parts[0] == _JSON_TRANSACTIONS_DIRNAME
+        ):
+            raise RuntimeError(f"json write-batch target escapes its root: {rel!r}")
+        target = root.joinpath(*parts)
+        if target.is_symlink():
+            raise RuntimeError(f"json write-batch target must not be a symlink: {target}")
+        try:
+            current: bytes | None = target.read_bytes()
+        except FileNotFoundError:
+            current = None
+        if current is not None and hashlib.sha256(current).hexdigest() == new_sha256:
+            continue
+        _replace_text(target, body, sync=True)
+        _fsync_directory(target.parent)
+
+
 def _write_text(path: Path, text: str) -> None:
     body = text if text.endswith("\n") else f"{text}\n"
     _atomic_write_text(path, body)
@@ -3879,7 +4141,8 @@ def _fcntl_exclusive_lock(lock_path: Path) -> Iterator[None]:
     lock_path.parent.mkdir(parents=True, exist_ok=True)
     fd = os.open(str(lock_path), os.O_WRONLY | os.O_CREAT, 0o600)
     try:
-        _fcntl.flock(fd, _fcntl.LOCK_EX)
+        with op_timing.phase("lock_wait"):
+            _fcntl.flock(fd, _fcntl.LOCK_EX)
         try:
             yield
         finally:
@@ -4051,6 +4314,7 @@ def record_child_return(
             f"launches/{arid}.parent_return_token. The launch may pre-date "
             f"the Adv-30 token mechanism — re-launch via record-launch."
         )
+    import secrets
     # secrets.compare_digest avoids timing leaks even though this is local I/O.
     if not secrets.compare_digest(return_token, expected_token):
         raise ValueError(
@@ -4376,7 +4640,7 @@ def _write_phase_state(repo_root: Path, orchestration_id: str, doc: dict[str, An
 
 def _load_phase_state(repo_root: Path, orchestration_id: str) -> dict[str, Any] | None:
     path = _phase_state_path(repo_root, orchestration_id)
-    if not path.exists():
+    if not _document_exists(path):
         return None
     try:
         data = _read_json(path)
@@ -4604,7 +4868,7 @@ def _mcp_permissions_for_launch(role: str, step: str, *, substep: str = "") -> l
 # This rejects not just path separators / traversal (`/`, `\`, `.`, `..`) but every other
 # metacharacter (space, `~`, `*`, `?`, glob/shell chars) in one place — a fail-closed guard, not
 # a full format check (the canonical regexes above own the exact `<prefix>_<date>_<seq3>` shape).
-_SAFE_PATH_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+_SAFE_PATH_ID_RE = lazy_re.compile(r"^[A-Za-z0-9_-]+$")
 
 
 def _is_safe_path_id(tok: str) -> bool:
@@ -4801,6 +5065,7 @@ def build_capability_document(
     # verification systems (and the record-launch read-only-profile branch) can recognize it.
     pure = _is_pure_launch_request(request_payload)
 
+    import secrets
     token = secrets.token_hex(32)
     body: dict[str, Any] = {
         "agent_run_id": agent_run_id.strip(),
@@ -5740,6 +6005,63 @@ def _path_under_any_write_root(rel_posix: str, write_roots: list[str]) -> bool:
     return False
 
 
+# Verdicts of the MCP phase gate a caller keeps across calls (`verdict_cache`); cleared
+# when full, like the hook-side policy cache — a leaf holds a handful of tokens.
+_MCP_GATE_VERDICT_CACHE_MAX = 64
+
+
+class _McpGateVerdict:
+    """What the document half of the MCP phase gate established for one (leaf, token, tool).
+
+    `inputs` pairs every document the checks read or probed with its stat identity, taken
+    before the read (`None` while absent). The verdict stands while each identity is
+    unchanged — the runtime rewrites these documents by atomic rename, so any rewrite is a
+    new inode — and `expires_at` has not passed. `cacheable` is false when an input changed
+    within `_SNAPSHOT_RACY_WINDOW_NS` of the read: a same-tick in-place rewrite could keep
+    its stat, the snapshot index's "racily clean" rule.
+    """
+
+    __slots__ = (
+        "inputs",
+        "cacheable",
+        "expires_at",
+        "node_safe",
+        "step_key",
+        "pipeline_ref",
+        "run_id",
+        "build_system",
+    )
+
+    def __init__(self) -> None:
+        self.inputs: list[tuple[Path, tuple[int, ...] | None]] = []
+        self.cacheable = True
+        self.expires_at: datetime | None = None
+        self.node_safe = ""
+        self.step_key = ""
+        self.pipeline_ref: str | None = None
+        self.run_id: str | None = None
+        self.build_system = "make"
+
+    def note_input(self, path: Path, started_ns: int) -> None:
+        identity = _gate_input_identity(path)
+        if identity is not None and max(identity[3], identity[4]) >= (
+            started_ns - _SNAPSHOT_RACY_WINDOW_NS
+        ):
+            self.cacheable = False
+        self.inputs.append((path, identity))
+
+    def is_current(self) -> bool:
+        return all(_gate_input_identity(path) == identity for path, identity in self.inputs)
+
+
+def _gate_input_identity(path: Path) -> tuple[int, ...] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
 def validate_mcp_build_tool_invocation(
     repo_root: Path,
     *,
@@ -5748,80 +6070,42 @@ def validate_mcp_build_tool_invocation(
     capability_token: str,
     tool_name: str,
     mcp_args: dict[str, Any] | None = None,
+    verdict_cache: dict[Any, _McpGateVerdict] | None = None,
 ) -> None:
-    """The phase gate before a `compile_project` / `run_linter` / `run_program` / `run_quality_checks` call."""
-    _require_safe_gate_ids(orchestration_id, agent_run_id, "MCP phase gate")
-    _require_preflight_launchable(repo_root, orchestration_id, enforce_live_probe=False)
-
-    root = _orchestration_root(repo_root, orchestration_id)
-    launch_resp = root / "launches" / f"{agent_run_id.strip()}.response.json"
-    if not launch_resp.exists():
-        raise RuntimeError(
-            "MCP phase gate: record-launch did not complete (missing launches/*.response.json) "
-            f"for agent_run_id={agent_run_id!r}"
-        )
-
-    doc = _load_phase_state(repo_root, orchestration_id)
-    if doc is None:
-        raise RuntimeError("MCP phase gate: phase_state.json missing")
-    cur = doc.get("current_state")
-    if cur != "preflight_passed":
-        raise RuntimeError(f"MCP phase gate: unexpected orchestration current_state: {cur!r}")
-
-    cap_path = _capabilities_dir(repo_root, orchestration_id) / f"{agent_run_id.strip()}.json"
-    if not cap_path.exists():
-        raise RuntimeError(f"MCP phase gate: capability file missing: {cap_path}")
-    cap = _read_json(cap_path)
-    if not isinstance(cap, dict):
-        raise RuntimeError(f"MCP phase gate: capability must be object: {cap_path}")
-    if str(cap.get("capability_token", "")).strip() != str(capability_token).strip():
-        raise RuntimeError("MCP phase gate: capability_token mismatch")
-
-    exp = cap.get("expires_at")
-    if isinstance(exp, str):
-        exp_dt = _parse_iso_z_expiry(exp)
-        if exp_dt is not None and datetime.now(timezone.utc) > exp_dt:
-            raise RuntimeError("MCP phase gate: capability token expired")
-
-    perms = cap.get("mcp_permissions")
-    allowed = [str(x) for x in perms] if isinstance(perms, list) else []
-    if tool_name not in allowed:
-        # Surface the resolving (step, substep) so an empty `allowed` is self-diagnosing:
-        # a correctly fail-closed leaf (e.g. generate.verify) reads the same as a genuinely
-        # missing _MCP_TOOL_GRANTS_BY_SUBSTEP entry without this context.
-        cap_step = str(cap.get("step", "")).strip().lower()
-        cap_substep = str(cap.get("substep", "")).strip().lower()
-        raise RuntimeError(
-            f"MCP phase gate: tool {tool_name!r} not permitted by capability "
-            f"(step={cap_step!r}, substep={cap_substep!r}, allowed={allowed!r})"
-        )
+    """The phase gate before a `compile_project` / `run_linter` / `run_program` / `run_quality_checks` call.
 
-    node_raw = cap.get("node_key")
-    step_raw = cap.get("step")
-    if not isinstance(node_raw, str) or not node_raw.strip():
-        raise RuntimeError("MCP phase gate: capability.node_key missing")
-    if not isinstance(step_raw, str) or not step_raw.strip():
-        raise RuntimeError("MCP phase gate: capability.step missing")
-    node_safe = _node_key_to_safe(node_raw.strip())
-    step_key = step_raw.strip().lower()
-    _require_child_agent_role_for_step(
-        cap.get("agent_role"),
-        step_key,
-        label="MCP phase gate: capability",
-        error_type=RuntimeError,
+    `verdict_cache` is a dict the caller keeps across calls (the MCP server keeps one per
+    process). A repeated call whose documents are all unchanged reuses their verdict
+    instead of re-reading preflight, phase_state, the capability, the launch request and
+    the IR; the token expiry, the argument checks and the audit line run on every call.
+    """
+    _require_safe_gate_ids(orchestration_id, agent_run_id, "MCP phase gate")
+    key = (
+        str(repo_root),
+        orchestration_id,
+        agent_run_id.strip(),
+        str(capability_token).strip(),
+        tool_name,
     )
-    ns = doc.get("node_states")
-    if not isinstance(ns, dict):
-        raise RuntimeError("MCP phase gate: phase_state.node_states missing")
-    inner = ns.get(node_safe)
-    if not isinstance(inner, dict):
-        raise RuntimeError(f"MCP phase gate: phase_state missing node {node_safe!r}")
-    st = inner.get(step_key)
-    if st != "child_running":
-        raise RuntimeError(
-            "MCP phase gate: node step must be child_running "
-            f"(node_key_safe={node_safe!r}, step={step_key!r}, current={st!r})"
+    verdict = verdict_cache.get(key) if verdict_cache is not None else None
+    if verdict is None or not verdict.is_current():
+        if verdict_cache is not None:
+            verdict_cache.pop(key, None)
+        verdict = _mcp_gate_document_verdict(
+            repo_root,
+            orchestration_id=orchestration_id,
+            agent_run_id=agent_run_id,
+            capability_token=capability_token,
+            tool_name=tool_name,
         )
+        if verdict_cache is not None and verdict.cacheable:
+            if len(verdict_cache) >= _MCP_GATE_VERDICT_CACHE_MAX:
+                verdict_cache.clear()
+            verdict_cache[key] = verdict
+    elif verdict.expires_at is not None and datetime.now(timezone.utc) > verdict.expires_at:
+        raise RuntimeError("MCP phase gate: capability token expired")
+    node_safe = verdict.node_safe
+    step_key = verdict.step_key
 
     args_obj = mcp_args if isinstance(mcp_args, dict) else {}
     if tool_name == "run_program" and step_key == "validate":
@@ -5840,23 +6124,8 @@ def validate_mcp_build_tool_invocation(
         # The MCP server's `_resolve_command_log_path` resolves a relative
         # `command_log_path` against `project_dir`; we normalize both to a
         # repo-relative canonical comparison.
-        try:
-            req_doc_for_log = _read_json(
-                _orchestration_root(repo_root, orchestration_id)
-                / "launches"
-                / f"{agent_run_id.strip()}.request.json"
-            )
-        except (OSError, json.JSONDecodeError):
-            req_doc_for_log = None
-        pipeline_ref_for_log: str | None = None
-        run_id_for_log: str | None = None
-        if isinstance(req_doc_for_log, dict):
-            pr_raw = req_doc_for_log.get("pipeline_ref")
-            if isinstance(pr_raw, str) and pr_raw.strip():
-                pipeline_ref_for_log = _normalize_rel_posix(pr_raw.strip())
-            ex_raw = req_doc_for_log.get("run_id")
-            if isinstance(ex_raw, str) and ex_raw.strip():
-                run_id_for_log = ex_raw.strip()
+        pipeline_ref_for_log = verdict.pipeline_ref
+        run_id_for_log = verdict.run_id
         if pipeline_ref_for_log and run_id_for_log:
             expected_log_rel = (
                 f"{pipeline_ref_for_log}/runs/{run_id_for_log}/"
@@ -5924,15 +6193,8 @@ def validate_mcp_build_tool_invocation(
                     "tool-execution evidence at canonical placement."
                 )
     if tool_name in {"compile_project", "run_quality_checks"}:
-        # Every absence on the way to this contract means make, which is the reading
-        # record_launch already applies to an IR that omits toolchain.build_system (and
-        # the conductor's own `str(toolchain.build_system or "make")`). Reading any of
-        # them as "no policy" exempts the whole contract: an unresolvable ir_ref, an IR
-        # without the key, an omitted argument, and an omitted preset each did so in
-        # turn, and the project is make-only.
-        ir_ref = _launch_ir_ref_for_agent(repo_root, orchestration_id, agent_run_id)
-        bs = (_impl_resolved_build_system(repo_root, ir_ref) if ir_ref else None) or "make"
-        if bs == "make":
+        # An omitted argument or preset means make too (see `_mcp_gate_document_verdict`).
+        if verdict.build_system == "make":
             if tool_name == "compile_project":
                 req_bs = str(args_obj.get("build_system", "")).strip().lower() or "make"
                 if req_bs != "make":
@@ -5957,20 +6219,139 @@ def validate_mcp_build_tool_invocation(
     )
 
 
-def _launch_ir_ref_for_agent(
-    repo_root: Path, orchestration_id: str, agent_run_id: str
-) -> str | None:
-    req_path = _orchestration_root(repo_root, orchestration_id) / "launches" / f"{agent_run_id.strip()}.request.json"
+def _mcp_gate_document_verdict(
+    repo_root: Path,
+    *,
+    orchestration_id: str,
+    agent_run_id: str,
+    capability_token: str,
+    tool_name: str,
+) -> _McpGateVerdict:
+    """The checks of `validate_mcp_build_tool_invocation` that read only documents."""
+    verdict = _McpGateVerdict()
+    started_ns = time.time_ns()
+    verdict.note_input(_preflight_path(repo_root, orchestration_id), started_ns)
+    _require_preflight_launchable(repo_root, orchestration_id, enforce_live_probe=False)
+
+    root = _orchestration_root(repo_root, orchestration_id)
+    launch_resp = root / "launches" / f"{agent_run_id.strip()}.response.json"
+    verdict.note_input(launch_resp, started_ns)
+    if not launch_resp.exists():
+        raise RuntimeError(
+            "MCP phase gate: record-launch did not complete (missing launches/*.response.json) "
+            f"for agent_run_id={agent_run_id!r}"
+        )
+
+    verdict.note_input(_phase_state_path(repo_root, orchestration_id), started_ns)
+    doc = _load_phase_state(repo_root, orchestration_id)
+    if doc is None:
+        raise RuntimeError("MCP phase gate: phase_state.json missing")
+    cur = doc.get("current_state")
+    if cur != "preflight_passed":
+        raise RuntimeError(f"MCP phase gate: unexpected orchestration current_state: {cur!r}")
+
+    cap_path = _capabilities_dir(repo_root, orchestration_id) / f"{agent_run_id.strip()}.json"
+    verdict.note_input(cap_path, started_ns)
+    if not cap_path.exists():
+        raise RuntimeError(f"MCP phase gate: capability file missing: {cap_path}")
+    cap = _read_json(cap_path)
+    if not isinstance(cap, dict):
+        raise RuntimeError(f"MCP phase gate: capability must be object: {cap_path}")
+    if str(cap.get("capability_token", "")).strip() != str(capability_token).strip():
+        raise RuntimeError("MCP phase gate: capability_token mismatch")
+
+    exp = cap.get("expires_at")
+    if isinstance(exp, str):
+        exp_dt = _parse_iso_z_expiry(exp)
+        if exp_dt is not None and datetime.now(timezone.utc) > exp_dt:
+            raise RuntimeError("MCP phase gate: capability token expired")
+        verdict.expires_at = exp_dt
+
+    perms = cap.get("mcp_permissions")
+    allowed = [str(x) for x in perms] if isinstance(perms, list) else []
+    if tool_name not in allowed:
+        # Surface the resolving (step, substep) so an empty `allowed` is self-diagnosing:
+        # a correctly fail-closed leaf (e.g. generate.verify) reads the same as a genuinely
+        # missing _MCP_TOOL_GRANTS_BY_SUBSTEP entry without this context.
+        cap_step = str(cap.get("step", "")).strip().lower()
+        cap_substep = str(cap.get("substep", "")).strip().lower()
+        raise RuntimeError(
+            f"MCP phase gate: tool {tool_name!r} not permitted by capability "
+            f"(step={cap_step!r}, substep={cap_substep!r}, allowed={allowed!r})"
+        )
+
+    node_raw = cap.get("node_key")
+    step_raw = cap.get("step")
+    if not isinstance(node_raw, str) or not node_raw.strip():
+        raise RuntimeError("MCP phase gate: capability.node_key missing")
+    if not isinstance(step_raw, str) or not step_raw.strip():
+        raise RuntimeError("MCP phase gate: capability.step missing")
+    node_safe = _node_key_to_safe(node_raw.strip())
+    step_key = step_raw.strip().lower()
+    _require_child_agent_role_for_step(
+        cap.get("agent_role"),
+        step_key,
+        label="MCP phase gate: capability",
+        error_type=RuntimeError,
+    )
+    ns = doc.get("node_states")
+    if not isinstance(ns, dict):
+        raise RuntimeError("MCP phase gate: phase_state.node_states missing")
+    inner = ns.get(node_safe)
+    if not isinstance(inner, dict):
+        raise RuntimeError(f"MCP phase gate: phase_state missing node {node_safe!r}")
+    st = inner.get(step_key)
+    if st != "child_running":
+        raise RuntimeError(
+            "MCP phase gate: node step must be child_running "
+            f"(node_key_safe={node_safe!r}, step={step_key!r}, current={st!r})"
+        )
+
+    verdict.node_safe = node_safe
+    verdict.step_key = step_key
+
+    needs_log_placement = tool_name == "run_program" and step_key == "validate"
+    needs_build_system = tool_name in {"compile_project", "run_quality_checks"}
+    req_doc: dict[str, Any] | None = None
+    if needs_log_placement or needs_build_system:
+        req_path = root / "launches" / f"{agent_run_id.strip()}.request.json"
+        verdict.note_input(req_path, started_ns)
+        req_doc = _launch_request_for_agent(req_path)
+    if needs_log_placement and req_doc is not None:
+        pr_raw = req_doc.get("pipeline_ref")
+        if isinstance(pr_raw, str) and pr_raw.strip():
+            verdict.pipeline_ref = _normalize_rel_posix(pr_raw.strip())
+        ex_raw = req_doc.get("run_id")
+        if isinstance(ex_raw, str) and ex_raw.strip():
+            verdict.run_id = ex_raw.strip()
+    if needs_build_system:
+        # Every absence on the way to this contract means make, which is the reading
+        # record_launch already applies to an IR that omits toolchain.build_system (and
+        # the conductor's own `str(toolchain.build_system or "make")`). Reading any of
+        # them as "no policy" exempts the whole contract: an unresolvable ir_ref, an IR
+        # without the key, an omitted argument, and an omitted preset each did so in
+        # turn, and the project is make-only.
+        ir_raw = req_doc.get("ir_ref") if req_doc is not None else None
+        ir_ref = ir_raw.strip() if isinstance(ir_raw, str) and ir_raw.strip() else None
+        if ir_ref:
+            verdict.note_input(
+                repo_root / _normalize_rel_posix(ir_ref) / "spec.ir.yaml", started_ns
+            )
+        verdict.build_system = (
+            _impl_resolved_build_system(repo_root, ir_ref) if ir_ref else None
+        ) or "make"
+    return verdict
+
+
+def _launch_request_for_agent(req_path: Path) -> dict[str, Any] | None:
+    """A leaf's `launches/<arid>.request.json`, or None when missing, unreadable or not an object."""
     if not req_path.is_file():
         return None
     try:
         doc = _read_json(req_path)
     except (OSError, json.JSONDecodeError):
         return None
-    if not isinstance(doc, dict):
-        return None
-    pr = doc.get("ir_ref")
-    return pr.strip() if isinstance(pr, str) and pr.strip() else None
+    return doc if isinstance(doc, dict) else None
 
 
 def _require_safe_gate_ids(
@@ -6411,6 +6792,12 @@ def run_gate(
     if not isinstance(args_json, dict):
         raise ValueError("args_json must be object")
 
+    from tools import gate_service
+
+    if gate != "orchestration_read":
+        # Resident mode: start the warm gate worker now so its validator import overlaps
+        # the permission checks below (tools/gate_service.py).
+        gate_service.prestart(repo_root, _gate_python_env(repo_root))
     _validate_run_gate_permissions(
         repo_root,
         orchestration_id=orchestration_id,
@@ -6453,14 +6840,10 @@ def run_gate(
     else:
         cmd = _gate_script_command(repo_root=repo_root, gate_name=gate, args_json=args_json)
         gate_env = _gate_python_env(repo_root)
-        proc = subprocess.run(
-            cmd,
-            cwd=str(repo_root),
-            env=gate_env,
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        with op_timing.operation("gate", gate) as gate_timer:
+            gate_timer.bind(mode=gate_service.gate_mode(gate_env))
+            proc = gate_service.run_gate_command(repo_root, gate_env, cmd)
+            gate_timer.exit = proc.returncode
         violations = _extract_gate_violations(proc.stdout or "", proc.stderr or "", proc.returncode)
         status = "pass" if proc.returncode == 0 else "fail"
         exit_code = proc.returncode
@@ -6572,7 +6955,7 @@ def _load_allowed_output_manifest(
     agent_run_id: str,
 ) -> dict[str, Any]:
     path = _allowed_output_manifest_path(repo_root, orchestration_id, agent_run_id)
-    if not path.exists():
+    if not _document_exists(path):
         raise ValueError(f"allowed_output_paths manifest not found: {path}")
     payload = _read_json(path)
     if not isinstance(payload, dict):
@@ -7850,7 +8233,7 @@ def _load_read_access_manifest(
     agent_run_id: str,
 ) -> dict[str, Any]:
     path = _read_access_manifest_path(repo_root, orchestration_id, agent_run_id=agent_run_id)
-    if not path.exists():
+    if not _document_exists(path):
         raise FileNotFoundError(f"read access manifest not found: {path}")
     payload = _read_json(path)
     if not isinstance(payload, dict):
@@ -8267,7 +8650,7 @@ def build_bwrap_profile(
         agent_run_id=agent_run_id,
     )
     cap_path = _capabilities_dir(repo_root, orchestration_id) / f"{agent_run_id}.json"
-    if not cap_path.exists():
+    if not _document_exists(cap_path):
         raise ValueError(f"capability file not found: {cap_path}")
     cap_payload = _read_json(cap_path)
     if not isinstance(cap_payload, dict):
@@ -8611,7 +8994,7 @@ def render_bwrap_command(
         if not isinstance(rel, str) or not rel.strip():
             continue
         abs_path = (Path(repo_root) / _normalize_rel_posix(rel)).resolve()
-        if not abs_path.exists():
+        if not _document_exists(abs_path):
             continue
         # Do NOT ro-bind a read input that lives inside a writable write_root: the rw
         # write_root bind already exposes it, and an ro file-pin would make it unwritable,
@@ -8665,13 +9048,18 @@ def render_bwrap_command(
         # that exemption unconditionally suppresses from the terminal write-diff. Reject it
         # fail-closed (the caller turns this into sandbox_enforcement_violation). Directory
         # roots are checked here because only file pins carry the symlink guard below.
-        _pycache_abs = (Path(repo_root) / _HOST_PYCACHE_REDIRECT_PREFIX).resolve()
-        if abs_path == _pycache_abs or abs_path.is_relative_to(_pycache_abs):
-            raise ValueError(
-                f"write_roots entry {rel!r} resolves into the host bytecode-cache redirect root "
-                f"({_pycache_abs}); that subtree is exempt from unauthorized-write validation and "
-                f"must never be leaf-writable (check for a symlink in the path)"
-            )
+        for _host_prefix, _what in (
+            (_HOST_PYCACHE_REDIRECT_PREFIX, "host bytecode-cache redirect root"),
+            (_HOST_GATE_CACHE_PREFIX, "host gate-cache root"),
+            (_HOST_BUILD_CACHE_PREFIX, "host build-cache root"),
+        ):
+            _host_abs = (Path(repo_root) / _host_prefix).resolve()
+            if abs_path == _host_abs or abs_path.is_relative_to(_host_abs):
+                raise ValueError(
+                    f"write_roots entry {rel!r} resolves into the {_what} ({_host_abs}); that "
+                    f"subtree is exempt from unauthorized-write validation and must never be "
+                    f"leaf-writable (check for a symlink in the path)"
+                )
         if not abs_path.exists():
             # File pins must be pre-created by build_bwrap_profile before render.
             if not is_dir_root:
@@ -9023,36 +9411,40 @@ def _run_write_baseline_path(
     return _orchestration_root(repo_root, orchestration_id) / "orchestration_run_write_baseline.json"
 
 
-def _should_ignore_runtime_snapshot_path(
-    rel_posix: str,
-    *,
+def _run_write_baseline_store_path(
+    repo_root: Path,
     orchestration_id: str,
-    agent_run_id: str,
-) -> bool:
-    token = _normalize_rel_posix(rel_posix)
-    if not token or token.startswith(".git/"):
-        return True
-    # Ignore Claude local/runtime settings mutated by system-level hooks.
-    if token.startswith(".claude/"):
-        return True
-    # NOTE: dated archive / backup workspaces at the repo root (`workspace_<date>/`,
-    # `workspace_backup_*/`) are deliberately NOT exempted. They bloat the baseline,
-    # but exempting them from BOTH the baseline and the terminal diff would blind
-    # unauthorized-write validation to any child write under a `workspace_*` path
-    # (the diff is the defense-in-depth backstop for an output_manifest_write_guard
-    # bypass). Correctness of write validation outranks the snapshot-size win.
-    # NOTE: No blanket pyc/__pycache__ exemption here.  Incidental bytecode is kept out of the
-    # repo source tree at the WRITER, by role: the leaf / agent-launch subprocess path inherits
-    # PYTHONDONTWRITEBYTECODE=1 (base_env in run_workflow.py); run-gate subprocesses get it from
-    # _gate_python_env (which ALSO redirects PYTHONPYCACHEPREFIX to workspace/.pycache/); and the
-    # IN-PROCESS conductor host redirects its cache to workspace/.pycache/ via sys.pycache_prefix
-    # (run_workflow.py). Writes under that redirect root are exempted by
-    # _is_host_pycache_redirect_write (see _validate_actual_write_paths).  A *.pyc that still lands
-    # in a repo-tree __pycache__/ is therefore an explicit bytecode generation (e.g.
-    # python3 -m py_compile) — an agent action that SHOULD surface as an
-    # unauthorized_write_violation, and is not exempted anywhere.
+    *,
+    agent_run_id: str | None = None,
+) -> Path:
+    """The compact form (`tools/write_baseline_store.py`) of `_run_write_baseline_path`.
+
+    Baselines are written only in this form; the JSON path is still read when it is the
+    only one present (a baseline from before the compact store, on resume).
+    """
+    return _run_write_baseline_path(
+        repo_root, orchestration_id, agent_run_id=agent_run_id
+    ).with_suffix(".bin")
+
+
+def _write_baseline_base_dir(repo_root: Path, orchestration_id: str) -> Path:
+    from tools.write_baseline_store import BASE_DIRNAME
+
+    return _orchestration_root(repo_root, orchestration_id) / BASE_DIRNAME
+
+
+@lru_cache(maxsize=64)
+def _runtime_snapshot_ignored_prefixes(orchestration_id: str) -> tuple[str, ...]:
+    """Directory prefixes (each ending in `/`) whose whole subtree the FS-diff ignores.
+
+    Shared by `_should_ignore_runtime_snapshot_path` and the snapshot walk, which prunes
+    a directory matching one of these instead of listing and stat-ing what it holds.
+    """
     orch_root = _normalize_rel_posix(f"workspace/orchestrations/{orchestration_id}")
-    runtime_prefixes = (
+    return (
+        ".git/",
+        # Ignore Claude local/runtime settings mutated by system-level hooks.
+        ".claude/",
         f"{orch_root}/access_logs/",
         f"{orch_root}/access_policies/",
         # Adv-16: per-arid active-child markers managed by record_launch /
@@ -9089,8 +9481,187 @@ def _should_ignore_runtime_snapshot_path(
         # without this exemption it would surface in that leaf's terminal
         # write-diff and be misattributed as an unauthorized_write_violation.
         f"{orch_root}/run_logs/",
+        # Shared, content-addressed tables the compact write baselines are deltas against.
+        f"{orch_root}/write_baselines/",
     )
-    if any(token.startswith(prefix) for prefix in runtime_prefixes):
+
+
+# Set by `run_workflow.py --with-deps --jobs N` on each dependency node it runs while other
+# nodes of the same closure may be running: a JSON list of `{orchestration_id, spec_kind,
+# spec_id, spec_versions}`, one per such peer.
+CLOSURE_PEERS_ENV = "METDSL_CLOSURE_PEERS"
+
+
+def _closure_peers(orchestration_id: str) -> list[dict[str, Any]]:
+    """The well-formed entries of `CLOSURE_PEERS_ENV`, this node itself excluded.
+
+    Empty unless the variable is set: a sequential closure never needs it. A malformed
+    entry is dropped, never widened — a peer only ever explains writes in scopes the
+    driver named.
+    """
+    raw = os.environ.get(CLOSURE_PEERS_ENV, "").strip()
+    if not raw:
+        return []
+    try:
+        peers = json.loads(raw)
+    except ValueError:
+        return []
+    if not isinstance(peers, list):
+        return []
+    kept: list[dict[str, Any]] = []
+    for peer in peers:
+        if not isinstance(peer, dict):
+            continue
+        peer_id = peer.get("orchestration_id")
+        versions = peer.get("spec_versions")
+        if (
+            not _is_safe_path_token(peer_id)
+            or peer_id == orchestration_id
+            or not _is_safe_path_token(peer.get("spec_kind"))
+            or not _is_safe_path_token(peer.get("spec_id"))
+            or not isinstance(versions, list)
+        ):
+            continue
+        kept.append(peer)
+    return kept
+
+
+def _closure_peer_ignored_prefixes(repo_root: Path, orchestration_id: str) -> tuple[str, ...]:
+    """The orchestration roots of the concurrently running peers of this closure node.
+
+    A peer's orchestration root is runtime state its own driver rewrites throughout the
+    run, exactly like this node's own root (`_runtime_snapshot_ignored_prefixes`), so it
+    stays out of the walk. The peer's node trees and scratch roots do not: a write there
+    is classified per path by `_closure_peer_write_explained`.
+    """
+    return tuple(f"workspace/orchestrations/{peer['orchestration_id']}/"
+                 for peer in _closure_peers(orchestration_id))
+
+
+def _closure_peer_run_end_ns(records: dict[str, dict[str, Any]], arid: str) -> int | None:
+    """`finished_at` of a peer run's terminal row in ns; None while the run has none."""
+    record = records.get(arid)
+    finished = record.get("finished_at") if record is not None else None
+    if not isinstance(finished, str):
+        return None
+    parsed = _parse_iso_z_expiry(finished)
+    # An unreadable end closes the window rather than leaving it open.
+    return int(parsed.timestamp()) * 10**9 + parsed.microsecond * 1000 if parsed is not None else 0
+
+
+def _closure_peer_write_windows(
+    repo_root: Path, orchestration_id: str
+) -> list[tuple[tuple[str, ...], int, int | None]]:
+    """`(scopes, start_ns, end_ns)` per launch of a concurrently running closure peer.
+
+    A launch's scopes are the parts of the peer's `workspace/ir/<node_key_safe>/` and
+    `workspace/pipelines/<node_key_safe>/` trees its capability grants it, plus its own
+    `workspace/tmp/<arid>/` root. The window opens when the capability was written and
+    closes at the run's `finished_at` in the peer's `agent_runs.jsonl`; a run with no
+    terminal row is still open. The peer's orchestration agent holds only its scratch
+    root, for the whole of its run. The set grows as the peer launches children.
+    """
+    windows: list[tuple[tuple[str, ...], int, int | None]] = []
+    for peer in _closure_peers(orchestration_id):
+        peer_root = _orchestration_root(repo_root, peer["orchestration_id"])
+        trees = tuple(
+            f"workspace/{area}/{peer['spec_kind']}__{peer['spec_id']}__{version}/"
+            for version in peer["spec_versions"] if _is_safe_path_token(version)
+            for area in ("ir", "pipelines")
+        )
+        try:
+            records = _load_run_records(peer_root)
+        except RuntimeError:
+            records = {}
+        try:
+            with os.scandir(peer_root / "capabilities") as it:
+                caps = [e for e in it if e.name.endswith(".json") and e.is_file()]
+        except OSError:
+            caps = []
+        for entry in caps:
+            arid = entry.name[:-5]
+            doc = _read_json_or_none(Path(entry.path))
+            if not _is_safe_path_token(arid) or not isinstance(doc, dict):
+                continue
+            # A grant wider than the peer's trees (`workspace/ir/`) is clipped to them.
+            granted = [
+                root if _repo_path_under_prefix(root, tree) else tree
+                for root in _load_write_roots_from_cap(doc.get("write_roots"))
+                for tree in trees
+                if _repo_path_under_prefix(root, tree) or _repo_path_under_prefix(tree, root)
+            ]
+            try:
+                start_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            windows.append(((*granted, f"workspace/tmp/{arid}/"), start_ns,
+                            _closure_peer_run_end_ns(records, arid)))
+        meta = _read_json_or_none(peer_root / "orchestration_meta.json")
+        orch_arid = meta.get("orchestration_agent_run_id") if isinstance(meta, dict) else None
+        if isinstance(orch_arid, str) and _is_safe_path_token(orch_arid.strip()):
+            orch_arid = orch_arid.strip()
+            windows.append(((f"workspace/tmp/{orch_arid}/",), 0,
+                            _closure_peer_run_end_ns(records, orch_arid)))
+    return windows
+
+
+def _closure_peer_write_explained(
+    repo_root: Path,
+    rel_posix: str,
+    windows: list[tuple[tuple[str, ...], int, int | None]],
+) -> bool:
+    """Whether a concurrently running peer's launch accounts for this changed path.
+
+    Only when the path lies in a launch's scopes AND its inode change time falls inside
+    that launch's window. ctime, not mtime: `touch -d` cannot set it, so a leaf cannot
+    date its own write into a peer's window. A deleted path is timed by its nearest
+    surviving directory, whose ctime the unlink moved. Anything else stays in this node's
+    diff and is judged as this node's write.
+    """
+    scoped = [(start, end) for scopes, start, end in windows
+              if _path_under_any_write_root(rel_posix, list(scopes))]
+    if not scoped:
+        return False
+    path = repo_root / rel_posix
+    while True:
+        try:
+            changed_ns = path.lstat().st_ctime_ns
+            break
+        except OSError:
+            if path == repo_root:
+                return False
+            path = path.parent
+    return any(start <= changed_ns and (end is None or changed_ns <= end)
+               for start, end in scoped)
+
+
+def _should_ignore_runtime_snapshot_path(
+    rel_posix: str,
+    *,
+    orchestration_id: str,
+    agent_run_id: str,
+) -> bool:
+    token = _normalize_rel_posix(rel_posix)
+    if not token:
+        return True
+    # NOTE: dated archive / backup workspaces at the repo root (`workspace_<date>/`,
+    # `workspace_backup_*/`) are deliberately NOT exempted. They bloat the baseline,
+    # but exempting them from BOTH the baseline and the terminal diff would blind
+    # unauthorized-write validation to any child write under a `workspace_*` path
+    # (the diff is the defense-in-depth backstop for an output_manifest_write_guard
+    # bypass). Correctness of write validation outranks the snapshot-size win.
+    # NOTE: No blanket pyc/__pycache__ exemption here.  Incidental bytecode is kept out of the
+    # repo source tree at the WRITER, by role: the leaf / agent-launch subprocess path inherits
+    # PYTHONDONTWRITEBYTECODE=1 (base_env in run_workflow.py); run-gate subprocesses get it from
+    # _gate_python_env (which ALSO redirects PYTHONPYCACHEPREFIX to workspace/.pycache/); and the
+    # IN-PROCESS conductor host redirects its cache to workspace/.pycache/ via sys.pycache_prefix
+    # (run_workflow.py). Writes under that redirect root are exempted by
+    # _is_host_pycache_redirect_write (see _validate_actual_write_paths).  A *.pyc that still lands
+    # in a repo-tree __pycache__/ is therefore an explicit bytecode generation (e.g.
+    # python3 -m py_compile) — an agent action that SHOULD surface as an
+    # unauthorized_write_violation, and is not exempted anywhere.
+    orch_root = _normalize_rel_posix(f"workspace/orchestrations/{orchestration_id}")
+    if token.startswith(_runtime_snapshot_ignored_prefixes(orchestration_id)):
         return True
     # `failure_analysis.runtime.<uuid12>.json` safety-net sidecar, written by the
     # outer run_workflow process's dev-mode failure-analysis path
@@ -9108,6 +9679,20 @@ def _should_ignore_runtime_snapshot_path(
         token,
     ):
         return True
+    # `run_workflow._orchestration_catalog`'s cache of every orchestration's meta fields,
+    # shared by all orchestrations of the repository: another driver's lookup rewrites it
+    # (and stages its temp file beside it) while this orchestration's children run.
+    if token == "workspace/orchestrations/catalog_index.jsonl" or re.fullmatch(
+        r"workspace/orchestrations/\.catalog_index\.jsonl\.[^/]+\.tmp", token
+    ):
+        return True
+    # The snapshot index's own `_atomic_write_text` staging file, visible to a walk that
+    # runs while another process of this orchestration is replacing the index.
+    if re.fullmatch(
+        rf"{re.escape(orch_root)}/\.{re.escape(_SNAPSHOT_INDEX_FILENAME)}\.[^/]+\.tmp",
+        token,
+    ):
+        return True
     runtime_files = {
         f"{orch_root}/agent_graph.json",
         f"{orch_root}/agent_runs.jsonl",
@@ -9150,30 +9735,147 @@ def _should_ignore_runtime_snapshot_path(
         f"{orch_root}/phase_state_log.jsonl",
         f"{orch_root}/preflight.json",
         f"{orch_root}/orchestration_run_write_baseline.json",
+        f"{orch_root}/orchestration_run_write_baseline.bin",
+        # Stat cache of the snapshot walk itself (`_snapshot_repo_files`).
+        f"{orch_root}/{_SNAPSHOT_INDEX_FILENAME}",
         f"{orch_root}/session_run_index.json",
         f"{orch_root}/session_run_index.json.lock",
     }
     return token in runtime_files
 
 
+_SNAPSHOT_INDEX_FILENAME = "snapshot_index.json"
+_SNAPSHOT_INDEX_VERSION = 1
+# A file whose mtime or ctime is this close to the walk that recorded it may still be
+# rewritten within the same timestamp tick (coarse-granularity filesystems), leaving a
+# stat identical to the recorded one over different bytes. Such an entry is recorded
+# without its digest and rehashed on the next walk — git's "racily clean" rule.
+_SNAPSHOT_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _snapshot_index_path(repo_root: Path, orchestration_id: str) -> Path:
+    return _orchestration_root(repo_root, orchestration_id) / _SNAPSHOT_INDEX_FILENAME
+
+
+def _load_snapshot_index(path: Path) -> dict[str, list[Any]]:
+    """The persisted `rel -> [size, mtime_ns, ino, ctime_ns, digest]` map, or {}.
+
+    A missing, unreadable, foreign-version or malformed index is an empty one: the
+    index is a cache, and every entry it contributes is re-validated against a fresh
+    stat before its digest is reused.
+    """
+    try:
+        doc = _read_json(path)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(doc, dict) or doc.get("version") != _SNAPSHOT_INDEX_VERSION:
+        return {}
+    files = doc.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {
+        rel: entry
+        for rel, entry in files.items()
+        if isinstance(rel, str)
+        and isinstance(entry, list)
+        and len(entry) == 5
+        and all(isinstance(v, int) for v in entry[:4])
+        and isinstance(entry[4], str)
+    }
+
+
+def _iter_snapshot_files(
+    repo_root: Path, ignored_prefixes: tuple[str, ...]
+) -> Iterator[tuple[str, str, os.stat_result]]:
+    """Yield `(rel_posix, abs_path, stat)` for every file `repo_root.rglob("*")` +
+    `is_file()` would report: regular files and symlinks to them (stat follows the
+    link), no descent into symlinked directories, unreadable directories skipped.
+    A directory under one of `ignored_prefixes` is pruned whole, because every path
+    below it is exempt from the diff anyway.
+    """
+    stack: list[tuple[str, str]] = [("", str(repo_root))]
+    while stack:
+        rel_dir, abs_dir = stack.pop()
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = list(it)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            rel = f"{rel_dir}{entry.name}"
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not f"{rel}/".startswith(ignored_prefixes):
+                    stack.append((f"{rel}/", entry.path))
+                continue
+            try:
+                st = entry.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError as exc:
+                if exc.errno in {errno.ELOOP, errno.EBADF}:
+                    continue
+                raise
+            if stat.S_ISREG(st.st_mode):
+                yield rel, entry.path, st
+
+
 def _snapshot_repo_files(
     repo_root: Path,
     *,
     orchestration_id: str,
     agent_run_id: str,
 ) -> dict[str, str]:
+    """`{rel_posix: "sha256:<hex>"}` for every non-exempt file under `repo_root`.
+
+    Incremental: the walk is a stat walk, and a file is hashed only when its
+    (size, mtime_ns, inode, ctime_ns) differs from what this orchestration's
+    `snapshot_index.json` recorded with its digest. ctime is in the key because no
+    unprivileged writer can set it: `touch -d` restoring an mtime over new bytes still
+    moves ctime. The index lives at the orchestration-dir root, read-only inside the
+    sandbox, so a leaf cannot plant digests to hide a write. The result is exactly the
+    full-hash snapshot's; only its cost changes.
+    """
+    started_ns = time.time_ns()
+    index_path = _snapshot_index_path(repo_root, orchestration_id)
+    previous = _load_snapshot_index(index_path)
+    current: dict[str, list[Any]] = {}
     snapshot: dict[str, str] = {}
-    for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
-        rel = _normalize_rel_posix(path.relative_to(repo_root).as_posix())
-        if _should_ignore_runtime_snapshot_path(
+    peer_prefixes = _closure_peer_ignored_prefixes(repo_root, orchestration_id)
+    ignored_prefixes = _runtime_snapshot_ignored_prefixes(orchestration_id) + peer_prefixes
+    for rel, abs_path, st in _iter_snapshot_files(repo_root, ignored_prefixes):
+        rel = _normalize_rel_posix(rel)
+        if rel.startswith(peer_prefixes) or _should_ignore_runtime_snapshot_path(
             rel,
             orchestration_id=orchestration_id,
             agent_run_id=agent_run_id,
         ):
             continue
-        snapshot[rel] = _compute_sha256(path)
+        identity = [st.st_size, st.st_mtime_ns, st.st_ino, st.st_ctime_ns]
+        cached = previous.get(rel)
+        if cached is not None and cached[4] and cached[:4] == identity:
+            digest = cached[4]
+        else:
+            digest = _compute_sha256(Path(abs_path))
+        snapshot[rel] = digest
+        racy = max(st.st_mtime_ns, st.st_ctime_ns) >= started_ns - _SNAPSHOT_RACY_WINDOW_NS
+        trusted = not racy and digest != "sha256:missing"
+        current[rel] = [*identity, digest if trusted else ""]
+    if current != previous and index_path.parent.is_dir():
+        try:
+            _atomic_write_text(
+                index_path,
+                json.dumps(
+                    {"version": _SNAPSHOT_INDEX_VERSION, "files": current},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                ),
+            )
+        except OSError:
+            pass  # a cache write failure costs the next walk its hashes, nothing else
     return snapshot
 
 
@@ -9194,10 +9896,18 @@ def _write_run_write_baseline(
             agent_run_id=run_id,
         ),
     }
-    _write_json(
-        _run_write_baseline_path(repo_root, orchestration_id, agent_run_id=agent_run_id),
+    from tools.write_baseline_store import save_baseline
+
+    save_baseline(
+        _run_write_baseline_store_path(repo_root, orchestration_id, agent_run_id=agent_run_id),
+        _write_baseline_base_dir(repo_root, orchestration_id),
         payload,
     )
+    # A legacy JSON baseline left from before a resume would otherwise outlive the one
+    # just taken and be read by a tool that only knows the JSON form.
+    _run_write_baseline_path(repo_root, orchestration_id, agent_run_id=agent_run_id).unlink(
+        missing_ok=True
+    )
     return payload
 
 
@@ -9207,11 +9917,25 @@ def _load_run_write_baseline(
     *,
     agent_run_id: str | None = None,
 ) -> dict[str, Any]:
+    from tools.write_baseline_store import BaselineFormatError, load_baseline
+
+    store_path = _run_write_baseline_store_path(
+        repo_root, orchestration_id, agent_run_id=agent_run_id
+    )
     path = _run_write_baseline_path(repo_root, orchestration_id, agent_run_id=agent_run_id)
-    if not path.exists():
+    if store_path.exists():
+        try:
+            payload = load_baseline(
+                store_path, _write_baseline_base_dir(repo_root, orchestration_id)
+            )
+        except (OSError, BaselineFormatError) as exc:
+            raise ValueError(f"run write baseline unreadable: {store_path}: {exc}") from exc
+        path = store_path
+    elif not path.exists():
         who = agent_run_id.strip() if isinstance(agent_run_id, str) and agent_run_id.strip() else "orchestration"
         raise ValueError(f"run write baseline missing for {who}: {path}")
-    payload = _read_json(path)
+    else:
+        payload = _read_json(path)
     if not isinstance(payload, dict):
         raise ValueError(f"run write baseline must be object: {path}")
     files = payload.get("files")
@@ -9253,6 +9977,7 @@ def _compute_changed_paths_against_baseline(
         agent_run_id=agent_run_id,
     )
     run_id = agent_run_id.strip() if isinstance(agent_run_id, str) and agent_run_id.strip() else "orchestration"
+    peer_prefixes = _closure_peer_ignored_prefixes(repo_root, orchestration_id)
     # Apply the runtime-snapshot ignore predicate to BOTH sides. `after` is
     # already filtered (via `_snapshot_repo_files`); filtering `before`
     # identically keeps the diff symmetric. Without this, a baseline written
@@ -9264,8 +9989,9 @@ def _compute_changed_paths_against_baseline(
     before = {
         rel: str(digest)
         for path, digest in dict(baseline.get("files", {})).items()
-        if not _should_ignore_runtime_snapshot_path(
-            (rel := _normalize_rel_posix(str(path))),
+        if not (rel := _normalize_rel_posix(str(path))).startswith(peer_prefixes)
+        and not _should_ignore_runtime_snapshot_path(
+            rel,
             orchestration_id=orchestration_id,
             agent_run_id=run_id,
         )
@@ -9280,7 +10006,125 @@ def _compute_changed_paths_against_baseline(
         for rel in set(before) | set(after)
         if before.get(rel) != after.get(rel)
     }
-    return sorted(changed)
+    peer_windows = _closure_peer_write_windows(repo_root, orchestration_id)
+    return sorted(rel for rel in changed
+                  if not _closure_peer_write_explained(repo_root, rel, peer_windows))
+
+
+# One in this many tracked children (chosen by a digest of the agent_run_id, so the
+# choice is reproducible) also runs the full diff and compares.
+_WRITE_TRACKING_CROSS_CHECK_EVERY = 8
+_WRITE_TRACKING_CROSS_CHECK_ENV = "METDSL_WRITE_TRACKING_CROSS_CHECK"
+
+
+def _start_write_tracker(repo_root: Path, orchestration_id: str, *, agent_run_id: str) -> bool:
+    """Start the child's inotify watcher when `METDSL_WRITE_TRACKING=inotify` selects it.
+
+    Must run BEFORE the child's launch baseline is written: a write between a baseline and
+    a watch that is not yet installed would be invisible to both.
+    """
+    from tools import write_tracker
+
+    if write_tracker.write_tracking_mode(os.environ) != write_tracker.WRITE_TRACKING_INOTIFY:
+        return False
+    return write_tracker.start(
+        repo_root,
+        _orchestration_root(repo_root, orchestration_id),
+        agent_run_id,
+        _runtime_snapshot_ignored_prefixes(orchestration_id),
+    )
+
+
+def _tracked_changed_paths(
+    repo_root: Path,
+    orchestration_id: str,
+    *,
+    agent_run_id: str,
+    final: bool,
+) -> list[str] | None:
+    """The child's changed paths from its watcher's candidates, or None for the full diff.
+
+    Each candidate is compared against the launch baseline exactly as
+    `_compute_changed_paths_against_baseline` compares a walked path: same exemptions,
+    same `is_file()` rule, same digest. A directory the watcher saw removed or moved
+    expands to every baseline file below it, and one moved in was reported file by file.
+    """
+    from tools import write_tracker
+
+    state = write_tracker.collect(
+        _orchestration_root(repo_root, orchestration_id), agent_run_id, final=final
+    )
+    if state is None:
+        return None
+    baseline = _load_run_write_baseline(repo_root, orchestration_id, agent_run_id=agent_run_id)
+    peer_prefixes = _closure_peer_ignored_prefixes(repo_root, orchestration_id)
+    before = {
+        rel: str(digest)
+        for path, digest in dict(baseline.get("files", {})).items()
+        if not (rel := _normalize_rel_posix(str(path))).startswith(peer_prefixes)
+        and not _should_ignore_runtime_snapshot_path(
+            rel,
+            orchestration_id=orchestration_id,
+            agent_run_id=agent_run_id,
+        )
+    }
+    candidates = {_normalize_rel_posix(str(p)) for p in state.get("paths") or []}
+    for raw_dir in state.get("dirs") or []:
+        prefix = _normalize_rel_posix(str(raw_dir)).rstrip("/") + "/"
+        candidates.update(rel for rel in before if rel.startswith(prefix))
+    changed: list[str] = []
+    for rel in sorted(candidates):
+        if not rel or rel.startswith(peer_prefixes) or _should_ignore_runtime_snapshot_path(
+            rel, orchestration_id=orchestration_id, agent_run_id=agent_run_id
+        ):
+            continue
+        path = repo_root / rel
+        # rglob never enters a symlinked directory, so a path below one is not a file of
+        # the snapshot even though `is_file()` would follow it.
+        below_symlink = any((repo_root / parent).is_symlink()
+                            for parent in Path(rel).parents if str(parent) != ".")
+        after = _compute_sha256(path) if not below_symlink and path.is_file() else None
+        if before.get(rel) != after:
+            changed.append(rel)
+    peer_windows = _closure_peer_write_windows(repo_root, orchestration_id)
+    return [rel for rel in changed
+            if not _closure_peer_write_explained(repo_root, rel, peer_windows)]
+
+
+def _cross_check_tracked_paths(
+    repo_root: Path,
+    orchestration_id: str,
+    *,
+    agent_run_id: str,
+    tracked: list[str],
+) -> list[str]:
+    """Return `tracked`, or the full diff when this child is sampled and they disagree.
+
+    A disagreement is persisted to `agents/<arid>/write_tracker_cross_check.json`: it
+    means the watcher missed a write, which is a finding in its own right.
+    """
+    forced = os.environ.get(_WRITE_TRACKING_CROSS_CHECK_ENV, "").strip().lower()
+    sampled = int(hashlib.sha256(agent_run_id.encode("utf-8")).hexdigest(), 16) % max(
+        1, _WRITE_TRACKING_CROSS_CHECK_EVERY
+    ) == 0
+    if not (forced in {"1", "always"} or (sampled and forced not in {"0", "never"})):
+        return tracked
+    full = _compute_changed_paths_against_baseline(
+        repo_root, orchestration_id, agent_run_id=agent_run_id
+    )
+    if full != tracked:
+        _write_json(
+            _orchestration_root(repo_root, orchestration_id)
+            / "agents" / agent_run_id / "write_tracker_cross_check.json",
+            {
+                "agent_run_id": agent_run_id,
+                "checked_at": _utc_now_iso(),
+                "missed_by_tracker": sorted(set(full) - set(tracked)),
+                "extra_in_tracker": sorted(set(tracked) - set(full)),
+            },
+        )
+        return full
+    return tracked
 
 
 def _actual_changed_paths_since_baseline(
@@ -9301,6 +10145,17 @@ def _actual_changed_paths_since_baseline(
     # `_deactivate_snapshot_path`) but is no longer consulted for diff
     # short-circuiting — that would hide real unauthorized writes that
     # appear between deactivate and the (possibly retried) record-agent-run.
+    #
+    # `METDSL_WRITE_TRACKING=inotify` swaps the walk for the child's watcher (see
+    # `_tracked_changed_paths`); the list it yields is the one the walk would have.
+    if isinstance(agent_run_id, str) and agent_run_id.strip():
+        tracked = _tracked_changed_paths(
+            repo_root, orchestration_id, agent_run_id=agent_run_id.strip(), final=True
+        )
+        if tracked is not None:
+            return _cross_check_tracked_paths(
+                repo_root, orchestration_id, agent_run_id=agent_run_id.strip(), tracked=tracked
+            )
     return _compute_changed_paths_against_baseline(
         repo_root, orchestration_id, agent_run_id=agent_run_id
     )
@@ -9342,6 +10197,26 @@ def _is_host_pycache_redirect_write(rel_path: str) -> bool:
     return _repo_path_under_prefix(_normalize_rel_posix(rel_path), _HOST_PYCACHE_REDIRECT_PREFIX)
 
 
+def _is_host_gate_cache_write(rel_path: str) -> bool:
+    """True if `rel_path` is under the validator's rule-result cache (``workspace/.gate_cache/``;
+    see _HOST_GATE_CACHE_PREFIX and tools/gate_cache.py).
+
+    The conductor runs ``validate_pipeline_semantics.py`` from deterministic substeps whose
+    child window is write-audited, and the validator memoizes rule results there — a trusted
+    HOST write, exempt for the reason and on the terms of _is_host_pycache_redirect_write: bwrap
+    binds the repo read-only, so a confined leaf that runs the validator hits EROFS (swallowed by
+    the cache) and cannot plant an entry."""
+    return _repo_path_under_prefix(_normalize_rel_posix(rel_path), _HOST_GATE_CACHE_PREFIX)
+
+
+def _is_host_build_cache_write(rel_path: str) -> bool:
+    """True if `rel_path` is under Build's dependency compile cache (``workspace/.build_cache/``;
+    see _HOST_BUILD_CACHE_PREFIX and tools/compile_cache.py). The in-process Build stores the
+    objects it compiled there inside its audited child window; exempt on the terms of
+    _is_host_gate_cache_write."""
+    return _repo_path_under_prefix(_normalize_rel_posix(rel_path), _HOST_BUILD_CACHE_PREFIX)
+
+
 def _orchestration_allowed_write_roots(orchestration_id: str) -> list[str]:
     # Host bytecode cache under workspace/.pycache/ (both the sys.pycache_prefix host redirect and
     # _gate_python_env's PYTHONPYCACHEPREFIX) is handled by the broad _is_host_pycache_redirect_write
@@ -9555,9 +10430,9 @@ def _cleanup_agent_tmp_root(
     is_owner_via_orchestration = False
     if not is_owner_via_launch:
         meta_path = orch_root_dir / "orchestration_meta.json"
-        if meta_path.is_file():
+        if _document_exists(meta_path):
             try:
-                meta_doc = json.loads(meta_path.read_text(encoding="utf-8"))
+                meta_doc = _read_json(meta_path)
             except (OSError, json.JSONDecodeError):
                 meta_doc = None
             if isinstance(meta_doc, dict):
@@ -9779,6 +10654,7 @@ def dismiss_violation(
             f"{token_path}. Re-run orchestration init to regenerate it."
         )
     _candidate = operator_token.strip() if operator_token else ""
+    import secrets
     # Constant-time compare so the gate does not leak the token via timing.
     if not _candidate or not secrets.compare_digest(_candidate, expected_token):
         raise ValueError(
@@ -10237,6 +11113,14 @@ def _validate_actual_write_paths(
             # (see _is_host_pycache_redirect_write): a leaf's explicit py_compile writes to the
             # source's own __pycache__, never here, so it still surfaces.
             continue
+        if _is_host_gate_cache_write(path):
+            # Validator rule-result cache written by the host's gate runs; exempt (see
+            # _is_host_gate_cache_write).
+            continue
+        if _is_host_build_cache_write(path):
+            # Dependency compile cache written by the host's in-process Build; exempt (see
+            # _is_host_build_cache_write).
+            continue
         if path in manifest_integrity_protected_logs:
             # Canonical MCP-owned audit logs are pre-validated against
             # canonical phase placements at launch time and protected by
@@ -11826,7 +12710,7 @@ def _fence_pure_doc(text: str) -> str:
                       PURE_DOC_FENCE_END])
 
 
-_PURE_PLACEHOLDER_RE = re.compile(r"<(\w+)>")
+_PURE_PLACEHOLDER_RE = lazy_re.compile(r"<(\w+)>")
 
 
 def _substitute_pure_placeholders(template: str, subs: dict[str, str]) -> str:
@@ -12525,15 +13409,15 @@ def _required_launch_prompt_constraint_lines(request_payload: dict[str, Any]) ->
 # backslash-continued invocations). Both checks ensure narrative
 # mentions of `validate_pipeline_semantics.py` in documentation prose are
 # never flagged.
-_DIRECT_INVOCATION_RE = re.compile(r"validate_pipeline_semantics\.py\b")
-_RUN_GATE_INVOCATION_RE = re.compile(r"--gate\s+validate_pipeline_semantics\b")
-_PYTHON3_INVOCATION_TOKEN_RE = re.compile(r"python3\b")
+_DIRECT_INVOCATION_RE = lazy_re.compile(r"validate_pipeline_semantics\.py\b")
+_RUN_GATE_INVOCATION_RE = lazy_re.compile(r"--gate\s+validate_pipeline_semantics\b")
+_PYTHON3_INVOCATION_TOKEN_RE = lazy_re.compile(r"python3\b")
 
 # Stage value extractors. Each produces a single capturing group with the
 # stage token. The patterns use a permissive lookahead body so they
 # tolerate wrapped commands (line continuations / multiline JSON args);
 # the caller bounds the search window before invoking these patterns.
-_DIRECT_STAGE_RE = re.compile(
+_DIRECT_STAGE_RE = lazy_re.compile(
     r"validate_pipeline_semantics\.py\b.*?--stage\s+(\w+)",
     re.DOTALL,
 )
@@ -12542,7 +13426,7 @@ _DIRECT_STAGE_RE = re.compile(
 # addition to the single-quoted form (`--args-json '{"stage":...}'`).
 # The optional `\\?` before each quote captures the escape character
 # when present. Codex review round 15 P1.
-_RUN_GATE_STAGE_RE = re.compile(
+_RUN_GATE_STAGE_RE = lazy_re.compile(
     r"--gate\s+validate_pipeline_semantics\b.*?"
     r"\\?[\"']stage\\?[\"']\s*:\s*\\?[\"'](\w+)\\?[\"']",
     re.DOTALL,
@@ -12804,13 +13688,13 @@ def _gate_allowlist_scan_text(request_payload: dict[str, Any], prompt_text: str)
     return _strip_exemplar_regions(prompt_text)
 
 
-_EXEMPLAR_REGION_RE = re.compile(
+_EXEMPLAR_REGION_RE = lazy_re.compile(
     re.escape(_EXEMPLAR_BEGIN_PREFIX) + r".*?" + re.escape(_EXEMPLAR_END_PREFIX) + r"[^\n]*",
     re.DOTALL,
 )
 
 
-_PURE_DOC_REGION_RE = re.compile(
+_PURE_DOC_REGION_RE = lazy_re.compile(
     re.escape(PURE_DOC_FENCE_BEGIN) + r".*?" + re.escape(PURE_DOC_FENCE_END),
     re.DOTALL,
 )
@@ -15030,6 +15914,179 @@ def _validate_launch_request_payload(request_payload: dict[str, Any]) -> None:
         )
 
 
+class _LedgerRecord(dict):
+    """A record of the cached ledger state, shared by every caller: mutation is refused.
+
+    `dict(record)` / `copy.deepcopy(record)` / `{**record}` return ordinary mutable
+    copies for a caller that needs one.
+    """
+
+    __slots__ = ()
+
+    def _refuse(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise TypeError("agent_runs ledger records are shared and read-only; copy before mutating")
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        import copy
+
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class _LedgerList(list):
+    __slots__ = ()
+
+    def _refuse(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise TypeError("agent_runs ledger records are shared and read-only; copy before mutating")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+    append = clear = extend = insert = pop = remove = reverse = sort = _refuse
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        import copy
+
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+def _freeze_ledger_value(value: Any) -> Any:
+    if type(value) is dict:
+        return _LedgerRecord((key, _freeze_ledger_value(item)) for key, item in value.items())
+    if type(value) is list:
+        return _LedgerList(_freeze_ledger_value(item) for item in value)
+    return value
+
+
+class _LedgerState:
+    """What one process has already parsed of one JSONL ledger.
+
+    `offset` is the end of the last newline-terminated line folded into `records`; a
+    reader parses only the bytes after it. The state is valid while the file keeps its
+    `(st_dev, st_ino)`, has not shrunk below `offset`, and still holds `tail` (the last
+    folded line) just before `offset` — every rewrite of a ledger goes through
+    `_atomic_write_text` (a new inode), and the tail check catches an in-place rewrite.
+    """
+
+    __slots__ = ("identity", "offset", "tail", "n_lines", "records")
+
+    def __init__(self, identity: tuple[int, int]) -> None:
+        self.identity = identity
+        self.offset = 0
+        self.tail = b""
+        self.n_lines = 0
+        self.records: dict[str, dict[str, Any]] = {}
+
+
+_LEDGER_STATES: dict[tuple[str, bool], _LedgerState] = {}
+
+
+def _read_ledger_records(
+    path: Path,
+    *,
+    strict: bool,
+    caller_holds_lock: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """The ledger at `path` keyed by agent_run_id (last line wins), parsing only new bytes.
+
+    `strict` is the `agent_runs.jsonl` contract (see `_load_run_records`): a malformed
+    line raises, unless it is the last non-empty line and a writer holds the lock. Non-
+    strict skips malformed lines (`_load_invalid_run_records`). Only newline-terminated
+    lines that parsed are folded into the cached state; an unterminated or in-flight
+    trailing line is re-read by the next call, so a line still being appended is never
+    frozen into the cache in its partial form. The returned records are shared
+    (`_LedgerRecord`); the returned dict itself is the caller's own.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return {}
+    key = (str(path), strict)
+    identity = (st.st_dev, st.st_ino)
+    state = _LEDGER_STATES.get(key)
+    if state is None or state.identity != identity or st.st_size < state.offset:
+        state = _LedgerState(identity)
+    with path.open("rb") as fh:
+        if state.offset:
+            fh.seek(state.offset - len(state.tail))
+            if fh.read(len(state.tail)) != state.tail:
+                state = _LedgerState(identity)
+        fh.seek(state.offset)
+        data = fh.read()
+    # (byte offset just past the line's `\n` — None for the unterminated remainder —,
+    # the raw line, the stripped text) per non-empty line. `splitlines` is applied per
+    # `\n`-terminated chunk so every line break it knows still splits, as it did when
+    # the whole file was split at once.
+    lines: list[tuple[int | None, bytes, str]] = []
+    cursor = 0
+    while cursor < len(data):
+        newline = data.find(b"\n", cursor)
+        end = len(data) if newline < 0 else newline + 1
+        raw = data[cursor:end]
+        for text in raw.decode("utf-8").splitlines():
+            token = text.strip()
+            if token:
+                lines.append((state.offset + end if newline >= 0 else None, raw, token))
+        cursor = end
+    new_records: list[tuple[str, dict[str, Any]]] = []
+    committed = (state.offset, state.tail, state.n_lines, 0)
+    for idx, (end_offset, raw, token) in enumerate(lines):
+        line_no = state.n_lines + idx + 1
+        is_last = idx == len(lines) - 1
+        # Fold a chunk only once every line it holds has parsed.
+        if idx and lines[idx - 1][0] is not None and lines[idx - 1][0] != end_offset:
+            committed = (lines[idx - 1][0], lines[idx - 1][1], line_no - 1, len(new_records))
+        try:
+            item = json.loads(token)
+        except json.JSONDecodeError as exc:
+            if not strict:
+                item = None
+            elif is_last and not caller_holds_lock and _agent_runs_writer_active(path):
+                break
+            else:
+                raise RuntimeError(
+                    f"agent_runs.jsonl has malformed JSON at line {line_no}: {exc} "
+                    f"(no active writer detected — durable corruption; quarantine "
+                    f"the ledger and roll forward explicitly)"
+                    if is_last else
+                    f"agent_runs.jsonl has malformed non-trailing JSON at line {line_no}: {exc}"
+                ) from exc
+        if not isinstance(item, dict):
+            if not strict:
+                item = None
+            elif is_last and not caller_holds_lock and _agent_runs_writer_active(path):
+                break
+            else:
+                raise RuntimeError(
+                    f"agent_runs.jsonl line {line_no} is not a JSON object: {item!r}"
+                )
+        if item is not None:
+            run_id = item.get("agent_run_id")
+            if isinstance(run_id, str) and run_id.strip():
+                new_records.append((run_id.strip(), _freeze_ledger_value(item)))
+    else:
+        if lines and lines[-1][0] is not None:
+            committed = (lines[-1][0], lines[-1][1], state.n_lines + len(lines), len(new_records))
+    records = dict(state.records)
+    records.update(new_records)
+    state.offset, state.tail, state.n_lines, n_committed = committed
+    state.records.update(new_records[:n_committed])
+    _LEDGER_STATES[key] = state
+    return records
+
+
 def _load_run_records(
     orchestration_root: Path,
     *,
@@ -15052,42 +16109,16 @@ def _load_run_records(
     writer-active probe would self-contend and falsely report in-flight,
     silently masking durable trailing-line corruption. Pass True to force
     every malformed line to surface.
+
+    The ledger is tailed incrementally (`_read_ledger_records`), so a long run's
+    repeated loads cost the appended lines, not the whole file. The records are shared
+    and read-only; copy one before changing it.
     """
-    runs_path = orchestration_root / "agent_runs.jsonl"
-    records: dict[str, dict[str, Any]] = {}
-    if not runs_path.exists():
-        return records
-    non_empty_lines = [s for s in (raw.strip() for raw in runs_path.read_text(encoding="utf-8").splitlines()) if s]
-    n_lines = len(non_empty_lines)
-    for idx, line in enumerate(non_empty_lines):
-        is_last = idx == n_lines - 1
-        in_flight = (
-            is_last
-            and not caller_holds_lock
-            and _agent_runs_writer_active(runs_path)
-        )
-        try:
-            item = json.loads(line)
-        except json.JSONDecodeError as exc:
-            if in_flight:
-                continue
-            raise RuntimeError(
-                f"agent_runs.jsonl has malformed JSON at line {idx + 1}: {exc} "
-                f"(no active writer detected — durable corruption; quarantine "
-                f"the ledger and roll forward explicitly)"
-                if is_last else
-                f"agent_runs.jsonl has malformed non-trailing JSON at line {idx + 1}: {exc}"
-            ) from exc
-        if not isinstance(item, dict):
-            if in_flight:
-                continue
-            raise RuntimeError(
-                f"agent_runs.jsonl line {idx + 1} is not a JSON object: {item!r}"
-            )
-        run_id = item.get("agent_run_id")
-        if isinstance(run_id, str) and run_id.strip():
-            records[run_id.strip()] = item
-    return records
+    return _read_ledger_records(
+        orchestration_root / "agent_runs.jsonl",
+        strict=True,
+        caller_holds_lock=caller_holds_lock,
+    )
 
 
 def _load_invalid_run_records(
@@ -15105,27 +16136,12 @@ def _load_invalid_run_records(
     (a re-rejected retry overwrites the earlier diagnostic row).
     """
     invalid_path = orchestration_root / "agent_runs_invalid.jsonl"
-    records: dict[str, dict[str, Any]] = {}
     if not invalid_path.is_file():
-        return records
+        return {}
     try:
-        lines = invalid_path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return records
-    for raw in lines:
-        token = raw.strip()
-        if not token:
-            continue
-        try:
-            item = json.loads(token)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(item, dict):
-            continue
-        run_id = item.get("agent_run_id")
-        if isinstance(run_id, str) and run_id.strip():
-            records[run_id.strip()] = item
-    return records
+        return _read_ledger_records(invalid_path, strict=False)
+    except (OSError, UnicodeDecodeError):
+        return {}
 
 
 def _validate_terminal_run_payload(
@@ -15948,7 +16964,7 @@ def _canonical_codex_hook_command(event: str) -> str:
     return (
         "sh -lc 'ROOT=$(git rev-parse --show-toplevel) || exit 2; "
         "PYTHONPATH=\"$ROOT${PYTHONPATH:+:$PYTHONPATH}\" "
-        "METDSL_HOOK_REPO_ROOT=\"$ROOT\" python3 -m tools.hooks.cli "
+        "METDSL_HOOK_REPO_ROOT=\"$ROOT\" python3 -m tools.hooks.client "
         f"--backend codex --event {event} --repo-root \"$ROOT\"'"
     )
 
@@ -16658,7 +17674,7 @@ def _canonical_claude_hook_command(event: str) -> str:
     return (
         "sh -lc 'ROOT=$(git rev-parse --show-toplevel) || exit 2; "
         "PYTHONPATH=\"$ROOT${PYTHONPATH:+:$PYTHONPATH}\" "
-        "METDSL_HOOK_REPO_ROOT=\"$ROOT\" python3 -m tools.hooks.cli "
+        "METDSL_HOOK_REPO_ROOT=\"$ROOT\" python3 -m tools.hooks.client "
         f"--backend claude --event {event} --repo-root \"$ROOT\"'"
     )
 
@@ -18402,6 +19418,7 @@ def init_orchestration(
     if normalized_driver is not None:
         meta["driver"] = normalized_driver
     if not orchestration_agent_run_id:
+        import uuid
         orchestration_agent_run_id = str(uuid.uuid4())
     backend_token = str(agent_backend).strip().lower()
     if backend_token not in SUPPORTED_PROVIDER_TOKENS:
@@ -18447,6 +19464,7 @@ def init_orchestration(
         )
         try:
             os.fchmod(_tok_fd, 0o600)
+            import uuid
             os.write(_tok_fd, str(uuid.uuid4()).encode("utf-8"))
             os.close(_tok_fd)
             os.replace(_tok_tmp, operator_token_path)
@@ -19031,460 +20049,467 @@ def record_launch(
     child_prompt_path = child_dialog_root / "child.prompt.txt"
     child_reply_path = child_dialog_root / "child.reply.txt"
 
-    graph_path = root / "agent_graph.json"
-    graph = _load_graph(graph_path)
-    edge = {
-        "parent_agent_run_id": parent_agent_run_id,
-        "child_agent_run_id": child_agent_run_id,
-        "relation_type": relation_type,
-    }
-    if edge not in graph["edges"]:
-        graph["edges"].append(edge)
-    _write_json(graph_path, graph)
-
-    nk = request_payload.get("node_key")
-    st = request_payload.get("step")
-    out_refs: dict[str, Any] = {
-        "launch_request_ref": request_ref,
-        "launch_response_ref": response_ref,
-        "launch_prompt_ref": prompt_ref,
-        "launch_reply_ref": reply_ref,
-        "child_launch_request_ref": child_request_ref,
-        "child_launch_response_ref": child_response_ref,
-        "child_launch_prompt_ref": child_prompt_ref,
-        "child_launch_reply_ref": child_reply_ref,
-        # The exact prompt text record-launch rendered and wrote to
-        # launches/<child_arid>.prompt.txt. Returned so the orchestration agent
-        # can pass it verbatim to the child leaf WITHOUT reading the template
-        # (the tools/prompt_templates/ templates) or the written prompt file (both blocked for the
-        # orchestration). The child-leaf prompt is then identical in content to
-        # the recorded artifact by construction (audit 1-to-1); the .prompt.txt
-        # file only differs by a trailing newline the text writer appends.
-        # Retained in terse output.
-        "launch_prompt_text": prompt_text,
-    }
-    if not (isinstance(nk, str) and nk.strip() and isinstance(st, str) and st.strip()):
-        raise ValueError("record-launch requires non-empty node_key and step for sandbox-enforced launch")
-    if isinstance(nk, str) and nk.strip() and isinstance(st, str) and st.strip():
-        _write_access_policy_for_launch(
-            repo_root,
-            orchestration_id,
-            child_agent_run_id,
-            request_payload,
-        )
-        policy_doc = _read_json(
-            _access_policies_dir(repo_root, orchestration_id) / f"{child_agent_run_id}.json"
-        )
-        if not isinstance(policy_doc, dict):
-            raise ValueError("access policy must be object for read manifest generation")
-        allowed_read_roots_obj = policy_doc.get("allowed_read_roots")
-        denied_read_roots_obj = policy_doc.get("denied_read_roots")
-        allowed_read_roots = (
-            [str(item) for item in allowed_read_roots_obj]
-            if isinstance(allowed_read_roots_obj, list)
-            else []
-        )
-        denied_read_roots = (
-            [str(item) for item in denied_read_roots_obj]
-            if isinstance(denied_read_roots_obj, list)
-            else []
-        )
-        read_manifest_ref = _write_read_access_manifest(
-            repo_root,
-            orchestration_id=orchestration_id,
-            agent_run_id=child_agent_run_id,
-            allowed_read_roots=allowed_read_roots,
-            denied_read_roots=denied_read_roots,
-        )
-        out_refs["read_access_manifest_ref"] = read_manifest_ref
-        cap_doc = _write_capability_for_launch(
-            repo_root,
-            orchestration_id,
-            child_agent_run_id,
-            request_payload,
-        )
-        cap_rel = f"workspace/orchestrations/{orchestration_id}/capabilities/{child_agent_run_id}.json"
-        out_refs["capability_ref"] = cap_rel
-        out_refs["capability_token"] = cap_doc.get("capability_token", "")
-        # A pure-function leaf (Z2) holds no write authority: the access policy (denied-all),
-        # read manifest, and capability (`write_roots: []`, `mode: pure_readonly`) written above
-        # are the truthful zero-authority record. Below, the write-authorization surface —
-        # output paths, file-tool pins, write-contract preflight, and the output manifest — is
-        # skipped, and the sandbox is the read-only profile. The FS-diff baseline,
-        # session-run-index, agent_graph, parent_return_token, and active-child markers stay
-        # unconditional (a child-window write is then caught by the empty-write_roots containment
-        # rule against that baseline — fail-closed, no new branch).
-        is_pure = _is_pure_launch_request(request_payload)
-        write_roots_obj = cap_doc.get("write_roots")
-        write_roots = [str(item) for item in write_roots_obj] if isinstance(write_roots_obj, list) else []
-        # Resolve toolchain.build_system from spec.ir.yaml.impl_defaults so the
-        # canonical-placement helper can gate cross-phase auto-inject on
-        # `build_system=make` (the documented Make-only exception).
-        _ir_ref_for_bs = str(request_payload.get("ir_ref") or "").strip()
-        if _ir_ref_for_bs:
-            _bs_resolved = _impl_resolved_build_system(repo_root, _ir_ref_for_bs)
-            request_payload = dict(request_payload)
-            # Default an ABSENT build_system to "make" to mirror the conductor's
-            # `str(toolchain.build_system or "make")` default. Previously the key was set only
-            # when build_system resolved to a non-empty string, so a missing build_system left
-            # it unset -> `_mandatory_file_tool_pins_for_launch` saw bs_norm="" and skipped the
-            # Makefile pin, while the conductor still listed/required the Makefile for a
-            # non-host-authored generate node -> a launch that proceeds without authorizing the
-            # extensionless Makefile. The project is make-only (Conductor._require_make_build_system
-            # hard-fails non-make) and real compile-produced IR always carries an explicit
-            # build_system; an explicit non-make value (e.g. cmake) is preserved as-is.
-            request_payload["_resolved_build_system"] = (
-                _bs_resolved.strip().lower()
-                if isinstance(_bs_resolved, str) and _bs_resolved.strip() else "make")
-            # The conductor authors src/Makefile host-side iff make AND fortran, for BOTH leaf
-            # and dependency nodes (= Conductor._conductor_authors_makefile; the dependency
-            # Makefile is as IR-determined as the leaf one — Model B). Mirror that exact
-            # condition so the mandatory-Makefile pin is suppressed only when the conductor
-            # really authored it (and kept otherwise, e.g. c/cpp), matching the leaf's
-            # allowed_output_paths. Computed here rather than as separate flags so conductor
-            # and runtime cannot disagree.
-            _lang_resolved = _impl_resolved_language(repo_root, _ir_ref_for_bs)
-            _bs_for_mk = (_bs_resolved or "").strip().lower() if isinstance(_bs_resolved, str) else ""
-            # Mirror the conductor's defaulting EXACTLY (`str(... or "make")` / `... or
-            # "fortran")`): an absent build_system/language defaults to make/fortran on both
-            # sides, so the two never disagree (an absent build_system must not make the
-            # conductor author while the runtime keeps the pin -> record_launch fail-closed).
-            request_payload["_resolved_makefile_host_authored"] = control_file_host_authored(
-                _bs_for_mk, _lang_resolved)
-        if is_pure:
-            # No output paths, no file-tool pins, no write-contract preflight — a pure leaf
-            # authors nothing in its window. Empty lists flow through the (inert for generate)
-            # lineage / cross-phase blocks below and suppress the output-manifest write.
-            allowed_output_paths = []
-            allowed_file_tool_paths = []
-        else:
-            allowed_output_paths = _allowed_output_paths_for_launch(
-                request_payload=request_payload,
-                write_roots=write_roots,
+    # One group commit for the launch documents (agent graph, access policy, read and output
+    # manifests, capability, sandbox profile, launch dialogs, phase state): a constant number
+    # of fsync round trips instead of one per document. The write baseline, the parent return
+    # token and the active-child markers stay outside it — NEW-M1 needs the token durable
+    # BEFORE the marker exists, which a shared barrier would not order.
+    with _json_write_batch(root):
+        graph_path = root / "agent_graph.json"
+        graph = _load_graph(graph_path)
+        edge = {
+            "parent_agent_run_id": parent_agent_run_id,
+            "child_agent_run_id": child_agent_run_id,
+            "relation_type": relation_type,
+        }
+        if edge not in graph["edges"]:
+            graph["edges"].append(edge)
+        _write_json(graph_path, graph)
+
+        nk = request_payload.get("node_key")
+        st = request_payload.get("step")
+        out_refs: dict[str, Any] = {
+            "launch_request_ref": request_ref,
+            "launch_response_ref": response_ref,
+            "launch_prompt_ref": prompt_ref,
+            "launch_reply_ref": reply_ref,
+            "child_launch_request_ref": child_request_ref,
+            "child_launch_response_ref": child_response_ref,
+            "child_launch_prompt_ref": child_prompt_ref,
+            "child_launch_reply_ref": child_reply_ref,
+            # The exact prompt text record-launch rendered and wrote to
+            # launches/<child_arid>.prompt.txt. Returned so the orchestration agent
+            # can pass it verbatim to the child leaf WITHOUT reading the template
+            # (the tools/prompt_templates/ templates) or the written prompt file (both blocked for the
+            # orchestration). The child-leaf prompt is then identical in content to
+            # the recorded artifact by construction (audit 1-to-1); the .prompt.txt
+            # file only differs by a trailing newline the text writer appends.
+            # Retained in terse output.
+            "launch_prompt_text": prompt_text,
+        }
+        if not (isinstance(nk, str) and nk.strip() and isinstance(st, str) and st.strip()):
+            raise ValueError("record-launch requires non-empty node_key and step for sandbox-enforced launch")
+        if isinstance(nk, str) and nk.strip() and isinstance(st, str) and st.strip():
+            _write_access_policy_for_launch(
+                repo_root,
+                orchestration_id,
+                child_agent_run_id,
+                request_payload,
             )
-            allowed_file_tool_paths = _allowed_file_tool_paths_for_launch(
-                request_payload=request_payload,
-                allowed_output_paths=allowed_output_paths,
+            policy_doc = _read_json(
+                _access_policies_dir(repo_root, orchestration_id) / f"{child_agent_run_id}.json"
             )
-            _validate_child_write_contract_preflight(
-                request_payload=request_payload,
-                capability_doc=cap_doc,
-                allowed_output_paths=allowed_output_paths,
+            if not isinstance(policy_doc, dict):
+                raise ValueError("access policy must be object for read manifest generation")
+            allowed_read_roots_obj = policy_doc.get("allowed_read_roots")
+            denied_read_roots_obj = policy_doc.get("denied_read_roots")
+            allowed_read_roots = (
+                [str(item) for item in allowed_read_roots_obj]
+                if isinstance(allowed_read_roots_obj, list)
+                else []
             )
-        (repo_root / "workspace" / "tmp" / child_agent_run_id).mkdir(parents=True, exist_ok=True)
-        # Execute step lineage bind (mandatory for ALL execute launches, not
-        # only when cross-phase quality_check log is authorized): every
-        # execute run must declare `source_build_id` in the launch request,
-        # and the referenced build's `binary_meta.json` must record
-        # `source_source_id` matching the request's `source_id`.
-        # Without this binding, an execute could run binaries from build A
-        # while attributing evidence (e.g. trial_meta) to a different
-        # sibling build's generation — a mixed-build forge that purely
-        # in-phase logging would not catch elsewhere.
-        _step_token_for_bind = str(request_payload.get("step") or "").strip().lower()
-        _pipe_ref_for_bind = _normalize_rel_posix(
-            str(request_payload.get("pipeline_ref") or "")
-        )
-        _substep_token_for_bind = str(request_payload.get("substep") or "").strip().lower()
-        if (
-            _step_token_for_bind == "validate"
-            and _substep_token_for_bind == "execute"
-            and _pipe_ref_for_bind
-        ):
-            _gen_id_for_bind = str(
-                request_payload.get("source_id") or ""
-            ).strip()
-            _source_binary_id = str(
-                request_payload.get("source_binary_id") or ""
-            ).strip()
-            if not _gen_id_for_bind:
-                raise ValueError(
-                    "validate.execute launch requires `source_id` in the launch "
-                    "request to bind provenance to a specific source."
-                )
-            if not _source_binary_id:
-                raise ValueError(
-                    "validate.execute launch requires `source_binary_id` in the launch "
-                    "request to bind provenance to a specific build. "
-                    "Without this binding, evidence could be forged across "
-                    "sibling builds even when in-phase logging is used."
-                )
-            _bm_path = (
-                repo_root / _pipe_ref_for_bind / "binary" / _source_binary_id / "binary_meta.json"
+            denied_read_roots = (
+                [str(item) for item in denied_read_roots_obj]
+                if isinstance(denied_read_roots_obj, list)
+                else []
             )
-            if not _bm_path.is_file():
-                raise ValueError(
-                    f"validate.execute launch source_binary_id={_source_binary_id!r} "
-                    f"does not resolve to an existing binary_meta.json at "
-                    f"{_bm_path!s}. The referenced build must exist on disk "
-                    "before validate.execute can attribute provenance to it."
+            read_manifest_ref = _write_read_access_manifest(
+                repo_root,
+                orchestration_id=orchestration_id,
+                agent_run_id=child_agent_run_id,
+                allowed_read_roots=allowed_read_roots,
+                denied_read_roots=denied_read_roots,
+            )
+            out_refs["read_access_manifest_ref"] = read_manifest_ref
+            cap_doc = _write_capability_for_launch(
+                repo_root,
+                orchestration_id,
+                child_agent_run_id,
+                request_payload,
+            )
+            cap_rel = f"workspace/orchestrations/{orchestration_id}/capabilities/{child_agent_run_id}.json"
+            out_refs["capability_ref"] = cap_rel
+            out_refs["capability_token"] = cap_doc.get("capability_token", "")
+            # A pure-function leaf (Z2) holds no write authority: the access policy (denied-all),
+            # read manifest, and capability (`write_roots: []`, `mode: pure_readonly`) written above
+            # are the truthful zero-authority record. Below, the write-authorization surface —
+            # output paths, file-tool pins, write-contract preflight, and the output manifest — is
+            # skipped, and the sandbox is the read-only profile. The FS-diff baseline,
+            # session-run-index, agent_graph, parent_return_token, and active-child markers stay
+            # unconditional (a child-window write is then caught by the empty-write_roots containment
+            # rule against that baseline — fail-closed, no new branch).
+            is_pure = _is_pure_launch_request(request_payload)
+            write_roots_obj = cap_doc.get("write_roots")
+            write_roots = [str(item) for item in write_roots_obj] if isinstance(write_roots_obj, list) else []
+            # Resolve toolchain.build_system from spec.ir.yaml.impl_defaults so the
+            # canonical-placement helper can gate cross-phase auto-inject on
+            # `build_system=make` (the documented Make-only exception).
+            _ir_ref_for_bs = str(request_payload.get("ir_ref") or "").strip()
+            if _ir_ref_for_bs:
+                _bs_resolved = _impl_resolved_build_system(repo_root, _ir_ref_for_bs)
+                request_payload = dict(request_payload)
+                # Default an ABSENT build_system to "make" to mirror the conductor's
+                # `str(toolchain.build_system or "make")` default. Previously the key was set only
+                # when build_system resolved to a non-empty string, so a missing build_system left
+                # it unset -> `_mandatory_file_tool_pins_for_launch` saw bs_norm="" and skipped the
+                # Makefile pin, while the conductor still listed/required the Makefile for a
+                # non-host-authored generate node -> a launch that proceeds without authorizing the
+                # extensionless Makefile. The project is make-only (Conductor._require_make_build_system
+                # hard-fails non-make) and real compile-produced IR always carries an explicit
+                # build_system; an explicit non-make value (e.g. cmake) is preserved as-is.
+                request_payload["_resolved_build_system"] = (
+                    _bs_resolved.strip().lower()
+                    if isinstance(_bs_resolved, str) and _bs_resolved.strip() else "make")
+                # The conductor authors src/Makefile host-side iff make AND fortran, for BOTH leaf
+                # and dependency nodes (= Conductor._conductor_authors_makefile; the dependency
+                # Makefile is as IR-determined as the leaf one — Model B). Mirror that exact
+                # condition so the mandatory-Makefile pin is suppressed only when the conductor
+                # really authored it (and kept otherwise, e.g. c/cpp), matching the leaf's
+                # allowed_output_paths. Computed here rather than as separate flags so conductor
+                # and runtime cannot disagree.
+                _lang_resolved = _impl_resolved_language(repo_root, _ir_ref_for_bs)
+                _bs_for_mk = (_bs_resolved or "").strip().lower() if isinstance(_bs_resolved, str) else ""
+                # Mirror the conductor's defaulting EXACTLY (`str(... or "make")` / `... or
+                # "fortran")`): an absent build_system/language defaults to make/fortran on both
+                # sides, so the two never disagree (an absent build_system must not make the
+                # conductor author while the runtime keeps the pin -> record_launch fail-closed).
+                request_payload["_resolved_makefile_host_authored"] = control_file_host_authored(
+                    _bs_for_mk, _lang_resolved)
+            if is_pure:
+                # No output paths, no file-tool pins, no write-contract preflight — a pure leaf
+                # authors nothing in its window. Empty lists flow through the (inert for generate)
+                # lineage / cross-phase blocks below and suppress the output-manifest write.
+                allowed_output_paths = []
+                allowed_file_tool_paths = []
+            else:
+                allowed_output_paths = _allowed_output_paths_for_launch(
+                    request_payload=request_payload,
+                    write_roots=write_roots,
                 )
-            try:
-                _bm_doc = _read_json(_bm_path)
-            except (OSError, json.JSONDecodeError):
-                _bm_doc = None
-            if not isinstance(_bm_doc, dict):
-                raise ValueError(
-                    f"validate.execute launch source_binary_id={_source_binary_id!r}: "
-                    "binary_meta.json could not be parsed as a JSON object."
+                allowed_file_tool_paths = _allowed_file_tool_paths_for_launch(
+                    request_payload=request_payload,
+                    allowed_output_paths=allowed_output_paths,
                 )
-            _bm_src_gen = _bm_doc.get("source_source_id")
+                _validate_child_write_contract_preflight(
+                    request_payload=request_payload,
+                    capability_doc=cap_doc,
+                    allowed_output_paths=allowed_output_paths,
+                )
+            (repo_root / "workspace" / "tmp" / child_agent_run_id).mkdir(parents=True, exist_ok=True)
+            # Execute step lineage bind (mandatory for ALL execute launches, not
+            # only when cross-phase quality_check log is authorized): every
+            # execute run must declare `source_build_id` in the launch request,
+            # and the referenced build's `binary_meta.json` must record
+            # `source_source_id` matching the request's `source_id`.
+            # Without this binding, an execute could run binaries from build A
+            # while attributing evidence (e.g. trial_meta) to a different
+            # sibling build's generation — a mixed-build forge that purely
+            # in-phase logging would not catch elsewhere.
+            _step_token_for_bind = str(request_payload.get("step") or "").strip().lower()
+            _pipe_ref_for_bind = _normalize_rel_posix(
+                str(request_payload.get("pipeline_ref") or "")
+            )
+            _substep_token_for_bind = str(request_payload.get("substep") or "").strip().lower()
             if (
-                not isinstance(_bm_src_gen, str)
-                or not _bm_src_gen.strip()
+                _step_token_for_bind == "validate"
+                and _substep_token_for_bind == "execute"
+                and _pipe_ref_for_bind
             ):
-                raise ValueError(
-                    f"validate.execute launch source_binary_id={_source_binary_id!r}: "
-                    "binary_meta.json must record `source_source_id` to "
-                    "bind validate.execute provenance. Migrate the build's metadata "
-                    "before launching validate.execute against it."
-                )
-            if _bm_src_gen.strip() != _gen_id_for_bind:
-                raise ValueError(
-                    f"validate.execute launch source_id={_gen_id_for_bind!r} "
-                    f"does not match build {_source_binary_id!r}'s "
-                    f"source_source_id={_bm_src_gen.strip()!r}. Validate.execute "
-                    "must run against the binary produced by the source "
-                    "it claims provenance for."
-                )
-        canonical_audit_logs = _canonical_mcp_audit_log_paths_for_request(
-            request_payload, allowed_output_paths, repo_root=repo_root
-        )
-        # Validate cross-phase canonical placements:
-        #   - Execute → generate/<gen>/ for run_quality_checks
-        #   - Build → generate/<gen>/ for in-source compile_project
-        #     (Make for Fortran/C-family runs project_dir=<gen>/src/)
-        # The `source_id` from the request payload is otherwise free-form
-        # and could authorize writes to an unrelated generation's audit log
-        # under the same pipeline. Require the referenced generate run to
-        # actually exist on disk (source_meta.json must be present) and to
-        # have reached pass state before granting cross-phase write authority.
-        _step_token_xpv = str(request_payload.get("step") or "").strip().lower()
-        _pipe_ref_xpv = _normalize_rel_posix(
-            str(request_payload.get("pipeline_ref") or "")
-        )
-        _substep_xpv = str(request_payload.get("substep") or "").strip().lower()
-        _xpv_is_validate_execute = (
-            _step_token_xpv == "validate" and _substep_xpv == "execute"
-        )
-        if (_xpv_is_validate_execute or _step_token_xpv == "build") and _pipe_ref_xpv:
-            _gen_prefix_xpv = f"{_pipe_ref_xpv}/source/"
-            for _log_path in canonical_audit_logs:
-                if not _log_path.startswith(_gen_prefix_xpv):
-                    continue
-                _tail_xpv = _log_path[len(_gen_prefix_xpv):]
-                _parts_xpv = [p for p in _tail_xpv.split("/") if p]
-                if not _parts_xpv:
-                    continue
-                _gen_id_xpv = _parts_xpv[0]
-                _gen_meta = (
-                    repo_root
-                    / _gen_prefix_xpv
-                    / _gen_id_xpv
-                    / "source_meta.json"
+                _gen_id_for_bind = str(
+                    request_payload.get("source_id") or ""
+                ).strip()
+                _source_binary_id = str(
+                    request_payload.get("source_binary_id") or ""
+                ).strip()
+                if not _gen_id_for_bind:
+                    raise ValueError(
+                        "validate.execute launch requires `source_id` in the launch "
+                        "request to bind provenance to a specific source."
+                    )
+                if not _source_binary_id:
+                    raise ValueError(
+                        "validate.execute launch requires `source_binary_id` in the launch "
+                        "request to bind provenance to a specific build. "
+                        "Without this binding, evidence could be forged across "
+                        "sibling builds even when in-phase logging is used."
+                    )
+                _bm_path = (
+                    repo_root / _pipe_ref_for_bind / "binary" / _source_binary_id / "binary_meta.json"
                 )
-                if not _gen_meta.exists():
+                if not _bm_path.is_file():
                     raise ValueError(
-                        f"{_step_token_xpv} launch references unknown "
-                        f"cross-phase source_id={_gen_id_xpv!r}: "
-                        f"source_meta.json not found at {_gen_meta!s}. "
-                        "Cross-phase MCP audit log authorization requires the "
-                        "referenced generation to have actually run."
+                        f"validate.execute launch source_binary_id={_source_binary_id!r} "
+                        f"does not resolve to an existing binary_meta.json at "
+                        f"{_bm_path!s}. The referenced build must exist on disk "
+                        "before validate.execute can attribute provenance to it."
                     )
-                # Verify the generation reached pass state BEFORE granting
-                # write authority into its tree. Authorizing writes against a
-                # failed/stale generation would let an Execute run mutate or
-                # append to provenance files that later validators trust,
-                # contaminating cross-phase artifacts irreversibly.
                 try:
-                    _gen_meta_doc = _read_json(_gen_meta)
+                    _bm_doc = _read_json(_bm_path)
                 except (OSError, json.JSONDecodeError):
-                    _gen_meta_doc = None
-                _gen_status_raw = (
-                    _gen_meta_doc.get("verification_status")
-                    if isinstance(_gen_meta_doc, dict)
-                    else None
-                )
-                _gen_status = (
-                    _gen_status_raw.strip().lower()
-                    if isinstance(_gen_status_raw, str)
-                    else None
-                )
-                if _gen_status != "pass":
+                    _bm_doc = None
+                if not isinstance(_bm_doc, dict):
                     raise ValueError(
-                        f"{_step_token_xpv} launch references cross-phase "
-                        f"source_id={_gen_id_xpv!r} with "
-                        f"verification_status={_gen_status!r} (expected "
-                        "'pass'). Cannot grant MCP-owned write authority to "
-                        "a failed/stale generation tree; this would "
-                        "contaminate provenance files trusted by later "
-                        "validators."
+                        f"validate.execute launch source_binary_id={_source_binary_id!r}: "
+                        "binary_meta.json could not be parsed as a JSON object."
                     )
-                # NOTE: execute step source_build_id / source_id lineage
-                # bind is enforced unconditionally above (see "Execute step
-                # lineage bind" block before canonical_audit_logs). The
-                # cross-phase loop here only handles existence + pass-state
-                # of the generation referenced from the cross-phase audit
-                # log path (build step's Make-only path).
-        if not is_pure:
-            # A pure launch writes NO output manifest — its absence is what the
-            # pipeline-semantics sweep keys on to catch a record-launch skip (mock-green guard).
-            manifest_ref = _write_allowed_output_manifest(
-                repo_root,
-                orchestration_id=orchestration_id,
-                agent_run_id=child_agent_run_id,
-                allowed_output_paths=allowed_output_paths,
-                allowed_file_tool_paths=allowed_file_tool_paths,
-                allowed_tmp_root=f"workspace/tmp/{child_agent_run_id}",
-                mcp_owned_audit_logs=canonical_audit_logs,
+                _bm_src_gen = _bm_doc.get("source_source_id")
+                if (
+                    not isinstance(_bm_src_gen, str)
+                    or not _bm_src_gen.strip()
+                ):
+                    raise ValueError(
+                        f"validate.execute launch source_binary_id={_source_binary_id!r}: "
+                        "binary_meta.json must record `source_source_id` to "
+                        "bind validate.execute provenance. Migrate the build's metadata "
+                        "before launching validate.execute against it."
+                    )
+                if _bm_src_gen.strip() != _gen_id_for_bind:
+                    raise ValueError(
+                        f"validate.execute launch source_id={_gen_id_for_bind!r} "
+                        f"does not match build {_source_binary_id!r}'s "
+                        f"source_source_id={_bm_src_gen.strip()!r}. Validate.execute "
+                        "must run against the binary produced by the source "
+                        "it claims provenance for."
+                    )
+            canonical_audit_logs = _canonical_mcp_audit_log_paths_for_request(
+                request_payload, allowed_output_paths, repo_root=repo_root
             )
-            out_refs["allowed_output_manifest_ref"] = manifest_ref
-        # An HTTP pure leaf (issue #28) runs in the conductor's own process over HTTPS: there is
-        # no child process to confine, no codex home to isolate, and no `backend_command` to
-        # pin. Everything ABOVE this point still runs for it — the capability, the manifest, the
-        # agent-graph edge, the session-index row — because those describe the LAUNCH, which is
-        # as real as any other. Only the process-sandbox layer is skipped, and it is marked so
-        # the audit validators (which key on `sandbox_profile` presence) can tell a skipped
-        # profile from a missing one.
-        if backend_token in _HTTP_PROVIDER_TOKENS:
-            request_payload.setdefault("leaf_transport", "http")
-            response_payload.setdefault("leaf_transport", "http")
-            response_payload.setdefault("sandbox_runtime", "none")
-            response_payload.setdefault("sandbox_enforced", False)
-        else:
-            try:
-                _resp_backend = response_payload.get("backend")
-                # THE SAME resolver the profile builder uses on the next lines, not
-                # a second reading of the raw field: `build_*_bwrap_profile` resolves
-                # the family with `_resolve_backend_type(backend_type, backend_command)`,
-                # which falls back to the COMMAND when the response omits `backend`.
-                # Reading the raw field here meant such a payload built a claude-shaped
-                # profile — `~/.claude` rw-bound, no CLAUDE_CONFIG_DIR — with no
-                # private home, i.e. a leaf on the operator's home, while the record
-                # described one it never read. Keying both off one function is what
-                # makes "the profile is claude-shaped" and "the claude isolation was
-                # prepared" the same question.
-                _backend_family = _resolve_backend_type(
-                    _resp_backend if isinstance(_resp_backend, str) else "",
-                    backend_command)
-                if _backend_family == "codex":
-                    # Prepared before any launch-side durable mutations above.  Do not
-                    # re-prepare here: doing so would reopen the generation race that
-                    # the expected-generation transaction check closes.
-                    if codex_isolation is None:
-                        codex_isolation = _prepare_codex_workflow_home(repo_root, orchestration_id)
-                    response_payload["codex_workflow_home"] = codex_isolation["home"]
-                    response_payload["codex_home_generation"] = int(codex_isolation["generation"])
-                    response_payload["codex_hooks_sha256"] = codex_isolation["hooks_sha256"]
-                claude_isolation: dict[str, str] | None = None
-                if _backend_family == "claude" and not is_pure:
-                    # Issue #63 final form. Only the AGENTIC leaf gets a private home: a
-                    # pure leaf takes no settings layer at all (`--safe-mode`, no tools,
-                    # no hooks), so preparing one would record a configuration surface it
-                    # never reads.
-                    claude_isolation = _prepare_claude_workflow_home(repo_root, orchestration_id)
-                    response_payload["claude_workflow_home"] = claude_isolation["home"]
-                    response_payload["claude_home_generation"] = int(claude_isolation["generation"])
-                    response_payload["claude_settings_sha256"] = claude_isolation["settings_sha256"]
-                    # A leaf authenticates from the bound credential FILE alone: the
-                    # environment route is a named exclusion, so `false` here means
-                    # this launch cannot authenticate at all. Recorded rather than
-                    # refused (see `_prepare_claude_workflow_home`), which makes the
-                    # cause readable in the launch record instead of only in whatever
-                    # the CLI prints when it fails.
-                    response_payload["claude_credentials_bound"] = bool(
-                        claude_isolation.get("credentials_bound"))
-                profile_kwargs: dict[str, Any] = {}
-                if codex_isolation is not None:
-                    profile_kwargs = codex_isolation_profile_kwargs(codex_isolation)
-                elif claude_isolation is not None:
-                    profile_kwargs = claude_isolation_profile_kwargs(claude_isolation)
-                if is_pure:
-                    # Read-only sandbox: repo bound ro, NO write_roots, no file pins. The pure leaf
-                    # has no repository write authority. Claude is tool-free, while Codex's
-                    # structured-output approximation remains tool-bearing in a read-only sandbox;
-                    # bwrap ensures neither can write an artifact from the child window.
-                    profile = build_readonly_bwrap_profile(
-                        repo_root=repo_root,
-                        orchestration_id=orchestration_id,
-                        agent_run_id=child_agent_run_id,
-                        backend_command=backend_command,
-                        backend_type=_resp_backend if isinstance(_resp_backend, str) else "",
-                        child_env=child_env,
-                        **profile_kwargs,
+            # Validate cross-phase canonical placements:
+            #   - Execute → generate/<gen>/ for run_quality_checks
+            #   - Build → generate/<gen>/ for in-source compile_project
+            #     (Make for Fortran/C-family runs project_dir=<gen>/src/)
+            # The `source_id` from the request payload is otherwise free-form
+            # and could authorize writes to an unrelated generation's audit log
+            # under the same pipeline. Require the referenced generate run to
+            # actually exist on disk (source_meta.json must be present) and to
+            # have reached pass state before granting cross-phase write authority.
+            _step_token_xpv = str(request_payload.get("step") or "").strip().lower()
+            _pipe_ref_xpv = _normalize_rel_posix(
+                str(request_payload.get("pipeline_ref") or "")
+            )
+            _substep_xpv = str(request_payload.get("substep") or "").strip().lower()
+            _xpv_is_validate_execute = (
+                _step_token_xpv == "validate" and _substep_xpv == "execute"
+            )
+            if (_xpv_is_validate_execute or _step_token_xpv == "build") and _pipe_ref_xpv:
+                _gen_prefix_xpv = f"{_pipe_ref_xpv}/source/"
+                for _log_path in canonical_audit_logs:
+                    if not _log_path.startswith(_gen_prefix_xpv):
+                        continue
+                    _tail_xpv = _log_path[len(_gen_prefix_xpv):]
+                    _parts_xpv = [p for p in _tail_xpv.split("/") if p]
+                    if not _parts_xpv:
+                        continue
+                    _gen_id_xpv = _parts_xpv[0]
+                    _gen_meta = (
+                        repo_root
+                        / _gen_prefix_xpv
+                        / _gen_id_xpv
+                        / "source_meta.json"
                     )
-                else:
-                    profile = build_bwrap_profile(
-                        repo_root=repo_root,
-                        orchestration_id=orchestration_id,
-                        agent_run_id=child_agent_run_id,
-                        backend_command=backend_command,
-                        backend_type=_resp_backend if isinstance(_resp_backend, str) else "",
-                        child_env=child_env,
-                        **profile_kwargs,
+                    if not _gen_meta.exists():
+                        raise ValueError(
+                            f"{_step_token_xpv} launch references unknown "
+                            f"cross-phase source_id={_gen_id_xpv!r}: "
+                            f"source_meta.json not found at {_gen_meta!s}. "
+                            "Cross-phase MCP audit log authorization requires the "
+                            "referenced generation to have actually run."
+                        )
+                    # Verify the generation reached pass state BEFORE granting
+                    # write authority into its tree. Authorizing writes against a
+                    # failed/stale generation would let an Execute run mutate or
+                    # append to provenance files that later validators trust,
+                    # contaminating cross-phase artifacts irreversibly.
+                    try:
+                        _gen_meta_doc = _read_json(_gen_meta)
+                    except (OSError, json.JSONDecodeError):
+                        _gen_meta_doc = None
+                    _gen_status_raw = (
+                        _gen_meta_doc.get("verification_status")
+                        if isinstance(_gen_meta_doc, dict)
+                        else None
                     )
-                command_argv = [backend_command]
-                rendered = render_bwrap_command(profile=profile, command_argv=command_argv)
-                profile["rendered_command"] = rendered
-                profile_path = _sandbox_profiles_dir(
-                    repo_root,
-                    orchestration_id,
-                ) / f"{child_agent_run_id}.json"
-                _write_json(profile_path, profile)
-                sandbox_ref = (
-                    f"workspace/orchestrations/{orchestration_id}/sandbox_profiles/{child_agent_run_id}.json"
-                )
-                out_refs["sandbox_profile_ref"] = sandbox_ref
-                request_payload.setdefault("sandbox_profile_ref", sandbox_ref)
-                response_payload.setdefault("sandbox_runtime", "bwrap")
-                response_payload.setdefault("sandbox_enforced", True)
-                response_payload.setdefault("sandbox_profile_ref", sandbox_ref)
-                response_payload.setdefault("sandbox_command", rendered)
-            except Exception as exc:
-                _write_sandbox_enforcement_violation(
+                    _gen_status = (
+                        _gen_status_raw.strip().lower()
+                        if isinstance(_gen_status_raw, str)
+                        else None
+                    )
+                    if _gen_status != "pass":
+                        raise ValueError(
+                            f"{_step_token_xpv} launch references cross-phase "
+                            f"source_id={_gen_id_xpv!r} with "
+                            f"verification_status={_gen_status!r} (expected "
+                            "'pass'). Cannot grant MCP-owned write authority to "
+                            "a failed/stale generation tree; this would "
+                            "contaminate provenance files trusted by later "
+                            "validators."
+                        )
+                    # NOTE: execute step source_build_id / source_id lineage
+                    # bind is enforced unconditionally above (see "Execute step
+                    # lineage bind" block before canonical_audit_logs). The
+                    # cross-phase loop here only handles existence + pass-state
+                    # of the generation referenced from the cross-phase audit
+                    # log path (build step's Make-only path).
+            if not is_pure:
+                # A pure launch writes NO output manifest — its absence is what the
+                # pipeline-semantics sweep keys on to catch a record-launch skip (mock-green guard).
+                manifest_ref = _write_allowed_output_manifest(
                     repo_root,
-                    orchestration_id,
+                    orchestration_id=orchestration_id,
                     agent_run_id=child_agent_run_id,
-                    reason="sandbox_profile_build_failed",
-                    detail={"error": str(exc)},
-                )
-                update_orchestration_status(
-                    repo_root,
-                    orchestration_id,
-                    status="fail_closed",
-                    reason_code="sandbox_enforcement_violation",
-                    reason_detail=str(exc),
-                    blocking_policy_scope="sandbox",
+                    allowed_output_paths=allowed_output_paths,
+                    allowed_file_tool_paths=allowed_file_tool_paths,
+                    allowed_tmp_root=f"workspace/tmp/{child_agent_run_id}",
+                    mcp_owned_audit_logs=canonical_audit_logs,
                 )
-                raise RuntimeError(f"record-launch sandbox enforcement failed: {exc}") from exc
-    _write_json(request_path, request_payload)
-    _write_json(response_path, response_payload)
-    _write_text(prompt_path, prompt_text)
-    _write_text(reply_path, reply_text)
-    _write_json(child_request_path, request_payload)
-    _write_json(child_response_path, response_payload)
-    _write_text(child_prompt_path, prompt_text)
-    _write_text(child_reply_path, reply_text)
-    if isinstance(nk, str) and nk.strip() and isinstance(st, str) and st.strip():
-        step_tok = st.strip().lower()
-        _transition_node_step_phase_state(
-            repo_root,
-            orchestration_id,
-            node_key=nk.strip(),
-            step=step_tok,
-            new_state="launch_recorded",
-            event="record_launch",
-            agent_run_id=child_agent_run_id,
-        )
-        _transition_node_step_phase_state(
-            repo_root,
-            orchestration_id,
-            node_key=nk.strip(),
-            step=step_tok,
-            new_state="child_running",
-            event="child_launched",
-            agent_run_id=child_agent_run_id,
-        )
+                out_refs["allowed_output_manifest_ref"] = manifest_ref
+            # An HTTP pure leaf (issue #28) runs in the conductor's own process over HTTPS: there is
+            # no child process to confine, no codex home to isolate, and no `backend_command` to
+            # pin. Everything ABOVE this point still runs for it — the capability, the manifest, the
+            # agent-graph edge, the session-index row — because those describe the LAUNCH, which is
+            # as real as any other. Only the process-sandbox layer is skipped, and it is marked so
+            # the audit validators (which key on `sandbox_profile` presence) can tell a skipped
+            # profile from a missing one.
+            if backend_token in _HTTP_PROVIDER_TOKENS:
+                request_payload.setdefault("leaf_transport", "http")
+                response_payload.setdefault("leaf_transport", "http")
+                response_payload.setdefault("sandbox_runtime", "none")
+                response_payload.setdefault("sandbox_enforced", False)
+            else:
+                try:
+                    _resp_backend = response_payload.get("backend")
+                    # THE SAME resolver the profile builder uses on the next lines, not
+                    # a second reading of the raw field: `build_*_bwrap_profile` resolves
+                    # the family with `_resolve_backend_type(backend_type, backend_command)`,
+                    # which falls back to the COMMAND when the response omits `backend`.
+                    # Reading the raw field here meant such a payload built a claude-shaped
+                    # profile — `~/.claude` rw-bound, no CLAUDE_CONFIG_DIR — with no
+                    # private home, i.e. a leaf on the operator's home, while the record
+                    # described one it never read. Keying both off one function is what
+                    # makes "the profile is claude-shaped" and "the claude isolation was
+                    # prepared" the same question.
+                    _backend_family = _resolve_backend_type(
+                        _resp_backend if isinstance(_resp_backend, str) else "",
+                        backend_command)
+                    if _backend_family == "codex":
+                        # Prepared before any launch-side durable mutations above.  Do not
+                        # re-prepare here: doing so would reopen the generation race that
+                        # the expected-generation transaction check closes.
+                        if codex_isolation is None:
+                            codex_isolation = _prepare_codex_workflow_home(repo_root, orchestration_id)
+                        response_payload["codex_workflow_home"] = codex_isolation["home"]
+                        response_payload["codex_home_generation"] = int(codex_isolation["generation"])
+                        response_payload["codex_hooks_sha256"] = codex_isolation["hooks_sha256"]
+                    claude_isolation: dict[str, str] | None = None
+                    if _backend_family == "claude" and not is_pure:
+                        # Issue #63 final form. Only the AGENTIC leaf gets a private home: a
+                        # pure leaf takes no settings layer at all (`--safe-mode`, no tools,
+                        # no hooks), so preparing one would record a configuration surface it
+                        # never reads.
+                        claude_isolation = _prepare_claude_workflow_home(repo_root, orchestration_id)
+                        response_payload["claude_workflow_home"] = claude_isolation["home"]
+                        response_payload["claude_home_generation"] = int(claude_isolation["generation"])
+                        response_payload["claude_settings_sha256"] = claude_isolation["settings_sha256"]
+                        # A leaf authenticates from the bound credential FILE alone: the
+                        # environment route is a named exclusion, so `false` here means
+                        # this launch cannot authenticate at all. Recorded rather than
+                        # refused (see `_prepare_claude_workflow_home`), which makes the
+                        # cause readable in the launch record instead of only in whatever
+                        # the CLI prints when it fails.
+                        response_payload["claude_credentials_bound"] = bool(
+                            claude_isolation.get("credentials_bound"))
+                    profile_kwargs: dict[str, Any] = {}
+                    if codex_isolation is not None:
+                        profile_kwargs = codex_isolation_profile_kwargs(codex_isolation)
+                    elif claude_isolation is not None:
+                        profile_kwargs = claude_isolation_profile_kwargs(claude_isolation)
+                    if is_pure:
+                        # Read-only sandbox: repo bound ro, NO write_roots, no file pins. The pure leaf
+                        # has no repository write authority. Claude is tool-free, while Codex's
+                        # structured-output approximation remains tool-bearing in a read-only sandbox;
+                        # bwrap ensures neither can write an artifact from the child window.
+                        profile = build_readonly_bwrap_profile(
+                            repo_root=repo_root,
+                            orchestration_id=orchestration_id,
+                            agent_run_id=child_agent_run_id,
+                            backend_command=backend_command,
+                            backend_type=_resp_backend if isinstance(_resp_backend, str) else "",
+                            child_env=child_env,
+                            **profile_kwargs,
+                        )
+                    else:
+                        profile = build_bwrap_profile(
+                            repo_root=repo_root,
+                            orchestration_id=orchestration_id,
+                            agent_run_id=child_agent_run_id,
+                            backend_command=backend_command,
+                            backend_type=_resp_backend if isinstance(_resp_backend, str) else "",
+                            child_env=child_env,
+                            **profile_kwargs,
+                        )
+                    command_argv = [backend_command]
+                    rendered = render_bwrap_command(profile=profile, command_argv=command_argv)
+                    profile["rendered_command"] = rendered
+                    profile_path = _sandbox_profiles_dir(
+                        repo_root,
+                        orchestration_id,
+                    ) / f"{child_agent_run_id}.json"
+                    _write_json(profile_path, profile)
+                    sandbox_ref = (
+                        f"workspace/orchestrations/{orchestration_id}/sandbox_profiles/{child_agent_run_id}.json"
+                    )
+                    out_refs["sandbox_profile_ref"] = sandbox_ref
+                    request_payload.setdefault("sandbox_profile_ref", sandbox_ref)
+                    response_payload.setdefault("sandbox_runtime", "bwrap")
+                    response_payload.setdefault("sandbox_enforced", True)
+                    response_payload.setdefault("sandbox_profile_ref", sandbox_ref)
+                    response_payload.setdefault("sandbox_command", rendered)
+                except Exception as exc:
+                    _write_sandbox_enforcement_violation(
+                        repo_root,
+                        orchestration_id,
+                        agent_run_id=child_agent_run_id,
+                        reason="sandbox_profile_build_failed",
+                        detail={"error": str(exc)},
+                    )
+                    update_orchestration_status(
+                        repo_root,
+                        orchestration_id,
+                        status="fail_closed",
+                        reason_code="sandbox_enforcement_violation",
+                        reason_detail=str(exc),
+                        blocking_policy_scope="sandbox",
+                    )
+                    raise RuntimeError(f"record-launch sandbox enforcement failed: {exc}") from exc
+        _write_json(request_path, request_payload)
+        _write_json(response_path, response_payload)
+        _write_text(prompt_path, prompt_text)
+        _write_text(reply_path, reply_text)
+        _write_json(child_request_path, request_payload)
+        _write_json(child_response_path, response_payload)
+        _write_text(child_prompt_path, prompt_text)
+        _write_text(child_reply_path, reply_text)
+        if isinstance(nk, str) and nk.strip() and isinstance(st, str) and st.strip():
+            step_tok = st.strip().lower()
+            _transition_node_step_phase_state(
+                repo_root,
+                orchestration_id,
+                node_key=nk.strip(),
+                step=step_tok,
+                new_state="launch_recorded",
+                event="record_launch",
+                agent_run_id=child_agent_run_id,
+            )
+            _transition_node_step_phase_state(
+                repo_root,
+                orchestration_id,
+                node_key=nk.strip(),
+                step=step_tok,
+                new_state="child_running",
+                event="child_launched",
+                agent_run_id=child_agent_run_id,
+            )
+    _start_write_tracker(repo_root, orchestration_id, agent_run_id=child_agent_run_id)
     _write_run_write_baseline(
         repo_root,
         orchestration_id,
@@ -19501,6 +20526,7 @@ def record_launch(
     # to construct a valid ack. Stored in launches/<arid>.parent_return_token
     # (parent-only via read manifests). Atomic write (M1/Adv-27) so
     # concurrent readers never observe partial content.
+    import secrets
     parent_return_token = secrets.token_hex(32)
     _atomic_write_text(
         _parent_return_token_path(repo_root, orchestration_id, child_agent_run_id),
@@ -19594,43 +20620,9 @@ def _read_existing_run_ids(path: Path, *, caller_holds_lock: bool = False) -> se
     `caller_holds_lock=True` skips the heuristic and treats every
     malformed line as durable corruption, which is the correct behavior
     when no other writer can be active by definition.
+    The parse itself is `_read_ledger_records`, shared with `_load_run_records`.
     """
-    if not path.exists():
-        return set()
-    run_ids: set[str] = set()
-    non_empty_lines = [s for s in (raw.strip() for raw in path.read_text(encoding="utf-8").splitlines()) if s]
-    n_lines = len(non_empty_lines)
-    for idx, line in enumerate(non_empty_lines):
-        is_last = idx == n_lines - 1
-        # NEW-H1: when the caller holds the fcntl lock, no other writer can
-        # be active — a malformed line is unconditionally durable corruption.
-        in_flight = (
-            is_last
-            and not caller_holds_lock
-            and _agent_runs_writer_active(path)
-        )
-        try:
-            item = json.loads(line)
-        except json.JSONDecodeError as exc:
-            if in_flight:
-                continue
-            raise RuntimeError(
-                f"agent_runs.jsonl has malformed JSON at line {idx + 1}: {exc} "
-                f"(no active writer detected — durable corruption; quarantine "
-                f"the ledger and roll forward explicitly)"
-                if is_last else
-                f"agent_runs.jsonl has malformed non-trailing JSON at line {idx + 1}: {exc}"
-            ) from exc
-        if not isinstance(item, dict):
-            if in_flight:
-                continue
-            raise RuntimeError(
-                f"agent_runs.jsonl line {idx + 1} is not a JSON object: {item!r}"
-            )
-        run_id = item.get("agent_run_id")
-        if isinstance(run_id, str) and run_id.strip():
-            run_ids.add(run_id.strip())
-    return run_ids
+    return set(_read_ledger_records(path, strict=True, caller_holds_lock=caller_holds_lock))
 
 
 def _validate_skipped_by_checkpoint_payload(payload: dict[str, Any]) -> None:
@@ -20329,6 +21321,7 @@ def deactivate_child_agent(
     ack_token = (
         ack_doc.get("return_token") if isinstance(ack_doc, dict) else None
     )
+    import secrets
     if not isinstance(ack_token, str) or not secrets.compare_digest(
         ack_token, expected_parent_token
     ):
@@ -20351,11 +21344,15 @@ def deactivate_child_agent(
     )
     if not snap_path.exists():
         try:
-            child_authored = _compute_changed_paths_against_baseline(
-                repo_root,
-                orchestration_id,
-                agent_run_id=child_run_id,
+            child_authored = _tracked_changed_paths(
+                repo_root, orchestration_id, agent_run_id=child_run_id, final=False
             )
+            if child_authored is None:
+                child_authored = _compute_changed_paths_against_baseline(
+                    repo_root,
+                    orchestration_id,
+                    agent_run_id=child_run_id,
+                )
             _write_json(
                 snap_path,
                 {
@@ -20864,6 +21861,7 @@ def write_step_result(
                 result=result,
             )
         except Exception:
+            import traceback
             print(
                 f"[WARN] checkpoint update failed for {node_key}/{step}: "
                 + traceback.format_exc(),
@@ -21751,7 +22749,7 @@ def update_orchestration_status(
     blocking_policy_scope: str | None = None,
 ) -> dict[str, Any]:
     meta_path = _orchestration_root(repo_root, orchestration_id) / "orchestration_meta.json"
-    if not meta_path.exists():
+    if not _document_exists(meta_path):
         raise FileNotFoundError(meta_path)
     # F3: serialize the full read-check-write-cleanup-marker section. Without this
     # lock, two concurrent terminalizers can both observe a non-terminal status,
@@ -22361,6 +23359,14 @@ def _project_terse_result(command: str, result: Any) -> Any:
 
 
 def main(argv: list[str] | None = None) -> int:
+    """CLI entry point; each call appends its timing record to the orchestration's
+    `audit/timings.jsonl` (tools/op_timing.py)."""
+    with op_timing.operation("runtime") as timer:
+        timer.exit = _main(argv)
+        return timer.exit
+
+
+def _main(argv: list[str] | None) -> int:
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -22850,6 +23856,18 @@ def main(argv: list[str] | None = None) -> int:
     verify_cp_parser.add_argument("--repo-root", required=True)
     verify_cp_parser.add_argument("--orchestration-id", required=True)
 
+    export_baseline_parser = subparsers.add_parser(
+        "export-write-baseline",
+        help="Print a write baseline (compact or legacy) as its JSON document, for audits.",
+    )
+    export_baseline_parser.add_argument("--repo-root", required=True)
+    export_baseline_parser.add_argument("--orchestration-id", required=True)
+    export_baseline_parser.add_argument(
+        "--agent-run-id",
+        default=None,
+        help="The run whose launch baseline to export (default: the orchestration baseline).",
+    )
+
     check_step_parser = subparsers.add_parser("check-step-completed")
     check_step_parser.add_argument("--repo-root", required=True)
     check_step_parser.add_argument("--orchestration-id", required=True)
@@ -23017,6 +24035,8 @@ def main(argv: list[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
     repo_root = Path(getattr(args, "repo_root")).resolve()
+    op_timing.bind(op=args.command, repo_root=repo_root,
+                   orchestration_id=getattr(args, "orchestration_id", None))
 
     if args.command == "init":
         driver_record: dict[str, Any] | None = None
@@ -23339,6 +24359,12 @@ def main(argv: list[str] | None = None) -> int:
             repo_root=repo_root,
             orchestration_id=args.orchestration_id,
         )
+    elif args.command == "export-write-baseline":
+        result = _load_run_write_baseline(
+            repo_root,
+            args.orchestration_id,
+            agent_run_id=args.agent_run_id,
+        )
     elif args.command == "check-step-completed":
         info = check_step_completed(
             repo_root=repo_root,
@@ -17,6 +17,7 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import time
 import traceback
 import uuid
 
@@ -56,6 +57,7 @@ from tools.llm_config import (
     load_llm_config,
     resolve_default_config_path,
 )
+from tools.runtime_service import run_runtime
 
 
 # Orchestration is conductor-only (the deterministic Python phase loop in
@@ -247,15 +249,7 @@ def _build_invocation_record(
 
 
 def _runtime_command(repo_root: Path, env: dict[str, str], args: list[str]) -> RuntimeResult:
-    command = ["python3", "tools/orchestration_runtime.py", *args]
-    completed = subprocess.run(
-        command,
-        cwd=repo_root,
-        env=env,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
+    completed = run_runtime(repo_root, env, args)
     if completed.returncode != 0:
         stderr = completed.stderr.strip()
         stdout = completed.stdout.strip()
@@ -1065,6 +1059,96 @@ def _ensure_preflight_pass(preflight: dict[str, Any]) -> tuple[bool, str]:
     return True, "pass"
 
 
+ORCHESTRATION_CATALOG_FILENAME = "catalog_index.jsonl"
+_ORCHESTRATION_CATALOG_VERSION = 1
+# A meta modified this recently may be rewritten again within one mtime tick, with the same
+# size, and look unchanged; its row is used for this lookup but not trusted by the next one.
+_ORCHESTRATION_CATALOG_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _orchestration_catalog_row(meta: dict[str, Any]) -> dict[str, Any]:
+    """The fields of one `orchestration_meta.json` that the orchestration lookups rank by."""
+    invocation = meta.get("invocation")
+    closure_id = invocation.get("closure_id") if isinstance(invocation, dict) else None
+    spec_ref = meta.get("spec_ref")
+    started_at = meta.get("started_at")
+    return {
+        "spec_ref": spec_ref.strip() if isinstance(spec_ref, str) else "",
+        "closure_id": closure_id if isinstance(closure_id, str) else None,
+        # Kept in the form `_is_non_terminal_status` reads it.
+        "status": str(meta.get("status") or ""),
+        "started_at": started_at.strip() if isinstance(started_at, str) else "",
+    }
+
+
+def _orchestration_catalog(repo_root: Path) -> dict[str, dict[str, Any]]:
+    """`orchestration_id -> catalog row` for every directory under workspace/orchestrations
+    whose `orchestration_meta.json` parses to an object.
+
+    The cold-start guard, `--resume` without an id, and closure resume each need a few
+    fields of every meta; parsing every meta on every invocation grows with the history.
+    `workspace/orchestrations/catalog_index.jsonl` caches those fields per orchestration
+    with the meta's stat identity `(st_ino, st_size, st_mtime_ns, st_ctime_ns)`, so a
+    lookup lists the directory and stats each meta, and parses only the ones that were
+    created or rewritten since. The metas stay the only source of truth: a catalog that
+    is missing, corrupt or from another version is rebuilt by that same pass, and no
+    writer of a meta has to know the catalog exists.
+    """
+    orch_root = repo_root / "workspace" / "orchestrations"
+    if not orch_root.is_dir():
+        return {}
+    catalog_path = orch_root / ORCHESTRATION_CATALOG_FILENAME
+    cached: dict[str, dict[str, Any]] = {}
+    try:
+        lines = catalog_path.read_text(encoding="utf-8").splitlines()
+        header = json.loads(lines[0]) if lines else None
+        if isinstance(header, dict) and header.get("version") == _ORCHESTRATION_CATALOG_VERSION:
+            for line in lines[1:]:
+                entry = json.loads(line)
+                cached[str(entry["id"])] = entry
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = {}
+    racy_after = time.time_ns() - _ORCHESTRATION_CATALOG_RACY_WINDOW_NS
+    rows: dict[str, dict[str, Any]] = {}
+    fresh: dict[str, dict[str, Any]] = {}
+    with os.scandir(orch_root) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    for entry in entries:
+        try:
+            st = os.stat(os.path.join(entry.path, "orchestration_meta.json"))
+        except OSError:
+            continue
+        key = [st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns]
+        entry_row = cached.get(entry.name)
+        if entry_row is None or entry_row.get("key") != key:
+            meta = _read_json_if_exists(Path(entry.path) / "orchestration_meta.json")
+            entry_row = {"id": entry.name, "key": key, "meta": None if meta is None
+                         else _orchestration_catalog_row(meta)}
+        if max(st.st_mtime_ns, st.st_ctime_ns) < racy_after:
+            fresh[entry.name] = entry_row
+        if isinstance(entry_row.get("meta"), dict):
+            rows[entry.name] = entry_row["meta"]
+    if fresh != cached:
+        body = "".join(
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for item in [{"version": _ORCHESTRATION_CATALOG_VERSION},
+                         *(fresh[oid] for oid in sorted(fresh))]
+        )
+        tmp: str | None = None
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=f".{ORCHESTRATION_CATALOG_FILENAME}.",
+                                       suffix=".tmp", dir=orch_root)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(body)
+            os.replace(tmp, catalog_path)
+        except OSError:
+            # A read-only or full workspace costs the next lookup its parses, nothing more.
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+    return rows
+
+
 def _find_latest_orchestration(repo_root: Path) -> str | None:
     """Return the most recent orchestration_id under workspace/orchestrations.
 
@@ -1080,19 +1164,9 @@ def _find_latest_orchestration(repo_root: Path) -> str | None:
     the id need not start with `orch_`, since --orchestration-id accepts arbitrary
     caller-supplied ids and those runs must remain resumable as "the latest".
     """
-    orch_root = repo_root / "workspace" / "orchestrations"
-    if not orch_root.is_dir():
-        return None
-    candidates: list[tuple[str, str]] = []
-    for path in orch_root.iterdir():
-        if not path.is_dir():
-            continue
-        meta = _read_json_if_exists(path / "orchestration_meta.json")
-        if not isinstance(meta, dict):
-            continue
-        started_at = meta.get("started_at")
-        started_key = started_at.strip() if isinstance(started_at, str) else ""
-        candidates.append((started_key, path.name))
+    candidates = [
+        (row["started_at"], oid) for oid, row in _orchestration_catalog(repo_root).items()
+    ]
     if not candidates:
         return None
     # max over (started_at, id): newest start wins; equal/empty starts fall back
@@ -1109,30 +1183,15 @@ def _index_closure_orchestrations(repo_root: Path, closure_id: str) -> dict[str,
     than once under one closure resolves to its most recent orchestration. Used by
     closure-aware resume to find each not-ready node's prior orchestration so it can be
     resumed (warm, from its checkpoint) rather than re-run cold."""
-    orch_root = repo_root / "workspace" / "orchestrations"
-    if not orch_root.is_dir():
-        return {}
     # spec_ref -> (started_at_key, orch_id) best seen so far
     best: dict[str, tuple[str, str]] = {}
-    for path in orch_root.iterdir():
-        if not path.is_dir():
+    for oid, row in _orchestration_catalog(repo_root).items():
+        if row["closure_id"] != closure_id or not row["spec_ref"]:
             continue
-        meta = _read_json_if_exists(path / "orchestration_meta.json")
-        if not isinstance(meta, dict):
-            continue
-        invocation = meta.get("invocation")
-        if not isinstance(invocation, dict) or invocation.get("closure_id") != closure_id:
-            continue
-        spec_ref = meta.get("spec_ref")
-        if not isinstance(spec_ref, str) or not spec_ref.strip():
-            continue
-        spec_ref = spec_ref.strip()
-        started_at = meta.get("started_at")
-        started_key = started_at.strip() if isinstance(started_at, str) else ""
-        candidate = (started_key, path.name)
-        prior = best.get(spec_ref)
+        candidate = (row["started_at"], oid)
+        prior = best.get(row["spec_ref"])
         if prior is None or candidate > prior:
-            best[spec_ref] = candidate
+            best[row["spec_ref"]] = candidate
     return {spec_ref: value[1] for spec_ref, value in best.items()}
 
 
@@ -1158,7 +1217,7 @@ def _index_incomplete_orchestrations_by_spec(repo_root: Path) -> dict[str, list[
     """Map `spec_ref -> [orchestration_id, ...]` for every orchestration whose meta is
     not in a terminal status.
 
-    One linear scan of `workspace/orchestrations` (same shape as
+    One pass over the orchestration catalog (`_orchestration_catalog`, same shape as
     `_index_closure_orchestrations`), run by the cold-start guard on every call: a
     fresh run of a spec that already has a non-terminal orchestration is either
     concurrent with a live driver (refuse) or about to discard a resumable checkpoint
@@ -1170,29 +1229,11 @@ def _index_incomplete_orchestrations_by_spec(repo_root: Path) -> dict[str, list[
     meta and re-checks the status before acting on it, so a run that terminalized
     between this scan and the probe is dropped rather than reported.
     """
-    orch_root = repo_root / "workspace" / "orchestrations"
-    if not orch_root.is_dir():
-        return {}
     found: dict[str, list[tuple[str, str]]] = {}
-    for path in orch_root.iterdir():
-        if not path.is_dir():
-            continue
-        meta = _read_json_if_exists(path / "orchestration_meta.json")
-        if not isinstance(meta, dict):
-            continue
-        if not _is_non_terminal_status(meta):
-            continue
-        spec_ref = meta.get("spec_ref")
-        if not isinstance(spec_ref, str) or not spec_ref.strip():
+    for oid, row in _orchestration_catalog(repo_root).items():
+        if not _is_non_terminal_status(row) or not row["spec_ref"]:
             continue
-        found.setdefault(spec_ref.strip(), []).append(
-            (
-                meta.get("started_at").strip()
-                if isinstance(meta.get("started_at"), str)
-                else "",
-                path.name,
-            )
-        )
+        found.setdefault(row["spec_ref"], []).append((row["started_at"], oid))
     return {
         spec_ref: [oid for _, oid in sorted(entries)]
         for spec_ref, entries in found.items()
@@ -2011,6 +2052,16 @@ def _llm_config_resume_rejection(
     return None
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
 class _RemovedFlagAction(argparse.Action):
     """A flag that no longer exists, kept REGISTERED so it fails by name.
 
@@ -2142,6 +2193,20 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
             "--with-deps)."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help=(
+            "With --with-deps (or a closure --resume): run up to N dependency nodes that "
+            "share no dependency path at the same time, each as its own orchestration in "
+            "its own worker process. The first failing node cancels the ones still running "
+            "(they terminalize as resumable `cancel`); --resume continues them. Default 1 "
+            "(one node at a time, in dependency order). Not recorded on the run — re-pass "
+            "it on --resume."
+        ),
+    )
     parser.add_argument(
         "--wait-usage-reset",
         action="store_true",
@@ -2255,6 +2320,32 @@ def _validated_pycache_redirect_root(repo_root: Path) -> Path:
     return resolved
 
 
+# Trees whose modules the runtime, gate and hook subprocesses import. Tests are never imported
+# by a run, so they are not compiled.
+_WARM_BYTECODE_TREES = ("tools", "mcp_servers")
+_WARM_BYTECODE_SKIP_RE = re.compile(r"[/\\]tests[/\\]")
+
+
+def _warm_host_bytecode(repo_root: Path) -> None:
+    """Compile the repo's modules into the bytecode redirect root (the active
+    `sys.pycache_prefix`) before the run starts.
+
+    Every `python3 tools/...` subprocess runs with PYTHONDONTWRITEBYTECODE=1, so none of them
+    ever caches what it compiles: without this, each bookkeeping call, gate and hook recompiles
+    the runtime / validator / hook-policy import graph from source (~0.3 s per call for the
+    runtime alone). Only the trusted host writes here, and `compileall` skips an up-to-date
+    entry, so a warm tree costs a few milliseconds of stats. Best effort: a module that does
+    not compile is left for its importer to report.
+    """
+    import compileall
+
+    for tree in _WARM_BYTECODE_TREES:
+        root = repo_root / tree
+        if root.is_dir():
+            with contextlib.suppress(OSError):
+                compileall.compile_dir(root, quiet=2, rx=_WARM_BYTECODE_SKIP_RE)
+
+
 def main(argv: list[str] | None = None) -> int:
     """Entry point. Thin wrapper that scopes the process-global `sys.pycache_prefix` redirect
     (installed by `_run_main` once repo_root is known) to THIS call.
@@ -2354,6 +2445,7 @@ def _run_main(
         )
         return 2
     sys.pycache_prefix = str(_pycache_resolved)
+    _warm_host_bytecode(repo_root)
 
     resume_mode = bool(args.resume)
 
@@ -2819,6 +2911,11 @@ def _run_main(
     # (b) the orchestration agent launch subprocess, and (c) any grandchild
     # `python3 tools/...` invocations the agent makes.
     base_env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    # ...but let them READ the bytecode the host compiled into its redirect root
+    # (`_warm_host_bytecode`), as `_gate_python_env` already does for gate subprocesses. The
+    # root is host-written only and never leaf-writable, and the leaf env allowlist does not
+    # forward this variable.
+    base_env["PYTHONPYCACHEPREFIX"] = str(_pycache_resolved)
     # NOTE: this only covers SUBPROCESSES. The IN-PROCESS conductor host's own bytecode is kept
     # out of the repo source tree by the `sys.pycache_prefix` redirect installed near the top of
     # main() (see the comment there for why it must run that early and why it uses a literal).
@@ -2849,6 +2946,7 @@ def _run_main(
             resume=True,
             prior_orch_by_spec=prior_map,
             raw_argv=raw_argv,
+            jobs=args.jobs,
         )
 
     # `--with-deps` runs the target's transitive dependency closure bottom-up
@@ -2874,6 +2972,7 @@ def _run_main(
             resume=False,
             prior_orch_by_spec=None,
             raw_argv=raw_argv,
+            jobs=args.jobs,
         )
 
     # Cold-start guard (single node): a fresh run of a spec that still has a
@@ -3973,7 +4072,9 @@ def _resolve_dependency_closure(
     Returns `(ordered, error)`:
       - `ordered`: dependency nodes in dependency order (dependencies before
         dependents), EXCLUDING the target. Each is
-        `{spec_ref, spec_kind, spec_id, spec_versions}`. `spec_versions` is the
+        `{spec_ref, spec_kind, spec_id, spec_versions, depends_on}`, where
+        `depends_on` lists the spec_refs of the node's direct dependencies (the
+        edges `--jobs` schedules by). `spec_versions` is the
         descending list of catalog versions satisfying the requiring edge's
         constraint (intersected across edges when a node is required more than
         once). The readiness check mirrors the runtime contract
@@ -4028,6 +4129,8 @@ def _resolve_dependency_closure(
     # satisfying every edge that required it (intersection across edges).
     kindid_by_ref: dict[str, tuple[str, str]] = {}
     matched_by_ref: dict[str, tuple[str, ...]] = {}
+    # Per spec_ref: the spec_refs of its direct dependencies (its in-closure edges).
+    edges_by_ref: dict[str, list[str]] = {}
     visiting: set[str] = set()
     done: set[str] = set()
     error: dict[str, str] | None = None
@@ -4207,6 +4310,7 @@ def _resolve_dependency_closure(
                 }
                 return
             kindid_by_ref[dep_spec_ref] = (kind, sid)
+            edges_by_ref.setdefault(spec_ref, []).append(dep_spec_ref)
             # Intersect the matching-version sets across edges. An empty
             # intersection means two edges pin incompatible version ranges for
             # the same node — a genuine conflict, fail-closed.
@@ -4247,11 +4351,412 @@ def _resolve_dependency_closure(
                 "spec_kind": kind,
                 "spec_id": sid,
                 "spec_versions": list(matched_by_ref[ref]),
+                "depends_on": sorted(set(edges_by_ref.get(ref, []))),
             }
         )
     return ordered, None
 
 
+def _run_dependency_node(
+    node: dict[str, Any],
+    *,
+    dep_orch_id: str,
+    dep_resume: bool,
+    repo_root: Path,
+    base_env: dict[str, str],
+    target_orchestration_id: str,
+    target_spec_ref: str,
+    until_phase: str,
+    dep_until_phase: str,
+    required_stages: list[str],
+    llm: str,
+    llm_command: str,
+    llm_config: LlmConfig,
+    workflow_mode: str,
+    agent_model: str | None,
+    status: str,
+    run_conductor: bool,
+    wait_usage_reset: bool,
+    stdout_format: str,
+    raw_argv: list[str] | None,
+    preclaimed_orchestration_id: str | None,
+    closure_driver_identity: dict[str, Any] | None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None, int]:
+    """Claim, guard and run ONE not-ready dependency node of a closure.
+
+    Returns `(entry, failure, rc)`: `entry` is the node's `dependency_runs` row (None when
+    the node was refused before it ran), `failure` the fail envelope to emit (None on
+    success) WITHOUT the closure-level `dependency_runs` / `target_spec_ref` keys, which
+    the caller adds because only it holds the whole summary. Nothing here reads or writes
+    closure-wide state, so `--jobs` can run it in a worker process.
+    """
+    kind, sid, spec_ref = node["spec_kind"], node["spec_id"], node["spec_ref"]
+    node_label = f"{kind}/{sid}@{node['spec_versions'][0]}"
+    # M-F executor fail-close, per warm-resumed member. The entry gate in main() only checked
+    # the entry orchestration; a mixed closure could otherwise resume a legacy-recorded
+    # dependency here under the pure-only dispatch. A cold (fresh) dep node records `pure` and
+    # is not gated.
+    if dep_resume:
+        # Twin gate, same reasoning one level down: the leaf-LLM configuration a member
+        # launched with must still be the one on disk, or its remaining phases would run on
+        # different models than its finished ones did.
+        for rejection in (
+            _generate_executor_resume_rejection(
+                dep_orch_id, _recorded_generate_executor(repo_root, dep_orch_id)),
+            _llm_config_resume_rejection(
+                dep_orch_id, _recorded_llm_config(repo_root, dep_orch_id),
+                repo_root=repo_root, effective_path=_repo_relative(llm_config.path, repo_root),
+                effective_sha256=llm_config.sha256,
+                effective_overrides={}),
+        ):
+            if rejection is not None:
+                return None, {
+                    **rejection,
+                    "failed_dependency_node": node_label,
+                    "spec_ref": spec_ref,
+                }, 2
+    # Claims are held across this node's guard AND its run. A cold node needs the
+    # SPEC claim (the orchestration its guard looks for is not written until `init`
+    # inside `_run_node`, so a competing run started in that window would scan
+    # clean); a warm-resumed node needs the ORCHESTRATION claim, because its guard
+    # may WRITE — terminalizing a dead driver — and two closures resuming the same
+    # member would otherwise both perform that write, the later one flipping an
+    # actively-resumed run back to `fail`.
+    dep_orch_preclaimed = dep_orch_id == preclaimed_orchestration_id
+    with contextlib.ExitStack() as node_claim:
+        if dep_resume:
+            node_claim_ok = dep_orch_preclaimed or node_claim.enter_context(
+                _exclusive_claim(repo_root, "orch", dep_orch_id))
+        else:
+            node_claim_ok = node_claim.enter_context(
+                _exclusive_claim(repo_root, "spec", spec_ref))
+        if not node_claim_ok:
+            return None, {
+                **_concurrent_cold_start_envelope(spec_ref),
+                "orchestration_id": dep_orch_id,
+                "failed_dependency_node": node_label,
+            }, 2
+        # Driver-liveness gate for this node: a warm-resumed member is terminalized
+        # when its own driver crashed (and refused when it is still live); a cold node
+        # is guarded against this spec's other non-terminal orchestrations.
+        node_conflict = (
+            _warm_resume_liveness_guard(
+                repo_root, dep_orch_id, stdout_format=stdout_format, env=base_env
+            )
+            if dep_resume
+            else _cold_start_running_guard(
+                repo_root, spec_ref, stdout_format=stdout_format,
+                driver_identity=closure_driver_identity,
+            )
+        )
+        if node_conflict is not None:
+            return None, {
+                **node_conflict,
+                "failed_dependency_node": node_label,
+                "spec_ref": spec_ref,
+            }, 2
+        try:
+            dep_source_dependency_ref = _discover_source_dependency_ref(repo_root, spec_ref)
+        except ValueError as exc:
+            return None, {
+                "status": "fail",
+                "reason": "dependency_dep_ref_unresolved",
+                "detail": str(exc),
+                "failed_dependency_node": node_label,
+                "spec_ref": spec_ref,
+            }, 2
+        # The per-node `node_start` event is emitted uniformly inside _run_node;
+        # here we only announce which dependency node (with its pretty label) the
+        # closure is about to drive, so the stream stays human-traceable.
+        _emit_unlogged_event(
+            {
+                "status": "info",
+                "event": "dependency_node_begin",
+                "node": node_label,
+                "spec_ref": spec_ref,
+                "until_phase": dep_until_phase,
+                "orchestration_id": dep_orch_id,
+                "resume": dep_resume,
+            },
+            stdout_format,
+        )
+        # Cold run records the reproduction/closure block; a resumed node preserves
+        # the block it already carries, so pass None there.
+        dep_invocation = None if dep_resume else _build_invocation_record(
+            argv=raw_argv,
+            spec_ref=spec_ref,
+            until_phase=dep_until_phase,
+            llm=llm,
+            llm_command=llm_command,
+            llm_config=llm_config,
+            repo_root=repo_root,
+            workflow_mode=workflow_mode,
+            agent_model=agent_model,
+            with_deps=True,
+            wait_usage_reset=wait_usage_reset,
+            closure_id=target_orchestration_id,
+            closure_target_spec_ref=target_spec_ref,
+            closure_until_phase=until_phase,
+        )
+        rc = _run_node(
+            repo_root=repo_root,
+            base_env=base_env,
+            orchestration_id=dep_orch_id,
+            spec_ref=spec_ref,
+            source_dependency_ref=dep_source_dependency_ref,
+            until_phase=dep_until_phase,
+            llm=llm,
+            llm_command=llm_command,
+            llm_config=llm_config,
+            workflow_mode=workflow_mode,
+            agent_model=agent_model,
+            status=status,
+            run_conductor=run_conductor,
+            resume_mode=dep_resume,
+            wait_usage_reset=wait_usage_reset,
+            invocation=dep_invocation,
+            # On resume, refresh this dep's persisted closure end-phase to the
+            # effective closure until_phase so an operator phase override stays durable
+            # on the dependency nodes even if the target orchestration is never created.
+            closure_until_phase=until_phase if dep_resume else None,
+            stdout_format=stdout_format,
+            spec_claim_held=not dep_resume,
+            orch_claim_held=dep_resume,
+        )
+    entry: dict[str, Any] = {
+        "node": node_label,
+        "spec_ref": spec_ref,
+        "skipped": False,
+        "resumed": dep_resume,
+        "orchestration_id": dep_orch_id,
+        "exit_code": rc,
+    }
+    if rc != 0:
+        return entry, {
+            "status": "fail",
+            "reason": "dependency_node_failed",
+            "failed_dependency_node": node_label,
+            "spec_ref": spec_ref,
+            "orchestration_id": dep_orch_id,
+            "exit_code": rc,
+        }, rc
+
+    # A zero exit code does not by itself prove the dependency reached the
+    # required readiness: `--no-run-conductor` only prepares artifacts, and a
+    # launched agent can exit cleanly with the orchestration still
+    # non-terminal ("running") without producing the ir/pipeline/verdict
+    # evidence. Re-verify before launching the dependent/target node;
+    # otherwise the next node would just fail-close at workflow-launch-check.
+    if not _dependency_node_ready(repo_root, node, required_stages):
+        entry["status"] = "not_ready_after_run"
+        return entry, {
+            "status": "fail",
+            "reason": "dependency_not_ready_after_run",
+            "detail": (
+                f"{node_label} ran (exit 0) but did not produce the "
+                f"required readiness ({'/'.join(required_stages)}); "
+                "common causes: --no-run-conductor, or the agent exited "
+                "without recording a terminal pass (status still running)."
+            ),
+            "failed_dependency_node": node_label,
+            "spec_ref": spec_ref,
+            "orchestration_id": dep_orch_id,
+        }, 2
+    return entry, None, 0
+
+
+def _closure_peer_map(ordered: list[dict[str, Any]]) -> dict[str, list[str]]:
+    """Per closure node, the nodes that may run at the same time as it under `--jobs`.
+
+    A node's ancestors have all finished before it starts and its descendants start only
+    after it finished, so their writes never fall inside its write-diff windows; every
+    other node of the closure is a potential peer.
+    """
+    deps = {n["spec_ref"]: set(n.get("depends_on") or ()) for n in ordered}
+    ancestors: dict[str, set[str]] = {}
+    for node in ordered:  # topological: a node's dependencies are already resolved
+        ref = node["spec_ref"]
+        ancestors[ref] = set()
+        for dep in deps[ref]:
+            if dep in ancestors:
+                ancestors[ref] |= {dep} | ancestors[dep]
+    return {
+        ref: [
+            other for other in ancestors
+            if other != ref and other not in ancestors[ref] and ref not in ancestors[other]
+        ]
+        for ref in ancestors
+    }
+
+
+def _dependency_node_worker(conn: Any, run_one: Any, kwargs: dict[str, Any]) -> None:
+    """Worker-process body for one `--jobs` node: run it and send `(entry, failure, rc)`.
+
+    SIGTERM (the cancellation signal) is routed through `_run_node`'s interrupt clause,
+    which terminalizes the node as a resumable `cancel` instead of leaving it `running`.
+    """
+    from tools.orchestration_runtime import CLOSURE_PEERS_ENV
+
+    _install_signal_handlers()
+    peers = kwargs["base_env"].get(CLOSURE_PEERS_ENV)
+    if peers is not None:
+        # The runtime calls the conductor makes in-process read the same scopes.
+        os.environ[CLOSURE_PEERS_ENV] = peers
+    conn.send(run_one(**kwargs))
+    conn.close()
+
+
+def _run_dependency_nodes_concurrently(
+    ordered: list[dict[str, Any]],
+    *,
+    jobs: int,
+    orch_ids: dict[str, tuple[str, bool]],
+    dependency_runs: list[dict[str, Any]],
+    is_ready: Any,
+    node_kwargs: dict[str, Any],
+    stdout_format: str,
+) -> tuple[dict[str, Any] | None, int]:
+    """Run the closure's not-ready dependency nodes, up to `jobs` at a time.
+
+    A node starts once every node it depends on is ready (skipped or finished), in the
+    closure's topological order, each in a forked worker process: `_run_node` owns
+    process-wide state (the stdout tee, the environment, signal dispositions) that two
+    nodes in one process would share. Each worker is told which nodes may run beside it
+    (`CLOSURE_PEERS_ENV`), so the runtime can attribute a write in a peer's tree to the
+    peer launch that made it instead of to this node.
+
+    First failure cancels: no further node is started, and every still-running worker is
+    sent SIGTERM, which terminalizes its orchestration as a resumable `cancel` — a
+    closure-aware `--resume` continues them warm. Returns `(failure, rc)` for the first
+    failure, or `(None, 0)`; `dependency_runs` is filled in completion order.
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait as wait_for
+
+    from tools.orchestration_runtime import CLOSURE_PEERS_ENV
+
+    context = multiprocessing.get_context("fork")
+    by_ref = {n["spec_ref"]: n for n in ordered}
+    peer_map = _closure_peer_map(ordered)
+    pending = list(ordered)
+    done: set[str] = set()
+    skipped: set[str] = set()
+    # sentinel -> (node, worker process, result pipe, orchestration id, resumed)
+    running: dict[int, tuple[dict[str, Any], Any, Any, str, bool]] = {}
+    first_failure: tuple[dict[str, Any], int] | None = None
+    try:
+        while pending or running:
+            skipped_any = False
+            for node in list(pending):
+                if first_failure is not None or len(running) >= jobs:
+                    break
+                if not set(node.get("depends_on") or ()) <= done:
+                    continue
+                pending.remove(node)
+                ref = node["spec_ref"]
+                if is_ready(node):
+                    dependency_runs.append({
+                        "node": f"{node['spec_kind']}/{node['spec_id']}@{node['spec_versions'][0]}",
+                        "spec_ref": ref, "skipped": True, "status": "ready",
+                    })
+                    done.add(ref)
+                    skipped.add(ref)
+                    skipped_any = True
+                    continue
+                dep_orch_id, dep_resume = orch_ids[ref]
+                peers = [
+                    {
+                        "orchestration_id": orch_ids[other][0],
+                        "spec_kind": by_ref[other]["spec_kind"],
+                        "spec_id": by_ref[other]["spec_id"],
+                        "spec_versions": by_ref[other]["spec_versions"],
+                    }
+                    for other in peer_map[ref] if other not in skipped
+                ]
+                kwargs = {
+                    **node_kwargs,
+                    "node": node,
+                    "dep_orch_id": dep_orch_id,
+                    "dep_resume": dep_resume,
+                    "base_env": {**node_kwargs["base_env"],
+                                 CLOSURE_PEERS_ENV: json.dumps(peers, sort_keys=True)},
+                }
+                receiver, sender = context.Pipe(duplex=False)
+                proc = context.Process(
+                    target=_dependency_node_worker,
+                    args=(sender, _run_dependency_node, kwargs),
+                    name=f"dependency-node:{ref}",
+                )
+                proc.start()
+                sender.close()
+                running[proc.sentinel] = (node, proc, receiver, dep_orch_id, dep_resume)
+            if not running:
+                if skipped_any and first_failure is None:
+                    continue
+                # Nothing runs and nothing more can start: after a failure the rest of
+                # `pending` waits on a node that will never be done.
+                break
+            for sentinel in wait_for(list(running)):
+                node, proc, receiver, dep_orch_id, dep_resume = running.pop(sentinel)
+                proc.join()
+                result = None
+                try:
+                    if receiver.poll():
+                        result = receiver.recv()
+                except (EOFError, OSError):
+                    result = None
+                receiver.close()
+                if result is None:
+                    # The worker died before reporting — cancelled, or killed outright.
+                    # A signal death (negative exitcode) is reported the shell's way.
+                    code = proc.exitcode or 2
+                    rc = code if code > 0 else 128 - code
+                    entry = {
+                        "node": f"{node['spec_kind']}/{node['spec_id']}@{node['spec_versions'][0]}",
+                        "spec_ref": node["spec_ref"],
+                        "skipped": False,
+                        "resumed": dep_resume,
+                        "orchestration_id": dep_orch_id,
+                        "exit_code": rc,
+                    }
+                    failure = {
+                        "status": "fail",
+                        "reason": "dependency_node_failed",
+                        "failed_dependency_node": entry["node"],
+                        "spec_ref": node["spec_ref"],
+                        "orchestration_id": dep_orch_id,
+                        "exit_code": rc,
+                    }
+                else:
+                    entry, failure, rc = result
+                if entry is not None:
+                    if failure is not None and first_failure is not None:
+                        entry["cancelled"] = True
+                    dependency_runs.append(entry)
+                if failure is None:
+                    done.add(node["spec_ref"])
+                elif first_failure is None:
+                    first_failure = (failure, rc)
+                    for _node, other, *_rest in running.values():
+                        other.terminate()
+    finally:
+        for _node, proc, receiver, *_rest in running.values():
+            proc.terminate()
+            proc.join()
+            receiver.close()
+    if first_failure is None and pending:
+        # No failure, yet nodes left that never became startable: a `depends_on` edge
+        # outside the closure. Reported rather than silently dropped before the target.
+        return {
+            "status": "fail",
+            "reason": "dependency_closure_stalled",
+            "unstarted_spec_refs": [n["spec_ref"] for n in pending],
+        }, 2
+    if first_failure is None:
+        return None, 0
+    return first_failure
+
+
 def _run_with_dependency_closure(
     *,
     repo_root: Path,
@@ -4273,6 +4778,7 @@ def _run_with_dependency_closure(
     prior_orch_by_spec: dict[str, str] | None = None,
     raw_argv: list[str] | None = None,
     preclaimed_orchestration_id: str | None = None,
+    jobs: int = 1,
 ) -> int:
     """Run the target's dependency closure bottom-up, then the target.
 
@@ -4281,6 +4787,10 @@ def _run_with_dependency_closure(
     dependency failure the run stops (the target is not launched). The target's
     final JSON result carries a `dependency_runs` summary.
 
+    `jobs` > 1 runs nodes that share no dependency path concurrently, up to `jobs` at
+    a time (`_run_dependency_nodes_concurrently`); a failure then also cancels the
+    nodes still running. `jobs=1` is the sequential topological walk.
+
     This drives BOTH the fresh `--with-deps` path and closure-aware `--resume`:
     - Fresh (`resume=False`, `prior_orch_by_spec=None`): every not-ready node gets a
       fresh orchestration id and a cold run. Behavior is unchanged from before, with
@@ -4329,230 +4839,74 @@ def _run_with_dependency_closure(
     closure_driver_identity = _current_driver_identity()
 
     dependency_runs: list[dict[str, Any]] = []
-    for node in ordered:
-        kind, sid, spec_ref = node["spec_kind"], node["spec_id"], node["spec_ref"]
-        node_label = f"{kind}/{sid}@{node['spec_versions'][0]}"
-        if _dependency_node_ready(repo_root, node, required_stages):
-            dependency_runs.append(
-                {"node": node_label, "spec_ref": spec_ref, "skipped": True, "status": "ready"}
-            )
-            continue
 
+    def node_orch_id(node: dict[str, Any]) -> tuple[str, bool]:
         # Closure-aware resume: a not-ready node with a prior orchestration under this
         # closure is resumed (warm) from its checkpoint; otherwise mint a fresh id and
         # cold-run it. Fresh `--with-deps` runs pass an empty map → always fresh/cold.
-        prior_dep_orch_id = prior_orch_by_spec.get(spec_ref) if resume else None
-        dep_orch_id = prior_dep_orch_id or _new_orchestration_id()
-        dep_resume = prior_dep_orch_id is not None
-        # M-F executor fail-close, per warm-resumed member. The entry gate in main() only checked
-        # the entry orchestration; a mixed closure could otherwise resume a legacy-recorded
-        # dependency here under the pure-only dispatch. A cold (fresh) dep node records `pure` and
-        # is not gated.
-        if dep_resume:
-            # Twin gate, same reasoning one level down: the leaf-LLM configuration a member
-            # launched with must still be the one on disk, or its remaining phases would run on
-            # different models than its finished ones did.
-            for rejection in (
-                _generate_executor_resume_rejection(
-                    dep_orch_id, _recorded_generate_executor(repo_root, dep_orch_id)),
-                _llm_config_resume_rejection(
-                    dep_orch_id, _recorded_llm_config(repo_root, dep_orch_id),
-                    repo_root=repo_root, effective_path=_repo_relative(llm_config.path, repo_root),
-                    effective_sha256=llm_config.sha256,
-                    effective_overrides={}),
-            ):
-                if rejection is None:
-                    continue
-                _emit_unlogged_event(
-                    {
-                        **rejection,
-                        "failed_dependency_node": node_label,
-                        "spec_ref": spec_ref,
-                        "dependency_runs": dependency_runs,
-                        "target_spec_ref": target_spec_ref,
-                    },
-                    stdout_format,
-                )
-                return 2
-        # Claims are held across this node's guard AND its run. A cold node needs the
-        # SPEC claim (the orchestration its guard looks for is not written until `init`
-        # inside `_run_node`, so a competing run started in that window would scan
-        # clean); a warm-resumed node needs the ORCHESTRATION claim, because its guard
-        # may WRITE — terminalizing a dead driver — and two closures resuming the same
-        # member would otherwise both perform that write, the later one flipping an
-        # actively-resumed run back to `fail`.
-        dep_orch_preclaimed = dep_orch_id == preclaimed_orchestration_id
-        with contextlib.ExitStack() as node_claim:
-            if dep_resume:
-                node_claim_ok = dep_orch_preclaimed or node_claim.enter_context(
-                    _exclusive_claim(repo_root, "orch", dep_orch_id))
-            else:
-                node_claim_ok = node_claim.enter_context(
-                    _exclusive_claim(repo_root, "spec", spec_ref))
-            if not node_claim_ok:
-                _emit_unlogged_event(
-                    {
-                        **_concurrent_cold_start_envelope(spec_ref),
-                        "orchestration_id": dep_orch_id,
-                        "failed_dependency_node": node_label,
-                        "dependency_runs": dependency_runs,
-                        "target_spec_ref": target_spec_ref,
-                    },
-                    stdout_format,
-                )
-                return 2
-            # Driver-liveness gate for this node: a warm-resumed member is terminalized
-            # when its own driver crashed (and refused when it is still live); a cold node
-            # is guarded against this spec's other non-terminal orchestrations.
-            node_conflict = (
-                _warm_resume_liveness_guard(
-                    repo_root, dep_orch_id, stdout_format=stdout_format, env=base_env
-                )
-                if dep_resume
-                else _cold_start_running_guard(
-                    repo_root, spec_ref, stdout_format=stdout_format,
-                    driver_identity=closure_driver_identity,
-                )
-            )
-            if node_conflict is not None:
-                _emit_unlogged_event(
-                    {
-                        **node_conflict,
-                        "failed_dependency_node": node_label,
-                        "spec_ref": spec_ref,
-                        "dependency_runs": dependency_runs,
-                        "target_spec_ref": target_spec_ref,
-                    },
-                    stdout_format,
-                )
-                return 2
-            try:
-                dep_source_dependency_ref = _discover_source_dependency_ref(repo_root, spec_ref)
-            except ValueError as exc:
-                _emit_unlogged_event(
+        prior_dep_orch_id = prior_orch_by_spec.get(node["spec_ref"]) if resume else None
+        return prior_dep_orch_id or _new_orchestration_id(), prior_dep_orch_id is not None
+
+    node_kwargs: dict[str, Any] = {
+        "repo_root": repo_root,
+        "base_env": base_env,
+        "target_orchestration_id": target_orchestration_id,
+        "target_spec_ref": target_spec_ref,
+        "until_phase": until_phase,
+        "dep_until_phase": dep_until_phase,
+        "required_stages": required_stages,
+        "llm": llm,
+        "llm_command": llm_command,
+        "llm_config": llm_config,
+        "workflow_mode": workflow_mode,
+        "agent_model": agent_model,
+        "status": status,
+        "run_conductor": run_conductor,
+        "wait_usage_reset": wait_usage_reset,
+        "stdout_format": stdout_format,
+        "raw_argv": raw_argv,
+        "preclaimed_orchestration_id": preclaimed_orchestration_id,
+        "closure_driver_identity": closure_driver_identity,
+    }
+    failure: dict[str, Any] | None = None
+    rc = 0
+    # Worker processes are forked; a host without fork runs the closure sequentially.
+    if jobs > 1 and len(ordered) > 1 and hasattr(os, "fork"):
+        failure, rc = _run_dependency_nodes_concurrently(
+            ordered,
+            jobs=jobs,
+            # Minted up front: a node's peers must be nameable before they start.
+            orch_ids={node["spec_ref"]: node_orch_id(node) for node in ordered},
+            dependency_runs=dependency_runs,
+            is_ready=lambda node: _dependency_node_ready(repo_root, node, required_stages),
+            node_kwargs=node_kwargs,
+            stdout_format=stdout_format,
+        )
+    else:
+        for node in ordered:
+            if _dependency_node_ready(repo_root, node, required_stages):
+                dependency_runs.append(
                     {
-                        "status": "fail",
-                        "reason": "dependency_dep_ref_unresolved",
-                        "detail": str(exc),
-                        "failed_dependency_node": node_label,
-                        "spec_ref": spec_ref,
-                        "dependency_runs": dependency_runs,
-                        "target_spec_ref": target_spec_ref,
-                    },
-                    stdout_format,
+                        "node": f"{node['spec_kind']}/{node['spec_id']}@{node['spec_versions'][0]}",
+                        "spec_ref": node["spec_ref"],
+                        "skipped": True,
+                        "status": "ready",
+                    }
                 )
-                return 2
-            # The per-node `node_start` event is emitted uniformly inside _run_node;
-            # here we only announce which dependency node (with its pretty label) the
-            # closure is about to drive, so the stream stays human-traceable.
-            _emit_unlogged_event(
-                {
-                    "status": "info",
-                    "event": "dependency_node_begin",
-                    "node": node_label,
-                    "spec_ref": spec_ref,
-                    "until_phase": dep_until_phase,
-                    "orchestration_id": dep_orch_id,
-                    "resume": dep_resume,
-                },
-                stdout_format,
-            )
-            # Cold run records the reproduction/closure block; a resumed node preserves
-            # the block it already carries, so pass None there.
-            dep_invocation = None if dep_resume else _build_invocation_record(
-                argv=raw_argv,
-                spec_ref=spec_ref,
-                until_phase=dep_until_phase,
-                llm=llm,
-                llm_command=llm_command,
-                llm_config=llm_config,
-                repo_root=repo_root,
-                workflow_mode=workflow_mode,
-                agent_model=agent_model,
-                with_deps=True,
-                wait_usage_reset=wait_usage_reset,
-                closure_id=target_orchestration_id,
-                closure_target_spec_ref=target_spec_ref,
-                closure_until_phase=until_phase,
-            )
-            rc = _run_node(
-                repo_root=repo_root,
-                base_env=base_env,
-                orchestration_id=dep_orch_id,
-                spec_ref=spec_ref,
-                source_dependency_ref=dep_source_dependency_ref,
-                until_phase=dep_until_phase,
-                llm=llm,
-                llm_command=llm_command,
-                llm_config=llm_config,
-                                workflow_mode=workflow_mode,
-                agent_model=agent_model,
-                status=status,
-                run_conductor=run_conductor,
-                resume_mode=dep_resume,
-                wait_usage_reset=wait_usage_reset,
-                invocation=dep_invocation,
-                # On resume, refresh this dep's persisted closure end-phase to the
-                # effective closure until_phase so an operator phase override stays durable
-                # on the dependency nodes even if the target orchestration is never created.
-                closure_until_phase=until_phase if dep_resume else None,
-                stdout_format=stdout_format,
-                spec_claim_held=not dep_resume,
-                orch_claim_held=dep_resume,
-            )
-        dependency_runs.append(
-            {
-                "node": node_label,
-                "spec_ref": spec_ref,
-                "skipped": False,
-                "resumed": dep_resume,
-                "orchestration_id": dep_orch_id,
-                "exit_code": rc,
-            }
+                continue
+            dep_orch_id, dep_resume = node_orch_id(node)
+            entry, failure, rc = _run_dependency_node(
+                node, dep_orch_id=dep_orch_id, dep_resume=dep_resume, **node_kwargs)
+            if entry is not None:
+                dependency_runs.append(entry)
+            if failure is not None:
+                break
+    if failure is not None:
+        _emit_unlogged_event(
+            {**failure, "dependency_runs": dependency_runs, "target_spec_ref": target_spec_ref},
+            stdout_format,
         )
-        if rc != 0:
-            _emit_unlogged_event(
-                {
-                    "status": "fail",
-                    "reason": "dependency_node_failed",
-                    "failed_dependency_node": node_label,
-                    "spec_ref": spec_ref,
-                    "orchestration_id": dep_orch_id,
-                    "exit_code": rc,
-                    "dependency_runs": dependency_runs,
-                    "target_spec_ref": target_spec_ref,
-                },
-                stdout_format,
-            )
-            return rc
-
-        # A zero exit code does not by itself prove the dependency reached the
-        # required readiness: `--no-run-conductor` only prepares artifacts, and a
-        # launched agent can exit cleanly with the orchestration still
-        # non-terminal ("running") without producing the ir/pipeline/verdict
-        # evidence. Re-verify before launching the dependent/target node;
-        # otherwise the next node would just fail-close at workflow-launch-check.
-        if not _dependency_node_ready(repo_root, node, required_stages):
-            dependency_runs[-1]["status"] = "not_ready_after_run"
-            _emit_unlogged_event(
-                {
-                    "status": "fail",
-                    "reason": "dependency_not_ready_after_run",
-                    "detail": (
-                        f"{node_label} ran (exit 0) but did not produce the "
-                        f"required readiness ({'/'.join(required_stages)}); "
-                        "common causes: --no-run-conductor, or the agent exited "
-                        "without recording a terminal pass (status still running)."
-                    ),
-                    "failed_dependency_node": node_label,
-                    "spec_ref": spec_ref,
-                    "orchestration_id": dep_orch_id,
-                    "dependency_runs": dependency_runs,
-                    "target_spec_ref": target_spec_ref,
-                },
-                stdout_format,
-            )
-            return 2
+        return rc
 
     # All dependencies are ready — run the target node, carrying the summary. On
     # closure-aware resume, reuse the closure id as the target orchestration id and
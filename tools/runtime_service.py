@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""Resident dispatch for the `orchestration_runtime.py` bookkeeping CLI.
+
+The conductor and `run_workflow.py` drive every bookkeeping step (`record-launch`,
+`finalize-child`, `write-step-result`, `check-step-completed`, `workflow-launch-check`,
+`set-status`, `reserve-phase-root`, ...) through the runtime's CLI, one fresh
+`python3 tools/orchestration_runtime.py <subcommand>` per call. That contract is
+deliberate — the callers must not reach into runtime internals, so the same guards fire
+as on the LLM path — but its price is an interpreter start plus a cold import of the
+runtime, PyYAML and the hook policy on EVERY call, which dwarfs the milliseconds of work
+most subcommands do. A node makes dozens of these calls.
+
+`METDSL_RUNTIME_MODE=resident` keeps the contract and drops the import. One long-lived
+worker per repository root (`python3 tools/runtime_service.py serve`) imports the runtime
+once and serves calls over a line-delimited JSON pipe: the request carries the argv, the
+stdin text, the environment and the working directory; the reply carries the exit code,
+stdout and stderr that the subprocess would have produced. The caller sees a
+`subprocess.CompletedProcess` either way, so nothing downstream of the dispatch changes.
+
+What is deliberately the SAME as the subprocess mode:
+
+  * the worker is a separate process started with the caller's environment, so the
+    runtime still never shares state with the conductor;
+  * each call runs `orchestration_runtime.main(argv)` end to end, so every `fcntl.flock`
+    is taken on a freshly opened descriptor and released before the reply is written —
+    a lock is never held across calls, and calls are served strictly one at a time;
+  * the environment and working directory are reset to the caller's per call, so a
+    conductor that changes `env` between calls is seen exactly as a fresh process would
+    see it;
+  * an uncaught exception becomes exit 1 with the traceback on stderr, and an argparse
+    rejection keeps its exit 2, as the interpreter would report them.
+
+The worker is recycled after `RESIDENT_MAX_CALLS` calls so module-level caches cannot
+drift for the life of a long closure. A worker that dies mid-call is reported as a
+failed call (never retried — the call may already have written) and replaced on the
+next one. `subprocess` remains the default.
+
+The subprocess mode starts the runtime as `python3 -m tools.orchestration_runtime`, not by
+its path: a script named on the command line is compiled from source on every start, and at
+the runtime's size that compile costs more than the rest of the start together, while a module
+run with ``-m`` loads the bytecode `run_workflow.py` compiles into the host redirect root
+(PYTHONPYCACHEPREFIX). The process is otherwise the one the path form starts.
+
+`python3 tools/runtime_service.py bench --repo-root .` compares the per-call latency of
+the two modes on a read-only subcommand.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+RUNTIME_MODE_ENV = "METDSL_RUNTIME_MODE"
+RUNTIME_MODE_SUBPROCESS = "subprocess"
+RUNTIME_MODE_RESIDENT = "resident"
+RUNTIME_MODES = (RUNTIME_MODE_SUBPROCESS, RUNTIME_MODE_RESIDENT)
+RUNTIME_SCRIPT = "tools/orchestration_runtime.py"
+RUNTIME_MODULE = "tools.orchestration_runtime"
+SERVICE_SCRIPT = "tools/runtime_service.py"
+# Calls one worker serves before it is replaced. High enough that a node's bookkeeping
+# runs on one warm import, low enough that the runtime's lru_caches are rebuilt a few
+# times over a long closure.
+RESIDENT_MAX_CALLS = 256
+
+
+def runtime_mode(env: Mapping[str, str]) -> str:
+    """The runtime dispatch mode named by `env`; unset means `subprocess`.
+
+    An unknown value is an error rather than a fallback: an operator who mistyped the
+    mode asked for something, and silently serving the other mode hides the typo.
+    """
+    value = str(env.get(RUNTIME_MODE_ENV) or "").strip().lower()
+    if not value:
+        return RUNTIME_MODE_SUBPROCESS
+    if value not in RUNTIME_MODES:
+        raise ValueError(
+            f"{RUNTIME_MODE_ENV}={value!r} is not one of {', '.join(RUNTIME_MODES)}")
+    return value
+
+
+class ResidentRuntime:
+    """One warm `runtime_service.py serve` worker for one repository root."""
+
+    def __init__(self, repo_root: Path, env: Mapping[str, str]) -> None:
+        self.repo_root = Path(repo_root)
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            ["python3", SERVICE_SCRIPT, "serve"],
+            cwd=self.repo_root, env=dict(env), text=True,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def call(self, args: Sequence[str], *, env: Mapping[str, str],
+             input: str | None = None) -> subprocess.CompletedProcess[str]:
+        request = {"argv": list(args), "stdin": input or "", "env": dict(env),
+                   "cwd": str(self.repo_root)}
+        with self._lock:
+            self.calls += 1
+            assert self._proc.stdin is not None and self._proc.stdout is not None
+            try:
+                self._proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (BrokenPipeError, OSError):
+                line = ""
+            if not line:
+                self.close()
+                return subprocess.CompletedProcess(
+                    ["python3", RUNTIME_SCRIPT, *args], 1, "",
+                    "resident runtime worker exited before replying; the call may have "
+                    "been partially applied")
+            reply = json.loads(line)
+        return subprocess.CompletedProcess(
+            ["python3", RUNTIME_SCRIPT, *args], int(reply["returncode"]),
+            str(reply["stdout"]), str(reply["stderr"]))
+
+    def close(self) -> None:
+        proc = self._proc
+        if proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def release(self) -> None:
+        """Forget this worker in a forked child without talking to it: the child's copies
+        of the pipe ends are pointed at /dev/null, so it neither joins the parent's
+        conversation nor holds the worker's stdin open once the parent closes it."""
+        devnull = os.open(os.devnull, os.O_RDWR)
+        try:
+            for stream in (self._proc.stdin, self._proc.stdout):
+                if stream is not None:
+                    with contextlib.suppress(OSError, ValueError):
+                        os.dup2(devnull, stream.fileno())
+        finally:
+            os.close(devnull)
+
+
+_WORKERS: dict[Path, ResidentRuntime] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def _resident_worker(repo_root: Path, env: Mapping[str, str]) -> ResidentRuntime:
+    key = Path(repo_root).resolve()
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is not None and (not worker.alive() or worker.calls >= RESIDENT_MAX_CALLS):
+            worker.close()
+            worker = None
+        if worker is None:
+            worker = ResidentRuntime(key, env)
+            _WORKERS[key] = worker
+        return worker
+
+
+def shutdown_resident_workers() -> None:
+    """Stop every resident worker this process started (also run at exit)."""
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_resident_workers)
+
+
+def _forget_inherited_workers() -> None:
+    """After fork, in the child: the parent's workers stay the parent's, and the
+    child starts its own on first use instead of interleaving requests on their pipes."""
+    global _WORKERS_LOCK
+    _WORKERS_LOCK = threading.Lock()
+    for worker in _WORKERS.values():
+        worker.release()
+    _WORKERS.clear()
+
+
+os.register_at_fork(after_in_child=_forget_inherited_workers)
+
+
+def run_runtime(repo_root: Path, env: Mapping[str, str], args: Sequence[str], *,
+                input: str | None = None) -> subprocess.CompletedProcess[str]:
+    """Run one `orchestration_runtime.py` subcommand in the mode `env` selects.
+
+    The result is what `subprocess.run(..., capture_output=True, text=True)` returns for
+    `python3 -m tools.orchestration_runtime *args`; callers keep their own exit-code and
+    JSON handling.
+    """
+    if runtime_mode(env) == RUNTIME_MODE_RESIDENT:
+        return _resident_worker(repo_root, env).call(args, env=env, input=input)
+    return subprocess.run(
+        ["python3", "-m", RUNTIME_MODULE, *args],
+        cwd=repo_root, env=dict(env), text=True, capture_output=True, check=False,
+        input=input,
+    )
+
+
+def _dispatch(runtime_main: Any, request: dict[str, Any], *,
+              script: str = RUNTIME_SCRIPT) -> dict[str, Any]:
+    """Run one request through `runtime_main` the way a fresh `python3 <script>` would."""
+    argv = [str(a) for a in request.get("argv") or []]
+    os.environ.clear()
+    os.environ.update({str(k): str(v) for k, v in (request.get("env") or {}).items()})
+    os.chdir(str(request.get("cwd") or "."))
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv, saved_stdin = sys.argv, sys.stdin
+    sys.argv = [script, *argv]
+    sys.stdin = io.StringIO(str(request.get("stdin") or ""))
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                code = runtime_main(argv)
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    code = exc.code or 0
+                else:
+                    print(exc.code, file=sys.stderr)
+                    code = 1
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.argv, sys.stdin = saved_argv, saved_stdin
+    return {"returncode": int(code or 0), "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue()}
+
+
+def serve() -> int:
+    """Worker loop: one JSON request per stdin line, one JSON reply per stdout line.
+
+    The request/reply pipes are moved off fd 0/1 before the runtime is imported, so a
+    child process the runtime spawns with inherited descriptors can neither read a
+    queued request nor write into the reply stream.
+    """
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.dup2(2, 1)
+    repo_root = Path(__file__).resolve().parent.parent
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from tools import op_timing, orchestration_runtime
+
+    op_timing.claim_startup()
+    for line in requests:
+        if not line.strip():
+            continue
+        reply = _dispatch(orchestration_runtime.main, json.loads(line))
+        replies.write(json.dumps(reply, ensure_ascii=False) + "\n")
+        replies.flush()
+    return 0
+
+
+def bench(repo_root: Path, *, calls: int, args: Sequence[str]) -> dict[str, Any]:
+    """Per-call latency of `args` in both modes, in milliseconds."""
+    env = {k: v for k, v in os.environ.items() if k != RUNTIME_MODE_ENV}
+    results: dict[str, Any] = {"argv": list(args), "calls": calls}
+    for mode in RUNTIME_MODES:
+        mode_env = {**env, RUNTIME_MODE_ENV: mode}
+        if mode == RUNTIME_MODE_RESIDENT:
+            run_runtime(repo_root, mode_env, args)          # start + import, not timed
+        samples = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            proc = run_runtime(repo_root, mode_env, args)
+            samples.append((time.perf_counter() - started) * 1000.0)
+            if proc.returncode != 0:
+                raise RuntimeError(
+                    f"bench: {mode} call failed: {proc.stderr.strip() or proc.stdout.strip()}")
+        results[mode] = {
+            "median_ms": round(statistics.median(samples), 3),
+            "min_ms": round(min(samples), 3),
+            "max_ms": round(max(samples), 3),
+        }
+    shutdown_resident_workers()
+    results["speedup"] = round(
+        results[RUNTIME_MODE_SUBPROCESS]["median_ms"]
+        / max(results[RUNTIME_MODE_RESIDENT]["median_ms"], 1e-6), 1)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("serve", help="Serve runtime calls on stdin/stdout (internal).")
+    bench_parser = subparsers.add_parser(
+        "bench", help="Compare per-call runtime latency of the subprocess and resident modes.")
+    bench_parser.add_argument("--repo-root", default=".")
+    bench_parser.add_argument("--calls", type=int, default=20)
+    bench_parser.add_argument(
+        "--orchestration-id", default="bench_runtime_service",
+        help="Orchestration id passed to the benchmarked read-only subcommand.")
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return serve()
+    repo_root = Path(args.repo_root).resolve()
+    result = bench(
+        repo_root, calls=max(1, args.calls),
+        args=["read-checkpoint", "--repo-root", str(repo_root),
+              "--orchestration-id", args.orchestration_id])
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Memory-bounded reads of ``raw/state_snapshots/`` for the post_execute evidence gate.
+
+`validate_pipeline_semantics._validate_raw_evidence` used to `read_text()` every snapshot,
+build a whitespace-stripped copy of it for the placeholder scan, and `json.load` it whole to
+infer the shape of each declared variable. A snapshot of a real atmospheric grid is hundreds of
+megabytes, and a JSON array of floats costs several times its text size as Python objects, so
+the gate's peak memory grew with the grid. The two readers here keep it flat:
+
+  * `placeholder_hits` scans the mmapped bytes in fixed-size chunks through an incremental UTF-8
+    decoder, carrying a pattern-length tail across chunk boundaries;
+  * `summarize_json_object` tokenizes the document incrementally and keeps, per TOP-LEVEL key,
+    only the inferred array shape (and the decoded value of the few string keys the caller
+    names). An innermost run of numbers is consumed by one regex match and counted by its
+    commas, so no element becomes a Python object.
+
+Both are exact replacements, not approximations: `placeholder_hits` reports what the old
+``errors="ignore"`` decode + space/newline strip + substring test reported, and
+`summarize_json_object` accepts precisely the documents `json.loads` accepts (including its
+``NaN`` / ``Infinity`` extensions and last-wins duplicate keys) and infers the shapes
+`_infer_json_shape` inferred. Memory is bounded by the chunk size plus the longest single token.
+
+Stdlib-only, like ``tools/gate_cache.py``, so the validator imports it without crossing its
+module boundary.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import mmap
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+CHUNK_BYTES = 4 * 1024 * 1024
+
+_WS = r"[ \t\n\r]*"
+# The number grammar of the C scanner json.loads uses (ASCII digits only), plus its constants.
+_NUM = r"(?:-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?|-?Infinity|NaN)"
+_TOKEN = re.compile(
+    _WS + r"(?:"
+    # An innermost array of numbers (or an empty array), consumed whole: the bulk of a grid.
+    rf"(?P<flat>\[{_WS}(?:{_NUM}(?:{_WS},{_WS}{_NUM})*)?{_WS}\])"
+    r"|(?P<punct>[\[\]{}:,])"
+    # One character per repetition: a `+` inside the `*` backtracks exponentially on an
+    # unterminated string.
+    r'|(?P<str>"(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*")'
+    rf"|(?P<num>{_NUM})"
+    r"|(?P<lit>true|false|null)"
+    r")"
+)
+_WS_RUN = re.compile(_WS)
+# Longer than any prefix of a number or a literal that is still a token in progress is not.
+_MAX_PARTIAL_SCALAR = 64
+
+
+class _InvalidJson(Exception):
+    pass
+
+
+def _decoded_chunks(path: Path, *, errors: str) -> Iterator[str]:
+    """The file's text, decoded in `CHUNK_BYTES` pieces from an mmap."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors=errors)
+    with path.open("rb") as stream:
+        try:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            yield decoder.decode(b"", final=True)
+            return
+        with mapped:
+            for start in range(0, len(mapped), CHUNK_BYTES):
+                yield decoder.decode(mapped[start:start + CHUNK_BYTES])
+        yield decoder.decode(b"", final=True)
+
+
+def placeholder_hits(path: Path, patterns: Iterable[str]) -> list[str]:
+    """The `patterns` found in the file once its spaces and line breaks are removed, in
+    `patterns` order. Undecodable bytes are dropped first, as ``errors="ignore"`` did, and a
+    ``\r`` goes with the newlines because the text-mode read this replaces turned it into one."""
+    wanted = list(patterns)
+    keep = max((len(p) for p in wanted), default=1) - 1
+    found: set[str] = set()
+    tail = ""
+    for chunk in _decoded_chunks(path, errors="ignore"):
+        window = tail + chunk.replace(" ", "").replace("\n", "").replace("\r", "")
+        for pattern in wanted:
+            if pattern not in found and pattern in window:
+                found.add(pattern)
+        tail = window[-keep:] if keep else ""
+    return [p for p in wanted if p in found]
+
+
+@dataclass
+class JsonObjectSummary:
+    """What the evidence gate reads of one top-level JSON object: its keys, the
+    `_infer_json_shape` of each value, and the values of the requested string keys."""
+
+    shapes: dict[str, list[int] | None] = field(default_factory=dict)
+    strings: dict[str, str] = field(default_factory=dict)
+
+    def keys(self) -> set[str]:
+        return set(self.shapes)
+
+
+def _tokens(path: Path) -> Iterator[tuple[str, str]]:
+    chunks = _decoded_chunks(path, errors="strict")
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def refill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    while True:
+        match = _TOKEN.match(buffer, pos)
+        # A number near the end of the buffer may continue in the next chunk (`12` of `123`,
+        # `1` of `1.5` or `1e5`); every other token is closed by its own last character.
+        if match is not None and match.lastgroup == "num" and not eof and (
+                len(buffer) - match.end() < 3):
+            refill()
+            continue
+        if match is None:
+            # More input can only help whitespace, an open string, or the first few characters
+            # of a number or literal; anything else is invalid however much follows, and
+            # reading on would grow the buffer to the rest of the file.
+            pos = _WS_RUN.match(buffer, pos).end()
+            rest = len(buffer) - pos
+            if rest == 0 or buffer[pos] == '"' or rest < _MAX_PARTIAL_SCALAR:
+                if refill():
+                    continue
+                if rest == 0:
+                    return
+            raise _InvalidJson
+        pos = match.end()
+        kind = match.lastgroup or ""
+        yield kind, match.group(kind)
+
+
+def _array_shape(count: int, first: Any, ragged: bool) -> list[int] | None:
+    if count == 0:
+        return [0]
+    if ragged or first is None:
+        return None
+    return [count, *first]
+
+
+def summarize_json_object(
+    path: Path, *, string_keys: Iterable[str] = ()
+) -> JsonObjectSummary | None:
+    """The summary of `path` when it holds one JSON object; ``None`` when it is not valid JSON
+    (``json.loads`` would raise, invalid UTF-8 included) or its top-level value is not an
+    object."""
+    wanted = set(string_keys)
+    summary = JsonObjectSummary()
+    # Frames: ["obj", state, key] / ["arr", state, count, first_shape, ragged].
+    stack: list[list[Any]] = []
+    top_kind: str | None = None
+
+    def expecting_value() -> bool:
+        if not stack:
+            return top_kind is None
+        frame = stack[-1]
+        if frame[0] == "arr":
+            return frame[1] in ("value_or_end", "value")
+        return frame[1] == "value"
+
+    def complete(shape: list[int] | None, kind: str, raw: str | None = None) -> None:
+        nonlocal top_kind
+        if not stack:
+            top_kind = kind
+            return
+        frame = stack[-1]
+        if frame[0] == "arr":
+            if frame[2] == 0:
+                frame[3] = shape
+            elif shape is None or shape != frame[3]:
+                frame[4] = True
+            frame[2] += 1
+        else:
+            if len(stack) == 1:
+                key = frame[2]
+                summary.shapes[key] = shape
+                if key in wanted and raw is not None:
+                    summary.strings[key] = json.loads(raw)
+                else:
+                    summary.strings.pop(key, None)
+        frame[1] = "comma_or_end"
+
+    try:
+        for kind, text in _tokens(path):
+            if kind == "punct":
+                if text == "{" or text == "[":
+                    if not expecting_value():
+                        raise _InvalidJson
+                    stack.append(["obj", "key_or_end", None] if text == "{"
+                                 else ["arr", "value_or_end", 0, None, False])
+                elif text == "}":
+                    if not stack or stack[-1][0] != "obj" or stack[-1][1] not in (
+                            "key_or_end", "comma_or_end"):
+                        raise _InvalidJson
+                    stack.pop()
+                    complete(None, "object")
+                elif text == "]":
+                    if not stack or stack[-1][0] != "arr" or stack[-1][1] not in (
+                            "value_or_end", "comma_or_end"):
+                        raise _InvalidJson
+                    _, _, count, first, ragged = stack.pop()
+                    complete(_array_shape(count, first, ragged), "array")
+                elif text == ",":
+                    if not stack or stack[-1][1] != "comma_or_end":
+                        raise _InvalidJson
+                    stack[-1][1] = "key" if stack[-1][0] == "obj" else "value"
+                else:  # ":"
+                    if not stack or stack[-1][0] != "obj" or stack[-1][1] != "colon":
+                        raise _InvalidJson
+                    stack[-1][1] = "value"
+            elif kind == "str" and stack and stack[-1][0] == "obj" and stack[-1][1] in (
+                    "key_or_end", "key"):
+                stack[-1][2] = json.loads(text) if len(stack) == 1 else None
+                stack[-1][1] = "colon"
+            elif not expecting_value():
+                raise _InvalidJson
+            elif kind == "flat":
+                commas = text.count(",")
+                if commas:
+                    complete([commas + 1], "array")
+                else:
+                    complete([1] if text[1:-1].strip(" \t\n\r") else [0], "array")
+            else:
+                complete([], "scalar", text if kind == "str" else None)
+    except (_InvalidJson, UnicodeDecodeError):
+        return None
+    if stack or top_kind is None:
+        return None
+    return summary if top_kind == "object" else None
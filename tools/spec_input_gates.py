@@ -46,6 +46,19 @@ MAX_SPEC_ID_LEN = 55
 # importers is a grammar with three chances to drift.
 CASE_ID_TOKEN_RE = re.compile(r"^[A-Za-z0-9._][A-Za-z0-9._-]*$")
 
+# The thread-affinity values `impl_defaults.backend_overrides.openmp.places` / `.proc_bind` may
+# take, matched after `.strip().lower()`. Placement is an abstract name — optionally with a
+# place count, `cores(4)` — or an explicit place list (`{0:4},{4:4}`, `0,2,4`); binding is
+# `true` / `false` or a per-level policy list (`spread,close`). The build-runtime MCP server
+# refuses any other value when it sets the run's environment, so the pipeline validator
+# refuses it at Compile too: otherwise a typo passes Compile, Generate and Build and surfaces
+# only as a Validate.execute transport failure. Public for the same reason as the case-id
+# grammar: one spelling for both of its readers.
+OMP_PLACES_RE = re.compile(
+    r"^(?:(?:threads|cores|ll_caches|numa_domains|sockets)(?:\(\d+\))?|[0-9{}:,!-]+)$")
+OMP_PROC_BIND_RE = re.compile(
+    r"^(?:true|false|(?:primary|master|close|spread)(?:,(?:primary|master|close|spread))*)$")
+
 
 def spec_id_length_violation(spec_id: Any) -> str | None:
     """Spec-input bound on spec_id length — the M3d mass-opt-in prerequisite gate.
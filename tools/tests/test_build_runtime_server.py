@@ -18,6 +18,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -495,6 +496,19 @@ class OrchestrationGateFailClosedTests(unittest.TestCase):
                 self._call("compile_project", self._args("compile_project"))
         loader.assert_not_called()
 
+    def test_gated_calls_share_the_process_verdict_cache(self) -> None:
+        args = {**self._args("run_linter"), "orchestration_id": "orch_x",
+                "agent_run_id": "leaf_1", "capability_token": "tok"}
+        with mock.patch.object(self.mod, "_load_orchestration_runtime") as loader:
+            gate = loader.return_value.validate_mcp_build_tool_invocation
+            gate.side_effect = RuntimeError("MCP phase gate: capability_token mismatch")
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    self._call("run_linter", args)
+        self.assertEqual(gate.call_count, 2)
+        for call in gate.call_args_list:
+            self.assertIs(call.kwargs["verdict_cache"], self.mod._MCP_GATE_VERDICTS)
+
 
 class EnvOverrideDenylistTests(unittest.TestCase):
     """Caller-supplied `env` may not redirect what runs.
@@ -633,6 +647,54 @@ class EnvOverrideDenylistTests(unittest.TestCase):
                 "target": {"class": "cpu"}, "threads_per_rank": 4})
         self.assertEqual(run_command.call_args.kwargs["env"]["OMP_NUM_THREADS"], "4")
 
+    def test_run_program_applies_the_affinity_policy_with_the_thread_count(self) -> None:
+        with self._spy_run_command() as run_command:
+            result = self.mod.tool_run_program({
+                "project_dir": str(self.project_dir), "command": ["true"],
+                "target": {"class": "cpu"}, "threads_per_rank": 4,
+                "omp_places": "threads(4)", "omp_proc_bind": "Spread,close"})
+        expected = {"OMP_NUM_THREADS": "4", "OMP_THREAD_LIMIT": "4",
+                    "OMP_PLACES": "threads(4)", "OMP_PROC_BIND": "spread,close"}
+        self.assertEqual(run_command.call_args.kwargs["env"], expected)
+        self.assertEqual(result["openmp_env"], expected)
+        # Without a thread count nothing OpenMP is set, affinity included.
+        with self._spy_run_command() as run_command:
+            result = self.mod.tool_run_program({
+                "project_dir": str(self.project_dir), "command": ["true"],
+                "target": {"class": "cpu"}, "omp_places": "cores"})
+        self.assertIsNone(run_command.call_args.kwargs["env"])
+        self.assertFalse(result["openmp_env_applied"])
+
+    def test_run_program_refuses_an_affinity_value_openmp_would_not_read(self) -> None:
+        for key, value in (("omp_places", "cores; rm -rf /"), ("omp_places", ""),
+                           ("omp_places", "banana"), ("omp_places", "banana(4)"),
+                           ("omp_proc_bind", "sideways"), ("omp_proc_bind", "true,close")):
+            with self.subTest(key=key, value=value), self._spy_run_command() as run_command:
+                with self.assertRaisesRegex(ValueError, key):
+                    self.mod.tool_run_program({
+                        "project_dir": str(self.project_dir), "command": ["true"],
+                        "target": {"class": "cpu"}, "threads_per_rank": 2, key: value})
+                run_command.assert_not_called()
+
+    def test_the_affinity_grammar_is_the_compile_gates(self) -> None:
+        from tools.spec_input_gates import OMP_PLACES_RE, OMP_PROC_BIND_RE
+
+        self.assertEqual(self.mod._load_affinity_grammar(), (OMP_PLACES_RE, OMP_PROC_BIND_RE))
+
+    def test_run_quality_checks_pins_the_rerun_thread_count(self) -> None:
+        with self._spy_run_command() as run_command:
+            result = self.mod.tool_run_quality_checks(
+                {"project_dir": str(self.project_dir), "preset": "make_test",
+                 "threads_per_rank": 1})
+        self.assertEqual(run_command.call_args.kwargs["env"],
+                         {"OMP_NUM_THREADS": "1", "OMP_THREAD_LIMIT": "1"})
+        self.assertEqual(result["openmp_env"]["OMP_NUM_THREADS"], "1")
+        with self._spy_run_command() as run_command:
+            result = self.mod.tool_run_quality_checks(
+                {"project_dir": str(self.project_dir), "preset": "make_test"})
+        self.assertIsNone(run_command.call_args.kwargs["env"])
+        self.assertNotIn("openmp_env", result)
+
 
 class OrchestratedEnvAllowlistTests(unittest.TestCase):
     """Under an orchestration the caller's `env` is an allowlist, not a denylist.
@@ -1122,5 +1184,87 @@ class ToolSchemaDocumentParityTests(unittest.TestCase):
                     f"{path.name} and the served schema declare different arguments")
 
 
+class ConcurrentDispatchTests(unittest.TestCase):
+    """`main()` answers tool calls as they finish, one project_dir at a time, and a
+    `notifications/cancelled` stops the cancelled call's whole process group."""
+
+    def setUp(self) -> None:
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.slow_dir = tmp / "slow"
+        self.fast_dir = tmp / "fast"
+        self.slow_dir.mkdir()
+        self.fast_dir.mkdir()
+        env = {k: v for k, v in os.environ.items()
+               if k not in ("METDSL_WORKFLOW_MODE", "METDSL_ORCHESTRATION_ID")}
+        env["METDSL_TIMINGS"] = "0"
+        self.server = subprocess.Popen(
+            [sys.executable, str(_SERVER_PATH)], stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE, text=True, env=env)
+        self.addCleanup(self._stop)
+
+    def _stop(self) -> None:
+        if self.server.poll() is None:
+            self.server.kill()
+            self.server.wait()
+        for stream in (self.server.stdin, self.server.stdout):
+            if not stream.closed:
+                stream.close()
+
+    def _send(self, message: dict) -> None:
+        self.server.stdin.write(json.dumps({"jsonrpc": "2.0", **message}) + "\n")
+        self.server.stdin.flush()
+
+    def _run_program(self, message_id: int, project_dir: Path, script: str) -> None:
+        self._send({"id": message_id, "method": "tools/call", "params": {
+            "name": "run_program",
+            "arguments": {"project_dir": str(project_dir), "command": ["sh", "-c", script]},
+        }})
+
+    def _response_ids(self) -> list:
+        self.server.stdin.close()
+        ids = [json.loads(line)["id"] for line in self.server.stdout]
+        self.assertEqual(self.server.wait(timeout=30), 0)
+        return ids
+
+    def test_a_fast_call_is_answered_before_a_slow_one_on_another_tree(self) -> None:
+        self._run_program(1, self.slow_dir, "sleep 2")
+        self._run_program(2, self.fast_dir, "true")
+        self.assertEqual(self._response_ids(), [2, 1])
+
+    def test_calls_on_one_tree_run_one_after_the_other(self) -> None:
+        self._run_program(1, self.slow_dir, "sleep 1; echo first >> order")
+        self._run_program(2, self.slow_dir / ".", "echo second >> order")
+        self.assertEqual(self._response_ids(), [1, 2])
+        self.assertEqual((self.slow_dir / "order").read_text(), "first\nsecond\n")
+
+    def test_cancelling_a_call_kills_its_process_group_and_drops_its_response(self) -> None:
+        pid_file = self.slow_dir / "grandchild.pid"
+        # The shell waits on a grandchild, so only a signal to the group stops both.
+        self._run_program(1, self.slow_dir, f"sleep 60 & echo $! > {pid_file}; wait")
+        deadline = time.monotonic() + 20
+        while not pid_file.is_file() or not pid_file.read_text().strip():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.05)
+        grandchild = int(pid_file.read_text())
+        self._send({"method": "notifications/cancelled",
+                    "params": {"requestId": 1, "reason": "superseded"}})
+        self._send({"id": 2, "method": "ping"})
+        started = time.monotonic()
+        self.assertEqual(self._response_ids(), [2])
+        self.assertLess(time.monotonic() - started, 30)
+        while True:
+            try:
+                state = Path(f"/proc/{grandchild}/stat").read_text().rsplit(")", 1)[1].split()[0]
+            except OSError:
+                break
+            if state in ("Z", "X"):
+                break
+            self.assertLess(time.monotonic(), deadline + 20, "grandchild survived the cancel")
+            time.sleep(0.05)
+        entry = json.loads((self.slow_dir / "command_log.jsonl").read_text().splitlines()[-1])
+        self.assertEqual(entry["error"], "cancelled by the client")
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -51,6 +51,7 @@ TIER_B_SUBCOMMANDS: frozenset[str] = frozenset({
     "record-timeout",
     "read-checkpoint",
     "verify-checkpoint-integrity",
+    "export-write-baseline",
     "check-step-completed",
     "orchestration-read",
     "repair-agent-runs",
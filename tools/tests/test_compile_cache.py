@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Tests for Build's dependency compile cache (tools/compile_cache.py)."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import compile_cache
+
+FLAGS = "-std=f2008 -O2 -J$(OBJDIR) -I$(OBJDIR)"
+UNITS = [("a_model.f90", "a_model.o"), ("b_model.f90", "b_model.o")]
+
+A_SRC = "module a_model\n  implicit none\n  integer, parameter :: n = 3\nend module a_model\n"
+B_SRC = ("module b_model\n  use a_model, only: n\n  implicit none\ncontains\n"
+         "  integer function twice()\n    twice = 2 * n\n  end function twice\n"
+         "end module b_model\n")
+
+# The shape of the conductor's dependency rules: deepest first, each object after every
+# deeper one.
+MAKEFILE = (
+    "FFLAGS = " + FLAGS + "\n"
+    "all: $(OBJDIR)/a_model.o $(OBJDIR)/b_model.o\n"
+    "$(OBJDIR)/a_model.o: $(OBJDIR)/a_model.f90\n"
+    "\tgfortran $(FFLAGS) -c $(OBJDIR)/a_model.f90 -o $(OBJDIR)/a_model.o\n"
+    "$(OBJDIR)/b_model.o: $(OBJDIR)/b_model.f90 $(OBJDIR)/a_model.o\n"
+    "\tgfortran $(FFLAGS) -c $(OBJDIR)/b_model.f90 -o $(OBJDIR)/b_model.o\n"
+)
+
+
+class _CacheCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        self.sources = {"a_model.f90": A_SRC, "b_model.f90": B_SRC}
+        self.builds = 0
+        identity = mock.patch.object(
+            compile_cache, "compiler_identity", lambda compiler: f"id:{compiler}")
+        identity.start()
+        self.addCleanup(identity.stop)
+
+    def _stage(self) -> Path:
+        self.builds += 1
+        build = self.repo / "workspace" / "tmp" / f"run{self.builds}" / "build"
+        build.mkdir(parents=True)
+        for name, text in self.sources.items():
+            (build / name).write_text(text, encoding="utf-8")
+        return build
+
+    def _cache(self, **kw) -> compile_cache.CompileCache:
+        kw.setdefault("compiler", "fc")
+        kw.setdefault("flags", FLAGS)
+        return compile_cache.CompileCache(self.repo, UNITS, **kw)
+
+    @staticmethod
+    def _fake_compile(build: Path) -> None:
+        """Stands in for the build: an object and an interface file per unit not present."""
+        for source, obj in UNITS:
+            stem = Path(obj).stem
+            if not (build / obj).exists():
+                text = (build / source).read_text(encoding="utf-8")
+                (build / obj).write_bytes(b"obj:" + text.encode())
+                (build / f"{stem}.mod").write_bytes(b"iface:" + text.encode())
+
+
+class CompileCacheTests(_CacheCase):
+    def test_a_stored_closure_is_primed_into_the_next_build(self) -> None:
+        first = self._stage()
+        cache = self._cache()
+        cache.prime(first)
+        self.assertEqual(cache.misses, ["a_model.f90", "b_model.f90"])
+        self._fake_compile(first)
+        cache.store(first)
+        self.assertEqual(cache.report(), {"status": "on", "published": [], "hits": [],
+                                          "misses": ["a_model.f90", "b_model.f90"],
+                                          "stored": 2, "evicted": 0})
+
+        second = self._stage()
+        cache = self._cache()
+        cache.prime(second)
+        self.assertEqual(cache.hits, ["a_model.f90", "b_model.f90"])
+        for name in ("a_model.o", "a_model.mod", "b_model.o", "b_model.mod"):
+            self.assertEqual((second / name).read_bytes(), (first / name).read_bytes())
+        # Each object is newer than its source and than every deeper object.
+        a, b = (second / "a_model.o").stat(), (second / "b_model.o").stat()
+        self.assertGreater(a.st_mtime_ns, (second / "a_model.f90").stat().st_mtime_ns)
+        self.assertGreater(b.st_mtime_ns, a.st_mtime_ns)
+        cache.store(second)
+        self.assertEqual(cache.stored, 0)
+
+    def test_a_changed_deeper_unit_misses_every_unit_after_it(self) -> None:
+        first = self._stage()
+        cache = self._cache()
+        cache.prime(first)
+        self._fake_compile(first)
+        cache.store(first)
+
+        self.sources["a_model.f90"] = A_SRC.replace("= 3", "= 4")
+        second = self._stage()
+        cache = self._cache()
+        cache.prime(second)
+        self.assertEqual((cache.hits, cache.misses), ([], ["a_model.f90", "b_model.f90"]))
+        self.assertFalse((second / "b_model.o").exists())
+
+    def test_another_closure_shares_a_unit_whose_interfaces_agree(self) -> None:
+        # Stored from a closure with an unrelated deeper unit: its interface is recorded but
+        # absent from a closure that never staged it, so that closure still hits.
+        sibling = [("x_model.f90", "x_model.o")] + UNITS
+        self.sources = {"x_model.f90": "module x_model\nend module x_model\n", **self.sources}
+        first = self._stage()
+        cache = compile_cache.CompileCache(self.repo, sibling, compiler="fc", flags=FLAGS)
+        cache.prime(first)
+        for source, obj in sibling:
+            (first / obj).write_bytes(b"obj:" + source.encode())
+            (first / obj.replace(".o", ".mod")).write_bytes(b"iface:" + source.encode())
+        cache.store(first)
+
+        del self.sources["x_model.f90"]
+        cache = self._cache()
+        cache.prime(self._stage())
+        self.assertEqual(cache.hits, ["a_model.f90", "b_model.f90"])
+
+        # The same interface name with other bytes is a different compile input: a miss.
+        build = self._stage()
+        (build / "x_model.mod").write_bytes(b"other")
+        cache = self._cache()
+        cache.prime(build)
+        self.assertEqual(cache.hits, [])
+
+    def test_the_key_covers_the_compiler_and_the_flags(self) -> None:
+        first = self._stage()
+        cache = self._cache()
+        cache.prime(first)
+        self._fake_compile(first)
+        cache.store(first)
+        for kw in ({"compiler": "other"}, {"flags": FLAGS + " -fopenmp"}):
+            cache = self._cache(**kw)
+            cache.prime(self._stage())
+            self.assertEqual(cache.hits, [], kw)
+
+    def test_a_tampered_entry_is_a_miss(self) -> None:
+        first = self._stage()
+        cache = self._cache()
+        cache.prime(first)
+        self._fake_compile(first)
+        cache.store(first)
+        (obj,) = (self.repo / compile_cache.CACHE_DIR).glob("*/*/*/a_model.o")
+        obj.write_bytes(b"planted")
+        cache = self._cache()
+        cache.prime(self._stage())
+        self.assertEqual(cache.hits, [])
+
+    def test_an_entry_evicted_mid_copy_is_a_clean_miss(self) -> None:
+        first = self._stage()
+        cache = self._cache()
+        cache.prime(first)
+        self._fake_compile(first)
+        cache.store(first)
+        copies = {"n": 0}
+        real_copy = shutil.copyfile
+
+        def evicted_after_one_file(src, dst):
+            copies["n"] += 1
+            if copies["n"] == 2:
+                shutil.rmtree(Path(src).parent)
+            return real_copy(src, dst)
+
+        second = self._stage()
+        cache = self._cache()
+        with mock.patch.object(compile_cache.shutil, "copyfile", side_effect=evicted_after_one_file):
+            cache.prime(second)
+        self.assertEqual((cache.hits, cache.misses), ([], ["a_model.f90", "b_model.f90"]))
+        self.assertEqual(sorted(p.name for p in second.iterdir()), ["a_model.f90", "b_model.f90"])
+
+    def test_eviction_drops_the_least_recently_used_entries(self) -> None:
+        first = self._stage()
+        cache = self._cache(max_bytes=1)
+        cache.prime(first)
+        self._fake_compile(first)
+        cache.store(first)
+        self.assertEqual(cache.evicted, 2)
+        self.assertEqual(list((self.repo / compile_cache.CACHE_DIR).glob("*/*/*/*")), [])
+
+    def test_a_zero_limit_or_an_unknown_compiler_turns_the_cache_off(self) -> None:
+        with mock.patch.dict(os.environ, {compile_cache.MAX_BYTES_ENV: "0"}):
+            off = self._cache()
+        with mock.patch.object(compile_cache, "compiler_identity", lambda compiler: None):
+            unknown = self._cache()
+        for cache in (off, unknown):
+            build = self._stage()
+            cache.prime(build)
+            self._fake_compile(build)
+            cache.store(build)
+            self.assertEqual(cache.report()["status"], "off")
+        self.assertFalse((self.repo / compile_cache.CACHE_DIR).exists())
+
+    def test_a_symlinked_cache_root_is_refused(self) -> None:
+        elsewhere = self.repo / "elsewhere"
+        elsewhere.mkdir()
+        (self.repo / "workspace").mkdir()
+        (self.repo / compile_cache.CACHE_DIR).symlink_to(elsewhere)
+        self.assertFalse(self._cache().enabled)
+
+
+class PublishedArtifactSetTests(_CacheCase):
+    """A dependency's Build publishes its model unit; a dependent links it from there."""
+
+    def _publish(self, **kw) -> Path:
+        # The dependency `b` built against `a`: its own source compiled after its closure.
+        build = self._stage()
+        self._fake_compile(build)
+        publisher = compile_cache.CompileCache(
+            self.repo, UNITS[:1], compiler=kw.get("compiler", "fc"),
+            flags=kw.get("flags", FLAGS))
+        target = self.repo / "dep" / "binary" / "bin_1" / compile_cache.ARTIFACT_SET_DIR
+        self.assertTrue(publisher.publish(target, build, build / "b_model.f90", "b_model.o"))
+        return target
+
+    def test_a_matching_toolchain_links_the_published_set(self) -> None:
+        target = self._publish()
+        manifest = json.loads((target / compile_cache.MANIFEST_NAME).read_text())
+        self.assertEqual(sorted(manifest["files"]), ["b_model.mod", "b_model.o"])
+        self.assertEqual(sorted(manifest["interfaces"]), ["a_model.mod"])
+        used = (target / compile_cache.MANIFEST_NAME).stat().st_mtime_ns
+
+        build = self._stage()
+        cache = self._cache()
+        cache.prime(build, {"b_model.f90": target})
+        # `a` was never published or cached; `b` is not reached past that miss.
+        self.assertEqual((cache.published, cache.misses), ([], ["a_model.f90", "b_model.f90"]))
+
+        self._fake_compile(build)
+        cache.store(build)
+        build = self._stage()
+        cache = self._cache()
+        cache.prime(build, {"b_model.f90": target})
+        self.assertEqual((cache.hits, cache.published), (["a_model.f90"], ["b_model.f90"]))
+        self.assertEqual((build / "b_model.o").read_bytes(), (target / "b_model.o").read_bytes())
+        # Linking from another node's binary directory never writes to it.
+        self.assertEqual((target / compile_cache.MANIFEST_NAME).stat().st_mtime_ns, used)
+
+    def test_another_toolchain_falls_back_to_the_staged_source(self) -> None:
+        target = self._publish(flags=FLAGS + " -fopenmp")
+        build = self._stage()
+        self._fake_compile(build)
+        for name in ("b_model.o", "b_model.mod"):
+            (build / name).unlink()
+        cache = compile_cache.CompileCache(self.repo, UNITS[1:], compiler="fc", flags=FLAGS)
+        cache.prime(build, {"b_model.f90": target})
+        self.assertEqual((cache.published, cache.misses), ([], ["b_model.f90"]))
+
+    def test_a_tampered_or_mismatched_set_is_not_linked(self) -> None:
+        target = self._publish()
+        (target / "b_model.o").write_bytes(b"planted")
+        build = self._stage()
+        self._fake_compile(build)
+        (build / "b_model.o").unlink()
+        cache = compile_cache.CompileCache(self.repo, UNITS[1:], compiler="fc", flags=FLAGS)
+        cache.prime(build, {"b_model.f90": target})
+        self.assertEqual(cache.published, [])
+
+        target = self._publish()
+        build = self._stage()
+        self._fake_compile(build)
+        (build / "a_model.mod").write_bytes(b"another interface")
+        (build / "b_model.o").unlink()
+        cache = compile_cache.CompileCache(self.repo, UNITS[1:], compiler="fc", flags=FLAGS)
+        cache.prime(build, {"b_model.f90": target})
+        self.assertEqual(cache.published, [])
+
+    def test_no_compiler_identity_publishes_nothing(self) -> None:
+        build = self._stage()
+        self._fake_compile(build)
+        with mock.patch.object(compile_cache, "compiler_identity", lambda compiler: None):
+            publisher = self._cache()
+        target = self.repo / compile_cache.ARTIFACT_SET_DIR
+        self.assertFalse(publisher.publish(target, build, build / "b_model.f90", "b_model.o"))
+        self.assertFalse(target.exists())
+
+
+@unittest.skipUnless(shutil.which("gfortran"), "gfortran not available")
+class CompileCacheMakeTests(_CacheCase):
+    """A primed build directory is up to date for make: nothing in the closure recompiles."""
+
+    def _make(self, build: Path) -> str:
+        (build.parent / "Makefile").write_text(MAKEFILE, encoding="utf-8")
+        proc = subprocess.run(
+            ["make", "-f", str(build.parent / "Makefile"), f"OBJDIR={build}"],
+            capture_output=True, text=True, check=True)
+        return proc.stdout
+
+    def test_a_primed_closure_is_not_recompiled(self) -> None:
+        first = self._stage()
+        cache = self._cache(compiler="gfortran")
+        cache.prime(first)
+        self.assertEqual(self._make(first).count("gfortran"), 2)
+        cache.store(first)
+
+        second = self._stage()
+        cache = self._cache(compiler="gfortran")
+        cache.prime(second)
+        self.assertEqual(len(cache.hits), 2)
+        self.assertNotIn("gfortran", self._make(second))
+
+
+class CompilerIdentityTests(unittest.TestCase):
+    def test_an_unresolvable_compiler_has_no_identity(self) -> None:
+        self.assertIsNone(compile_cache.compiler_identity("no-such-compiler-on-path"))
+
+    def test_the_identity_names_the_resolved_executable_and_its_version(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            fc = Path(td) / "fc"
+            fc.write_text("#!/bin/sh\necho 'FC 9.9.9'\n", encoding="utf-8")
+            fc.chmod(0o755)
+            identity = compile_cache.compiler_identity(str(fc))
+        self.assertIsNotNone(identity)
+        self.assertTrue(identity.startswith(os.path.realpath(fc)))
+        self.assertTrue(identity.endswith("FC 9.9.9"))
+
+
+class BuildCacheRootDriftTests(unittest.TestCase):
+    def test_the_runtime_exemption_and_the_layout_allowlist_name_the_cache_root(self) -> None:
+        from tools.orchestration_runtime import (
+            _HOST_BUILD_CACHE_PREFIX,
+            _is_host_build_cache_write,
+        )
+        from tools.validate_workspace_root import ALLOWED_WORKSPACE_TOP_LEVEL_DIRS
+
+        self.assertEqual(_HOST_BUILD_CACHE_PREFIX, compile_cache.CACHE_DIR)
+        self.assertIn(compile_cache.CACHE_DIR.split("/")[-1], ALLOWED_WORKSPACE_TOP_LEVEL_DIRS)
+        self.assertTrue(_is_host_build_cache_write(f"{compile_cache.CACHE_DIR}/ab/ab/x.o"))
+        self.assertFalse(_is_host_build_cache_write(f"{compile_cache.CACHE_DIR}-x/x.o"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for content-hash derivation keys (tools/content_digest.py) and R6-proper readiness.
+
+Each test seeds a synthetic registry — `b` depends on `c`, `d` is an unrelated leaf — with
+certified IRs carrying `content_digest.json`, then edits one input and asserts exactly which
+nodes `_dependency_resolution_freshness` reports stale.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools import content_digest
+from tools.orchestration_runtime import (
+    _dependency_resolution_freshness,
+    _load_spec_catalog,
+    _verify_dep_stage,
+)
+
+_DEPS = {"b": ["c"], "c": [], "d": []}
+
+
+def _spec_text(spec_id: str, version: str, body: str) -> str:
+    return (f"# Controlled Spec: {spec_id}\n\n## 0. Meta information\n"
+            f"- `spec_id`: `{spec_id}`\n- `spec_version`: `{version}`\n\n{body}\n")
+
+
+class ContentDigestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        self.versions = {s: "0.1.0" for s in _DEPS}
+        self._write_catalog()
+        for spec_id, kids in _DEPS.items():
+            d = self.repo / "spec" / "component" / spec_id
+            d.mkdir(parents=True)
+            (d / "controlled_spec.md").write_text(
+                _spec_text(spec_id, "0.1.0", f"{spec_id} computes a flux."), encoding="utf-8")
+            (d / "tests.md").write_text(
+                f"- `spec_ref.spec_version`: `0.1.0`\n- test `{spec_id}_t0`\n", encoding="utf-8")
+            comp = "  components: []\n" if not kids else "  components:\n" + "".join(
+                f"    - component_id: {k}\n"
+                '      version_constraint: ">=0.1.0 <1.0.0"\n' for k in kids)
+            (d / "deps.yaml").write_text(
+                f"spec_id: {spec_id}\nspec_kind: component\ndependencies:\n{comp}"
+                "  profiles: []\n", encoding="utf-8")
+        for spec_id in _DEPS:
+            self._certify(spec_id)
+
+    def _write_catalog(self) -> None:
+        reg = self.repo / "spec" / "registry"
+        reg.mkdir(parents=True, exist_ok=True)
+        (reg / "spec_catalog.yaml").write_text(
+            "catalog_version: 0.2.0\nspecs:\n" + "".join(
+                f"  - spec_kind: component\n    spec_id: {s}\n    spec_version: {v}\n"
+                f"    deps_path: spec/component/{s}/deps.yaml\n"
+                for s, v in self.versions.items()),
+            encoding="utf-8")
+        _load_spec_catalog.cache_clear()
+
+    def _ir_dir(self, spec_id: str) -> Path:
+        version = self.versions[spec_id]
+        return (self.repo / "workspace" / "ir" / f"component__{spec_id}__{version}"
+                / f"{spec_id}_20260101_001")
+
+    def _certify(self, spec_id: str) -> None:
+        version = self.versions[spec_id]
+        ir_dir = self._ir_dir(spec_id)
+        ir_dir.mkdir(parents=True)
+        (ir_dir / "ir_meta.json").write_text(
+            json.dumps({"verification_status": "pass"}), encoding="utf-8")
+        (ir_dir / "spec.ir.yaml").write_text(
+            f"spec_id: {spec_id}\nimpl_defaults:\n  real_kind: float64\n", encoding="utf-8")
+        record = content_digest.build_record(
+            self.repo, f"spec/component/{spec_id}",
+            node_key=f"component/{spec_id}@{version}", ir_dir=ir_dir)
+        self.assertIsNotNone(record)
+        (ir_dir / content_digest.SIDECAR_NAME).write_text(json.dumps(record), encoding="utf-8")
+
+    def _stale(self) -> set[str]:
+        return {s for s, v in self.versions.items()
+                if not _dependency_resolution_freshness(self.repo, "component", s, v)[0]}
+
+    def test_an_unchanged_tree_is_fresh_and_ready(self) -> None:
+        self.assertEqual(self._stale(), set())
+        self.assertTrue(_verify_dep_stage(self.repo, "component", "b", "0.1.0", "ir_ref"))
+
+    def test_a_content_edit_within_one_version_stales_exactly_its_cone(self) -> None:
+        spec = self.repo / "spec" / "component" / "c" / "controlled_spec.md"
+        spec.write_text(_spec_text("c", "0.1.0", "c computes a limited flux."), encoding="utf-8")
+        self.assertEqual(self._stale(), {"b", "c"})
+        _fresh, detail = _dependency_resolution_freshness(self.repo, "component", "b", "0.1.0")
+        self.assertIn("dependency component/c content changed", detail)
+
+    def test_a_version_bump_without_a_content_change_keeps_the_dependents_fresh(self) -> None:
+        d = self.repo / "spec" / "component" / "c"
+        for name in ("controlled_spec.md", "tests.md"):
+            text = (d / name).read_text(encoding="utf-8")
+            (d / name).write_text(text.replace("0.1.0", "0.2.0"), encoding="utf-8")
+        self.versions["c"] = "0.2.0"
+        self._write_catalog()
+        # The bumped node has no artifacts at its new version; its dependent's key is unchanged.
+        self.assertTrue(_dependency_resolution_freshness(self.repo, "component", "b", "0.1.0")[0])
+        self.assertEqual(
+            content_digest.derivation_inputs(
+                self.repo, "spec/component/c", spec_kind="component", spec_id="c")
+            ["derivation_key"],
+            json.loads((self._ir_dir("b") / content_digest.SIDECAR_NAME).read_text(
+                encoding="utf-8"))["dependencies"]["component/c"])
+
+    def test_a_replaced_certified_ir_is_stale(self) -> None:
+        (self._ir_dir("d") / "spec.ir.yaml").write_text("spec_id: d\n", encoding="utf-8")
+        self.assertEqual(self._stale(), {"d"})
+
+    def test_a_malformed_record_is_stale_and_a_missing_one_falls_back(self) -> None:
+        (self._ir_dir("d") / content_digest.SIDECAR_NAME).write_text("{}", encoding="utf-8")
+        fresh, detail = _dependency_resolution_freshness(self.repo, "component", "d", "0.1.0")
+        self.assertFalse(fresh)
+        self.assertIn("content_digest.json", detail)
+        (self._ir_dir("d") / content_digest.SIDECAR_NAME).unlink()
+        # A leaf without a record takes the version-granularity check, which passes.
+        self.assertEqual(self._stale(), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Tests for the validator rule-result cache (tools/gate_cache.py) and its CLI wiring."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import gate_cache
+
+
+class _Tagged(str):
+    pass
+
+
+class RuleCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        self.src = self.repo / "workspace" / "pipelines" / "p" / "src"
+        self.src.mkdir(parents=True)
+        (self.src / "m.f90").write_text("module m\nend module m\n", encoding="utf-8")
+        self.calls = 0
+
+    def _rule(self, out: list[str]) -> None:
+        self.calls += 1
+        out.append("plain finding")
+        out.append(_Tagged("typed finding"))
+
+    def _run(self, mode: str = "on") -> tuple[gate_cache.RuleCache, list[str]]:
+        cache = gate_cache.RuleCache(self.repo, mode, violation_types={"_Tagged": _Tagged})
+        found = cache.run("source_structure", 1, params={"src": str(self.src)},
+                          inputs=[self.src, self.repo / "absent.json"], compute=self._rule)
+        return cache, found
+
+    def test_an_unchanged_input_replays_the_violations_with_their_types(self) -> None:
+        _, first = self._run()
+        cache, second = self._run()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(second, first)
+        self.assertIsInstance(second[1], _Tagged)
+        self.assertNotIsInstance(second[0], _Tagged)
+
+    def test_editing_a_declared_input_recomputes(self) -> None:
+        self._run()
+        (self.src / "m.f90").write_text("module m\n! edited\nend module m\n", encoding="utf-8")
+        self._run()
+        (self.repo / "absent.json").write_text("{}", encoding="utf-8")
+        self._run()
+        self.assertEqual(self.calls, 3)
+
+    def test_off_mode_neither_reads_nor_writes(self) -> None:
+        self._run("off")
+        self._run("off")
+        self.assertEqual(self.calls, 2)
+        self.assertFalse((self.repo / gate_cache.CACHE_DIR).exists())
+
+    def test_check_mode_recomputes_and_reports_a_disagreement(self) -> None:
+        self._run()
+        cache, _ = self._run("check")
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.mismatches, [])
+        # An entry that no longer matches what the rule computes — the shape an undeclared
+        # input leaves behind — is reported and replaced.
+        entry = next((self.repo / gate_cache.CACHE_DIR).rglob("*.json"))
+        doc = json.loads(entry.read_text(encoding="utf-8"))
+        doc["violations"] = []
+        entry.write_text(json.dumps(doc), encoding="utf-8")
+        cache, found = self._run("check")
+        self.assertEqual(len(cache.mismatches), 1)
+        self.assertEqual(len(found), 2)
+        self.assertEqual(self._run()[1], found)
+
+    def test_a_symlinked_cache_root_is_not_used(self) -> None:
+        elsewhere = self.repo / "workspace" / "pipelines" / "p" / "planted"
+        elsewhere.mkdir()
+        os.symlink(elsewhere, self.repo / gate_cache.CACHE_DIR)
+        cache, _ = self._run()
+        self.assertEqual(cache.mode, "off")
+        self.assertEqual(list(elsewhere.iterdir()), [])
+
+    def test_a_failing_rule_stores_nothing(self) -> None:
+        cache = gate_cache.RuleCache(self.repo)
+
+        def boom(out: list[str]) -> None:
+            raise RuntimeError("front end unavailable")
+
+        with self.assertRaises(RuntimeError):
+            cache.run("r", 1, params={}, inputs=[self.src], compute=boom)
+        self.assertFalse((self.repo / gate_cache.CACHE_DIR).exists())
+
+
+class MemoTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        self.calls = 0
+
+    def _upper(self, text: str) -> str:
+        self.calls += 1
+        return text.upper()
+
+    def _memo(self, mode: str = "on", text: str = "x" * 10) -> tuple[gate_cache.RuleCache, str]:
+        cache = gate_cache.RuleCache(self.repo, mode)
+        value = cache.memo("upper", 1, text, compute=self._upper, encode=lambda v: v,
+                           decode=lambda _t, doc: doc)
+        return cache, value
+
+    def test_a_value_is_computed_once_per_content_version(self) -> None:
+        self._memo()
+        cache, value = self._memo()
+        self.assertEqual((self.calls, cache.hits, value), (1, 1, "X" * 10))
+        self._memo(text="y" * 10)
+        self.assertEqual(self.calls, 2)
+        self._memo("off")
+        self.assertEqual(self.calls, 3)
+
+    def test_check_mode_reports_a_stored_value_that_disagrees(self) -> None:
+        self._memo()
+        entry = next((self.repo / gate_cache.CACHE_DIR / "_memo").rglob("*.json"))
+        doc = json.loads(entry.read_text(encoding="utf-8"))
+        doc["value"] = "planted"
+        entry.write_text(json.dumps(doc), encoding="utf-8")
+        self.assertEqual(self._memo()[1], "planted")
+        cache, value = self._memo("check")
+        self.assertEqual(value, "X" * 10)
+        self.assertEqual(len(cache.mismatches), 1)
+        self.assertEqual(self._memo()[1], "X" * 10)
+
+
+class FortranViewMemoTests(unittest.TestCase):
+    """The validator's derived Fortran views are parsed once per content version."""
+
+    def setUp(self) -> None:
+        import tools.validate_pipeline_semantics as vps
+
+        self.vps = vps
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        saved = dict(vps._SOURCE_VIEW_MEMO)
+        vps._SOURCE_VIEW_MEMO.clear()
+        self.addCleanup(lambda: (vps._SOURCE_VIEW_MEMO.clear(), vps._SOURCE_VIEW_MEMO.update(saved)))
+        self.source = "module m\n" + "".join(
+            f"  real :: v{i}; v{i} = 1.0 &\n    + 2.0  ! note {i}\n" for i in range(80)
+        ) + "end module m\n"
+
+    def _view(self, cache: gate_cache.RuleCache) -> str:
+        token = self.vps._active_rule_cache.set(cache)
+        try:
+            return self.vps._joined_masked_fortran_view(self.source)
+        finally:
+            self.vps._active_rule_cache.reset(token)
+
+    def test_a_second_process_replays_the_view_and_its_logical_lines(self) -> None:
+        first = self._view(gate_cache.RuleCache(self.repo))
+        self.assertEqual(first, self.vps._compute_joined_masked_view(self.source))
+        self.vps._SOURCE_VIEW_MEMO.clear()          # what a fresh validator process starts with
+        cache = gate_cache.RuleCache(self.repo)
+        with mock.patch.object(self.vps, "_compute_joined_masked_view",
+                               side_effect=AssertionError("recomputed")):
+            self.assertEqual(self._view(cache), first)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(self.vps._memo_logical_lines(self.source),
+                         self.vps.fortran_lines.fortran_logical_lines(self.source))
+
+    def test_a_structure_tree_round_trips_through_its_json(self) -> None:
+        fs = self.vps.fortran_structure
+        tree = fs.StructureTree(
+            view="subroutine s(x)\nend subroutine s",
+            procedures=(fs.Procedure(kind="subroutine", name="s", dummy_args_text="x",
+                                     result_name=None, body_start=16, body_end=16,
+                                     contains_at=None),),
+            interface_spans=((0, 5),),
+            errors=(fs.StructureError(line=1, snippet="s", missing=False),),
+        )
+        doc = json.loads(json.dumps(fs.tree_to_json(tree)))
+        self.assertEqual(fs.tree_from_json(tree.view, doc), tree)
+
+
+class GateCacheRootDriftTests(unittest.TestCase):
+    def test_the_runtime_exemption_and_the_layout_allowlist_name_the_cache_root(self) -> None:
+        from tools.orchestration_runtime import _HOST_GATE_CACHE_PREFIX, _is_host_gate_cache_write
+        from tools.validate_workspace_root import ALLOWED_WORKSPACE_TOP_LEVEL_DIRS
+
+        self.assertEqual(_HOST_GATE_CACHE_PREFIX, gate_cache.CACHE_DIR)
+        self.assertIn(gate_cache.CACHE_DIR.split("/")[-1], ALLOWED_WORKSPACE_TOP_LEVEL_DIRS)
+        self.assertTrue(_is_host_gate_cache_write(f"{gate_cache.CACHE_DIR}/r/ab/ab.json"))
+        self.assertFalse(_is_host_gate_cache_write(f"{gate_cache.CACHE_DIR}-x/r.json"))
+
+
+class ValidatorCliCacheTests(unittest.TestCase):
+    """`validate_pipeline_semantics.py --stage post_generate` memoizes its source rule group."""
+
+    def setUp(self) -> None:
+        from tools.tests.test_validate_pipeline_semantics import (
+            _create_minimal_execution_tree,
+            _seed_shape_expr_schema_into,
+        )
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        _seed_shape_expr_schema_into(self.repo)
+        _create_minimal_execution_tree(
+            self.repo, dep_spec_id="dynamics_shallow_water_flux_2d_rusanov_p0",
+            model_text="module shallow_water2d_model\nend module shallow_water2d_model\n",
+            runner_text="program r\nend program r\n", run_command=["x", "y"])
+        self.pipeline = ("workspace/pipelines/problem__shallow_water2d__0.3.0/"
+                         "shallow-water2d_20260415_001")
+
+    def _main(self, *extra: str) -> int:
+        import tools.validate_pipeline_semantics as vps
+
+        with mock.patch("builtins.print"):
+            return vps.main(["--repo-root", str(self.repo), "--stage", "post_generate",
+                             "--pipeline-root", self.pipeline,
+                             "--source-id", "src_20260415_001", *extra])
+
+    def test_a_stale_ir_finding_replays_with_its_exit_code(self) -> None:
+        import tools.validate_pipeline_semantics as vps
+
+        def stale(repo_root, execution, gen_id, violations):
+            violations.append(vps.StaleDependencyIRViolation("dependency IR is stale"))
+
+        with mock.patch.object(vps, "_validate_generate_outputs_for_generation",
+                               side_effect=stale) as rule:
+            self.assertEqual(self._main(), vps.STALE_DEPENDENCY_IR_EXIT_CODE)
+            self.assertEqual(self._main(), vps.STALE_DEPENDENCY_IR_EXIT_CODE)
+            self.assertEqual(rule.call_count, 1)
+            self.assertEqual(self._main("--no-cache"), vps.STALE_DEPENDENCY_IR_EXIT_CODE)
+            self.assertEqual(rule.call_count, 2)
+            src = self.repo / self.pipeline / "source" / "src_20260415_001" / "src"
+            (src / "shallow_water2d_model.f90").write_text("! edited\n", encoding="utf-8")
+            self._main()
+            self.assertEqual(rule.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Tests for tools/gate_service.py — resident execution of the run-gate scripts."""
+
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import gate_service as gs
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+
+
+def _cmd(script: str, *argv: str) -> list[str]:
+    return [sys.executable, str(TOOLS_DIR / script), *argv]
+
+
+class GateModeTests(unittest.TestCase):
+    def test_unset_is_the_subprocess_mode(self) -> None:
+        self.assertEqual(gs.gate_mode({}), gs.GATE_MODE_SUBPROCESS)
+
+    def test_a_mistyped_mode_is_refused_not_defaulted(self) -> None:
+        with self.assertRaisesRegex(ValueError, "METDSL_GATE_MODE"):
+            gs.gate_mode({gs.GATE_MODE_ENV: "resdient"})
+
+    def test_every_runtime_gate_script_has_a_resident_module(self) -> None:
+        from tools.orchestration_runtime import _gate_script_command
+
+        for gate in ("validate_pipeline_semantics", "check_artifact_syntax",
+                     "validate_workspace_root"):
+            cmd = _gate_script_command(repo_root=TOOLS_DIR.parent, gate_name=gate, args_json={})
+            self.assertIn(Path(cmd[1]).name, gs.GATE_MODULES)
+
+
+class ResidentGateTests(unittest.TestCase):
+    """A resident gate reports exactly what the subprocess gate reports."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        (self.repo / "workspace").mkdir()
+        (self.repo / "workspace" / "ok.json").write_text("{}", encoding="utf-8")
+        (self.repo / "workspace" / "bad.json").write_text("{", encoding="utf-8")
+        self.addCleanup(gs.shutdown_resident_workers)
+        self.env = {k: v for k, v in os.environ.items() if k != gs.GATE_MODE_ENV}
+        self.env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    def _both(self, cmd: list[str]):
+        sub = gs.run_gate_command(self.repo, self.env, cmd)
+        res = gs.run_gate_command(
+            self.repo, {**self.env, gs.GATE_MODE_ENV: gs.GATE_MODE_RESIDENT}, cmd)
+        return sub, res
+
+    def test_pass_fail_and_usage_errors_match_the_subprocess_mode(self) -> None:
+        for cmd in (
+            _cmd("check_artifact_syntax.py", "--expect-top", "object", "workspace/ok.json"),
+            _cmd("check_artifact_syntax.py", "workspace/ok.json", "workspace/bad.json"),
+            _cmd("check_artifact_syntax.py", "--expect-top", "scalar", "workspace/ok.json"),
+            _cmd("validate_workspace_root.py"),
+        ):
+            with self.subTest(cmd=cmd[1:]):
+                sub, res = self._both(cmd)
+                self.assertEqual(res.returncode, sub.returncode)
+                self.assertEqual(res.stdout, sub.stdout)
+                self.assertEqual(res.stderr, sub.stderr)
+                self.assertEqual(res.args, cmd)
+
+    def test_the_worker_is_reused_then_recycled(self) -> None:
+        env = {**self.env, gs.GATE_MODE_ENV: gs.GATE_MODE_RESIDENT}
+        cmd = _cmd("check_artifact_syntax.py", "workspace/ok.json")
+        with mock.patch.object(gs, "RESIDENT_MAX_GATES", 2):
+            gs.prestart(self.repo, env)
+            first = gs._resident_worker(self.repo, env)
+            gs.run_gate_command(self.repo, env, cmd)
+            self.assertIs(gs._resident_worker(self.repo, env), first)
+            gs.run_gate_command(self.repo, env, cmd)
+            self.assertIsNot(gs._resident_worker(self.repo, env), first)
+            self.assertFalse(first.alive())
+
+    def test_a_dead_worker_fails_its_gate_and_is_replaced(self) -> None:
+        env = {**self.env, gs.GATE_MODE_ENV: gs.GATE_MODE_RESIDENT}
+        cmd = _cmd("check_artifact_syntax.py", "workspace/ok.json")
+        worker = gs._resident_worker(self.repo, env)
+        os.kill(worker._proc.pid, signal.SIGKILL)
+        worker._proc.wait()
+        failed = worker.call(cmd, env=env)
+        self.assertEqual(failed.returncode, 1)
+        self.assertIn("exited before replying", failed.stderr)
+        self.assertEqual(gs.run_gate_command(self.repo, env, cmd).returncode, 0)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_a_forked_child_gates_on_its_own_worker(self) -> None:
+        env = {**self.env, gs.GATE_MODE_ENV: gs.GATE_MODE_RESIDENT}
+        ok, bad = (_cmd("check_artifact_syntax.py", f"workspace/{name}.json")
+                   for name in ("ok", "bad"))
+        parent_worker = gs._resident_worker(self.repo, env)
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            status = 1
+            try:
+                codes = [gs.run_gate_command(self.repo, env, cmd).returncode
+                         for cmd in (bad, ok, bad)]
+                fresh = gs._WORKERS[self.repo.resolve()] is not parent_worker
+                gs.shutdown_resident_workers()
+                status = 0 if fresh and codes[1] == 0 and codes[0] == codes[2] != 0 else 3
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertTrue(parent_worker.alive())
+        self.assertEqual(gs.run_gate_command(self.repo, env, ok).returncode, 0)
+        self.assertIs(gs._WORKERS[self.repo.resolve()], parent_worker)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Tests for the warm hook server (tools/hooks/server.py) and its client shim."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from tools.hooks import common
+from tools.hooks import server as hook_server
+from tools.hooks.client import HOOK_SERVER_SOCKET_ENV
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ORCH = "orch_hook_server_001"
+ARID = "arid_hook_server_001"
+# `(pid, starttime)` of the launch ARID is bound to in the scope tests.
+LAUNCH = (4242, "1000")
+
+
+def _client(env: dict[str, str], payload: dict, repo_root: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "tools.hooks.client", "--backend", "claude",
+         "--event", "PreToolUse", "--repo-root", repo_root],
+        cwd=REPO_ROOT, env=env, input=json.dumps(payload), text=True,
+        capture_output=True, check=False,
+    )
+
+
+class ScopeTests(unittest.TestCase):
+    """A host-side server must decline anything naming another root or orchestration."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name).resolve()
+
+    def _reason(self, *, argv=None, env=None, stdin="", launch=LAUNCH,
+                lineage=frozenset({LAUNCH})) -> str | None:
+        request = {"argv": argv or [], "stdin": stdin,
+                   "env": {"METDSL_ORCHESTRATION_ID": ORCH,
+                           "METDSL_CHILD_AGENT_RUN_ID": ARID, **(env or {})}}
+        return hook_server.out_of_scope_reason(
+            request, repo_root=self.root, orchestration_id=ORCH,
+            launches={ARID: launch}, lineage=lineage)
+
+    def test_own_root_and_orchestration_are_served(self) -> None:
+        self.assertIsNone(self._reason(
+            argv=["--repo-root", str(self.root)],
+            env={"METDSL_HOOK_REPO_ROOT": str(self.root)},
+            stdin=json.dumps({"orchestration_id": ORCH, "repo_root": str(self.root)})))
+
+    def test_every_spelling_of_a_foreign_scope_is_declined(self) -> None:
+        other = str(self.root / "elsewhere")
+        self.assertIsNotNone(self._reason(env={"METDSL_ORCHESTRATION_ID": "orch_other"}))
+        self.assertIsNotNone(self._reason(env={"METDSL_HOOK_REPO_ROOT": other}))
+        self.assertIsNotNone(self._reason(argv=[f"--repo-root={other}"]))
+        self.assertIsNotNone(self._reason(stdin=json.dumps({"orchestration_id": "orch_other"})))
+        self.assertIsNotNone(self._reason(stdin=json.dumps({"payload": {"repo_root": other}})))
+        self.assertIsNotNone(self._reason(
+            argv=["--input-json", json.dumps({"repo_root": other})]))
+
+    def test_an_unregistered_agent_run_id_is_declined(self) -> None:
+        # It names the `access_logs/` file the host would append to.
+        self.assertIsNotNone(self._reason(env={"METDSL_CHILD_AGENT_RUN_ID": "../../escape"}))
+        self.assertIsNotNone(self._reason(env={"METDSL_CHILD_AGENT_RUN_ID": ""}))
+
+    def test_a_claimed_id_the_connection_does_not_descend_from_is_declined(self) -> None:
+        self.assertIsNotNone(self._reason(lineage=frozenset({(4243, "1000")})))
+        self.assertIsNotNone(self._reason(lineage=frozenset({(4242, "1001")})))
+        self.assertIsNotNone(self._reason(lineage=frozenset()))
+        self.assertIsNotNone(self._reason(launch=None))
+
+
+class PolicyJsonCacheTests(unittest.TestCase):
+    def test_a_rewritten_document_is_reparsed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "read_manifest.json"
+            path.write_text(json.dumps({"allowed_read_roots": ["docs"]}), encoding="utf-8")
+            first = common.load_policy_json(path)
+            first["allowed_read_roots"].append("mutated by the caller")
+            self.assertEqual(common.load_policy_json(path), {"allowed_read_roots": ["docs"]})
+            replacement = Path(tmp) / "next.json"
+            replacement.write_text(json.dumps({"allowed_read_roots": ["spec"]}), encoding="utf-8")
+            os.replace(replacement, path)
+            self.assertEqual(common.load_policy_json(path), {"allowed_read_roots": ["spec"]})
+            path.unlink()
+            with self.assertRaises(OSError):
+                common.load_policy_json(path)
+
+
+class HookServerEndToEndTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name).resolve()
+        self.addCleanup(hook_server.stop_hook_servers)
+        self.env = {
+            **{k: v for k, v in os.environ.items() if k != HOOK_SERVER_SOCKET_ENV},
+            "PYTHONPATH": str(REPO_ROOT),
+            "PYTHONDONTWRITEBYTECODE": "1",
+            "METDSL_ORCHESTRATION_ID": ORCH,
+            "METDSL_CHILD_AGENT_RUN_ID": ARID,
+            "METDSL_HOOK_REPO_ROOT": str(self.root),
+        }
+        self.payload = {"tool_name": "Bash", "tool_input": {"command": "echo hello"}}
+
+    def _launch(self, agent_run_id: str = ARID, pid: int | None = None) -> Path | None:
+        """Start the server for a launch and bind it to `pid` — by default this test
+        process, which spawns every client below."""
+        socket_path = hook_server.ensure_hook_server(self.root, ORCH, self.env,
+                                                     agent_run_id=agent_run_id)
+        self.assertTrue(hook_server.bind_hook_server_launch(
+            self.root, ORCH, agent_run_id, os.getpid() if pid is None else pid))
+        return socket_path
+
+    def test_server_reply_matches_the_cold_cli(self) -> None:
+        socket_path = self._launch()
+        self.assertIsNotNone(socket_path)
+        self.assertEqual(socket_path, hook_server.hook_server_socket_path(self.root, ORCH))
+        cold = _client(self.env, self.payload, str(self.root))
+        warm = _client({**self.env, HOOK_SERVER_SOCKET_ENV: str(socket_path)},
+                       self.payload, str(self.root))
+        self.assertEqual((warm.returncode, warm.stdout, warm.stderr),
+                         (cold.returncode, cold.stdout, cold.stderr))
+        audit = (self.root / "workspace" / "orchestrations" / ORCH / "hooks"
+                 / "native_hook_events.jsonl")
+        self.assertEqual(len(audit.read_text(encoding="utf-8").splitlines()), 2)
+
+    def test_a_planted_symlink_is_not_followed_from_the_host(self) -> None:
+        # Cold, this hook runs in the leaf's sandbox, where the link's target is out of
+        # reach; the host-side server must not give the leaf more than that.
+        socket_path = self._launch()
+        self.assertIsNotNone(socket_path)
+        hooks_dir = self.root / "workspace" / "orchestrations" / ORCH / "hooks"
+        hooks_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory() as outside:
+            target = Path(outside) / "victim.txt"
+            target.write_text("", encoding="utf-8")
+            (hooks_dir / "native_hook_events.jsonl").symlink_to(target)
+            _client({**self.env, HOOK_SERVER_SOCKET_ENV: str(socket_path)},
+                    self.payload, str(self.root))
+            self.assertEqual(target.read_text(encoding="utf-8"), "")
+
+    def _ask(self, socket_path: Path | None, agent_run_id: str) -> dict:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps({
+                "argv": ["--backend", "claude", "--event", "PreToolUse"],
+                "env": {**self.env, "METDSL_CHILD_AGENT_RUN_ID": agent_run_id},
+                "stdin": json.dumps(self.payload),
+            }).encode("utf-8") + b"\n")
+            return json.loads(sock.makefile("rb").readline())
+
+    def test_a_launch_the_server_was_not_told_about_runs_cold(self) -> None:
+        socket_path = self._launch()
+        reply = self._ask(socket_path, "arid_never_launched")
+        self.assertIn("METDSL_CHILD_AGENT_RUN_ID", reply["fallback"])
+
+    def test_claiming_another_launchs_id_runs_cold(self) -> None:
+        # ARID belongs to a process this one does not descend from; this connection's own
+        # launch is served, the borrowed identity is not.
+        other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        self.addCleanup(other.wait)
+        self.addCleanup(other.kill)
+        socket_path = self._launch(ARID, pid=other.pid)
+        self._launch("arid_own_launch")
+        self.assertIn("not the launch this connection comes from",
+                      self._ask(socket_path, ARID)["fallback"])
+        self.assertNotIn("fallback", self._ask(socket_path, "arid_own_launch"))
+        # Registered but never bound: no connection matches it.
+        self.assertIsNotNone(hook_server.ensure_hook_server(
+            self.root, ORCH, self.env, agent_run_id="arid_unbound"))
+        self.assertIn("fallback", self._ask(socket_path, "arid_unbound"))
+
+    def test_an_absent_server_falls_back_to_the_cold_cli(self) -> None:
+        missing = self.root / "no_such.sock"
+        cold = _client(self.env, self.payload, str(self.root))
+        started = time.perf_counter()
+        proc = _client({**self.env, HOOK_SERVER_SOCKET_ENV: str(missing)},
+                       self.payload, str(self.root))
+        self.assertLess(time.perf_counter() - started, 30.0)
+        self.assertEqual((proc.returncode, proc.stdout), (cold.returncode, cold.stdout))
+
+    def test_the_server_is_started_once_per_orchestration(self) -> None:
+        first = self._launch()
+        second = self._launch()
+        self.assertEqual(first, second)
+        self.assertEqual(len(hook_server._SERVERS), 1)
+        hook_server.stop_hook_servers()
+        self.assertFalse(Path(str(first)).exists())
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_a_forked_child_borrows_the_server_without_owning_it(self) -> None:
+        socket_path = self._launch()
+        server = hook_server._SERVERS[(self.root, ORCH)]
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            status = 1
+            try:
+                # A borrowed handle cannot register a launch (its pipe is /dev/null), so
+                # the child's leaf runs cold rather than starting a rival server.
+                again = hook_server.ensure_hook_server(
+                    self.root, ORCH, self.env, agent_run_id="arid_forked_child")
+                hook_server.stop_hook_servers()
+                status = 0 if again is None else 3
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertTrue(server.alive())
+        self.assertTrue(Path(str(socket_path)).exists())
+        warm = _client({**self.env, HOOK_SERVER_SOCKET_ENV: str(socket_path)},
+                       self.payload, str(self.root))
+        self.assertEqual(warm.returncode, 0)
+        hook_server.stop_hook_servers()
+        self.assertFalse(server.alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""What importing the per-call CLI modules costs: every bookkeeping call, gate and hook of a
+workflow is a fresh interpreter, so an import that is not needed on the common path is paid on
+every one of them."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools import lazy_re
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_LAZY_PATTERN_MODULES = (
+    "tools.orchestration_runtime",
+    "tools.validate_pipeline_semantics",
+    "tools.hooks.common",
+    "tools.backends.language.fortran.signatures",
+)
+
+
+# Ceilings on the summed `-X importtime` self time of each entry point, in microseconds, with
+# bytecode warm in a pycache prefix the way `run_workflow` starts every host subprocess. Set
+# at about 2.5x the best-of-three measured when they were recorded (2026-10-17: runtime
+# import ~49 ms, validator import ~55 ms, the conductor's `--stage compile` invocation ~46 ms
+# beyond its own script), so a slower machine passes and a new eager import of a heavy
+# dependency does not. Lower a ceiling when a change makes its entry point cheaper.
+_IMPORT_BUDGET_US = {
+    "import tools.orchestration_runtime": 125_000,
+    "import tools.validate_pipeline_semantics": 140_000,
+    "validate_pipeline_semantics.py --stage compile": 120_000,
+}
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|")
+
+
+def _modules_after_import(module: str) -> set[str]:
+    code = f"import json, sys; import {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, text=True,
+                          capture_output=True, check=True)
+    return set(json.loads(proc.stdout))
+
+
+class ImportBudgetTests(unittest.TestCase):
+    def test_the_runtime_defers_what_only_some_subcommands_use(self) -> None:
+        loaded = _modules_after_import("tools.orchestration_runtime")
+        self.assertEqual(loaded & {"yaml", "uuid", "secrets", "traceback"}, set())
+
+    def test_the_validator_does_not_pull_in_the_runtime(self) -> None:
+        loaded = _modules_after_import("tools.validate_pipeline_semantics")
+        self.assertEqual(loaded & {"tools.orchestration_runtime", "tools.verdict_evaluator",
+                                   "tools.codegen_bundle", "concurrent.futures"}, set())
+
+
+class ImportTimeBudgetTests(unittest.TestCase):
+    """Startup cost, measured: `_IMPORT_BUDGET_US` bounds what each entry point imports, so a
+    heavy import nobody thought to list is caught as well as the ones the tests above name."""
+
+    def setUp(self) -> None:
+        prefix = tempfile.TemporaryDirectory()
+        self.addCleanup(prefix.cleanup)
+        self.env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        self.env["PYTHONPYCACHEPREFIX"] = prefix.name
+        ir_root = tempfile.TemporaryDirectory()
+        self.addCleanup(ir_root.cleanup)
+        self.ir_repo = Path(ir_root.name)
+        ir_dir = self.ir_repo / "workspace" / "ir" / "n" / "r"
+        ir_dir.mkdir(parents=True)
+        (ir_dir / "spec.ir.yaml").write_text("spec_id: budget\n", encoding="utf-8")
+
+    def _import_us(self, argv: list[str]) -> int:
+        """Best of three runs, after one that fills the bytecode prefix."""
+        samples = []
+        for _ in range(4):
+            proc = subprocess.run([sys.executable, "-X", "importtime", *argv], cwd=REPO_ROOT,
+                                  env=self.env, text=True, capture_output=True, check=False)
+            samples.append(sum(int(m.group(1)) for line in proc.stderr.splitlines()
+                               if (m := _IMPORTTIME_LINE.match(line))))
+        return min(samples[1:])
+
+    def test_entry_points_start_within_their_import_budget(self) -> None:
+        entry_points = {
+            "import tools.orchestration_runtime": ["-c", "import tools.orchestration_runtime"],
+            "import tools.validate_pipeline_semantics":
+                ["-c", "import tools.validate_pipeline_semantics"],
+            # As the conductor's Compile.static gate runs it.
+            "validate_pipeline_semantics.py --stage compile":
+                ["tools/validate_pipeline_semantics.py", "--stage", "compile",
+                 "--repo-root", str(self.ir_repo), "--ir-ref", "workspace/ir/n/r"],
+        }
+        self.assertEqual(set(entry_points), set(_IMPORT_BUDGET_US))
+        for name, argv in entry_points.items():
+            with self.subTest(entry_point=name):
+                spent = self._import_us(argv)
+                self.assertGreater(spent, 0, "no -X importtime output was read")
+                self.assertLessEqual(
+                    spent, _IMPORT_BUDGET_US[name],
+                    f"{name} imports for {spent} us against a budget of "
+                    f"{_IMPORT_BUDGET_US[name]} us: defer the new import to its call site")
+
+
+class LazyPatternTests(unittest.TestCase):
+    def test_a_pattern_compiles_on_first_use_and_behaves_like_re(self) -> None:
+        lazy = lazy_re.compile(r"(?P<word>[a-z]+)\s*=", re.IGNORECASE)
+        self.assertIsNone(lazy._lazy_compiled)
+        eager = re.compile(r"(?P<word>[a-z]+)\s*=", re.IGNORECASE)
+        for text in ("Key = 1", "1 = 2", "a=b=c"):
+            with self.subTest(text=text):
+                self.assertEqual(bool(lazy.search(text)), bool(eager.search(text)))
+                self.assertEqual(lazy.findall(text), eager.findall(text))
+        self.assertEqual((lazy.pattern, lazy.flags), (eager.pattern, eager.flags))
+        self.assertIs(lazy.compiled(), lazy.compiled())
+
+    def test_converted_modules_compile_no_pattern_at_import(self) -> None:
+        import importlib
+
+        for name in _LAZY_PATTERN_MODULES:
+            module = importlib.import_module(name)
+            eager = [attr for attr, value in vars(module).items()
+                     if isinstance(value, re.Pattern)]
+            with self.subTest(module=name):
+                self.assertEqual(eager, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Tests for tools/op_timing.py — the per-call timing records in audit/timings.jsonl."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import op_timing
+
+ORCH_ID = "orch_20260101T000000Z_aaaaaaaa"
+
+
+class OpTimingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        (self.repo / "workspace" / "orchestrations" / ORCH_ID).mkdir(parents=True)
+        self.log = op_timing.timings_path(self.repo, ORCH_ID)
+        env = mock.patch.dict(os.environ, {op_timing.TIMINGS_ENV: "1"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _records(self) -> list[dict]:
+        if not self.log.exists():
+            return []
+        return [json.loads(line) for line in self.log.read_text(encoding="utf-8").splitlines()]
+
+    def test_phases_partition_the_wall_time_of_one_call(self) -> None:
+        with op_timing.operation("runtime") as timer:
+            op_timing.bind(op="record-launch", repo_root=self.repo, orchestration_id=ORCH_ID)
+            with op_timing.phase("lock_wait"):
+                time.sleep(0.02)
+            with op_timing.phase("io"):
+                with op_timing.phase("io"):  # nested: counted once
+                    time.sleep(0.02)
+            timer.exit = 0
+        (record,) = self._records()
+        self.assertEqual((record["kind"], record["op"], record["exit"]),
+                         ("runtime", "record-launch", 0))
+        self.assertGreaterEqual(record["lock_wait_s"], 0.02)
+        self.assertGreaterEqual(record["io_s"], 0.02)
+        self.assertLess(record["io_s"], 0.04)
+        own = record["total_s"] - (record["import_s"] or 0.0)
+        self.assertAlmostEqual(
+            own, record["lock_wait_s"] + record["io_s"] + record["compute_s"], places=4)
+
+    def test_a_nested_operation_names_its_parent_and_a_system_exit_keeps_its_code(self) -> None:
+        with self.assertRaises(SystemExit):
+            with op_timing.operation("runtime", "run-gate") as timer:
+                timer.bind(repo_root=self.repo, orchestration_id=ORCH_ID)
+                with op_timing.operation("gate", "check_artifact_syntax") as gate:
+                    gate.bind(mode="subprocess")
+                    gate.exit = 1
+                raise SystemExit(2)
+        gate_record, outer = self._records()
+        self.assertEqual(gate_record["within"], "runtime:run-gate")
+        self.assertEqual((gate_record["mode"], gate_record["exit"]), ("subprocess", 1))
+        self.assertIsNone(gate_record["import_s"])
+        self.assertNotIn("within", outer)
+        self.assertEqual(outer["exit"], 2)
+
+    def test_nothing_is_written_when_off_or_without_an_orchestration(self) -> None:
+        with mock.patch.dict(os.environ, {op_timing.TIMINGS_ENV: "0"}):
+            with op_timing.operation("hook", "PreToolUse") as timer:
+                timer.bind(repo_root=self.repo, orchestration_id=ORCH_ID)
+        for oid in (None, "orch_missing", "../" + ORCH_ID):
+            with op_timing.operation("hook", "PreToolUse") as timer:
+                timer.bind(repo_root=self.repo, orchestration_id=oid)
+        self.assertFalse(self.log.exists())
+        self.assertFalse((self.repo / "workspace" / "orchestrations" / "orch_missing").exists())
+
+    def test_a_planted_symlink_is_not_followed(self) -> None:
+        target = self.repo / "elsewhere.txt"
+        target.write_text("", encoding="utf-8")
+        self.log.parent.mkdir()
+        os.symlink(target, self.log)
+        with op_timing.operation("mcp", "compile_project") as timer:
+            timer.bind(repo_root=self.repo, orchestration_id=ORCH_ID)
+        self.assertEqual(target.read_text(encoding="utf-8"), "")
+
+    def test_every_runtime_subcommand_records_itself(self) -> None:
+        from tools import orchestration_runtime
+
+        with mock.patch("sys.stdout"):
+            code = orchestration_runtime.main(
+                ["init", "--repo-root", str(self.repo), "--orchestration-id", ORCH_ID])
+        self.assertEqual(code, 0)
+        (record,) = self._records()
+        self.assertEqual((record["kind"], record["op"], record["exit"]), ("runtime", "init", 0))
+        self.assertGreater(record["io_s"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
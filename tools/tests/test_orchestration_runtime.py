@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import io
 import json
@@ -13435,6 +13436,318 @@ def _launchable_preflight_dict(**extra: object) -> dict[str, object]:
     return base
 
 
+class SnapshotIndexTests(unittest.TestCase):
+    """`_snapshot_repo_files` hashes only what changed and reports what a full hash would."""
+
+    OID = "orch_snapshot_index"
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        self.orch = self.repo / "workspace" / "orchestrations" / self.OID
+        (self.orch / "agents" / "a1").mkdir(parents=True)
+        (self.orch / "agents" / "a1" / "run_write_baseline.json").write_text("{}", encoding="utf-8")
+        (self.repo / ".git").mkdir()
+        (self.repo / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+        (self.repo / "spec").mkdir()
+        (self.repo / "spec" / "a.md").write_text("a", encoding="utf-8")
+        (self.repo / "workspace_20260101").mkdir()
+        (self.repo / "workspace_20260101" / "old.f90").write_text("x", encoding="utf-8")
+        (self.repo / "spec" / "link.md").symlink_to(self.repo / "spec" / "a.md")
+        (self.repo / "spec_link").symlink_to(self.repo / "spec", target_is_directory=True)
+        (self.repo / "dangling").symlink_to(self.repo / "nowhere")
+
+    def _full_hash(self) -> dict[str, str]:
+        expected = {}
+        for path in self.repo.rglob("*"):
+            if not path.is_file():
+                continue
+            rel = path.relative_to(self.repo).as_posix()
+            if ort._should_ignore_runtime_snapshot_path(
+                    rel, orchestration_id=self.OID, agent_run_id="a1"):
+                continue
+            expected[rel] = _compute_sha256(path)
+        return expected
+
+    def _snapshot(self) -> dict[str, str]:
+        return ort._snapshot_repo_files(self.repo, orchestration_id=self.OID, agent_run_id="a1")
+
+    def test_matches_the_full_hash_walk(self) -> None:
+        self.assertEqual(self._snapshot(), self._full_hash())
+        self.assertIn("spec/link.md", self._snapshot())
+        self.assertNotIn("spec_link/a.md", self._snapshot())
+        self.assertTrue((self.orch / "snapshot_index.json").is_file())
+        self.assertNotIn(f"workspace/orchestrations/{self.OID}/snapshot_index.json",
+                         self._snapshot())
+
+    def test_unchanged_files_are_not_rehashed(self) -> None:
+        # `utime` itself moves ctime to now, so the window is closed for this test only.
+        self.enterContext(mock.patch.object(ort, "_SNAPSHOT_RACY_WINDOW_NS", 0))
+        self._snapshot()
+        with mock.patch.object(ort, "_compute_sha256", wraps=ort._compute_sha256) as spy:
+            self.assertEqual(self._snapshot(), self._full_hash())
+        hashed = {Path(call.args[0]).name for call in spy.call_args_list}
+        self.assertNotIn("old.f90", hashed)
+
+    def test_rewrite_with_restored_mtime_is_still_seen(self) -> None:
+        self.enterContext(mock.patch.object(ort, "_SNAPSHOT_RACY_WINDOW_NS", 0))
+        target = self.repo / "spec" / "a.md"
+        before = self._snapshot()
+        st = target.stat()
+        target.write_text("b", encoding="utf-8")
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+        after = self._snapshot()
+        self.assertNotEqual(before["spec/a.md"], after["spec/a.md"])
+        self.assertEqual(after, self._full_hash())
+
+    def test_a_corrupt_index_is_an_empty_one(self) -> None:
+        self._snapshot()
+        (self.orch / "snapshot_index.json").write_text("{not json", encoding="utf-8")
+        self.assertEqual(self._snapshot(), self._full_hash())
+
+
+class ClosurePeerDiffTests(unittest.TestCase):
+    """A closure peer's write leaves this node's write-diff only when a peer launch explains it."""
+
+    OID = "orch_closure_node"
+    PEER = "orch_closure_peer"
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        (self.repo / "workspace" / "orchestrations" / self.OID).mkdir(parents=True)
+        (self.repo / "workspace" / "orchestrations" / self.PEER / "capabilities").mkdir(parents=True)
+        (self.repo / "spec").mkdir()
+        ort._write_run_write_baseline(self.repo, self.OID, agent_run_id="a1")
+        peer = [{"orchestration_id": self.PEER, "spec_kind": "component", "spec_id": "d",
+                 "spec_versions": ["0.1.0"]}]
+        self.peers_env = {ort.CLOSURE_PEERS_ENV: json.dumps(peer)}
+
+    def _write(self, rel: str) -> None:
+        path = self.repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+
+    def _peer_launch(self, write_roots: list[str], *, finished_at: str | None = None) -> None:
+        peer_root = self.repo / "workspace" / "orchestrations" / self.PEER
+        (peer_root / "capabilities" / "p1.json").write_text(
+            json.dumps({"agent_run_id": "p1", "write_roots": write_roots}), encoding="utf-8")
+        if finished_at is not None:
+            (peer_root / "agent_runs.jsonl").write_text(json.dumps(
+                {"agent_run_id": "p1", "status": "pass", "finished_at": finished_at}) + "\n",
+                encoding="utf-8")
+
+    def test_only_the_named_peer_scopes_are_exempt(self) -> None:
+        self._peer_launch(["workspace/ir/component__d__0.1.0/",
+                           "workspace/pipelines/component__d__0.1.0/"])
+        peer_writes = [
+            f"workspace/orchestrations/{self.PEER}/phase_state.json",
+            "workspace/ir/component__d__0.1.0/ir1/spec.ir.yaml",
+            "workspace/pipelines/component__d__0.1.0/p1/lineage.json",
+            "workspace/tmp/p1/scratch.py",
+        ]
+        own_writes = [
+            "spec/b.md",
+            "workspace/ir/component__d__0.2.0/ir1/spec.ir.yaml",
+            "workspace/tmp/p2/scratch.py",
+        ]
+        for rel in peer_writes + own_writes:
+            self._write(rel)
+        changed = lambda: ort._compute_changed_paths_against_baseline(  # noqa: E731
+            self.repo, self.OID, agent_run_id="a1")
+        with mock.patch.dict(os.environ, self.peers_env):
+            self.assertEqual(changed(), sorted(own_writes))
+        with mock.patch.dict(os.environ, {ort.CLOSURE_PEERS_ENV: ""}):
+            self.assertEqual(changed(), sorted(peer_writes + own_writes
+                                               + [f"workspace/orchestrations/{self.PEER}"
+                                                  "/capabilities/p1.json"]))
+
+    def test_a_malformed_peer_entry_exempts_nothing(self) -> None:
+        bad = [{"orchestration_id": "../..", "spec_kind": "component", "spec_id": "d",
+                "spec_versions": ["0.1.0"]}, "orch_x", {"orchestration_id": self.OID,
+                "spec_kind": "component", "spec_id": "e", "spec_versions": ["0.1.0"]}]
+        with mock.patch.dict(os.environ, {ort.CLOSURE_PEERS_ENV: json.dumps(bad)}):
+            self.assertEqual(ort._closure_peer_ignored_prefixes(self.repo, self.OID), ())
+            self.assertEqual(ort._closure_peer_write_windows(self.repo, self.OID), [])
+
+    def test_a_leaf_write_into_a_peer_tree_no_peer_launch_explains_is_rejected(self) -> None:
+        # The peer's only launch finished before the leaf wrote, and never held pipelines/.
+        self._peer_launch(["workspace/ir/component__d__0.1.0/"],
+                          finished_at="2020-01-01T00:00:00Z")
+        cross_node = ["workspace/ir/component__d__0.1.0/ir1/spec.ir.yaml",
+                      "workspace/pipelines/component__d__0.1.0/p1/lineage.json"]
+        for rel in cross_node:
+            self._write(rel)
+        caps = self.repo / "workspace" / "orchestrations" / self.OID / "capabilities"
+        caps.mkdir()
+        (caps / "a1.json").write_text(json.dumps(
+            {"agent_run_id": "a1", "write_roots": ["workspace/ir/component__e__0.1.0/"]}),
+            encoding="utf-8")
+        ort._write_allowed_output_manifest(
+            self.repo, orchestration_id=self.OID, agent_run_id="a1",
+            allowed_output_paths=[], allowed_file_tool_paths=[])
+        with mock.patch.dict(os.environ, self.peers_env):
+            self.assertEqual(ort._compute_changed_paths_against_baseline(
+                self.repo, self.OID, agent_run_id="a1"), cross_node)
+            with self.assertRaisesRegex(ValueError,
+                                        "terminal run has unauthorized write paths"):
+                ort._validate_actual_write_paths(
+                    self.repo, self.OID,
+                    {"agent_run_id": "a1", "agent_role": "step", "status": "pass"})
+
+
+class JsonWriteBatchTests(unittest.TestCase):
+    """`_json_write_batch` commits N documents with a constant number of syncs and rolls a
+    durable journal forward after a crash."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def _syncs(self, count: int) -> int:
+        calls = {"n": 0}
+
+        def counted(fd: int) -> None:
+            calls["n"] += 1
+
+        def barrier(path: Path) -> None:
+            calls["n"] += 1
+
+        with mock.patch.object(ort.os, "fsync", side_effect=counted), \
+                mock.patch.object(ort, "_sync_filesystem", side_effect=barrier):
+            with ort._json_write_batch(self.root):
+                for i in range(count):
+                    ort._write_json(self.root / "docs" / f"{i}.json", {"i": i})
+        return calls["n"]
+
+    def test_a_batch_syncs_a_constant_number_of_times(self) -> None:
+        self.assertEqual(self._syncs(2), self._syncs(12))
+        self.assertEqual(ort._read_json(self.root / "docs" / "11.json"), {"i": 11})
+        self.assertEqual(list((self.root / ort._JSON_TRANSACTIONS_DIRNAME).iterdir()), [])
+
+    def test_targets_change_only_after_the_journal_is_durable(self) -> None:
+        doc = self.root / "doc.json"
+        ort._write_json(doc, {"v": "old"})
+        order: list[tuple[str, bool]] = []
+        real_replace = ort._replace_text
+
+        def recorded(path: Path, body: str, *, sync: bool) -> None:
+            order.append((path.name, sync))
+            real_replace(path, body, sync=sync)
+
+        with mock.patch.object(ort, "_replace_text", side_effect=recorded):
+            with ort._json_write_batch(self.root):
+                ort._write_json(doc, {"v": "new"})
+                self.assertEqual(json.loads(doc.read_text(encoding="utf-8")), {"v": "old"})
+                self.assertEqual(ort._read_json(doc), {"v": "new"})
+                self.assertTrue(ort._document_exists(self.root / "doc.json"))
+                self.assertEqual(order, [])
+        self.assertEqual(order, [("journal.json", True), ("doc.json", False)])
+        self.assertEqual(ort._read_json(doc), {"v": "new"})
+
+    def test_a_durable_journal_rolls_the_batch_forward(self) -> None:
+        lost, empty, torn = (self.root / n for n in ("lost.json", "empty.json", "torn.json"))
+        for path in (lost, empty, torn):
+            ort._write_json(path, {"v": "old"})
+        with mock.patch.object(ort, "_sync_filesystem", side_effect=OSError("power loss")):
+            with self.assertRaises(OSError):
+                with ort._json_write_batch(self.root):
+                    for path in (lost, empty, torn):
+                        ort._write_json(path, {"v": "new"})
+        # What the disk may hold after the power loss: a rename that never happened, and
+        # renames whose data never reached it (zero-length, or zero-filled).
+        ort._write_json(lost, {"v": "old"})
+        empty.write_text("", encoding="utf-8")
+        torn.write_bytes(b"\0" * 12)
+        ort._recover_json_transactions(self.root)
+        for path in (lost, empty, torn):
+            self.assertEqual(ort._read_json(path), {"v": "new"})
+        self.assertEqual(list((self.root / ort._JSON_TRANSACTIONS_DIRNAME).iterdir()), [])
+
+    def test_a_journal_left_after_the_renames_never_rolls_back_a_later_batch(self) -> None:
+        graph = self.root / "agent_graph.json"
+        # A crash after every rename but before the journal is retired.
+        with mock.patch.object(ort.shutil, "rmtree", side_effect=OSError("power loss")):
+            with self.assertRaises(OSError):
+                with ort._json_write_batch(self.root):
+                    ort._write_json(graph, {"edges": ["A"]})
+        self.assertNotEqual(list((self.root / ort._JSON_TRANSACTIONS_DIRNAME).iterdir()), [])
+        with ort._json_write_batch(self.root):
+            edges = ort._read_json(graph)["edges"]
+            ort._write_json(graph, {"edges": [*edges, "B"]})
+        ort._recover_json_transactions(self.root)
+        self.assertEqual(ort._read_json(graph), {"edges": ["A", "B"]})
+        self.assertEqual(list((self.root / ort._JSON_TRANSACTIONS_DIRNAME).iterdir()), [])
+
+
+class RunLedgerTailTests(unittest.TestCase):
+    """`_load_run_records` parses only appended lines and matches a full parse."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.runs = self.root / "agent_runs.jsonl"
+        self.addCleanup(ort._LEDGER_STATES.clear)
+
+    def _append(self, text: str) -> None:
+        with self.runs.open("a", encoding="utf-8") as fh:
+            fh.write(text)
+
+    def _row(self, arid: str, status: str = "pass") -> str:
+        return json.dumps({"agent_run_id": arid, "status": status, "paths": ["a"]}) + "\n"
+
+    def test_only_appended_lines_are_parsed(self) -> None:
+        self._append(self._row("a1") + "\n" + self._row("a2"))
+        self.assertEqual(list(ort._load_run_records(self.root)), ["a1", "a2"])
+        self._append(self._row("a1", "fail") + self._row("a3"))
+        with mock.patch.object(ort.json, "loads", wraps=json.loads) as spy:
+            records = ort._load_run_records(self.root)
+        self.assertEqual(spy.call_count, 2)
+        self.assertEqual(records["a1"]["status"], "fail")
+        self.assertEqual(list(records), ["a1", "a2", "a3"])
+        self.assertEqual(ort._read_existing_run_ids(self.runs), {"a1", "a2", "a3"})
+
+    def test_a_rewritten_ledger_is_parsed_again(self) -> None:
+        self._append(self._row("a1") + self._row("a2"))
+        ort._load_run_records(self.root)
+        ort._atomic_write_text(self.runs, self._row("a1", "fail"))
+        self.assertEqual(ort._load_run_records(self.root), {"a1": {
+            "agent_run_id": "a1", "status": "fail", "paths": ["a"]}})
+        # In place, same inode, longer than before: the tail check catches it.
+        self.runs.write_text(self._row("b1") + self._row("b2") + self._row("b3"), encoding="utf-8")
+        self.assertEqual(list(ort._load_run_records(self.root)), ["b1", "b2", "b3"])
+
+    def test_a_partial_trailing_line_is_never_cached(self) -> None:
+        self._append(self._row("a1") + '{"agent_run_id": "a2", "sta')
+        with mock.patch.object(ort, "_agent_runs_writer_active", return_value=True):
+            self.assertEqual(list(ort._load_run_records(self.root)), ["a1"])
+        self._append('tus": "pass"}\n')
+        self.assertEqual(ort._load_run_records(self.root)["a2"]["status"], "pass")
+
+    def test_corruption_is_reported_at_its_line_in_the_whole_file(self) -> None:
+        self._append(self._row("a1") + self._row("a2"))
+        ort._load_run_records(self.root)
+        self._append("{broken\n" + self._row("a3"))
+        with self.assertRaisesRegex(RuntimeError, "non-trailing JSON at line 3"):
+            ort._load_run_records(self.root)
+
+    def test_shared_records_refuse_mutation_but_copies_do_not(self) -> None:
+        self._append(self._row("a1"))
+        record = ort._load_run_records(self.root)["a1"]
+        with self.assertRaises(TypeError):
+            record["status"] = "fail"
+        with self.assertRaises(TypeError):
+            record["paths"].append("b")
+        clone = copy.deepcopy(record)
+        clone["paths"].append("b")
+        self.assertEqual(dict(record) | {"status": "fail"}, {**clone, "status": "fail", "paths": ["a"]})
+        self.assertEqual(json.loads(json.dumps(record)), {"agent_run_id": "a1", "status": "pass", "paths": ["a"]})
+
+
 class OrchestrationMetaAndJudgeHookTests(unittest.TestCase):
     def test_write_preflight_persists_parallel_nodes_meta_without_init(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -15253,84 +15566,145 @@ class TestPhase2PlanGuardsIntegration(unittest.TestCase):
                 )
             self.assertIn("record-launch", str(ctx.exception).lower())
 
+    @staticmethod
+    def _launch_mcp_build_child(repo_root: Path) -> str:
+        """Orchestration g2 with build child `build_child_1` launched; its capability token."""
+        init_orchestration(repo_root=repo_root, orchestration_id="g2")
+        _mark_dependencies_ready(repo_root, "g2")
+        write_preflight(
+            repo_root=repo_root,
+            orchestration_id="g2",
+            payload={
+                "status": "pass",
+                "sandbox_runtime": "bwrap",
+                "sandbox_enforced": True,
+                "can_launch_step_agents": True,
+                "can_launch_substep_agents": True,
+                "feature_states": {"multi_agent": True, "hooks": True},
+                "checks": [{"name": "multi_agent_enabled", "pass": True}, {"name": "hooks_enabled", "pass": True}, {"name": "codex_home_writable", "pass": True}, {"name": "sandbox_bwrap_available", "pass": True}, {"name": "sandbox_bwrap_userns", "pass": True}],
+            },
+        )
+        g2_req = {
+            "agent_run_id": "build_child_1",
+            "agent_role": "step",
+            "node_key": "problem/shallow_water2d@0.3.0",
+            "step": "build",
+            "agent_model": "claude-opus-4-8",
+            "orchestration_id": "g2",
+            "parent_agent_run_id": "orch_g2",
+            "ir_ref": _FIX_IR_REF,
+            "pipeline_ref": _FIX_PIPE_REF,
+            "dependency_ref": _FIX_DEP_REF,
+            "skill_name": "workflow-build",
+            "skill_ref": "skills/workflow-build/SKILL.md",
+            "skill_must_read_refs": _fixture_skill_must_read_refs_step("build"),
+            "issue_severity": "none",
+            "repair_strategy": "none",
+            "repair_target_agent_run_id": "none",
+            "repair_reason": "none",
+            "allowed_output_paths": [f"{_FIX_PIPE_REF}/binary/bin_20260101_001/bin/simulate"],
+            "launch_prompt_full": render_launch_prompt_text(
+                {
+                    "agent_run_id": "build_child_1",
+                    "node_key": "problem/shallow_water2d@0.3.0",
+                    "step": "build",
+                    "orchestration_id": "g2",
+                    "parent_agent_run_id": "orch_g2",
+                    "ir_ref": _FIX_IR_REF,
+                    "pipeline_ref": _FIX_PIPE_REF,
+                    "dependency_ref": _FIX_DEP_REF,
+                    "skill_name": "workflow-build",
+                    "skill_ref": "skills/workflow-build/SKILL.md",
+                    "skill_must_read_refs": _fixture_skill_must_read_refs_step("build"),
+                    "issue_severity": "none",
+                    "repair_strategy": "none",
+                    "repair_target_agent_run_id": "none",
+                    "repair_reason": "none",
+                }
+            ),
+        }
+        record_launch(
+            repo_root=repo_root,
+            orchestration_id="g2",
+            parent_agent_run_id="orch_g2",
+            child_agent_run_id="build_child_1",
+            request_payload=g2_req,
+            response_payload={
+                "agent_run_id": "build_child_1",
+                **_spawn_response_payload("sess_build_child_1"),
+            },
+        )
+        cap_path = repo_root / "workspace/orchestrations/g2/capabilities/build_child_1.json"
+        return str(json.loads(cap_path.read_text(encoding="utf-8"))["capability_token"])
+
     def test_validate_mcp_accepts_after_record_launch_build_child(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo_root = Path(tmp)
-            init_orchestration(repo_root=repo_root, orchestration_id="g2")
-            _mark_dependencies_ready(repo_root, "g2")
-            write_preflight(
-                repo_root=repo_root,
-                orchestration_id="g2",
-                payload={
-                    "status": "pass",
-                    "sandbox_runtime": "bwrap",
-                    "sandbox_enforced": True,
-                    "can_launch_step_agents": True,
-                    "can_launch_substep_agents": True,
-                    "feature_states": {"multi_agent": True, "hooks": True},
-                    "checks": [{"name": "multi_agent_enabled", "pass": True}, {"name": "hooks_enabled", "pass": True}, {"name": "codex_home_writable", "pass": True}, {"name": "sandbox_bwrap_available", "pass": True}, {"name": "sandbox_bwrap_userns", "pass": True}],
-                },
-            )
-            g2_req = {
-                "agent_run_id": "build_child_1",
-                "agent_role": "step",
-                "node_key": "problem/shallow_water2d@0.3.0",
-                "step": "build",
-                "agent_model": "claude-opus-4-8",
-                "orchestration_id": "g2",
-                "parent_agent_run_id": "orch_g2",
-                "ir_ref": _FIX_IR_REF,
-                "pipeline_ref": _FIX_PIPE_REF,
-                "dependency_ref": _FIX_DEP_REF,
-                "skill_name": "workflow-build",
-                "skill_ref": "skills/workflow-build/SKILL.md",
-                "skill_must_read_refs": _fixture_skill_must_read_refs_step("build"),
-                "issue_severity": "none",
-                "repair_strategy": "none",
-                "repair_target_agent_run_id": "none",
-                "repair_reason": "none",
-                "allowed_output_paths": [f"{_FIX_PIPE_REF}/binary/bin_20260101_001/bin/simulate"],
-                "launch_prompt_full": render_launch_prompt_text(
-                    {
-                        "agent_run_id": "build_child_1",
-                        "node_key": "problem/shallow_water2d@0.3.0",
-                        "step": "build",
-                        "orchestration_id": "g2",
-                        "parent_agent_run_id": "orch_g2",
-                        "ir_ref": _FIX_IR_REF,
-                        "pipeline_ref": _FIX_PIPE_REF,
-                        "dependency_ref": _FIX_DEP_REF,
-                        "skill_name": "workflow-build",
-                        "skill_ref": "skills/workflow-build/SKILL.md",
-                        "skill_must_read_refs": _fixture_skill_must_read_refs_step("build"),
-                        "issue_severity": "none",
-                        "repair_strategy": "none",
-                        "repair_target_agent_run_id": "none",
-                        "repair_reason": "none",
-                    }
-                ),
-            }
-            record_launch(
-                repo_root=repo_root,
-                orchestration_id="g2",
-                parent_agent_run_id="orch_g2",
-                child_agent_run_id="build_child_1",
-                request_payload=g2_req,
-                response_payload={
-                    "agent_run_id": "build_child_1",
-                    **_spawn_response_payload("sess_build_child_1"),
-                },
-            )
-            cap_path = repo_root / "workspace/orchestrations/g2/capabilities/build_child_1.json"
-            cap = json.loads(cap_path.read_text(encoding="utf-8"))
+            token = self._launch_mcp_build_child(repo_root)
             validate_mcp_build_tool_invocation(
                 repo_root,
                 orchestration_id="g2",
                 agent_run_id="build_child_1",
-                capability_token=str(cap["capability_token"]),
+                capability_token=token,
                 tool_name="compile_project",
             )
 
+    def test_validate_mcp_verdict_cache_reuses_unchanged_documents(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            token = self._launch_mcp_build_child(repo_root)
+            cache: dict = {}
+
+            def gate() -> None:
+                validate_mcp_build_tool_invocation(
+                    repo_root,
+                    orchestration_id="g2",
+                    agent_run_id="build_child_1",
+                    capability_token=token,
+                    tool_name="compile_project",
+                    mcp_args={"build_system": "make"},
+                    verdict_cache=cache,
+                )
+
+            # Documents written this instant may still be rewritten within the same tick,
+            # so the first verdict is not kept.
+            gate()
+            self.assertEqual(cache, {})
+            with mock.patch.object(ort, "_SNAPSHOT_RACY_WINDOW_NS", 0):
+                gate()
+                self.assertEqual(len(cache), 1)
+                with mock.patch.object(
+                    ort, "_read_json", side_effect=AssertionError("re-read")
+                ), mock.patch.object(ort, "_append_workflow_hook_log") as audit:
+                    gate()
+                    # The argument checks and the audit line still run on a hit.
+                    with self.assertRaisesRegex(RuntimeError, "build_system make"):
+                        validate_mcp_build_tool_invocation(
+                            repo_root,
+                            orchestration_id="g2",
+                            agent_run_id="build_child_1",
+                            capability_token=token,
+                            tool_name="compile_project",
+                            mcp_args={"build_system": "cmake"},
+                            verdict_cache=cache,
+                        )
+                self.assertEqual(audit.call_count, 1)
+
+                cap_path = repo_root / "workspace/orchestrations/g2/capabilities/build_child_1.json"
+                cap = json.loads(cap_path.read_text(encoding="utf-8"))
+                expired = dict(cap, expires_at="2000-01-01T00:00:00Z")
+                ort._atomic_write_text(cap_path, json.dumps(expired))
+                with self.assertRaisesRegex(RuntimeError, "expired"):
+                    gate()
+                self.assertEqual(cache, {})
+                ort._atomic_write_text(cap_path, json.dumps(cap))
+                gate()
+                # A verdict past its expiry is refused without any document changing.
+                (verdict,) = cache.values()
+                verdict.expires_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+                with self.assertRaisesRegex(RuntimeError, "expired"):
+                    gate()
+
     @staticmethod
     def _perm_test_refs(**extra):
         import tools.workflow_conductor as wc
@@ -28594,7 +28968,9 @@ class FailureAnalysisRuntimeSidecarExemptionTests(unittest.TestCase):
         from tools.orchestration_runtime import (
             _actual_changed_paths_since_baseline,
             _compute_sha256,
+            _load_run_write_baseline,
             _run_write_baseline_path,
+            _run_write_baseline_store_path,
             _write_run_write_baseline,
         )
 
@@ -28611,12 +28987,15 @@ class FailureAnalysisRuntimeSidecarExemptionTests(unittest.TestCase):
             (repo_root / sidecar_rel).write_text("{}\n", encoding="utf-8")
 
             _write_run_write_baseline(repo_root, orch_id, agent_run_id="child_arid")
-            # Simulate an old baseline that recorded the sidecar digest.
+            # Simulate an old (legacy JSON) baseline that recorded the sidecar digest.
             bpath = _run_write_baseline_path(
                 repo_root, orch_id, agent_run_id="child_arid"
             )
-            doc = json.loads(bpath.read_text(encoding="utf-8"))
+            doc = _load_run_write_baseline(repo_root, orch_id, agent_run_id="child_arid")
             doc["files"][sidecar_rel] = _compute_sha256(repo_root / sidecar_rel)
+            _run_write_baseline_store_path(
+                repo_root, orch_id, agent_run_id="child_arid"
+            ).unlink()
             bpath.write_text(json.dumps(doc), encoding="utf-8")
 
             changed = _actual_changed_paths_since_baseline(
@@ -29844,7 +30223,12 @@ class ChildContextDocSizeTests(unittest.TestCase):
         # `iterative`/`columnwise`, an absent one included. An author cannot predict a
         # finding the doc does not describe. Set from the measured 56463 plus this table's
         # conventional ~150 B of slack, the same rule as the two SKILL entries below.
-        "docs/workflow/phases/phase_01_compile.md": 56650,
+        # Bumped 56650->57000 (2026-10-17): `backend_overrides.openmp` gains `places` /
+        # `proc_bind`, which Validate.execute sets as the measured run's OMP_PLACES /
+        # OMP_PROC_BIND, and the knob paragraph states the one VALUE check in the knob layer —
+        # a Compile.static violation the leaf cannot avoid unless this doc names it. The
+        # grammar itself stays in the schema; measured 56870 plus the same slack.
+        "docs/workflow/phases/phase_01_compile.md": 57000,
         # Per-substep SKILLs — each force-read by its own LLM leaf.
         # Bumped 10800->11500: Compile.generate now authors the io_contract section (G2 /
         # docs/design/deterministic_followups.md) — it was moved here from Compile.verify so the
@@ -824,6 +824,22 @@ class PureMakefileTests(unittest.TestCase):
             self.assertIn(f"BIN ?= {_SPEC_ID}_runner", mk)
             self.assertIn("test:", mk)
 
+    def test_both_makefiles_pin_the_flags_the_compile_cache_keys_on(self) -> None:
+        # A `?=` default would yield to a host FFLAGS, compiling objects the cache then
+        # stores under the default-flags key.
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            refs = _write_node(repo)
+            c = _conductor(repo)
+            _, flags = c._compile_rule_flags(c._read_toolchain(refs))
+            pure = c._render_pure_makefile_from_graph(
+                refs, c._build_pure_bundle_graph(refs, _valid_bundle()))
+            c._write_makefile(refs)
+            shaped = (repo / refs.source_dir() / "src" / "Makefile").read_text(encoding="utf-8")
+            for mk in (pure, shaped):
+                self.assertIn(f"FFLAGS  := {flags}\n", mk)
+                self.assertNotIn("FFLAGS  ?=", mk)
+
 
 # ======================================================================================
 # _run_pure_generate_substep: happy path + bounded repair + exhaustion
@@ -5474,6 +5474,169 @@ class DependencyClosureTests(unittest.TestCase):
             self.assertEqual(len(captured), 3)
             self.assertEqual([c for c in calls if c and c[0] == "set-status"], [])
 
+    def _seed_two_branch(self, repo_root: Path) -> None:
+        # problem A → components B and D, each → harness C. B and D share no edge.
+        _write_catalog(repo_root, [
+            {"spec_kind": "problem", "spec_id": "a", "spec_version": "0.3.0",
+             "deps_path": "spec/problem/a/deps.yaml"},
+            {"spec_kind": "component", "spec_id": "b", "spec_version": "0.1.0",
+             "deps_path": "spec/component/b/deps.yaml"},
+            {"spec_kind": "component", "spec_id": "d", "spec_version": "0.1.0",
+             "deps_path": "spec/component/d/deps.yaml"},
+            {"spec_kind": "infrastructure", "spec_id": "c", "spec_version": "0.1.0",
+             "deps_path": "spec/component/c/deps.yaml"},
+        ])
+        _write_deps(repo_root, "spec/problem/a", "problem", "a",
+                    components=[("b", ">=0.1.0 <1.0.0"), ("d", ">=0.1.0 <1.0.0")],
+                    infrastructure=[("c", ">=0.1.0 <1.0.0")])
+        for sid in ("b", "d"):
+            _write_deps(repo_root, f"spec/component/{sid}", "component", sid,
+                        infrastructure=[("c", ">=0.1.0 <1.0.0")])
+        _write_deps(repo_root, "spec/component/c", "infrastructure", "c")
+
+    def _drive_closure_jobs(self, repo_root: Path, fake_run_node, *, jobs: int):
+        """Drive the closure with `jobs` workers. Workers are forked, so `fake_run_node`
+        reports through files: a node is ready once `<repo>/ran/<spec_id>` exists."""
+        from tools.orchestration_runtime import _load_spec_catalog
+        _load_spec_catalog.cache_clear()
+        (repo_root / "ran").mkdir()
+
+        def fake_ready(repo_root, node, required_stages):
+            return (repo_root / "ran" / node["spec_id"]).exists()
+
+        buf = io.StringIO()
+        with mock.patch.object(run_workflow, "_run_node", fake_run_node), \
+                mock.patch.object(run_workflow, "_dependency_node_ready", fake_ready), \
+                redirect_stdout(buf):
+            rc = run_workflow._run_with_dependency_closure(
+                repo_root=repo_root,
+                base_env={"PATH": os.environ.get("PATH", "")},
+                target_orchestration_id="orch_target",
+                target_spec_ref="spec/problem/a",
+                target_source_dependency_ref="spec/problem/a/deps.yaml",
+                until_phase="Validate",
+                llm="claude",
+                llm_command="claude",
+                llm_config=_sample_config("claude"),
+                workflow_mode="dev",
+                status="running",
+                run_conductor=False,
+                jobs=jobs,
+            )
+        events = [json.loads(line) for line in buf.getvalue().splitlines()
+                  if line.strip().startswith("{")]
+        return rc, events
+
+    def test_closure_nodes_carry_their_direct_dependencies(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            self._seed_two_branch(repo_root)
+            ordered, err = run_workflow._resolve_dependency_closure(repo_root, "spec/problem/a")
+            self.assertIsNone(err)
+            deps = {n["spec_id"]: n["depends_on"] for n in ordered}
+            self.assertEqual(deps, {"c": [], "b": ["spec/component/c"],
+                                    "d": ["spec/component/c"]})
+            peers = run_workflow._closure_peer_map(ordered)
+            self.assertEqual(peers["spec/component/b"], ["spec/component/d"])
+            self.assertEqual(peers["spec/component/c"], [])
+
+    def test_jobs_runs_independent_nodes_concurrently_with_their_peers_named(self) -> None:
+        from tools.orchestration_runtime import CLOSURE_PEERS_ENV
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            self._seed_two_branch(repo_root)
+            other = {"b": "d", "d": "b"}
+
+            def fake_run_node(**kw):
+                sid = Path(kw["spec_ref"]).name
+                (repo_root / "ran" / f"{sid}.started").touch()
+                (repo_root / "ran" / f"{sid}.peers").write_text(
+                    kw["base_env"].get(CLOSURE_PEERS_ENV, ""), encoding="utf-8")
+                if sid in other:
+                    # Each sibling waits for the other to start: sequential runs time out.
+                    deadline = time.monotonic() + 20
+                    while not (repo_root / "ran" / f"{other[sid]}.started").exists():
+                        if time.monotonic() > deadline:
+                            return 1
+                        time.sleep(0.01)
+                (repo_root / "ran" / sid).touch()
+                return 0
+
+            rc, events = self._drive_closure_jobs(repo_root, fake_run_node, jobs=2)
+            self.assertEqual(rc, 0)
+            peers_b = json.loads((repo_root / "ran" / "b.peers").read_text(encoding="utf-8"))
+            self.assertEqual([p["spec_id"] for p in peers_b], ["d"])
+            self.assertEqual((repo_root / "ran" / "c.peers").read_text(encoding="utf-8"), "[]")
+            # The target ran in the driver itself, after every dependency.
+            self.assertTrue((repo_root / "ran" / "a").exists())
+            self.assertFalse((repo_root / "ran" / "a.peers").read_text(encoding="utf-8"))
+
+    def test_first_failure_cancels_the_running_siblings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            self._seed_two_branch(repo_root)
+
+            def fake_run_node(**kw):
+                sid = Path(kw["spec_ref"]).name
+                (repo_root / "ran" / f"{sid}.started").touch()
+                if sid == "b":
+                    while not (repo_root / "ran" / "d.started").exists():
+                        time.sleep(0.01)
+                    return 1
+                if sid == "d":
+                    time.sleep(60)  # until cancelled
+                (repo_root / "ran" / sid).touch()
+                return 0
+
+            started = time.monotonic()
+            rc, events = self._drive_closure_jobs(repo_root, fake_run_node, jobs=2)
+            self.assertLess(time.monotonic() - started, 30)
+            self.assertEqual(rc, 1)
+            failure = events[-1]
+            self.assertEqual(failure["reason"], "dependency_node_failed")
+            self.assertEqual(failure["spec_ref"], "spec/component/b")
+            runs = {Path(r["spec_ref"]).name: r for r in failure["dependency_runs"]}
+            self.assertEqual(runs["d"]["exit_code"], 143)
+            self.assertTrue(runs["d"]["cancelled"])
+            self.assertFalse((repo_root / "ran" / "a.started").exists())
+
+    def test_a_failure_with_dependents_still_pending_ends_the_closure(self) -> None:
+        # C fails before B and D can start; they wait on C forever, so the driver must
+        # stop once nothing runs instead of polling an empty worker set.
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            self._seed_two_branch(repo_root)
+
+            def fake_run_node(**kw):
+                sid = Path(kw["spec_ref"]).name
+                (repo_root / "ran" / f"{sid}.started").touch()
+                return 1 if sid == "c" else 0
+
+            started = time.monotonic()
+            rc, events = self._drive_closure_jobs(repo_root, fake_run_node, jobs=2)
+            self.assertLess(time.monotonic() - started, 30)
+            self.assertEqual(rc, 1)
+            failure = events[-1]
+            self.assertEqual(failure["reason"], "dependency_node_failed")
+            self.assertEqual(failure["spec_ref"], "spec/component/c")
+            for sid in ("b", "d", "a"):
+                self.assertFalse((repo_root / "ran" / f"{sid}.started").exists(), sid)
+
+    def test_nodes_that_never_become_startable_fail_the_closure(self) -> None:
+        ordered = [
+            {"spec_ref": "spec/component/b", "depends_on": ["spec/component/missing"],
+             "spec_kind": "component", "spec_id": "b", "spec_versions": ["0.1.0"]},
+        ]
+        failure, rc = run_workflow._run_dependency_nodes_concurrently(
+            ordered, jobs=2, orch_ids={"spec/component/b": ("orch_b", False)},
+            dependency_runs=[], is_ready=lambda node: False,
+            node_kwargs={"base_env": {}}, stdout_format="jsonl",
+        )
+        self.assertEqual(rc, 2)
+        self.assertEqual(failure["reason"], "dependency_closure_stalled")
+        self.assertEqual(failure["unstarted_spec_refs"], ["spec/component/b"])
+
 
 class StdoutTeeTests(unittest.TestCase):
     """Cover the host-side run-log tee added to run_workflow: stdout mirroring,
@@ -6920,6 +7083,54 @@ class IncompleteOrchestrationIndexTests(unittest.TestCase):
                 run_workflow._index_incomplete_orchestrations_by_spec(Path(tmp)), {})
 
 
+class OrchestrationCatalogTests(unittest.TestCase):
+    """`_orchestration_catalog` — the lookups parse only metas written since the last one."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo_root = Path(tmp.name)
+        self.orchs = self.repo_root / "workspace" / "orchestrations"
+        # Every meta here is written moments before it is read; the racy window would
+        # otherwise keep all of them out of the catalog.
+        self.enterContext(mock.patch.object(run_workflow, "_ORCHESTRATION_CATALOG_RACY_WINDOW_NS", 0))
+
+    def _write_meta(self, oid: str, meta: dict) -> None:
+        d = self.orchs / oid
+        d.mkdir(parents=True, exist_ok=True)
+        (d / "orchestration_meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    def test_an_unchanged_history_is_not_parsed_again(self) -> None:
+        for n in range(5):
+            self._write_meta(f"orch_{n}", {"status": "pass", "spec_ref": "spec/a",
+                                           "started_at": f"2026-01-0{n + 1}T00:00:00Z"})
+        self.assertEqual(run_workflow._find_latest_orchestration(self.repo_root), "orch_4")
+        self.assertTrue((self.orchs / "catalog_index.jsonl").is_file())
+        with mock.patch.object(run_workflow, "_read_json_if_exists",
+                               wraps=run_workflow._read_json_if_exists) as spy:
+            self.assertEqual(run_workflow._find_latest_orchestration(self.repo_root), "orch_4")
+            self._write_meta("orch_5", {"status": "running", "spec_ref": "spec/a",
+                                        "invocation": {"closure_id": "c1"}})
+            self.assertEqual(run_workflow._index_incomplete_orchestrations_by_spec(self.repo_root),
+                             {"spec/a": ["orch_5"]})
+        self.assertEqual(spy.call_count, 1)
+
+    def test_rewritten_removed_and_corrupt_entries_follow_the_metas(self) -> None:
+        self._write_meta("orch_a", {"status": "running", "spec_ref": "spec/a",
+                                    "invocation": {"closure_id": "c1"}})
+        self._write_meta("orch_b", {"status": "running", "spec_ref": "spec/b"})
+        self.assertEqual(run_workflow._index_closure_orchestrations(self.repo_root, "c1"),
+                         {"spec/a": "orch_a"})
+        self._write_meta("orch_a", {"status": "fail", "spec_ref": "spec/a",
+                                    "invocation": {"closure_id": "c1"}})
+        shutil.rmtree(self.orchs / "orch_b")
+        self.assertEqual(run_workflow._index_incomplete_orchestrations_by_spec(self.repo_root), {})
+        (self.orchs / "catalog_index.jsonl").write_text("{not json", encoding="utf-8")
+        self.assertEqual(run_workflow._find_latest_orchestration(self.repo_root), "orch_a")
+        self.assertEqual(run_workflow._index_closure_orchestrations(self.repo_root, "c1"),
+                         {"spec/a": "orch_a"})
+
+
 class ProcStatParsingTests(unittest.TestCase):
     """`_parse_proc_stat` — field extraction from a `/proc/<pid>/stat` body.
 
@@ -8057,5 +8268,32 @@ class LlmConfigStartupTests(unittest.TestCase):
         self.assertGreaterEqual(len(calls), 3)   # entry + dependency member + target
 
 
+class HostBytecodeWarmupTests(unittest.TestCase):
+    def test_modules_compile_into_the_redirect_root_and_tests_are_skipped(self) -> None:
+        import importlib.util
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            (repo_root / "tools" / "tests").mkdir(parents=True)
+            (repo_root / "mcp_servers").mkdir()
+            (repo_root / "tools" / "m.py").write_text("X = 1\n", encoding="utf-8")
+            (repo_root / "tools" / "tests" / "test_m.py").write_text("Y = 2\n", encoding="utf-8")
+            (repo_root / "mcp_servers" / "s.py").write_text("Z = 3\n", encoding="utf-8")
+            prefix = repo_root / "workspace" / ".pycache"
+            saved = sys.pycache_prefix
+            try:
+                sys.pycache_prefix = str(prefix)
+                run_workflow._warm_host_bytecode(repo_root)
+                cached = {
+                    src: Path(importlib.util.cache_from_source(str(repo_root / src))).is_file()
+                    for src in ("tools/m.py", "tools/tests/test_m.py", "mcp_servers/s.py")
+                }
+            finally:
+                sys.pycache_prefix = saved
+            self.assertEqual(cached, {"tools/m.py": True, "tools/tests/test_m.py": False,
+                                      "mcp_servers/s.py": True})
+            self.assertEqual(list(repo_root.rglob("__pycache__")), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Tests for tools/runtime_service.py — resident dispatch of the runtime CLI."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import runtime_service as rs
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class RuntimeModeTests(unittest.TestCase):
+    def test_unset_is_the_subprocess_mode(self) -> None:
+        self.assertEqual(rs.runtime_mode({}), rs.RUNTIME_MODE_SUBPROCESS)
+        self.assertEqual(rs.runtime_mode({rs.RUNTIME_MODE_ENV: " "}), rs.RUNTIME_MODE_SUBPROCESS)
+
+    def test_a_mistyped_mode_is_refused_not_defaulted(self) -> None:
+        with self.assertRaisesRegex(ValueError, "METDSL_RUNTIME_MODE"):
+            rs.runtime_mode({rs.RUNTIME_MODE_ENV: "residnet"})
+
+
+class DispatchTests(unittest.TestCase):
+    """`_dispatch` must report what a fresh interpreter would: exit code, stdout, stderr."""
+
+    def setUp(self) -> None:
+        saved_env, saved_cwd = dict(os.environ), os.getcwd()
+
+        def restore() -> None:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+        self.addCleanup(restore)
+
+    def test_env_cwd_stdin_and_argv_are_the_callers_per_call(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            def fake_main(argv: list[str]) -> int:
+                print(json.dumps({"argv": argv, "env": os.environ.get("PROBE"),
+                                  "stale": os.environ.get("STALE"), "cwd": os.getcwd(),
+                                  "stdin": sys.stdin.read(), "prog": sys.argv[0]}))
+                return 0
+            os.environ["STALE"] = "left over from a previous call"
+            reply = rs._dispatch(fake_main, {"argv": ["set-status", "--x"], "stdin": "body",
+                                             "env": {"PROBE": "1"}, "cwd": tmp})
+        self.assertEqual(reply["returncode"], 0)
+        seen = json.loads(reply["stdout"])
+        self.assertEqual(seen["argv"], ["set-status", "--x"])
+        self.assertEqual(seen["env"], "1")
+        self.assertIsNone(seen["stale"])
+        self.assertEqual(Path(seen["cwd"]).resolve(), Path(tmp).resolve())
+        self.assertEqual(seen["stdin"], "body")
+        self.assertEqual(seen["prog"], rs.RUNTIME_SCRIPT)
+
+    def test_uncaught_exception_is_exit_one_with_the_traceback_on_stderr(self) -> None:
+        def fake_main(argv: list[str]) -> int:
+            raise ValueError("boom")
+        reply = rs._dispatch(fake_main, {"argv": [], "env": dict(os.environ), "cwd": "."})
+        self.assertEqual(reply["returncode"], 1)
+        self.assertIn("ValueError: boom", reply["stderr"])
+
+    def test_system_exit_keeps_its_code(self) -> None:
+        def fake_main(argv: list[str]) -> int:
+            raise SystemExit(2)
+        reply = rs._dispatch(fake_main, {"argv": [], "env": dict(os.environ), "cwd": "."})
+        self.assertEqual(reply["returncode"], 2)
+
+
+class ResidentWorkerTests(unittest.TestCase):
+    """End to end through a real worker, compared with the subprocess mode."""
+
+    def setUp(self) -> None:
+        self.addCleanup(rs.shutdown_resident_workers)
+        self.env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+    def _both(self, args: list[str]) -> tuple[object, object]:
+        sub = rs.run_runtime(REPO_ROOT, {**self.env, rs.RUNTIME_MODE_ENV: "subprocess"}, args)
+        res = rs.run_runtime(REPO_ROOT, {**self.env, rs.RUNTIME_MODE_ENV: "resident"}, args)
+        return sub, res
+
+    def test_resident_reply_matches_the_subprocess_reply(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sub, res = self._both(["read-checkpoint", "--repo-root", tmp,
+                                   "--orchestration-id", "orch_missing"])
+        self.assertEqual(sub.returncode, 0)
+        self.assertEqual((res.returncode, res.stdout), (sub.returncode, sub.stdout))
+
+    def test_argparse_rejection_keeps_exit_two(self) -> None:
+        sub, res = self._both(["no-such-subcommand", "--repo-root", "."])
+        self.assertEqual(sub.returncode, 2)
+        self.assertEqual(res.returncode, 2)
+        self.assertIn("invalid choice", res.stderr)
+
+    def test_worker_is_reused_then_recycled(self) -> None:
+        env = {**self.env, rs.RUNTIME_MODE_ENV: "resident"}
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(rs, "RESIDENT_MAX_CALLS", 2):
+            args = ["read-checkpoint", "--repo-root", tmp, "--orchestration-id", "o"]
+            rs.run_runtime(REPO_ROOT, env, args)
+            first = rs._WORKERS[REPO_ROOT.resolve()]
+            rs.run_runtime(REPO_ROOT, env, args)
+            self.assertIs(rs._WORKERS[REPO_ROOT.resolve()], first)
+            rs.run_runtime(REPO_ROOT, env, args)
+            self.assertIsNot(rs._WORKERS[REPO_ROOT.resolve()], first)
+            self.assertFalse(first.alive())
+
+    def test_a_worker_that_died_is_a_failed_call_then_replaced(self) -> None:
+        env = {**self.env, rs.RUNTIME_MODE_ENV: "resident"}
+        worker = rs._resident_worker(REPO_ROOT, env)
+        worker._proc.kill()
+        worker._proc.wait()
+        proc = worker.call(["read-checkpoint"], env=env)
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn("exited before replying", proc.stderr)
+        self.assertIsNot(rs._resident_worker(REPO_ROOT, env), worker)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_a_forked_child_starts_its_own_worker_and_leaves_the_parents_alone(self) -> None:
+        env = {**self.env, rs.RUNTIME_MODE_ENV: "resident"}
+        with tempfile.TemporaryDirectory() as tmp:
+            args = ["read-checkpoint", "--repo-root", tmp, "--orchestration-id", "o"]
+            expected = rs.run_runtime(REPO_ROOT, env, args)
+            parent_worker = rs._WORKERS[REPO_ROOT.resolve()]
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover - runs in the child
+                status = 1
+                try:
+                    os.close(read_fd)
+                    inherited = list(rs._WORKERS.values())
+                    replies = [rs.run_runtime(REPO_ROOT, env, args) for _ in range(3)]
+                    child_worker = rs._WORKERS[REPO_ROOT.resolve()]
+                    ok = (not inherited and child_worker is not parent_worker
+                          and all((r.returncode, r.stdout)
+                                  == (expected.returncode, expected.stdout) for r in replies))
+                    os.write(write_fd, b"ok" if ok else b"mismatch")
+                    rs.shutdown_resident_workers()
+                    status = 0
+                finally:
+                    os._exit(status)
+            os.close(write_fd)
+            with os.fdopen(read_fd, "rb") as pipe:
+                verdict = pipe.read()
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual((verdict, os.waitstatus_to_exitcode(status)), (b"ok", 0))
+            self.assertTrue(parent_worker.alive())
+            again = rs.run_runtime(REPO_ROOT, env, args)
+            self.assertIs(rs._WORKERS[REPO_ROOT.resolve()], parent_worker)
+            self.assertEqual((again.returncode, again.stdout),
+                             (expected.returncode, expected.stdout))
+
+
+if __name__ == "__main__":
+    unittest.main()
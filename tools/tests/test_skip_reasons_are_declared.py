@@ -110,6 +110,10 @@ _DECLARED_ENVIRONMENT_SKIPS = {
         "procfs is present but boot_id is not readable",
     "requires POSIX signals":
         "the platform has no SIGTERM",
+    "requires os.fork":
+        "the platform cannot fork (non-POSIX host)",
+    "inotify not available":
+        "the kernel has no inotify (non-Linux host) or the per-user instance limit is exhausted",
     "not a git checkout":
         "the tree is a `git archive` snapshot, so a repository-wide census has no subject",
     "no git work tree to ask about tracking":
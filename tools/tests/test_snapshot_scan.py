@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for tools/snapshot_scan.py — the bounded-memory readers of raw/state_snapshots/."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import snapshot_scan as ss
+from tools.validate_pipeline_semantics import PLACEHOLDER_TEXT_PATTERNS, _infer_json_shape
+
+_DOCUMENTS = (
+    b'{"case_id": "c1", "u": [[1.0, 2.5e-3], [3, -4]], "t": 0.5}',
+    b'{"u": [[1, 2], [3]], "v": [], "w": [[], []], "x": [[1], 2], "y": {"k": [1]}}',
+    b'{"u": [[[1]], [[2]]], "s": ["a", "b\\"c"], "m": [true, null, "x", 1e30]}',
+    b'{"t": NaN, "u": [-Infinity, Infinity], "case_id": 7}',
+    b'{"case_id": "a", "case_id": [1, 2], "test_id": "t1"}',
+    b'{\r\n "test_id": "caf\\u00e9",\r\n "u": [ 1 , 2 ]\r\n}\r\n',
+    b'{}',
+    # Not an object, or not JSON at all.
+    b'[1, 2]', b'"x"', b'', b'  ', b'\xef\xbb\xbf{}', b'{"a": "\xff"}', b'{"a": 01}',
+    b'{"a": [1, 2]', b'{"a": 1} x', b'{"a": 1,}', b'{"a" 1}', b'{"a": [1 2]}',
+    b'{"a": "unterminated', b'{"a": 1.}', b'{"a": tru}', b'{"a": -}',
+)
+
+
+def _reference(raw: bytes) -> tuple[dict, dict] | None:
+    """What the evidence gate derived from the document before it streamed it."""
+    try:
+        data = json.loads(raw.decode("utf-8").replace("\r\n", "\n"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return ({k: _infer_json_shape(v) for k, v in data.items()},
+            {k: v for k, v in data.items() if k in ("case_id", "test_id") and isinstance(v, str)})
+
+
+class SnapshotScanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "case.json"
+
+    def _summary(self, raw: bytes) -> tuple[dict, dict] | None:
+        self.path.write_bytes(raw)
+        summary = ss.summarize_json_object(self.path, string_keys=("case_id", "test_id"))
+        return None if summary is None else (summary.shapes, summary.strings)
+
+    def test_summaries_match_json_loads_at_every_chunk_size(self) -> None:
+        # A one-byte chunk splits every token, escape and multibyte character somewhere.
+        for chunk in (1, 2, 5, ss.CHUNK_BYTES):
+            with mock.patch.object(ss, "CHUNK_BYTES", chunk):
+                for raw in _DOCUMENTS:
+                    with self.subTest(chunk=chunk, raw=raw):
+                        self.assertEqual(self._summary(raw), _reference(raw))
+
+    def test_a_grid_is_shaped_without_decoding_its_elements(self) -> None:
+        row = "[" + ",".join(f"{0.5 * i:.6e}" for i in range(300)) + "]"
+        raw = ('{"u": [' + ",".join([row] * 40) + '], "t": 1}').encode("utf-8")
+        with mock.patch.object(ss, "CHUNK_BYTES", 997), \
+                mock.patch.object(ss.json, "loads", wraps=json.loads) as decoded:
+            self.assertEqual(self._summary(raw), ({"u": [40, 300], "t": []}, {}))
+        # Only the two top-level keys are ever decoded.
+        self.assertEqual(decoded.call_count, 2)
+
+    def test_placeholder_hits_match_the_stripped_text_scan(self) -> None:
+        pattern = PLACEHOLDER_TEXT_PATTERNS[0]
+        spread = " \r\n".join(pattern)
+        for raw in (spread.encode("utf-8"), b"\xff" + spread.encode("utf-8") + b"\xfe",
+                    b'{"u": [1, 2]}'):
+            text = raw.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+            compact = text.replace(" ", "").replace("\n", "")
+            expected = [p for p in PLACEHOLDER_TEXT_PATTERNS if p in compact]
+            self.path.write_bytes(raw)
+            for chunk in (1, 3, ss.CHUNK_BYTES):
+                with self.subTest(raw=raw, chunk=chunk), \
+                        mock.patch.object(ss, "CHUNK_BYTES", chunk):
+                    self.assertEqual(
+                        ss.placeholder_hits(self.path, PLACEHOLDER_TEXT_PATTERNS), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1494,6 +1494,33 @@ end program shallow_water2d_runner
             )
             self.assertEqual({"run_test_001"}, {e.exec_dir.name for e in scoped})
 
+    def test_parallel_jobs_report_is_identical_to_serial(self) -> None:
+        """--jobs N runs each execution's rules on a worker; the merged report must be
+        byte-identical to the serial one, including which sibling run owns the shared
+        source's structural findings."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            _seed_shape_expr_schema_into(repo_root)
+            _create_minimal_execution_tree(
+                repo_root,
+                dep_spec_id="dynamics_shallow_water_flux_2d_rusanov_p0",
+                model_text="module shallow_water2d_model\nend module shallow_water2d_model\n",
+                runner_text="program r\nend program r\n",
+                run_command=["./simulate", "workspace/spec.ir.yaml", "workspace/outdir"],
+            )
+            node_safe = "problem__shallow_water2d__0.3.0"
+            runs = (repo_root / "workspace" / "pipelines" / node_safe
+                    / "shallow-water2d_20260415_001" / "runs")
+            for run_id in ("run_test_002", "run_test_003"):
+                shutil.copytree(runs / "run_test_001", runs / run_id)
+            (runs / "run_test_002" / node_safe / "perf.json").unlink()
+            (runs / "run_test_003" / node_safe / "raw" / "metrics_basis.json").unlink()
+
+            serial = validate(repo_root=repo_root, workspace_root="workspace")
+            parallel = validate(repo_root=repo_root, workspace_root="workspace", jobs=3)
+            self.assertTrue(serial)
+            self.assertEqual(serial, parallel)
+
     def test_required_raw_evidence_execution_trace_is_ir_driven(self) -> None:
         """RC1: execution_trace.json must be IR-driven, not a fixed default.
 
@@ -12966,6 +12993,62 @@ end program shallow_water2d_runner
                 f"Expected no trivial placeholder violation, got: {violations}",
             )
 
+    def test_numeric_leaf_triviality_matches_the_per_leaf_walk(self) -> None:
+        """The row-at-a-time triviality check agrees with collecting every leaf and counting
+        the non-zero ones, including bools, NaN, nulls and the depth limit."""
+        from tools.validate_pipeline_semantics import _numeric_leaf_triviality
+
+        def leaves(obj, depth=0):
+            if depth > 8 or isinstance(obj, bool):
+                return []
+            if isinstance(obj, (int, float)):
+                return [float(obj)]
+            if obj is None:
+                return [None]
+            items = obj.values() if isinstance(obj, dict) else obj if isinstance(obj, list) else []
+            return [leaf for item in items for leaf in leaves(item, depth + 1)]
+
+        def reference(obj):
+            found = leaves(obj)
+            if not found:
+                return None
+            return not any(v is not None and v != 0.0 for v in found)
+
+        deep = 1.0
+        for _ in range(9):
+            deep = [deep]
+        for doc in (
+            {"a": [0.0, 0, None, -0.0]}, {"a": [0.0, True]}, {"a": [False, 0]},
+            {"a": [float("nan")]}, {"a": [[0.0] * 50, [0.0] * 49 + [2e-300]]},
+            {"a": "1", "b": ["x", None]}, {"a": []}, {"a": {"b": [0, {"c": 3}]}},
+            {"deep": deep}, {"deep": [0.0, deep]}, {"a": [None, None]}, {},
+        ):
+            with self.subTest(doc=doc):
+                self.assertEqual(_numeric_leaf_triviality(doc), reference(doc))
+
+    def test_evidence_documents_are_parsed_once_per_execution_pass(self) -> None:
+        from unittest import mock
+
+        import tools.validate_pipeline_semantics as vps
+
+        with tempfile.TemporaryDirectory() as tmp:
+            good = Path(tmp) / "diagnostics.json"
+            good.write_text('{"checks": {}}', encoding="utf-8")
+            bad = Path(tmp) / "metrics_basis.json"
+            bad.write_text("{", encoding="utf-8")
+            with mock.patch.object(vps, "_read_json", wraps=vps._read_json) as read:
+                token = vps._active_evidence_documents.set({})
+                try:
+                    self.assertIs(vps._read_evidence_json(good), vps._read_evidence_json(good))
+                    for _ in range(2):
+                        with self.assertRaises(json.JSONDecodeError):
+                            vps._read_evidence_json(bad)
+                finally:
+                    vps._active_evidence_documents.reset(token)
+                self.assertEqual(read.call_count, 2)
+                vps._read_evidence_json(good)
+                self.assertEqual(read.call_count, 3)
+
     def test_shape_expr_schema_load_is_lazy_and_errors_are_structured(self) -> None:
         """Regression: a missing or malformed shape_expr schema must NOT crash
         at import time (which would block `--help` and unrelated CLI flows).
@@ -19531,6 +19614,35 @@ class ImplDefaultsKnobNameGateTests(unittest.TestCase):
     def test_nested_accepts_a_bool(self) -> None:
         self.assertEqual(self._run(self._impl(overrides={"openmp": {"nested": False}})), [])
 
+    def test_affinity_knobs_are_pinned_strings(self) -> None:
+        # Validate.execute passes them to OMP_PLACES / OMP_PROC_BIND; a non-string would be
+        # dropped there, so the gate names it instead.
+        self.assertEqual(self._run(self._impl(
+            overrides={"openmp": {"places": "cores", "proc_bind": "close"}})), [])
+        v = self._run(self._impl(overrides={"openmp": {"places": 4, "proc_bind": ["close"]}}))
+        self.assertEqual(len(v), 2, v)
+        self.assertIn("impl_defaults.backend_overrides.openmp.places must be str, got int", v[0])
+        self.assertIn("openmp.proc_bind must be str, got list", v[1])
+        # Pinned, so a wrong-cased spelling is now the canonical knob unread.
+        v = self._run(self._impl(overrides={"openmp": {"Proc_Bind": "spread"}}))
+        self.assertEqual(len(v), 1, v)
+        self.assertIn("is the canonical knob `proc_bind` spelled inexactly", v[0])
+
+    def test_affinity_values_follow_the_run_program_grammar(self) -> None:
+        # run_program refuses these values; refusing them here keeps a typo from surfacing only
+        # as a Validate.execute transport failure after a full Generate and Build.
+        for places, proc_bind in (("threads(4)", "spread,close"), ("{0:4},{4:4}", "true"),
+                                  (" Sockets ", "MASTER"), ("0,2,4", "false")):
+            self.assertEqual(self._run(self._impl(
+                overrides={"openmp": {"places": places, "proc_bind": proc_bind}})), [],
+                (places, proc_bind))
+        v = self._run(self._impl(overrides={"openmp": {"places": "banana",
+                                                       "proc_bind": "spread;close"}}))
+        self.assertEqual(len(v), 2, v)
+        self.assertIn("openmp.places must be `threads`, `cores`", v[0])
+        self.assertIn("got 'banana'", v[0])
+        self.assertIn("openmp.proc_bind must be `true`, `false`", v[1])
+
     def test_non_string_keys_do_not_crash(self) -> None:
         # A YAML mapping may carry a non-string key (`2:`, `true:`, `~:`). `sorted()` over mixed
         # types raised TypeError, which replaced the whole `FAIL - <violation>` report with a
@@ -19591,7 +19703,7 @@ class ImplDefaultsKnobNameGateTests(unittest.TestCase):
         # The exact-spelling rule applies ONLY to the pinned family; the knob layer stays open.
         self.assertEqual(self._run(self._impl(
             abstract={"Wavefront_Depth": 3, "MEMORY_LAYOUT": "column_major"},
-            overrides={"openmp": {"Proc_Bind": "spread"}})), [])
+            overrides={"openmp": {"Wait_Policy": "passive"}})), [])
 
     def test_backend_key_named_override_section_flagged(self) -> None:
         # The motivating harm itself: three live IRs request 4 threads under `cpu_openmp` and run on
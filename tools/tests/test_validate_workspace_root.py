@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import tempfile
 import time
@@ -11,6 +12,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from tools import validate_workspace_root as vwr
 from tools.validate_workspace_root import validate, validate_with_scope
 
 
@@ -1600,5 +1602,71 @@ class ValidateWorkspaceRootTests(unittest.TestCase):
             self.assertTrue(any("non-directory entry directly under workspace/tmp/" in v for v in violations))
 
 
+class WorkspaceScanTests(unittest.TestCase):
+    """The one-pass inventory and the persisted JSON scan cursor."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        self.ws = self.repo / "workspace"
+        plan = self.ws / "plans" / "node" / "plan_001"
+        plan.mkdir(parents=True)
+        self.bad = plan / "plan.json"
+        self.bad.write_text(json.dumps({"plan_dir": "/abs"}), encoding="utf-8")
+        (plan / "ok.json").write_text("{}", encoding="utf-8")
+        outside = self.repo / "outside"
+        outside.mkdir()
+        (outside / "linked.json").write_text("{", encoding="utf-8")
+        (outside / "linked.py").write_text("", encoding="utf-8")
+        os.symlink(outside, plan / "linked_dir")
+        os.symlink(outside / "linked.json", plan / "alias.json")
+
+    def _scan(self, cursor: bool = True) -> list[str]:
+        violations, _ = validate_with_scope(
+            repo_root=self.repo, workspace_root="workspace", write_scope_baseline=None,
+            stage="", node_key="", pipeline_id="", scan_cursor=cursor)
+        return violations
+
+    def test_the_inventory_lists_what_rglob_lists(self) -> None:
+        inventory = vwr._WorkspaceInventory(self.ws)
+        for suffix in (".json", ".py"):
+            self.assertEqual(inventory.named(suffix), sorted(self.ws.rglob(f"*{suffix}")))
+        self.assertEqual(sorted(inventory.subtree(self.ws / "plans")),
+                         sorted((self.ws / "plans").rglob("*")))
+        # A symlinked directory is listed but not entered, as by rglob.
+        self.assertIsNone(inventory.subtree(self.bad.parent / "linked_dir"))
+
+    def _rescanned(self) -> tuple[list[str], set[str]]:
+        with patch.object(vwr, "_scan_json_for_violations",
+                          wraps=vwr._scan_json_for_violations) as scan:
+            violations = self._scan()
+        # The cursor itself is rewritten by every run, so it is always read afresh.
+        return violations, {c.args[0].name for c in scan.call_args_list} - {
+            vwr.SCAN_CURSOR_FILENAME}
+
+    def test_an_unchanged_file_replays_its_findings_and_an_edit_rescans(self) -> None:
+        first = self._scan()
+        self.assertEqual(first, self._scan(cursor=False))
+        self.assertTrue((self.repo / vwr._GATE_CACHE_DIR / vwr.SCAN_CURSOR_FILENAME).is_file())
+        # Every file was written just now, inside the racy-clean window: none was recorded.
+        self.assertEqual(self._rescanned()[1], {"plan.json", "ok.json", "alias.json"})
+        with patch.object(vwr, "_SCAN_CURSOR_RACY_NS", 0):
+            self._scan()
+            self.assertEqual(self._rescanned(), (first, set()))
+            # Same size, same mtime: the ctime still moves, so the edit is seen.
+            st = self.bad.stat()
+            self.bad.write_text(json.dumps({"plan_dir": "/xyz"}), encoding="utf-8")
+            os.utime(self.bad, ns=(st.st_atime_ns, st.st_mtime_ns))
+            violations, rescanned = self._rescanned()
+            self.assertEqual(rescanned, {"plan.json"})
+            self.assertTrue(any("/xyz" in v for v in violations))
+
+    def test_library_calls_do_not_touch_the_cursor(self) -> None:
+        self._scan(cursor=False)
+        validate(repo_root=self.repo, workspace_root="workspace")
+        self.assertFalse((self.repo / vwr._GATE_CACHE_DIR).exists())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -850,6 +850,14 @@ class _FakeConductor(wc.Conductor):
     def _write_dependency_graph(self, refs):  # type: ignore[override]
         return None
 
+    # Likewise for the content-digest record: there is no spec or IR under the fake repo_root
+    # to hash. The real writer is covered by `WriteContentDigestTest`.
+    def _snapshot_content_digest_inputs(self, refs):  # type: ignore[override]
+        return None
+
+    def _write_content_digest(self, refs):  # type: ignore[override]
+        return None
+
     # configurable hooks (default: everything passes)
     status_fn = None  # (phase, substep, n) -> "pass"|"fail"
     decision_fn = None  # (phase, outcomes) -> RouteDecision
@@ -11796,6 +11804,50 @@ class WriteDependencySurfaceTest(unittest.TestCase):
                 (repo / refs.ir_ref / "dependency_surface.json").exists())
 
 
+class WriteContentDigestTest(unittest.TestCase):
+    """R6 proper: once Compile passes the conductor records <ir_ref>/content_digest.json, bound to
+    the inputs it snapshotted at Compile start rather than to the files as they are afterwards."""
+
+    def test_records_the_inputs_snapshotted_at_compile_start(self) -> None:
+        from tools import content_digest
+        from tools.orchestration_runtime import _load_spec_catalog
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            _load_spec_catalog.cache_clear()
+            (repo / "spec" / "registry").mkdir(parents=True)
+            (repo / "spec" / "registry" / "spec_catalog.yaml").write_text(
+                "catalog_version: 0.2.0\nspecs:\n"
+                "  - spec_kind: component\n    spec_id: top\n    spec_version: \"0.1.0\"\n"
+                "    deps_path: spec/component/top/deps.yaml\n", encoding="utf-8")
+            spec = repo / "spec" / "component" / "top"
+            spec.mkdir(parents=True)
+            (spec / "deps.yaml").write_text(
+                "spec_id: top\nspec_kind: component\ndependencies:\n"
+                "  components: []\n  profiles: []\n", encoding="utf-8")
+            (spec / "controlled_spec.md").write_text("top v1\n", encoding="utf-8")
+            (spec / "tests.md").write_text("t\n", encoding="utf-8")
+            refs = wc.NodeRefs(node_key="component/top@0.1.0", spec_path="spec/component/top",
+                               ir_id="i", pipeline_id="p", source_id="s", binary_id="b")
+            c = _FakeConductor(repo_root=repo, orchestration_id="o",
+                               orchestration_agent_run_id="ORCH", llm_config=_cfg("claude"),
+                               env={})
+            wc.Conductor._snapshot_content_digest_inputs(c, refs)
+            (spec / "controlled_spec.md").write_text("top v2, edited mid-compile\n",
+                                                     encoding="utf-8")
+            (repo / refs.ir_ref).mkdir(parents=True)
+            (repo / refs.ir_ref / "spec.ir.yaml").write_text("spec_id: top\n", encoding="utf-8")
+            wc.Conductor._write_content_digest(c, refs)
+            record = json.loads((repo / refs.ir_ref / content_digest.SIDECAR_NAME).read_text(
+                encoding="utf-8"))
+            self.assertEqual(record["node_key"], "component/top@0.1.0")
+            self.assertEqual(record["generated_by"], "conductor")
+            current = content_digest.derivation_inputs(
+                repo, "spec/component/top", spec_kind="component", spec_id="top")
+            self.assertNotEqual(record["derivation_key"], current["derivation_key"])
+            self.assertEqual(content_digest.stale_reasons(record, current, repo / refs.ir_ref),
+                             ["controlled_spec.md changed"])
+
+
 class WriteLineageTest(unittest.TestCase):
     """P2: lineage.json is authored host-side by the conductor (it lives at the pipeline
     root, which must stay non-writable to the sandboxed leaf)."""
@@ -12795,6 +12847,25 @@ class WriteMakefileTest(unittest.TestCase):
             # canonical src/ of the depending node is never touched (no top model written)
             self.assertFalse((repo / refs.source_dir() / "src").exists())
 
+    def test_dependency_artifact_sets_sit_beside_the_staged_binaries(self) -> None:
+        # Each dependency's published set is looked up beside the SAME binary its source is
+        # staged from, and keyed by the staged basename the compile cache's units use.
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            refs = wc.NodeRefs(node_key="component/top@0.1.0", spec_path="spec/component/top",
+                               ir_id="i", pipeline_id="p", source_id="s", binary_id="b")
+            self._write_dep_ir(repo, refs)
+            base = self._seed_dep_pipeline(repo, "component/base@0.1.0", "base_20260101_001",
+                                           "src_base", "module base_model\nend module base_model\n")
+            mid = self._seed_dep_pipeline(repo, "component/mid@0.1.0", "mid_20260101_001",
+                                          "src_mid", "module mid_model\nend module mid_model\n",
+                                          binary_id="bin_20260101_002")
+            sets = self._conductor(repo)._dependency_artifact_sets(refs)
+            self.assertEqual(sets, {
+                base.name: base.parents[3] / "binary" / "bin_20260101_001" / "artifacts",
+                mid.name: mid.parents[3] / "binary" / "bin_20260101_002" / "artifacts",
+            })
+
     def test_stage_dependency_sources_binds_to_certified_binary_source(self) -> None:
         # Regression (Codex P2): when lineage.json has advanced to a NEWER source than the
         # certified binary was built from, staging must use the CERTIFIED binary's
@@ -13799,6 +13870,114 @@ class DeterministicBuildTest(unittest.TestCase):
             self.assertEqual(meta["source_ir_id"], "ir_20260707_007")
             self.assertEqual(meta["source_source_id"], "src_20260707_003")
 
+    def test_build_inproc_reuses_cached_dependency_objects_and_reports_them(self) -> None:
+        # The second Build of a dependent finds the closure's objects in the compile cache,
+        # primed into its OBJDIR before compile_project, and binary_meta records the hits.
+        import sys
+        import tempfile
+        from unittest import mock
+        sys.path.insert(0, str(Path("mcp_servers").resolve()))
+        import build_runtime_server  # type: ignore
+        from tools import compile_cache
+
+        with tempfile.TemporaryDirectory() as td:
+            repo = Path(td)
+            c = wc.Conductor(repo_root=repo, orchestration_id="t",
+                             orchestration_agent_run_id="x", llm_config=_cfg("claude"), env={})
+            refs = wc.NodeRefs(
+                node_key="component/spec_x@0.1.0", spec_path="spec/component/spec_x",
+                ir_id="x_1", pipeline_id="x_1", source_id="src_1", binary_id="bin_1")
+            (repo / refs.ir_ref).mkdir(parents=True, exist_ok=True)
+            (repo / refs.source_dir() / "src").mkdir(parents=True, exist_ok=True)
+
+            def fake_stage(refs, obj_dir):
+                obj_dir.mkdir(parents=True, exist_ok=True)
+                (obj_dir / "dep_model.f90").write_text("module dep_model\nend module dep_model\n")
+                return ["workspace/pipelines/dep/source/s/src/dep_model.f90"]
+
+            compiled: list[bool] = []
+
+            def fake_compile(args):
+                obj_dir = Path(args["extra_args"][0].split("=", 1)[1])
+                compiled.append(not (obj_dir / "dep_model.o").exists())
+                if compiled[-1]:
+                    (obj_dir / "dep_model.o").write_bytes(b"obj")
+                    (obj_dir / "dep_model.mod").write_bytes(b"iface")
+                (repo / refs.binary_dir() / "bin").mkdir(parents=True, exist_ok=True)
+                (repo / refs.binary_dir() / "bin" / "spec_x_runner").write_text("x")
+                return {"ok": True, "return_code": 0, "command_id": "cid"}
+
+            metas = []
+            with mock.patch.object(build_runtime_server, "tool_compile_project", fake_compile), \
+                    mock.patch.object(c, "_stage_dependency_sources", fake_stage), \
+                    mock.patch.object(compile_cache, "compiler_identity", lambda fc: "fc 1"):
+                for child in ("child-1", "child-2"):
+                    c._build_inproc(refs, child, "captok")
+                    metas.append(json.loads(
+                        (repo / refs.binary_dir() / "binary_meta.json").read_text()))
+
+            self.assertEqual(compiled, [True, False])
+            self.assertEqual(metas[0]["compile_cache"]["misses"], ["dep_model.f90"])
+            self.assertEqual(metas[0]["compile_cache"]["stored"], 1)
+            self.assertEqual(metas[1]["compile_cache"]["hits"], ["dep_model.f90"])
+            self.assertEqual(
+                (repo / "workspace" / "tmp" / "child-2" / "build" / "dep_model.mod").read_bytes(),
+                b"iface")
+
+    def test_build_inproc_publishes_the_model_artifact_set_beside_binary_meta(self) -> None:
+        # A passing Build publishes its own model unit for its dependents: the object and the
+        # interface file, with the source named as a dependent will stage it.
+        import sys
+        import tempfile
+        from unittest import mock
+        sys.path.insert(0, str(Path("mcp_servers").resolve()))
+        import build_runtime_server  # type: ignore
+        from tools import compile_cache
+
+        with tempfile.TemporaryDirectory() as td:
+            repo = Path(td)
+            c = wc.Conductor(repo_root=repo, orchestration_id="t",
+                             orchestration_agent_run_id="x", llm_config=_cfg("claude"), env={})
+            refs = wc.NodeRefs(
+                node_key="component/spec_x@0.1.0", spec_path="spec/component/spec_x",
+                ir_id="x_1", pipeline_id="x_1", source_id="src_1", binary_id="bin_1")
+            (repo / refs.ir_ref).mkdir(parents=True, exist_ok=True)
+            src = repo / refs.source_dir() / "src"
+            src.mkdir(parents=True, exist_ok=True)
+            (src / "spec_x_model.f90").write_text("module spec_x_model\nend module spec_x_model\n")
+
+            def fake_compile(args):
+                obj_dir = Path(args["extra_args"][0].split("=", 1)[1])
+                obj_dir.mkdir(parents=True, exist_ok=True)
+                (obj_dir / "spec_x_model.o").write_bytes(b"obj")
+                (obj_dir / "spec_x_model.mod").write_bytes(b"iface")
+                (repo / refs.binary_dir() / "bin").mkdir(parents=True, exist_ok=True)
+                (repo / refs.binary_dir() / "bin" / "spec_x_runner").write_text("x")
+                return {"ok": True, "return_code": 0, "command_id": "cid"}
+
+            gate = subprocess.CompletedProcess([], 0, "", "")
+            with mock.patch.object(build_runtime_server, "tool_compile_project", fake_compile), \
+                    mock.patch.object(compile_cache, "compiler_identity", lambda fc: "fc 1"), \
+                    mock.patch.object(wc.subprocess, "run", return_value=gate):
+                c._build_inproc(refs, "child-1", "captok")
+
+            meta = json.loads((repo / refs.binary_dir() / "binary_meta.json").read_text())
+            self.assertEqual(meta["artifact_set_ref"], f"{refs.binary_dir()}/artifacts")
+            self.assertNotIn("compile_cache", meta)  # a leaf stages no closure
+            manifest = json.loads(
+                (repo / refs.binary_dir() / "artifacts" / "entry.json").read_text())
+            self.assertEqual(manifest["source"], "spec_x_model.f90")
+            self.assertEqual(sorted(manifest["files"]), ["spec_x_model.mod", "spec_x_model.o"])
+
+            # A failing rebuild under the same binary_id withdraws the set.
+            with mock.patch.object(build_runtime_server, "tool_compile_project",
+                                   lambda args: {"ok": False, "return_code": 2}), \
+                    mock.patch.object(compile_cache, "compiler_identity", lambda fc: "fc 1"):
+                c._build_inproc(refs, "child-2", "captok")
+            meta = json.loads((repo / refs.binary_dir() / "binary_meta.json").read_text())
+            self.assertNotIn("artifact_set_ref", meta)
+            self.assertFalse((repo / refs.binary_dir() / "artifacts").exists())
+
     def test_execute_inproc_injects_spec_and_cases_env(self) -> None:
         # Validate.execute must run `make test` with the SAME runner argv run_program uses
         # (--cases <spec> <case_id>...), so the make-test re-run's diagnostics match for the
@@ -14566,7 +14745,9 @@ class DeterministicBuildTest(unittest.TestCase):
     def _b1_execute(self, repo: Path, ir_yaml: str, *, gate_result: tuple[int, str],
                     matching_diagnostics: bool,
                     diagnostics: dict | None = None,
-                    syn_result: tuple[int, str] | None = None) -> tuple[dict, dict]:
+                    syn_result: tuple[int, str] | None = None,
+                    perf: dict | None = None,
+                    calls: dict | None = None) -> tuple[dict, dict]:
         """Drive _execute_inproc with the two gate subprocesses stubbed to `gate_result`
         (returncode, stdout) and the runner/make-test diagnostics seeded so the quality_check
         passes (matching_diagnostics) or fails. Returns (result, trial_meta-or-{}).
@@ -14574,7 +14755,10 @@ class DeterministicBuildTest(unittest.TestCase):
         `syn_result` gives `check_artifact_syntax.py` its own (returncode, stdout) when a test
         needs the two gates to disagree — the post_execute validator's exit code is the one that
         classifies, and only a differing pair shows that. It defaults to `gate_result`, which is
-        what every caller predating the exit-code channel passes."""
+        what every caller predating the exit-code channel passes.
+
+        `perf` seeds the runner's perf.json; `calls`, when given, collects the arguments of the
+        run_program and run_quality_checks calls under those two names."""
         import sys
         import subprocess as _sp
         from unittest import mock
@@ -14596,6 +14780,8 @@ class DeterministicBuildTest(unittest.TestCase):
         diag = diagnostics or {"checks": {"k": {"status": "pass"}},
                                "verdict": {"overall": "pass"}}
         (run_tmp / "diagnostics.json").write_text(json.dumps(diag), encoding="utf-8")
+        if perf is not None:
+            (run_tmp / "perf.json").write_text(json.dumps(perf), encoding="utf-8")
         if matching_diagnostics:
             qc_tmp.mkdir(parents=True, exist_ok=True)
             (qc_tmp / "diagnostics.json").write_text(json.dumps(diag), encoding="utf-8")
@@ -14611,10 +14797,19 @@ class DeterministicBuildTest(unittest.TestCase):
                 return _sp.CompletedProcess(argv, syn_rc, stdout=syn_out, stderr="")
             return _sp.CompletedProcess(argv, rc, stdout=out, stderr="")
 
-        with mock.patch.object(build_runtime_server, "tool_run_program",
-                               lambda a: {"ok": True, "command_id": "R"}), \
+        seen = calls if calls is not None else {}
+
+        def fake_run_program(args):
+            seen["run_program"] = args
+            return {"ok": True, "command_id": "R"}
+
+        def fake_run_quality_checks(args):
+            seen["run_quality_checks"] = args
+            return {"ok": True, "command_id": "Q"}
+
+        with mock.patch.object(build_runtime_server, "tool_run_program", fake_run_program), \
              mock.patch.object(build_runtime_server, "tool_run_quality_checks",
-                               lambda a: {"ok": True, "command_id": "Q"}), \
+                               fake_run_quality_checks), \
              mock.patch.object(wc.subprocess, "run", fake_subprocess_run):
             result = c._execute_inproc(refs, "child-1", "captok")
 
@@ -14622,6 +14817,84 @@ class DeterministicBuildTest(unittest.TestCase):
         meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
         return result, meta
 
+    def test_execute_inproc_runs_at_the_ir_thread_count_and_records_it(self) -> None:
+        import tempfile
+        ir = (self._B1_IR_MINIMAL
+              + "  backend_overrides:\n    openmp:\n      num_threads: 4\n"
+                "      places: cores\n      proc_bind: close\n")
+        calls: dict = {}
+        with tempfile.TemporaryDirectory() as td:
+            repo = Path(td)
+            _out, meta = self._b1_execute(
+                repo, ir, gate_result=(0, ""), matching_diagnostics=True, calls=calls,
+                perf={"walltime_sec": 1.0, "throughput_cells_per_sec": 2.0,
+                      "parallelism": {"mpi_ranks": 1, "threads_per_rank": 1,
+                                      "gpu_devices": 0, "parallel_degree_total": 1}})
+            run_args = calls["run_program"]
+            self.assertEqual(run_args["threads_per_rank"], 4)
+            self.assertEqual((run_args["omp_places"], run_args["omp_proc_bind"]),
+                             ("cores", "close"))
+            # The make-test re-run is the single-thread side of the comparison.
+            self.assertEqual(calls["run_quality_checks"]["threads_per_rank"], 1)
+
+            env = meta["environment"]
+            self.assertEqual(env["threads_per_rank"], 4)
+            self.assertEqual(env["openmp_env"]["OMP_NUM_THREADS"], "4")
+            self.assertEqual(env["parallelism"], {
+                "threads_per_rank": 4, "places": "cores", "proc_bind": "close",
+                "source": "impl_defaults.backend_overrides.openmp"})
+            # The runner rendered one thread while the run was given four: the evidence is
+            # kept as the runner wrote it and the disagreement is recorded beside it.
+            self.assertEqual(env["parallelism_mismatch"], {
+                "threads_per_rank": {"reported": 1, "applied": 4}})
+            node_dir = repo / self._b1_refs().run_node_dir()
+            perf = json.loads((node_dir / "perf.json").read_text(encoding="utf-8"))
+            self.assertEqual(perf["parallelism"], {
+                "mpi_ranks": 1, "threads_per_rank": 1, "gpu_devices": 0,
+                "parallel_degree_total": 1})
+            qc = json.loads((node_dir / "quality_check.json").read_text(encoding="utf-8"))
+            self.assertEqual(qc["comparison"]["reference"]["threads_per_rank"], 4)
+            self.assertEqual(qc["comparison"]["candidate"]["threads_per_rank"], 1)
+
+    def test_execute_inproc_without_a_thread_knob_stays_single_threaded(self) -> None:
+        import tempfile
+        calls: dict = {}
+        with tempfile.TemporaryDirectory() as td:
+            _out, meta = self._b1_execute(Path(td), self._B1_IR_MINIMAL, gate_result=(0, ""),
+                                          matching_diagnostics=True, calls=calls)
+        self.assertEqual(calls["run_program"]["threads_per_rank"], 1)
+        self.assertNotIn("omp_places", calls["run_program"])
+        # A single-thread primary run leaves the re-run on the make default.
+        self.assertNotIn("threads_per_rank", calls["run_quality_checks"])
+        self.assertEqual(meta["environment"]["parallelism"]["threads_per_rank"], 1)
+
+    def test_execute_inproc_records_no_mismatch_when_the_runner_agrees(self) -> None:
+        import tempfile
+        ir = (self._B1_IR_MINIMAL
+              + "  backend_overrides:\n    openmp:\n      num_threads: 2\n")
+        perf = {"walltime_sec": 1.0, "throughput_cells_per_sec": 2.0,
+                "parallelism": {"mpi_ranks": 1, "threads_per_rank": 2,
+                                "gpu_devices": 0, "parallel_degree_total": 2}}
+        with tempfile.TemporaryDirectory() as td:
+            _out, meta = self._b1_execute(Path(td), ir, gate_result=(0, ""),
+                                          matching_diagnostics=True, perf=perf)
+        self.assertEqual(meta["environment"]["parallelism_mismatch"], {})
+
+    def test_execute_parallelism_reads_the_thread_count_the_runner_renders(self) -> None:
+        # perf.json#parallelism is rendered by the runner from the same knob; the two readers
+        # must agree on every spelling of it, or the evidence misstates the run.
+        from tools.backends.language.fortran import runner
+        for value in (4, "8", 2.0, 0, -3, True, None, "many", [2]):
+            omp = {} if value is None else {"num_threads": value}
+            impl = {"backend_overrides": {"openmp": omp}}
+            with self.subTest(value=value):
+                self.assertEqual(
+                    wc.Conductor._execute_parallelism(impl)["threads_per_rank"],
+                    runner._threads({"impl_defaults": impl}))
+        self.assertEqual(wc.Conductor._execute_parallelism(
+            {"backend_overrides": {"openmp": {"places": 4, "proc_bind": " spread "}}}),
+            {"threads_per_rank": 1, "proc_bind": "spread"})
+
     def test_execute_inproc_records_post_execute_violation(self) -> None:
         # A genuine gate report (the gate RAN and exited non-zero) becomes the category and its
         # text becomes the excerpt the warm repair leaf receives.
@@ -15865,6 +16138,40 @@ class DeterministicGateTest(unittest.TestCase):
             self.assertEqual(
                 c.determine_substep_status(refs, "generate", "gate", paths)[0], "pass")
 
+    def test_lint_and_syntax_run_concurrently(self) -> None:
+        """lint and syntax overlap: each checker waits at a two-party barrier that only opens
+        when the other is running too, so a sequential gate would time out here. The verdict
+        keeps the canonical syntax -> lint order regardless of which finishes first."""
+        import contextlib
+        import tempfile
+        import threading
+        with tempfile.TemporaryDirectory() as td:
+            repo = Path(td)
+            refs = self._refs()
+            self._seed(repo, refs)
+            c = self._conductor(repo)
+            barrier = threading.Barrier(2, timeout=10)
+
+            def linter(args):
+                barrier.wait()
+                return {"ok": False, "return_code": 1, "command_id": "cid",
+                        "preset": "fortitude", "stdout": "S001 line too long"}
+
+            def syntax(args):
+                if not str(args.get("project_dir", "")).endswith("_canary"):
+                    barrier.wait()
+                return self._syntax_fail(args)
+
+            with contextlib.ExitStack() as stack:
+                for p in self._patches(linter, syntax):
+                    stack.enter_context(p)
+                out = c._gate_inproc(refs, "child-1", "captok")
+
+            self.assertEqual(out["returncode"], 0)
+            meta = json.loads((repo / refs.source_dir() / "gate_meta.json").read_text())
+            self.assertEqual(meta["failure_categories"], ["syntax_error", "lint_findings"])
+            self.assertEqual(meta["checkers"]["static"]["status"], "skipped")
+
     def test_syntax_runtimeerror_suppresses_gate_meta_and_is_transport_fail(self) -> None:
         """New test 5: a syntax attribution RuntimeError (fail_closed) dominates a co-occurring
         lint content-fail — it propagates, so NO gate_meta is written and the substep is a
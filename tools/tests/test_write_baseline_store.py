@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Tests for the compact write-baseline store (tools/write_baseline_store.py)."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from tools import orchestration_runtime as ort
+from tools import write_baseline_store as store
+
+OID = "orch_baseline_store"
+
+
+def _digest(text: str) -> str:
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class StoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.base_dir = self.root / store.BASE_DIRNAME
+        self.files = {f"workspace/n{i:03d}/ir/näme.json": _digest(str(i)) for i in range(200)}
+        self.files["workspace/vanished.txt"] = "sha256:missing"
+        self.addCleanup(store._BASE_CACHE.clear)
+
+    def _save(self, name: str, files: dict[str, str]) -> dict:
+        payload = {"orchestration_id": OID, "agent_run_id": name,
+                   "created_at": "2026-01-01T00:00:00Z", "files": files}
+        store.save_baseline(self.root / f"{name}.bin", self.base_dir, payload)
+        return payload
+
+    def test_a_saved_baseline_loads_back_unchanged(self) -> None:
+        payload = self._save("a1", self.files)
+        store._BASE_CACHE.clear()
+        self.assertEqual(store.load_baseline(self.root / "a1.bin", self.base_dir), payload)
+        self.assertLess((self.root / "a1.bin").stat().st_size, 1024)
+
+    def test_a_later_run_is_stored_as_a_delta_against_the_shared_base(self) -> None:
+        self._save("a1", self.files)
+        changed = dict(self.files)
+        changed["workspace/n000/ir/näme.json"] = _digest("edited")
+        del changed["workspace/n001/ir/näme.json"]
+        changed["workspace/new.f90"] = _digest("new")
+        payload = self._save("a2", changed)
+        self.assertEqual(len(list(self.base_dir.glob("*.bin"))), 1)
+        header, delta, removed = store.decode((self.root / "a2.bin").read_bytes())
+        self.assertEqual(len(delta), 2)
+        self.assertEqual(removed, ["workspace/n001/ir/näme.json"])
+        self.assertEqual(store.load_baseline(self.root / "a2.bin", self.base_dir), payload)
+        self.assertEqual(store.load_baseline(self.root / "a1.bin", self.base_dir)["files"],
+                         self.files)
+
+    def test_a_large_delta_starts_a_new_base(self) -> None:
+        self._save("a1", self.files)
+        payload = self._save("a2", {p: _digest("x" + p) for p in self.files})
+        self.assertEqual(len(list(self.base_dir.glob("*.bin"))), 2)
+        self.assertEqual(store.load_baseline(self.root / "a2.bin", self.base_dir), payload)
+
+    def test_a_tampered_base_is_refused(self) -> None:
+        self._save("a1", self.files)
+        store._BASE_CACHE.clear()
+        base = next(self.base_dir.glob("*.bin"))
+        data = bytearray(base.read_bytes())
+        data[-1] ^= 1
+        base.write_bytes(bytes(data))
+        with self.assertRaises(store.BaselineFormatError):
+            store.load_baseline(self.root / "a1.bin", self.base_dir)
+
+
+class RuntimeBaselineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name)
+        (self.repo / "workspace" / "orchestrations" / OID).mkdir(parents=True)
+        (self.repo / "spec").mkdir()
+        (self.repo / "spec" / "a.md").write_text("a", encoding="utf-8")
+
+    def test_the_runtime_writes_only_the_compact_form_and_exports_json(self) -> None:
+        legacy = ort._run_write_baseline_path(self.repo, OID, agent_run_id="a1")
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({"files": {}}), encoding="utf-8")
+        payload = ort._write_run_write_baseline(self.repo, OID, agent_run_id="a1")
+        self.assertFalse(legacy.exists())
+        self.assertTrue(ort._run_write_baseline_store_path(self.repo, OID, agent_run_id="a1").is_file())
+        self.assertEqual(ort._load_run_write_baseline(self.repo, OID, agent_run_id="a1"), payload)
+        (self.repo / "spec" / "b.md").write_text("b", encoding="utf-8")
+        self.assertEqual(
+            ort._compute_changed_paths_against_baseline(self.repo, OID, agent_run_id="a1"),
+            ["spec/b.md"])
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            rc = ort.main(["export-write-baseline", "--repo-root", str(self.repo),
+                           "--orchestration-id", OID, "--agent-run-id", "a1"])
+        self.assertEqual(rc, 0)
+        self.assertEqual(json.loads(buf.getvalue())["files"], payload["files"])
+
+
+if __name__ == "__main__":
+    unittest.main()
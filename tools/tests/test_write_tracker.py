@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for inotify write tracking (tools/write_tracker.py) and its runtime consumer."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tools import orchestration_runtime as ort
+from tools import write_tracker
+
+OID = "orch_write_tracker"
+ARID = "a1"
+
+
+def _inotify_available() -> bool:
+    try:
+        write_tracker._Inotify().close()
+    except OSError:
+        return False
+    return True
+
+
+class WriteTrackingModeTests(unittest.TestCase):
+    def test_unset_is_the_full_diff_and_unknown_is_an_error(self) -> None:
+        self.assertEqual(write_tracker.write_tracking_mode({}), "diff")
+        self.assertEqual(
+            write_tracker.write_tracking_mode({"METDSL_WRITE_TRACKING": " INotify "}), "inotify")
+        with self.assertRaises(ValueError):
+            write_tracker.write_tracking_mode({"METDSL_WRITE_TRACKING": "fanotify"})
+
+
+@unittest.skipUnless(sys.platform.startswith("linux") and _inotify_available(),
+                     "inotify not available")
+class TrackedChangedPathsTests(unittest.TestCase):
+    """The tracked list must be the list the full baseline diff produces."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name).resolve()
+        self.orch = self.repo / "workspace" / "orchestrations" / OID
+        (self.orch / "agents" / ARID).mkdir(parents=True)
+        (self.repo / "spec" / "deep").mkdir(parents=True)
+        (self.repo / "spec" / "a.md").write_text("a", encoding="utf-8")
+        (self.repo / "spec" / "deep" / "b.md").write_text("b", encoding="utf-8")
+        (self.repo / "src").mkdir()
+        (self.repo / "src" / "keep.f90").write_text("k", encoding="utf-8")
+        self.enterContext(mock.patch.dict(os.environ, {"METDSL_WRITE_TRACKING": "inotify"}))
+        self.addCleanup(write_tracker.stop, write_tracker.state_path(self.orch, ARID))
+        self.assertTrue(ort._start_write_tracker(self.repo, OID, agent_run_id=ARID))
+        ort._write_run_write_baseline(self.repo, OID, agent_run_id=ARID)
+
+    def _full(self) -> list[str]:
+        return ort._compute_changed_paths_against_baseline(self.repo, OID, agent_run_id=ARID)
+
+    def test_creates_edits_deletes_and_moved_trees_are_all_reported(self) -> None:
+        (self.repo / "spec" / "a.md").write_text("edited", encoding="utf-8")
+        (self.repo / "src" / "new.f90").write_text("n", encoding="utf-8")
+        shutil.move(str(self.repo / "spec" / "deep"), str(self.repo / "moved"))
+        (self.repo / "fresh" / "sub").mkdir(parents=True)
+        (self.repo / "fresh" / "sub" / "c.md").write_text("c", encoding="utf-8")
+        (self.orch / "agents" / ARID / "runtime_owned.json").write_text("{}", encoding="utf-8")
+        checkpoint = ort._tracked_changed_paths(self.repo, OID, agent_run_id=ARID, final=False)
+        self.assertEqual(checkpoint, self._full())
+        (self.repo / "src" / "keep.f90").unlink()
+        final = ort._tracked_changed_paths(self.repo, OID, agent_run_id=ARID, final=True)
+        self.assertEqual(final, self._full())
+        self.assertIn("src/keep.f90", final)
+        self.assertIn("spec/deep/b.md", final)
+        self.assertIn("moved/b.md", final)
+        self.assertIn("fresh/sub/c.md", final)
+        # The watcher has delivered its final set; a retried terminal call takes the walk.
+        self.assertIsNone(ort._tracked_changed_paths(self.repo, OID, agent_run_id=ARID, final=True))
+
+    def test_a_finished_watcher_falls_back_to_the_full_diff(self) -> None:
+        write_tracker.stop(write_tracker.state_path(self.orch, ARID))
+        (self.repo / "spec" / "a.md").write_text("edited", encoding="utf-8")
+        self.assertIsNone(ort._tracked_changed_paths(self.repo, OID, agent_run_id=ARID, final=True))
+        self.assertEqual(
+            ort._actual_changed_paths_since_baseline(self.repo, OID, agent_run_id=ARID),
+            ["spec/a.md"])
+
+    def test_a_sampled_disagreement_is_recorded_and_the_full_diff_wins(self) -> None:
+        (self.repo / "spec" / "a.md").write_text("edited", encoding="utf-8")
+        with mock.patch.dict(os.environ, {"METDSL_WRITE_TRACKING_CROSS_CHECK": "always"}), \
+                mock.patch.object(ort, "_tracked_changed_paths", return_value=[]):
+            changed = ort._actual_changed_paths_since_baseline(self.repo, OID, agent_run_id=ARID)
+        self.assertEqual(changed, ["spec/a.md"])
+        record = self.orch / "agents" / ARID / "write_tracker_cross_check.json"
+        self.assertIn("spec/a.md", record.read_text(encoding="utf-8"))
+
+
+class WatcherExpiryTests(unittest.TestCase):
+    @unittest.skipUnless(sys.platform.startswith("linux") and _inotify_available(),
+                         "inotify not available")
+    def test_an_expired_watcher_reports_an_incomplete_set(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            state = root / "state.json"
+            for signum in (signal.SIGUSR1, signal.SIGTERM):
+                self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+            self.assertEqual(write_tracker.watch(root, state, [], max_seconds=0), 0)
+            doc = write_tracker.read_state(state)
+            self.assertEqual(doc["status"], "final")
+            self.assertFalse(doc["complete"])
+
+
+if __name__ == "__main__":
+    unittest.main()
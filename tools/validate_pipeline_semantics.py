@@ -8,6 +8,7 @@ import bisect
 import hashlib
 import json
 import re
+import sys
 
 import yaml
 from contextlib import contextmanager
@@ -15,7 +16,7 @@ from contextvars import ContextVar
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator
 
 try:
     # The Fortran logical-line scanner is IMPORTED, not copy-pasted: three hand-rolled
@@ -39,6 +40,12 @@ try:
     # The neutral seam to whichever language backend host-renders a node's runner glue. Imported
     # for its dispatch functions only — the renderer itself is never named here.
     from tools import host_render
+    # Content-addressed memo of rule results; stdlib-only, so no cycle.
+    from tools import gate_cache
+    # Bounded-memory snapshot readers; stdlib-only as well.
+    from tools import snapshot_scan
+    # Module-level patterns compile on first use: most stages read only a few of them.
+    from tools import lazy_re
     from tools.meta_contracts import (
         STAGE_META_FILENAME_BY_STEP,
         required_meta_keys_for_step,
@@ -68,6 +75,9 @@ except ModuleNotFoundError:  # pragma: no cover - import bootstrap for direct CL
     # The neutral seam to whichever language backend host-renders a node's runner glue. Imported
     # for its dispatch functions only — the renderer itself is never named here.
     from tools import host_render
+    from tools import gate_cache
+    from tools import snapshot_scan
+    from tools import lazy_re
     from tools.meta_contracts import (
         STAGE_META_FILENAME_BY_STEP,
         required_meta_keys_for_step,
@@ -94,7 +104,7 @@ FORBIDDEN_RUNNER_OUTPUTS = (
     "trial_meta.json",
 )
 LLM_REVIEW_FILENAME = "semantic_review.json"
-FORTRAN_IDENTIFIER_PATTERN = re.compile(r"[a-z_][a-z0-9_]*")
+FORTRAN_IDENTIFIER_PATTERN = lazy_re.compile(r"[a-z_][a-z0-9_]*")
 RAW_EVIDENCE_ARTIFACTS = {
     "metrics_basis.json",
     "execution_trace.json",
@@ -223,13 +233,13 @@ def _make_quality_check_applies(build_system: str | None, language: str | None)
     )
 
 
-TEST_ID_HEADING_PATTERN = re.compile(r"^###\s+\d+-\d+\.\s+`([^`]+)`\s*$")
+TEST_ID_HEADING_PATTERN = lazy_re.compile(r"^###\s+\d+-\d+\.\s+`([^`]+)`\s*$")
 # tests.md test-id declarations come in two forms: the problem-spec heading form
 # (`### 6-1. `<id>``, matched above) and the component/profile bullet form
 # (`- `test_id`: `<id>``). The bullet form captures the SECOND backtick group (the id),
 # not the literal `test_id` label; anchoring on the `test_id`: key excludes sibling bullets
 # like `- `pass_when`:` / `- `suite.pass_rule`:`.
-TEST_ID_BULLET_PATTERN = re.compile(r"^-\s+`test_id`\s*:\s*`([^`]+)`")
+TEST_ID_BULLET_PATTERN = lazy_re.compile(r"^-\s+`test_id`\s*:\s*`([^`]+)`")
 TEST_OUTCOME_VALUES = {"pass", "fail", "xfail", "skipped", "blocked"}
 # Bundled schema lives next to this validator; used as the canonical fallback
 # when no target repo_root is in scope (tests, ad-hoc invocation) and as the
@@ -246,11 +256,22 @@ _BUNDLED_SHAPE_EXPR_SCHEMA_PATH = (
 _active_repo_root_for_schema: ContextVar["Path | None"] = ContextVar(
     "_active_repo_root_for_schema", default=None
 )
+# The rule-result cache of the running CLI invocation (tools/gate_cache.py). Set only by main();
+# a library call (validate(), validate_post_generate_stage(), ...) runs every rule uncached.
+_active_rule_cache: ContextVar["gate_cache.RuleCache | None"] = ContextVar(
+    "_active_rule_cache", default=None
+)
+# The run node's parsed evidence documents (`_read_evidence_json`), keyed by path. Set for the
+# length of one `_execution_pass`, so each rule reading diagnostics.json / metrics_basis.json
+# shares one parse and the documents are dropped with the pass.
+_active_evidence_documents: ContextVar["dict[Path, Any] | None"] = ContextVar(
+    "_active_evidence_documents", default=None
+)
 # Strip outer brackets/parens to expose the comma-separated body. The
 # inner grammar (what each dim token may look like) is owned entirely by
 # the active schema's list-form regex — this split is just a syntactic
 # extractor for downstream binding/equality logic.
-_SHAPE_EXPR_DIM_SPLIT = re.compile(r"^[\[\(]\s*(.+?)\s*[\]\)]$")
+_SHAPE_EXPR_DIM_SPLIT = lazy_re.compile(r"^[\[\(]\s*(.+?)\s*[\]\)]$")
 
 
 
@@ -519,14 +540,14 @@ _LINT_PRESET_FOR_LANGUAGE: dict[str, str] = {
 # dropping the `ruff` member from the registry leaves this mapping producing `ruff` for `python`
 # while the gate refuses it, with the suite green. `test_backend_boundary` pins the values
 # against the registry's implemented linters so that pair cannot open.
-_NODE_KEY_SAFE_PATTERN_LINEAGE = re.compile(
+_NODE_KEY_SAFE_PATTERN_LINEAGE = lazy_re.compile(
     r"^[a-z][a-z0-9_]*__[a-z0-9][a-z0-9_]*__[0-9][0-9A-Za-z._-]*$"
 )
-_SLUG_DATE_SEQ3_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*_(\d{8})_(\d{3})$")
+_SLUG_DATE_SEQ3_PATTERN = lazy_re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*_(\d{8})_(\d{3})$")
 _STAGE_DATE_SEQ3_PATTERNS: dict[str, re.Pattern[str]] = {
-    "src": re.compile(r"^src_(\d{8})_(\d{3})$"),
-    "bin": re.compile(r"^bin_(\d{8})_(\d{3})$"),
-    "run": re.compile(r"^run_(\d{8})_(\d{3})$"),
+    "src": lazy_re.compile(r"^src_(\d{8})_(\d{3})$"),
+    "bin": lazy_re.compile(r"^bin_(\d{8})_(\d{3})$"),
+    "run": lazy_re.compile(r"^run_(\d{8})_(\d{3})$"),
 }
 
 
@@ -827,7 +848,87 @@ def _agent_role(item: dict[str, Any]) -> str | None:
     return None
 
 
+# Derived source views, memoized by source content. Every view below is a pure function of one
+# text, and several gates of one stage — and every stage after it — derive the same views of the
+# same model/runner/checks sources. In-process the memo is keyed by the text itself (bounded,
+# oldest first out); across processes it goes through the CLI's gate cache
+# (`gate_cache.RuleCache.memo`, keyed by the text's digest, the code fingerprint and, for a
+# parse, the structure front end's version), and only for texts long enough that a disk
+# read is cheaper than recomputing. Bump `_SOURCE_VIEW_MEMO_VERSION` when a view's meaning changes
+# without a code change the fingerprint would see.
+_SOURCE_VIEW_MEMO_VERSION = 1
+_SOURCE_VIEW_MEMO: dict[tuple[str, str], Any] = {}
+_SOURCE_VIEW_MEMO_MAX = 512
+_SOURCE_VIEW_MEMO_DISK_MIN_CHARS = 2048
+
+
+def _source_view_memo(
+    kind: str,
+    text: str,
+    compute: Callable[[str], Any],
+    *,
+    encode: Callable[[Any], Any],
+    decode: Callable[[str, Any], Any],
+    extra: str = "",
+) -> Any:
+    key = (kind, text)
+    if key in _SOURCE_VIEW_MEMO:
+        return _SOURCE_VIEW_MEMO[key]
+    cache = _active_rule_cache.get()
+    if cache is not None and len(text) >= _SOURCE_VIEW_MEMO_DISK_MIN_CHARS:
+        value = cache.memo(kind, _SOURCE_VIEW_MEMO_VERSION, text, compute=compute,
+                           encode=encode, decode=decode, extra=extra)
+    else:
+        value = compute(text)
+    if len(_SOURCE_VIEW_MEMO) >= _SOURCE_VIEW_MEMO_MAX:
+        _SOURCE_VIEW_MEMO.pop(next(iter(_SOURCE_VIEW_MEMO)))
+    _SOURCE_VIEW_MEMO[key] = value
+    return value
+
+
+def _memo_logical_lines(text: str) -> list[tuple[int, str]]:
+    """The backend's logical lines of `text`, memoized (`_source_view_memo`). A fresh list per
+    call, so a caller that extends its result does not edit the memo."""
+    return list(_source_view_memo(
+        "logical_lines", text,
+        lambda t: tuple(fortran_lines.fortran_logical_lines(t)),
+        encode=lambda value: [list(item) for item in value],
+        decode=lambda _t, doc: tuple((int(lineno), str(line)) for lineno, line in doc),
+    ))
+
+
+def _structure_memo_salt() -> str:
+    """Keys every memo derived from a structure parse, so a changed front end reparses."""
+    return fortran_structure.front_end_version()
+
+
+def _memo_structure_view(view: str) -> Any:
+    """The structure tree `parse_view` builds of `view`, memoized (`_source_view_memo`). A failure
+    to load the front end raises as before and stores nothing."""
+    return _source_view_memo(
+        "structure", view, fortran_structure.parse_view,
+        encode=fortran_structure.tree_to_json,
+        decode=fortran_structure.tree_from_json,
+        extra=_structure_memo_salt(),
+    )
+
+
 def _joined_masked_fortran_view(lowered: str) -> str:
+    """`_compute_joined_masked_view(lowered)`, memoized by content (`_source_view_memo`)."""
+    return _source_view_memo(
+        "masked_view", lowered, _compute_joined_masked_view,
+        encode=lambda view: view,
+        decode=_memo_str,
+    )
+
+
+def _memo_str(_text: str, doc: Any) -> str:
+    if not isinstance(doc, str):
+        raise TypeError("memoized view must be a string")
+    return doc
+
+
+def _compute_joined_masked_view(lowered: str) -> str:
     """``lowered`` as ONE STATEMENT PER LINE, `&` continuations joined and code-lookalikes masked.
 
     The view every rule in this module that matches Fortran's KEYWORD STRUCTURE over multi-line
@@ -875,7 +976,7 @@ def _joined_masked_fortran_view(lowered: str) -> str:
     masked = fortran_lines.mask_code_lookalikes(
         "\n".join(
             _FORTRAN_STATEMENT_LABEL.sub("", statement.lstrip(), count=1)
-            for _lineno, line in fortran_lines.fortran_logical_lines(lowered)
+            for _lineno, line in _memo_logical_lines(lowered)
             for statement in fortran_lines.split_fortran_statements(line)
         )
     )
@@ -892,11 +993,11 @@ def _joined_masked_fortran_view(lowered: str) -> str:
 # without the `, non_intrinsic ::` module-nature prefix. An earlier form keyed on the word
 # `only` and could not cross the comma that follows `use`, so a bare rename
 # (`use m, ncomp => slot`) and the prefixed spelling both went unseen.
-_FORTRAN_USE_LOCAL_NAMES = re.compile(
+_FORTRAN_USE_LOCAL_NAMES = lazy_re.compile(
     r"^use\b\s*(?:,\s*(?:non_)?intrinsic\s*)?(?:::)?\s*[a-z_][a-z0-9_]*\s*,\s*"
     r"(?:only\s*:)?"
 )
-_FORTRAN_ASSOCIATE_OPEN = re.compile(
+_FORTRAN_ASSOCIATE_OPEN = lazy_re.compile(
     r"^(?:[a-z_][a-z0-9_]*\s*:\s*)?(?:associate|select\s*type)\s*\("
 )
 # A `block` / `associate` / `select type` / `interface` body is a scope of its own. A named
@@ -904,11 +1005,11 @@ _FORTRAN_ASSOCIATE_OPEN = re.compile(
 # it were exempted an actual passed at an earlier call in the enclosing body. Names such a
 # construct declares still land in the "other" set, where they can only SUBTRACT — the direction
 # that costs a false violation rather than an exemption.
-_FORTRAN_CONSTRUCT_OPEN = re.compile(
+_FORTRAN_CONSTRUCT_OPEN = lazy_re.compile(
     r"^(?:[a-z_][a-z0-9_]*\s*:\s*)?(?:block\b|associate\s*\(|select\s*type\s*\(|select\s*case\s*\()"
     r"|^(?:abstract\s+)?interface\b"
 )
-_FORTRAN_CONSTRUCT_END = re.compile(r"^end\s*(?:block|associate|select|interface)\b")
+_FORTRAN_CONSTRUCT_END = lazy_re.compile(r"^end\s*(?:block|associate|select|interface)\b")
 # Every statement that ATTACHES something to a name. The list of keywords is closed in F2008 and
 # short; the SYNTAX behind each of them is neither, so this does not parse them — any statement
 # opening with one of these contributes every identifier it mentions to the disqualifying set.
@@ -920,7 +1021,7 @@ _FORTRAN_CONSTRUCT_END = re.compile(r"^end\s*(?:block|associate|select|interface
 # name made definable while still looking like a pure constant. Enumerating their eighteen
 # grammars is the same losing move this rule was adopted to stop making; over-collecting from
 # them costs a false violation, which is the direction that may be wrong.
-_FORTRAN_ATTRIBUTE_STATEMENT = re.compile(
+_FORTRAN_ATTRIBUTE_STATEMENT = lazy_re.compile(
     r"^(?:common|dimension|equivalence|data|namelist|pointer|target|save|allocatable|external"
     r"|intent|volatile|asynchronous|codimension|contiguous|protected|value|optional|intrinsic"
     r"|bind|sequence|generic|procedure|entry)\b"
@@ -932,7 +1033,7 @@ _FORTRAN_ATTRIBUTE_STATEMENT = re.compile(
 # that matches what the statement does.
 
 
-_FORTRAN_BARE_DECLARATION = re.compile(
+_FORTRAN_BARE_DECLARATION = lazy_re.compile(
     r"^(integer|real|complex|logical|character|doubleprecision|double\s+precision"
     r"|type|class|enumerator)\b"
 )
@@ -940,11 +1041,11 @@ _FORTRAN_BARE_DECLARATION = re.compile(
 
 # Only up to the OPENING paren: the group is delimited by `_extract_balanced_parens`, not by a
 # greedy `(.*)\)$` — see `_fortran_parameter_names`.
-_FORTRAN_PARAMETER_STATEMENT_PATTERN = re.compile(r"^parameter\s*\(")
+_FORTRAN_PARAMETER_STATEMENT_PATTERN = lazy_re.compile(r"^parameter\s*\(")
 # A statement LABEL may precede any statement, including a structural one. Every rule below
 # anchors on the keyword, so the label has to come off first — a labelled `10 contains` that went
 # unrecognized left the module specification part open across every procedure that followed it.
-_FORTRAN_STATEMENT_LABEL = re.compile(r"^\d+\s+")
+_FORTRAN_STATEMENT_LABEL = lazy_re.compile(r"^\d+\s+")
 
 
 def _fortran_statement_body(line: str) -> str:
@@ -1265,7 +1366,7 @@ def _is_literal_like_expr(expr: str) -> bool:
 # The `intent(out)` declarations of one scope. ONE definition: the three `problem` model gates
 # each carried their own copy of this pattern, and each recomputed the same set from the same
 # text. The set is computed once, in the envelope, and every gate reads `envelope.out_vars`.
-_FORTRAN_INTENT_OUT_PATTERN = re.compile(r"intent\s*\(\s*out\s*\)\s*::\s*([^\n!]+)")
+_FORTRAN_INTENT_OUT_PATTERN = lazy_re.compile(r"intent\s*\(\s*out\s*\)\s*::\s*([^\n!]+)")
 
 
 class _FortranSourceStructureError(Exception):
@@ -1367,7 +1468,7 @@ def _fortran_view_pair(lowered: str) -> tuple[str, str, list[int], list[int]]:
     """
     raw_statements = [
         statement.lstrip()
-        for _lineno, line in fortran_lines.fortran_logical_lines(lowered)
+        for _lineno, line in _memo_logical_lines(lowered)
         for statement in fortran_lines.split_fortran_statements(line)
     ]
     stripped_lines = [
@@ -1410,6 +1511,32 @@ def _line_starts(text: str) -> list[int]:
 
 
 def _fortran_procedure_envelopes(lowered: str) -> list[_FortranProcedureEnvelope]:
+    """`_compute_procedure_envelopes(lowered)`, memoized by content (`_source_view_memo`).
+
+    A source whose structure cannot be resolved raises its structure error on every call and
+    memoizes nothing (its parse is memoized one level down)."""
+    return list(_source_view_memo(
+        "envelopes", lowered,
+        lambda text: tuple(_compute_procedure_envelopes(text)),
+        encode=lambda value: [
+            {**envelope.__dict__,
+             "intent_out_vars": sorted(envelope.intent_out_vars),
+             "out_vars": sorted(envelope.out_vars)}
+            for envelope in value
+        ],
+        decode=lambda _text, doc: tuple(
+            _FortranProcedureEnvelope(**{
+                **item,
+                "intent_out_vars": frozenset(item["intent_out_vars"]),
+                "out_vars": frozenset(item["out_vars"]),
+            })
+            for item in doc
+        ),
+        extra=_structure_memo_salt(),
+    ))
+
+
+def _compute_procedure_envelopes(lowered: str) -> list[_FortranProcedureEnvelope]:
     """Every procedure DEFINITION in ``lowered``, with the body each gate must read.
 
     The structure comes from `tools/backends/language/fortran/structure.parse_view` (tree-sitter-fortran), NOT from
@@ -1473,10 +1600,10 @@ def _fortran_procedure_envelopes(lowered: str) -> list[_FortranProcedureEnvelope
     # source is refused only when NEITHER reading resolves, which is strictly weaker than either
     # rule and needs no enumeration to stay true.
     view, labelled_view, view_starts, labelled_starts = _fortran_view_pair(lowered)
-    tree = fortran_structure.parse_view(view)
+    tree = _memo_structure_view(view)
     translate = False
     if tree.errors:
-        labelled_tree = fortran_structure.parse_view(labelled_view)
+        labelled_tree = _memo_structure_view(labelled_view)
         if labelled_tree.errors:
             # The STRIPPED reading's errors are reported: it is the canonical view, the one whose
             # line numbers the rest of this module speaks in.
@@ -1952,10 +2079,10 @@ def _normalize_make_token(token: str) -> str | None:
     return name
 
 
-_MAKE_ASSIGNMENT_PATTERN = re.compile(
+_MAKE_ASSIGNMENT_PATTERN = lazy_re.compile(
     r"^([A-Za-z_][A-Za-z0-9_]*)\s*([:+?]?)=\s*(.*)$"
 )
-_MAKE_VAR_REF_PATTERN = re.compile(r"\$\(([A-Za-z_][A-Za-z0-9_]*)\)|\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_MAKE_VAR_REF_PATTERN = lazy_re.compile(r"\$\(([A-Za-z_][A-Za-z0-9_]*)\)|\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
 
 
 def _expand_make_vars(
@@ -2221,7 +2348,7 @@ def _makefile_relinking_recipe_targets(
 # (e.g. `OBJDIR=<per-run tmp>`), so a prerequisite's `$(OBJDIR)/` prefix is NOT
 # cosmetic: it determines which concrete target make resolves under an override.
 _MAKE_DIR_SENTINELS = frozenset({"OBJDIR", "BINDIR", "RUNDIR"})
-_OBJDIR_REF_PATTERN = re.compile(r"\$[({]OBJDIR[)}]")
+_OBJDIR_REF_PATTERN = lazy_re.compile(r"\$[({]OBJDIR[)}]")
 
 
 def _token_has_objdir_prefix(token: str) -> bool:
@@ -2333,7 +2460,9 @@ def _fortran_source_views(src_files: list[Path]) -> dict[Path, str]:
     this note each gave a single directory's figure and neither reproduced for the other reader.
     The number that does not move is the absolute: 1.9s for the whole tree of 357 directories,
     against 0.02s of raw reads. Large multiplier, small absolute — a note rather than a concern,
-    and the multiplier is what to check first if that stops being true."""
+    and the multiplier is what to check first if that stops being true. The view itself is now
+    memoized by content (`_source_view_memo`), so a later gate or stage over an unchanged source pays
+    the multiplier only once per content version."""
     return {
         src_file: _joined_masked_fortran_view(
             src_file.read_text(encoding="utf-8", errors="ignore").lower()
@@ -2397,8 +2526,8 @@ def _fortran_source_module_deps(src_files: list[Path]) -> dict[str, set[str]]:
 # Leading whitespace is spaces only: a make variable ASSIGNMENT cannot start with a tab
 # (a tab-indented line is a recipe command, e.g. a shell `BIN=...` inside a target body),
 # so excluding a leading tab avoids a false positive on recipe lines.
-_MAKE_BIN_ASSIGN_RE = re.compile(r"^[ ]*BIN[ \t]*(\?=|:=|\+=|=)", re.MULTILINE)
-_MAKE_BIN_REF_RE = re.compile(r"\$[({]BIN[)}]")
+_MAKE_BIN_ASSIGN_RE = lazy_re.compile(r"^[ ]*BIN[ \t]*(\?=|:=|\+=|=)", re.MULTILINE)
+_MAKE_BIN_REF_RE = lazy_re.compile(r"\$[({]BIN[)}]")
 
 
 def _validate_makefile_bin_overridable(
@@ -2550,7 +2679,7 @@ def _validate_fortran_makefile_src_dir(src_dir: Path, violations: list[str]) ->
 # `build_system=make` Makefile they appear mostly in non-building utility modes
 # (`cmake -E`, `ninja -t`, `meson test`, `libtool --mode=execute`), so a bare
 # command-word match would be a false positive.
-_RELINK_TOOL_PATTERN = re.compile(
+_RELINK_TOOL_PATTERN = lazy_re.compile(
     r"""^(?:
         \$\$?[({](?:MAKE|FC|CC|CXX|LD|AR|F90|F95|F77)[)}]
       | (?:make|gmake|mingw32-make|gfortran|gcc|clang|cc|ld|ar|nvcc|nvfortran|ifort|ifx|f90|f95|f77)\b
@@ -2577,7 +2706,7 @@ _SHELL_CMD_WRAPPER_PREFIXES = frozenset(
 )
 # A leading `NAME=value` shell assignment precedes the actual command, so the
 # following token is the command word (e.g. `FC=gfortran make …`).
-_SHELL_ASSIGNMENT_PREFIX = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+_SHELL_ASSIGNMENT_PREFIX = lazy_re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
 
 
 def _shell_command_words(recipe: str) -> list[str]:
@@ -2650,12 +2779,12 @@ def _shell_command_words(recipe: str) -> list[str]:
     return words
 
 
-_SHELL_DASH_C_ARG = re.compile(
+_SHELL_DASH_C_ARG = lazy_re.compile(
     r"""\b(?:sh|bash|dash|zsh|ksh)\s+-[A-Za-z]*c\s+   # -c, possibly with combined flags (-lc)
         ("(?:[^"]*)"|'(?:[^']*)'|\S+)""",
     re.VERBOSE,
 )
-_BACKTICK_SPAN = re.compile(r"`([^`]*)`")
+_BACKTICK_SPAN = lazy_re.compile(r"`([^`]*)`")
 
 
 def _command_word_relinks(command: str, var_map: dict[str, str] | None) -> bool:
@@ -3007,30 +3136,30 @@ def _validate_makefile_test_invokes_cases(
 # Edit descriptors may carry a leading repeat count (e.g. ``2l1`` / ``3f0.6``);
 # the negative lookbehind excludes letters so multi-letter descriptors such as
 # ``tl`` (tab-left) are not mistaken for an ``L`` (logical) descriptor.
-_RUNNER_FORMAT_LOGICAL_DESC = re.compile(r"(?<![a-z])l\d*(?![a-z])")
+_RUNNER_FORMAT_LOGICAL_DESC = lazy_re.compile(r"(?<![a-z])l\d*(?![a-z])")
 # ``f0`` is the F descriptor with width 0; it may be preceded by a repeat count
 # (``2f0.6``) or a ``P`` scale factor (``1pf0.6``). The lookbehind excludes every
 # letter *except* ``p`` so a ``P`` scale factor is allowed while ``f0`` embedded
 # in a word (e.g. ``leaf0``) is not matched.
-_RUNNER_FORMAT_F0_DESC = re.compile(r"(?<![a-oq-z])f0(?:\.\d+)?")
+_RUNNER_FORMAT_F0_DESC = lazy_re.compile(r"(?<![a-oq-z])f0(?:\.\d+)?")
 # Statement recognizers (operate on lowercased logical lines). ``write`` must be a
 # statement keyword followed by ``(`` (not a substring of an identifier such as
 # ``write_flag`` / ``rewrite``). A FORMAT statement carries a leading label.
-_RUNNER_WRITE_STMT = re.compile(r"(?<![a-z0-9_])write\s*\(")
-_RUNNER_FORMAT_STMT = re.compile(r"^\s*(\d+)\s+format\s*\(")
-_RUNNER_CHAR_LITERAL = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"")
-_RUNNER_KEYWORD_ITEM = re.compile(r"[a-z][a-z0-9_]*\s*=")
-_RUNNER_FMT_KEYWORD = re.compile(r"fmt\s*=\s*(.*)", re.DOTALL)
-_RUNNER_NAME_TOKEN = re.compile(r"[a-z][a-z0-9_]*\Z")
+_RUNNER_WRITE_STMT = lazy_re.compile(r"(?<![a-z0-9_])write\s*\(")
+_RUNNER_FORMAT_STMT = lazy_re.compile(r"^\s*(\d+)\s+format\s*\(")
+_RUNNER_CHAR_LITERAL = lazy_re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"")
+_RUNNER_KEYWORD_ITEM = lazy_re.compile(r"[a-z][a-z0-9_]*\s*=")
+_RUNNER_FMT_KEYWORD = lazy_re.compile(r"fmt\s*=\s*(.*)", re.DOTALL)
+_RUNNER_NAME_TOKEN = lazy_re.compile(r"[a-z][a-z0-9_]*\Z")
 # Fortran scoping-unit boundaries. Statement labels, FORMAT statements, and local
 # variables are scoped to their program unit, so resolution must not cross units.
-_FORTRAN_UNIT_END = re.compile(
+_FORTRAN_UNIT_END = lazy_re.compile(
     r"^\s*end\s*$|^\s*end\s*(?:program|module|submodule|subroutine|function|blockdata)\b"
 )
-_FORTRAN_UNIT_OPEN = re.compile(
+_FORTRAN_UNIT_OPEN = lazy_re.compile(
     r"^\s*(?:(?:pure|elemental|impure|recursive)\s+)*(?:program|subroutine|module|submodule)\b"
 )
-_FORTRAN_FUNCTION_OPEN = re.compile(r"(?<![a-z0-9_])function\s+[a-z][a-z0-9_]*\s*\(")
+_FORTRAN_FUNCTION_OPEN = lazy_re.compile(r"(?<![a-z0-9_])function\s+[a-z][a-z0-9_]*\s*\(")
 
 
 def _iter_fortran_logical_lines(text: str) -> list[tuple[int, str]]:
@@ -3050,7 +3179,7 @@ def _iter_fortran_logical_lines(text: str) -> list[tuple[int, str]]:
     longer be read one way here and another way there. This adapter adds only the ``;`` split.
     """
     logical: list[tuple[int, str]] = []
-    for lineno, joined in fortran_lines.fortran_logical_lines(text):
+    for lineno, joined in _memo_logical_lines(text):
         for statement in fortran_lines.split_fortran_statements(joined):
             if statement.strip():
                 logical.append((lineno, statement))
@@ -3170,7 +3299,7 @@ def _scan_runner_format_text(
         )
 
 
-_RUNNER_UNIT_KEYWORD = re.compile(r"unit\s*=\s*(.*)", re.DOTALL)
+_RUNNER_UNIT_KEYWORD = lazy_re.compile(r"unit\s*=\s*(.*)", re.DOTALL)
 # Unit designators that are never a JSON artifact (stdout / stderr); formatted
 # writes to them are debug/log output and must not be scanned for JSON safety.
 _NON_JSON_WRITE_UNITS = {"*", "output_unit", "error_unit"}
@@ -3492,7 +3621,7 @@ def _validate_runner_json_serialization(
 # SEPARATE literal so this pattern does not match. A fixed/sequential literal
 # (``snapshot_0001.json``, a combined file) does match. The character class
 # excludes quotes so a match never crosses a string-literal boundary.
-_RUNNER_SNAPSHOT_LITERAL = re.compile(r"state_snapshots/([^/'\"]+)\.json")
+_RUNNER_SNAPSHOT_LITERAL = lazy_re.compile(r"state_snapshots/([^/'\"]+)\.json")
 
 
 def _validate_runner_snapshot_filenames(
@@ -3579,6 +3708,25 @@ def _read_json(path: Path) -> Any:
     return json.loads(text)
 
 
+def _read_evidence_json(path: Path) -> Any:
+    """`_read_json` of a run node's evidence document, parsed once per execution pass.
+
+    Inside `_execution_pass` the parsed document (or its decode error) is kept for the rest of
+    the pass; outside one it is `_read_json`. Callers treat the result as read-only."""
+    documents = _active_evidence_documents.get()
+    if documents is None:
+        return _read_json(path)
+    if path not in documents:
+        try:
+            documents[path] = _read_json(path)
+        except json.JSONDecodeError as exc:
+            documents[path] = exc
+    document = documents[path]
+    if isinstance(document, json.JSONDecodeError):
+        raise document
+    return document
+
+
 def _canonical_json(obj: Any) -> str:
     return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
@@ -4166,14 +4314,13 @@ def _validate_raw_evidence(
         else:
             schema_path = snapshots_dir / SNAPSHOT_SCHEMA_FILE
             snapshot_data_files = [p for p in files if p != schema_path]
+            # Snapshots are grid-sized: both passes stream the file (`tools/snapshot_scan.py`)
+            # rather than holding its text, a stripped copy and its parsed arrays at once.
             for snapshot in files:
-                text = snapshot.read_text(encoding="utf-8", errors="ignore")
-                compact = text.replace(" ", "").replace("\n", "")
-                for patt in PLACEHOLDER_TEXT_PATTERNS:
-                    if patt in compact:
-                        violations.append(
-                            f"{snapshot}: placeholder content detected ({patt})"
-                        )
+                for patt in snapshot_scan.placeholder_hits(snapshot, PLACEHOLDER_TEXT_PATTERNS):
+                    violations.append(
+                        f"{snapshot}: placeholder content detected ({patt})"
+                    )
 
             if state_snapshot_required:
                 if not schema_path.exists():
@@ -4279,13 +4426,12 @@ def _validate_raw_evidence(
                         for snapshot in snapshot_data_files:
                             if snapshot.suffix.lower() != ".json":
                                 continue
-                            try:
-                                data = _read_json(snapshot)
-                            except json.JSONDecodeError:
-                                continue
-                            if not isinstance(data, dict):
+                            summary = snapshot_scan.summarize_json_object(
+                                snapshot, string_keys=("case_id", "test_id")
+                            )
+                            if summary is None:
                                 continue
-                            keys = set(data.keys())
+                            keys = summary.keys()
                             required_state_names = state_variables
                             if per_test_required:
                                 # Identify what this snapshot's required raw
@@ -4300,7 +4446,7 @@ def _validate_raw_evidence(
                                 # reliability and use the first that resolves to
                                 # a declared per-test requirement; otherwise fall
                                 # back to requiring every declared variable.
-                                raw_case_id = data.get("case_id")
+                                raw_case_id = summary.strings.get("case_id")
                                 case_token = (
                                     raw_case_id.strip()
                                     if isinstance(raw_case_id, str)
@@ -4309,7 +4455,7 @@ def _validate_raw_evidence(
                                 )
                                 case_required = None
                                 # (1) A per-TEST snapshot names its test outright.
-                                raw_test_id = data.get("test_id")
+                                raw_test_id = summary.strings.get("test_id")
                                 if (
                                     isinstance(raw_test_id, str)
                                     and raw_test_id.strip() in per_test_required
@@ -4375,9 +4521,9 @@ def _validate_raw_evidence(
                                 missing_time.add(snapshot.name)
 
                             for name, shape_expr in state_variable_shapes.items():
-                                if name not in data:
+                                if name not in keys:
                                     continue
-                                value_shape = _infer_json_shape(data.get(name))
+                                value_shape = summary.shapes[name]
                                 if value_shape is None:
                                     violations.append(
                                         f"{snapshot}:{name} has unsupported or ragged shape"
@@ -4388,8 +4534,8 @@ def _validate_raw_evidence(
                                         f"{snapshot}:{name} shape {value_shape} does not match declared shape_expr {shape_expr}"
                                     )
 
-                            if time_variable in data:
-                                time_shape = _infer_json_shape(data.get(time_variable))
+                            if time_variable in keys:
+                                time_shape = summary.shapes[time_variable]
                                 if time_shape is None:
                                     violations.append(
                                         f"{snapshot}:{time_variable} has unsupported or ragged shape"
@@ -4440,18 +4586,24 @@ def _validate_raw_evidence(
     metrics_basis_path = execution.node_dir / "raw" / "metrics_basis.json"
     if diagnostics_path.exists() and metrics_basis_path.exists():
         try:
-            diagnostics = _read_json(diagnostics_path)
+            diagnostics = _read_evidence_json(diagnostics_path)
         except json.JSONDecodeError:
             violations.append(f"{diagnostics_path}: invalid json")
             diagnostics = None
         try:
-            metrics_basis = _read_json(metrics_basis_path)
+            metrics_basis = _read_evidence_json(metrics_basis_path)
         except json.JSONDecodeError:
             violations.append(f"{metrics_basis_path}: invalid json")
             metrics_basis = None
         if (
             diagnostics is not None
             and metrics_basis is not None
+            # Two objects with different keys cannot serialize alike; skip serializing both.
+            and not (
+                isinstance(diagnostics, dict)
+                and isinstance(metrics_basis, dict)
+                and diagnostics.keys() != metrics_basis.keys()
+            )
             and _canonical_json(diagnostics) == _canonical_json(metrics_basis)
         ):
             violations.append(
@@ -4493,7 +4645,7 @@ def _validate_execution_json_outputs(execution: NodeExecution, violations: list[
     diagnostics_path = execution.node_dir / "diagnostics.json"
     if diagnostics_path.exists():
         try:
-            diagnostics = _read_json(diagnostics_path)
+            diagnostics = _read_evidence_json(diagnostics_path)
         except json.JSONDecodeError:
             violations.append(f"{diagnostics_path}: invalid json")
         else:
@@ -4738,6 +4890,67 @@ def _run_problem_model_gates(
 
 
 
+# Versions of the cached source rules. Bump one when its checks change in a way the code
+# fingerprint would not see (it covers every tools/ module, so an edit here already does).
+_SOURCE_STRUCTURE_RULE_VERSION = 1
+_GENERATE_SOURCE_RULE_VERSION = 1
+
+
+def _source_rule_inputs(repo_root: Path, pipeline_dir: Path, src_dir: Path) -> list[Path]:
+    """Every file the structural source rules read for one ``src/`` directory: the tree itself,
+    the pipeline's lineage.json, the IR and dependency-graph sidecar it names, the dependency
+    document (``_dependency_doc_path``), and the controlled_spec the IR's
+    ``meta.source_refs`` points at (the infrastructure signature gate parses §5.1 from it).
+    Anything that fails to resolve is simply not added — the lineage digest already keys on
+    the value that failed."""
+    lineage_path = pipeline_dir / "lineage.json"
+    inputs = [src_dir, lineage_path]
+    try:
+        lineage = _read_json(lineage_path)
+    except (json.JSONDecodeError, OSError):
+        return inputs
+    if not isinstance(lineage, dict):
+        return inputs
+    ir_ref = lineage.get("ir_ref")
+    if isinstance(ir_ref, str) and ir_ref.startswith("workspace/"):
+        ir_path = repo_root / ir_ref / "spec.ir.yaml"
+        inputs += [ir_path, repo_root / ir_ref / "dependency_graph.json"]
+        try:
+            ir = _read_yaml(ir_path)
+        except (yaml.YAMLError, OSError):
+            ir = None
+        meta = ir.get("meta") if isinstance(ir, dict) else None
+        refs = meta.get("source_refs") if isinstance(meta, dict) else None
+        cs_ref = refs.get("controlled_spec") if isinstance(refs, dict) else None
+        if isinstance(cs_ref, str) and cs_ref.strip():
+            cs_path = Path(cs_ref)
+            inputs.append(cs_path if cs_path.is_absolute() else repo_root / cs_path)
+    dependency_ref = lineage.get("dependency_ref")
+    if isinstance(dependency_ref, str) and dependency_ref.startswith("workspace/"):
+        dep_path = repo_root / dependency_ref
+        inputs += [dep_path, dep_path / "spec.ir.yaml"]
+    return inputs
+
+
+def _run_cached_rule(
+    rule_id: str,
+    rule_version: int,
+    *,
+    params: dict[str, str],
+    inputs: list[Path],
+    compute: Callable[[list[str]], Any],
+    violations: list[str],
+) -> None:
+    """Append the violations of one declared-input rule group, through the CLI's rule cache
+    when one is active (see tools/gate_cache.py)."""
+    cache = _active_rule_cache.get()
+    if cache is None:
+        compute(violations)
+        return
+    violations.extend(cache.run(rule_id, rule_version, params=params, inputs=inputs,
+                                compute=compute))
+
+
 def _validate_generate_outputs(
     repo_root: Path, execution: NodeExecution, src_dir: Path, violations: list[str]
 ) -> tuple[list[Path], list[str]] | None:
@@ -5286,7 +5499,7 @@ def _validate_generate_outputs_for_generation(
 # prefixes, then `subroutine <name>`. `^\s*` anchors at the (comment-stripped, continuation-
 # joined) logical-line start, so `end subroutine` / `call` lines never match. Kept in lock-step
 # with the runtime regex by the cross-scanner parity test (ComponentGeneratedSurfaceGateTests).
-_COMPONENT_PUBLISHED_SUB_RE = re.compile(
+_COMPONENT_PUBLISHED_SUB_RE = lazy_re.compile(
     r"^\s*(?:(?:pure|impure|elemental|recursive|module)\s+)*"
     r"subroutine\s+(?P<name>[A-Za-z]\w*)",
     re.IGNORECASE,
@@ -5446,14 +5659,14 @@ _DO_SEP = rf"(?:{_BLANK}+|{_BLANK}*,{_BLANK}*)"
 # A COUNTED loop: `do <var> =`, also accepting an obsolescent branch-target label (`do 10 i = 1, n`).
 # The `=` tail is what makes it counted, so `do concurrent (...)` and `do while (...)` are excluded by
 # construction, and `do_it = 1` cannot match because `do` must be followed by a blank.
-_COUNTED_DO_RE = re.compile(
+_COUNTED_DO_RE = lazy_re.compile(
     _DO_OPENER + rf"{_DO_SEP}(?:\d+{_BLANK}+)?[a-z_]\w*{_BLANK}*=", re.IGNORECASE | re.MULTILINE
 )
 
 # `do concurrent` anywhere in the file is a declaration of parallel intent and takes the file out of
 # the floor's reach even when counted loops sit beside it — without this, an accumulator reset beside
 # `do concurrent` work was reported as unparallelized, contradicting the floor's own message.
-_DO_CONCURRENT_RE = re.compile(
+_DO_CONCURRENT_RE = lazy_re.compile(
     _DO_OPENER + rf"{_DO_SEP}concurrent\b", re.IGNORECASE | re.MULTILINE
 )
 
@@ -5482,7 +5695,7 @@ _DO_CONCURRENT_RE = re.compile(
 # and a counted loop beside it could fire, even though the wrapped header might be a `do concurrent`.
 # A 13k-combination sweep over {blanks, labels, construct names, `do`-prefixed identifiers,
 # separators, tokens, trailing blanks} now reports zero spurious matches and zero missed headers.
-_WRAPPED_DO_RE = re.compile(
+_WRAPPED_DO_RE = lazy_re.compile(
     _DO_OPENER + rf"(?={_BLANK}|&|,){_BLANK}*,?{_BLANK}*[^=\s]*{_BLANK}*&{_BLANK}*(?:!.*)?$",
     re.IGNORECASE | re.MULTILINE,
 )
@@ -5492,7 +5705,7 @@ _WRAPPED_DO_RE = re.compile(
 # by blanks only, so the anchor IS the language rule. It is what keeps a doc comment reading "the
 # `!$omp parallel do` directives would go here (not added)" — a shape a real generated source
 # contains — from satisfying the floor, and likewise a commented-out `!!$omp`.
-_OMP_DIRECTIVE_RE = re.compile(rf"^{_BLANK}*!\$omp\b", re.IGNORECASE | re.MULTILINE)
+_OMP_DIRECTIVE_RE = lazy_re.compile(rf"^{_BLANK}*!\$omp\b", re.IGNORECASE | re.MULTILINE)
 
 # Values of the parallelization knob that mean "no parallelism here". `_validate_impl_defaults_knobs`
 # blesses `none` explicitly, so without this the two new gates contradicted each other: Compile
@@ -6139,7 +6352,7 @@ def _parse_test_ids_from_tests_md(tests_path: Path) -> list[str]:
 
 # Matches a top-level numbered controlled_spec heading `## <n>. Title`. The `(?:\s|$)`
 # after the dot ensures a decimal subsection like `## 5.1 Foo` is NOT read as section 5.
-_CONTROLLED_SPEC_SECTION_HEADING = re.compile(r"^##\s+(\d+)\.(?:\s|$)")
+_CONTROLLED_SPEC_SECTION_HEADING = lazy_re.compile(r"^##\s+(\d+)\.(?:\s|$)")
 
 
 def _extract_controlled_spec_section(text: str, section_num: str) -> str | None:
@@ -6253,7 +6466,7 @@ def _parse_public_api_from_controlled_spec(
 # `.stanza_line_set`, over `fortran_lines`); what stays here is the gates that compare what they
 # produce. The fence below is Markdown, not source syntax, so it stays too.
 
-_FENCED_BLOCK_RE = re.compile(r"(?ms)^```[^\n]*\n(.*?)^```[^\n]*$")
+_FENCED_BLOCK_RE = lazy_re.compile(r"(?ms)^```[^\n]*\n(.*?)^```[^\n]*$")
 
 
 def _strip_fenced_blocks(text: str) -> str:
@@ -6286,7 +6499,7 @@ def _mask_fortran_string_contents(line: str) -> str:
     return "".join(out)
 
 
-_SUBSECTION_51_HEADING = re.compile(r"^###\s+5\.1(?:[.\s]|$)")
+_SUBSECTION_51_HEADING = lazy_re.compile(r"^###\s+5\.1(?:[.\s]|$)")
 
 
 def _extract_subsection_51(section5_body: str) -> str | None:
@@ -8047,7 +8260,7 @@ def _validate_diagnostics_contract_output(
         # presence of diagnostics.json itself is already required by _validate_raw_evidence
         return
     try:
-        diagnostics = _read_json(diagnostics_path)
+        diagnostics = _read_evidence_json(diagnostics_path)
     except json.JSONDecodeError:
         # invalid json already reported elsewhere
         return
@@ -8862,7 +9075,7 @@ def _dependency_run_token(dep_data: dict[str, Any]) -> str | None:
     return None
 
 
-_NODE_KEY_TOKEN_PART_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+_NODE_KEY_TOKEN_PART_RE = lazy_re.compile(r"^[A-Za-z0-9._-]+$")
 
 
 def _closure_node_validated_in_own_pipeline(repo_root: Path, normalized_token: str) -> bool:
@@ -9666,27 +9879,39 @@ def _validate_tests_verdict_summary_consistency(
             )
 
 
-def _collect_numeric_leaves(obj: Any, _depth: int = 0) -> list[float | None]:
-    """Recursively collect numeric / null leaves from a JSON object/array (depth limit 8)."""
+# Element types of a JSON array that `_numeric_leaf_triviality` settles in one C-level pass.
+_NUMERIC_ROW_TYPES = frozenset({int, float, type(None)})
+
+
+def _numeric_leaf_triviality(obj: Any, _depth: int = 0) -> bool | None:
+    """Whether the numeric / null leaves of a JSON object/array (depth limit 8) are all zero or
+    null: ``None`` when there is no such leaf, ``False`` at the first non-zero number.
+
+    bool is a subclass of int and is not a numeric leaf. A row of numbers and nulls — the bulk
+    of an evidence array — is settled by `type` / `any` over the whole list instead of a
+    recursive call per element; NaN counts as non-zero, as ``nan != 0.0`` does."""
     if _depth > 8:
-        return []
+        return None
     if isinstance(obj, bool):
-        return []  # bool is a subclass of int, so check it first
+        return None
     if isinstance(obj, (int, float)):
-        return [float(obj)]
+        return obj == 0
     if obj is None:
-        return [None]
-    if isinstance(obj, list):
-        result: list[float | None] = []
-        for item in obj:
-            result.extend(_collect_numeric_leaves(item, _depth + 1))
-        return result
+        return True
     if isinstance(obj, dict):
-        result = []
-        for v in obj.values():
-            result.extend(_collect_numeric_leaves(v, _depth + 1))
-        return result
-    return []
+        obj = list(obj.values())
+    elif not isinstance(obj, list):
+        return None
+    if _depth + 1 <= 8 and obj and set(map(type, obj)) <= _NUMERIC_ROW_TYPES:
+        return not any(obj)
+    found: bool | None = None
+    for item in obj:
+        trivial = _numeric_leaf_triviality(item, _depth + 1)
+        if trivial is False:
+            return False
+        if trivial:
+            found = True
+    return found
 
 
 def _validate_metrics_basis_not_trivial(
@@ -9699,21 +9924,15 @@ def _validate_metrics_basis_not_trivial(
         return  # existence check is handled by _validate_raw_evidence
 
     try:
-        data = _read_json(metrics_path)
+        data = _read_evidence_json(metrics_path)
     except json.JSONDecodeError:
         return  # JSON syntax errors are already handled by another function
 
     if not isinstance(data, dict):
         return
 
-    numeric_values = _collect_numeric_leaves(data)
-    if not numeric_values:
-        return  # skip if there is no numeric field at all
-
-    non_trivial_count = sum(
-        1 for v in numeric_values if v is not None and v != 0.0
-    )
-    if non_trivial_count == 0:
+    # None: no numeric field at all, which is skipped.
+    if _numeric_leaf_triviality(data):
         violations.append(
             f"{metrics_path}: all numeric fields are zero or null "
             "(trivial placeholder detected)"
@@ -11174,6 +11393,8 @@ _IMPL_OPENMP_OVERRIDE_TYPES: dict[str, tuple[type, ...]] = {
     "chunk_size": (int,),
     "collapse": (int,),
     "nested": (bool,),
+    "places": (str,),
+    "proc_bind": (str,),
 }
 
 
@@ -11354,6 +11575,42 @@ def _validate_impl_defaults_knobs(
         _append_impl_knob_type_violations(
             ir_path, prefix, section, _IMPL_OPENMP_OVERRIDE_TYPES, violations,
         )
+        _append_impl_affinity_value_violations(ir_path, prefix, section, violations)
+
+
+def _append_impl_affinity_value_violations(
+    ir_path: Path,
+    prefix: str,
+    section: dict[str, Any],
+    violations: list[str],
+) -> None:
+    """The one VALUE check in the knob layer: `places` / `proc_bind` become the measured run's
+    `OMP_PLACES` / `OMP_PROC_BIND`, and `run_program` refuses a value outside their grammar.
+
+    Refused here, where Compile can still repair it, rather than after a full Generate and Build.
+    A non-string value is the type check's finding and is left to it."""
+    from tools.spec_input_gates import OMP_PLACES_RE, OMP_PROC_BIND_RE
+
+    by_lowered = {str(k).strip().lower(): k for k in section}
+    for key, pattern, spelled in (
+        ("places", OMP_PLACES_RE,
+         "`threads`, `cores`, `ll_caches`, `numa_domains` or `sockets` (optionally with a "
+         "count, `cores(4)`), or an explicit place list (`{0:4},{4:4}`)"),
+        ("proc_bind", OMP_PROC_BIND_RE,
+         "`true`, `false`, or a policy list of `primary`/`master`/`close`/`spread` "
+         "(`spread,close`)"),
+    ):
+        actual_key = by_lowered.get(key)
+        if actual_key is None:
+            continue
+        value = section[actual_key]
+        if not isinstance(value, str) or pattern.match(value.strip().lower()):
+            continue
+        violations.append(
+            f"{ir_path}: {prefix}.{key} must be {spelled}, got {value!r} — Validate.execute "
+            "sets it as the run's OpenMP environment, and a value outside that grammar fails "
+            "the run after a full Generate and Build"
+        )
 
 
 def _append_impl_alias_violations(
@@ -13711,8 +13968,16 @@ def _validate_post_generate_stage_impl(
     # required here — the presence check validates only node_key and pipeline_id, which
     # are the fields lineage.json already carries at Generate time.
     _validate_pipeline_lineage_presence([execution], violations)
-    _validate_generate_outputs_for_generation(
-        repo_root, execution, gen_id, violations
+    _run_cached_rule(
+        "generate_source",
+        _GENERATE_SOURCE_RULE_VERSION,
+        params={"repo_root": str(repo_root), "node_key": execution.node_key,
+                "pipeline_dir": str(pipeline_dir), "source_id": gen_id},
+        inputs=_source_rule_inputs(
+            repo_root, pipeline_dir, pipeline_dir / "source" / gen_id / "src"),
+        compute=lambda out: _validate_generate_outputs_for_generation(
+            repo_root, execution, gen_id, out),
+        violations=violations,
     )
 
     gen_dir = pipeline_dir / "source" / gen_id
@@ -13793,6 +14058,158 @@ def _validate_post_build_stage_impl(
     return violations
 
 
+@dataclass(frozen=True)
+class _ExecutionRuleContext:
+    """What the per-execution rules read besides the execution itself."""
+
+    repo_root: Path
+    require_llm_review: bool
+    require_verdict: bool
+
+
+@dataclass
+class _ExecutionPass:
+    """One execution's rule results, merged by `_validate_impl` in discovery order."""
+
+    violations: list[str]
+    fingerprint: SourceFingerprint | None
+    expected_nodes: set[str]
+    run_token: str | None
+    cache_mismatches: list[str]
+
+
+def _rule_structural_source(
+    ctx: _ExecutionRuleContext, execution: NodeExecution, owns_source: bool,
+    violations: list[str],
+) -> None:
+    in_scope_src_dir = _execution_in_scope_src_dir(execution, violations)
+    if in_scope_src_dir is None or not owns_source:
+        return
+    repo_root = ctx.repo_root
+
+    def _source_structure(out: list[str]) -> None:
+        _validate_generate_outputs(repo_root, execution, in_scope_src_dir, out)
+        _validate_dependency_operation_usage(repo_root, execution, in_scope_src_dir, out)
+        _validate_runner_outputs(
+            execution, in_scope_src_dir, out,
+            known_case_ids=_case_ids_for_execution(repo_root, execution),
+        )
+
+    _run_cached_rule(
+        "source_structure",
+        _SOURCE_STRUCTURE_RULE_VERSION,
+        params={"repo_root": str(repo_root), "node_key": execution.node_key,
+                "pipeline_dir": str(execution.pipeline_dir),
+                "src_dir": str(in_scope_src_dir)},
+        inputs=_source_rule_inputs(repo_root, execution.pipeline_dir, in_scope_src_dir),
+        compute=_source_structure,
+        violations=violations,
+    )
+
+
+# The per-execution rules of `validate()`, in the order their violations are reported. Each
+# reads only its own execution (and the repository), so executions are independent of one
+# another and `_run_execution_passes` may run them on a process pool; the violation order is
+# fixed by this tuple and the execution discovery order, never by scheduling.
+_EXECUTION_RULES: tuple[
+    Callable[[_ExecutionRuleContext, NodeExecution, bool, list[str]], None], ...
+] = (
+    lambda c, e, _o, v: _validate_algorithm_contract_schema(c.repo_root, e, v),
+    lambda c, e, _o, v: _validate_io_contract_schema(c.repo_root, e, v),
+    lambda c, e, _o, v: _validate_trial_meta(c.repo_root, e, v),
+    lambda c, e, _o, v: _validate_execution_json_outputs(e, v),
+    lambda c, e, _o, v: _validate_raw_evidence(c.repo_root, e, v),
+    lambda c, e, _o, v: _validate_metrics_basis_not_trivial(e, v),
+    _rule_structural_source,
+    lambda c, e, _o, v: _validate_run_program_inputs(c.repo_root, e, v),
+    lambda c, e, _o, v: _validate_quality_check_commands(c.repo_root, e, v),
+    lambda c, e, _o, v: _validate_tests_verdict_summary_consistency(
+        c.repo_root, e, v, require_verdict=c.require_verdict),
+    lambda c, e, _o, v: _validate_llm_semantic_review(
+        c.repo_root, e, v, require_llm_review=c.require_llm_review),
+)
+
+
+def _execution_pass(
+    ctx: _ExecutionRuleContext, execution: NodeExecution, owns_source: bool
+) -> _ExecutionPass:
+    violations: list[str] = []
+    documents = _active_evidence_documents.set({})
+    try:
+        for rule in _EXECUTION_RULES:
+            rule(ctx, execution, owns_source, violations)
+    finally:
+        _active_evidence_documents.reset(documents)
+    expected_nodes: set[str] = set()
+    run_token: str | None = None
+    dep_data = _dependency_resolved_for_execution(ctx.repo_root, execution)
+    if isinstance(dep_data, dict):
+        expected_nodes = _dependency_expected_node_keys(dep_data)
+        run_token = _dependency_run_token(dep_data)
+    cache = _active_rule_cache.get()
+    return _ExecutionPass(
+        violations=violations,
+        fingerprint=_source_fingerprint(execution),
+        expected_nodes=expected_nodes,
+        run_token=run_token,
+        cache_mismatches=list(cache.mismatches) if cache is not None else [],
+    )
+
+
+def _init_execution_worker(repo_root: Path, cache_mode: str | None) -> None:
+    """Process-pool initializer: a worker runs under the caller's schema root and, when the
+    caller had one, its own rule cache in the caller's mode."""
+    _active_repo_root_for_schema.set(repo_root)
+    if cache_mode is not None:
+        _active_rule_cache.set(gate_cache.RuleCache(
+            repo_root, cache_mode,
+            violation_types={"StaleDependencyIRViolation": StaleDependencyIRViolation},
+        ))
+
+
+def _execution_pass_in_worker(
+    ctx: _ExecutionRuleContext, execution: NodeExecution, owns_source: bool
+) -> _ExecutionPass:
+    cache = _active_rule_cache.get()
+    if cache is not None:
+        cache.mismatches.clear()
+    return _execution_pass(ctx, execution, owns_source)
+
+
+def _run_execution_passes(
+    ctx: _ExecutionRuleContext,
+    executions: list[NodeExecution],
+    owns_source: list[bool],
+    jobs: int,
+) -> list[_ExecutionPass]:
+    """Every execution's pass, in `executions` order. With ``jobs > 1`` and more than one
+    execution they run on a process pool (the rules are CPU-bound Python); results are
+    still collected in order, so the report is byte-identical to the serial one and the
+    first failing execution's exception is the one raised."""
+    cache = _active_rule_cache.get()
+    if jobs <= 1 or len(executions) <= 1:
+        results = [_execution_pass(ctx, e, o) for e, o in zip(executions, owns_source)]
+        if cache is not None:
+            # The serial passes share the caller's cache; its mismatches are already there.
+            for result in results:
+                result.cache_mismatches = []
+        return results
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(executions)),
+        initializer=_init_execution_worker,
+        initargs=(ctx.repo_root, cache.mode if cache is not None else None),
+    ) as pool:
+        futures = [pool.submit(_execution_pass_in_worker, ctx, e, o)
+                   for e, o in zip(executions, owns_source)]
+        results = [f.result() for f in futures]
+    if cache is not None:
+        for result in results:
+            cache.mismatches.extend(result.cache_mismatches)
+    return results
+
+
 def validate(
     repo_root: Path,
     workspace_root: str,
@@ -13803,6 +14220,7 @@ def validate(
     in_flight_agent_run_ids: set[str] | None = None,
     current_orchestration_id: str | None = None,
     require_verdict: bool = True,
+    jobs: int = 1,
 ) -> list[str]:
     with _pinned_repo_root_for_schema(repo_root):
         return _validate_impl(
@@ -13815,6 +14233,7 @@ def validate(
             in_flight_agent_run_ids,
             current_orchestration_id,
             require_verdict,
+            jobs,
         )
 
 
@@ -13828,6 +14247,7 @@ def _validate_impl(
     in_flight_agent_run_ids: set[str] | None = None,
     current_orchestration_id: str | None = None,
     require_verdict: bool = True,
+    jobs: int = 1,
 ) -> list[str]:
     violations: list[str] = []
     normalized_workspace_root = _normalize_workspace_root_token(workspace_root)
@@ -13911,61 +14331,33 @@ def _validate_impl(
     lineage_contexts: list[tuple[NodeLineage, set[str], str | None]] = []
     lineages = _lineage_records(workspace_path, pipeline_roots)
     # Structural SOURCE checks are scoped to the source each execution declares
-    # via trial_meta.source_source_id (mirroring --run-id run-scoping). Track the
-    # sources already structurally validated so that, in legacy multi-run mode,
-    # several runs sharing one source do not re-validate it and emit duplicate
-    # violations.
+    # via trial_meta.source_source_id (mirroring --run-id run-scoping). The first
+    # execution (in discovery order) declaring a source owns its structural scan, so
+    # that, in legacy multi-run mode, several runs sharing one source do not
+    # re-validate it and emit duplicate violations. Decided up front so each
+    # execution's pass is independent of the others and can run on a worker.
     validated_structural_src_dirs: set[Path] = set()
-
+    owns_source: list[bool] = []
     for execution in executions:
-        _validate_algorithm_contract_schema(repo_root, execution, violations)
-        _validate_io_contract_schema(repo_root, execution, violations)
-        _validate_trial_meta(repo_root, execution, violations)
-        _validate_execution_json_outputs(execution, violations)
-        _validate_raw_evidence(repo_root, execution, violations)
-        _validate_metrics_basis_not_trivial(execution, violations)
-        in_scope_src_dir = _execution_in_scope_src_dir(execution, violations)
-        if (
-            in_scope_src_dir is not None
-            and in_scope_src_dir not in validated_structural_src_dirs
-        ):
-            validated_structural_src_dirs.add(in_scope_src_dir)
-            _validate_generate_outputs(
-                repo_root, execution, in_scope_src_dir, violations
-            )
-            _validate_dependency_operation_usage(
-                repo_root, execution, in_scope_src_dir, violations
-            )
-            _validate_runner_outputs(
-                execution, in_scope_src_dir, violations,
-                known_case_ids=_case_ids_for_execution(repo_root, execution),
-            )
-        _validate_run_program_inputs(repo_root, execution, violations)
-        _validate_quality_check_commands(repo_root, execution, violations)
-        _validate_tests_verdict_summary_consistency(
-            repo_root, execution, violations, require_verdict=require_verdict
-        )
-        _validate_llm_semantic_review(
-            repo_root,
-            execution,
-            violations,
-            require_llm_review=require_llm_review,
-        )
-
-        fp = _source_fingerprint(execution)
-        if fp is not None:
-            source_hash_map.setdefault(fp.digest, []).append(fp)
-        dep_data = _dependency_resolved_for_execution(repo_root, execution)
-        if isinstance(dep_data, dict):
-            expected_nodes = _dependency_expected_node_keys(dep_data)
-            if expected_nodes:
-                dep_contexts.append(
-                    (
-                        execution,
-                        expected_nodes,
-                        _dependency_run_token(dep_data),
-                    )
-                )
+        src_dir = _execution_in_scope_src_dir(execution, [])
+        owns_source.append(src_dir is not None and src_dir not in validated_structural_src_dirs)
+        if src_dir is not None:
+            validated_structural_src_dirs.add(src_dir)
+
+    context = _ExecutionRuleContext(
+        repo_root=repo_root,
+        require_llm_review=require_llm_review,
+        require_verdict=require_verdict,
+    )
+    for execution, result in zip(
+        executions, _run_execution_passes(context, executions, owns_source, jobs)
+    ):
+        violations.extend(result.violations)
+        if result.fingerprint is not None:
+            source_hash_map.setdefault(result.fingerprint.digest, []).append(
+                result.fingerprint)
+        if result.expected_nodes:
+            dep_contexts.append((execution, result.expected_nodes, result.run_token))
     for lineage in lineages:
         if not lineage.dependency_ref or not lineage.dependency_ref.startswith("workspace/"):
             continue
@@ -14230,6 +14622,34 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Allow missing orchestration artifacts for legacy pipelines.",
     )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            f"Recompute every rule; neither read nor write the rule-result cache "
+            f"({gate_cache.CACHE_DIR}/)."
+        ),
+    )
+    cache_group.add_argument(
+        "--cache-check",
+        action="store_true",
+        help=(
+            "Self-check the rule-result cache: recompute every cached rule, compare it with "
+            "the stored entry, and report each disagreement on stderr (the recomputed result "
+            "is the one used and stored)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_jobs,
+        default=1,
+        help=(
+            "Run the per-execution rules of the post_execute/pre_judge/final stages on up "
+            "to N worker processes (default: 1, in-process). The report is identical to the "
+            "serial one: violations are merged in execution discovery order."
+        ),
+    )
     parser.add_argument(
         "--legacy-mode",
         action="store_true",
@@ -14264,8 +14684,31 @@ def main(argv: list[str] | None = None) -> int:
     # process (or repeated in-process main() calls in tests / batch tooling)
     # would leak the first repo's context into later validations against a
     # different repo_root, producing order-dependent schema-resolution bugs.
-    with _pinned_repo_root_for_schema(repo_root):
-        return _main_dispatch(args, repo_root)
+    cache = gate_cache.RuleCache(
+        repo_root,
+        "off" if args.no_cache else "check" if args.cache_check else "on",
+        violation_types={"StaleDependencyIRViolation": StaleDependencyIRViolation},
+    )
+    cache_token = _active_rule_cache.set(cache)
+    try:
+        with _pinned_repo_root_for_schema(repo_root):
+            return _main_dispatch(args, repo_root)
+    finally:
+        _active_rule_cache.reset(cache_token)
+        if cache.mismatches:
+            print("gate cache self-check: MISMATCH", file=sys.stderr)
+            for line in cache.mismatches:
+                print(f"- {line}", file=sys.stderr)
+
+
+def _positive_jobs(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"--jobs must be an integer (got {raw!r})") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"--jobs must be >= 1 (got {value})")
+    return value
 
 
 def _main_dispatch(args: argparse.Namespace, repo_root: Path) -> int:
@@ -14332,6 +14775,7 @@ def _main_dispatch(args: argparse.Namespace, repo_root: Path) -> int:
                     # The ONLY stage where verdict.json is legitimately absent: the conductor
                     # authors it after this gate returns clean (`_execute_inproc`).
                     require_verdict=False,
+                    jobs=args.jobs,
                 )
             elif args.stage == "pre_judge":
                 violations = validate(
@@ -14351,6 +14795,7 @@ def _main_dispatch(args: argparse.Namespace, repo_root: Path) -> int:
                         if args.orchestration_id and args.orchestration_id.strip()
                         else None
                     ),
+                    jobs=args.jobs,
                 )
             else:
                 violations = validate(
@@ -14363,6 +14808,7 @@ def _main_dispatch(args: argparse.Namespace, repo_root: Path) -> int:
                     # ORCHESTRATION artifacts, and coupling the verdict to it would let
                     # `--allow-missing-orchestration` silently switch off the verdict/summary pin.
                     require_verdict=True,
+                    jobs=args.jobs,
                 )
     except fortran_structure.FortranStructureUnavailableError as exc:
         # A DEDICATED EXIT CODE, because this failure is the OPERATOR's and no edit to any source
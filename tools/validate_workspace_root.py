@@ -11,11 +11,19 @@ import argparse
 import json
 import os
 import re
+import stat
 import subprocess
+import tempfile
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+try:  # script run: sys.path[0] is tools/ ; package import: repo root on path
+    from gate_cache import CACHE_DIR as _GATE_CACHE_DIR, code_fingerprint as _code_fingerprint
+except ImportError:  # pragma: no cover - import-path shim
+    from tools.gate_cache import CACHE_DIR as _GATE_CACHE_DIR, code_fingerprint as _code_fingerprint
 
 
 # Adv-17: TTL beyond which a "running" orchestration is considered stale
@@ -154,8 +162,12 @@ def _orchestration_has_active_marker(orch_dir: Path) -> bool:
     return bool(_orchestration_active_marker_arids(orch_dir))
 
 
-def _path_recursive_max_mtime(path: Path) -> float:
-    """Return the maximum mtime under `path`, recursively. 0.0 if empty/error."""
+def _path_recursive_max_mtime(
+    path: Path, inventory: "_WorkspaceInventory | None" = None
+) -> float:
+    """Return the maximum mtime under `path`, recursively. 0.0 if empty/error.
+
+    With an `inventory` that listed `path`, its entries stand in for a fresh `rglob`."""
     latest = 0.0
     try:
         st = path.stat()
@@ -165,8 +177,9 @@ def _path_recursive_max_mtime(path: Path) -> float:
         return 0.0
     if not path.is_dir():
         return latest
+    listed = inventory.subtree(path) if inventory is not None else None
     try:
-        for sub in path.rglob("*"):
+        for sub in listed if listed is not None else path.rglob("*"):
             try:
                 m = sub.stat().st_mtime
             except OSError:
@@ -208,6 +221,7 @@ def _orchestration_active_marker_arids(
     orch_dir: Path,
     fresh_within_seconds: float | None = None,
     workspace_root: Path | None = None,
+    inventory: "_WorkspaceInventory | None" = None,
 ) -> set[str]:
     """Return the set of arids that have a per-arid active_children marker.
 
@@ -246,7 +260,7 @@ def _orchestration_active_marker_arids(
             if workspace_root is not None:
                 tmp_subdir = workspace_root / "tmp" / arid
                 if tmp_subdir.exists():
-                    latest = max(latest, _path_recursive_max_mtime(tmp_subdir))
+                    latest = max(latest, _path_recursive_max_mtime(tmp_subdir, inventory))
             if latest < cutoff:
                 continue
         out.add(arid)
@@ -273,6 +287,13 @@ ALLOWED_WORKSPACE_TOP_LEVEL_DIRS = {
     # Must stay in sync with that constant (a standalone-validator import of the heavy runtime
     # module is avoided; test_orchestration_runtime.py drift-guards the coupling instead).
     ".pycache",
+    # Leaf segment of tools/gate_cache.CACHE_DIR (`workspace/.gate_cache`): the host-written
+    # validator rule-result cache; mirrored by orchestration_runtime._HOST_GATE_CACHE_PREFIX.
+    ".gate_cache",
+    # Leaf segment of tools/compile_cache.CACHE_DIR (`workspace/.build_cache`): Build's
+    # host-written dependency compile cache; mirrored by
+    # orchestration_runtime._HOST_BUILD_CACHE_PREFIX.
+    ".build_cache",
 }
 NODE_KEY_SAFE_PATTERN = re.compile(
     r"^[a-z][a-z0-9_]*__[a-z0-9][a-z0-9_]*__[0-9][0-9A-Za-z._-]*$"
@@ -281,6 +302,175 @@ SLUG_DATE_SEQ3_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*_[0-9]{8}_[0-9]{3
 AGENT_RUN_ID_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$")
 
 
+@dataclass(frozen=True)
+class _InventoryEntry:
+    path: Path
+    is_dir: bool  # follows a symlink, as `Path.is_dir()` does
+    is_symlink: bool
+
+
+class _WorkspaceInventory:
+    """Every entry under workspace/, listed by ONE `os.scandir` traversal.
+
+    The JSON reference scan, the forbidden-script scan, the layout scan and the tmp-dir
+    liveness probe each used to list the tree again (`rglob("*.json")`, `rglob("*.py")`,
+    `iterdir()`, `rglob("*")` per live tmp dir). They now read this listing instead. It
+    descends into real directories only, never through a symlinked one, exactly as `rglob`
+    does, so every check sees the entries it saw before.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.children: dict[Path, list[_InventoryEntry]] = {}
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            entries: list[_InventoryEntry] = []
+            try:
+                with os.scandir(directory) as it:
+                    for dirent in it:
+                        try:
+                            is_dir = dirent.is_dir()
+                            is_symlink = dirent.is_symlink()
+                        except OSError:
+                            is_dir = is_symlink = False
+                        entries.append(
+                            _InventoryEntry(directory / dirent.name, is_dir, is_symlink)
+                        )
+            except OSError:
+                pass
+            entries.sort(key=lambda entry: entry.path)
+            self.children[directory] = entries
+            pending.extend(e.path for e in entries if e.is_dir and not e.is_symlink)
+
+    def listing(self, directory: Path) -> list[_InventoryEntry]:
+        """The sorted entries of `directory`; listed afresh when the traversal did not enter
+        it (a symlinked directory, or one created since)."""
+        listed = self.children.get(directory)
+        if listed is not None:
+            return listed
+        try:
+            return [_InventoryEntry(p, p.is_dir(), p.is_symlink())
+                    for p in sorted(directory.iterdir())]
+        except OSError:
+            return []
+
+    def subtree(self, directory: Path) -> list[Path] | None:
+        """Every path below `directory` (what `directory.rglob("*")` yields), or None when
+        the traversal did not enter it."""
+        if directory not in self.children:
+            return None
+        out: list[Path] = []
+        pending = [directory]
+        while pending:
+            for entry in self.children.get(pending.pop(), ()):
+                out.append(entry.path)
+                if entry.is_dir and not entry.is_symlink:
+                    pending.append(entry.path)
+        return out
+
+    def named(self, suffix: str) -> list[Path]:
+        """`sorted(root.rglob(f"*{suffix}"))`: every entry, of any type, whose name ends in
+        `suffix`."""
+        return sorted(
+            entry.path
+            for entries in self.children.values()
+            for entry in entries
+            if entry.path.name.endswith(suffix)
+        )
+
+
+# The scan cursor: each JSON file's reference-scan result from the previous CLI run, replayed
+# while the file's stat identity is unchanged. Lives in the host-written gate cache
+# (tools/gate_cache.py) and, like it, is engaged only by `main`.
+SCAN_CURSOR_FILENAME = "workspace_scan.json"
+_SCAN_CURSOR_VERSION = 1
+# A file changed this close to the scan may change again within one timestamp tick without a
+# visible stat change (git's "racily clean" entries); its result is not recorded.
+_SCAN_CURSOR_RACY_NS = 2_000_000_000
+
+
+class _ScanCursor:
+    """Per-file scan results keyed by (size, mtime_ns, ctime_ns, inode, device).
+
+    `ctime` cannot be set from user space, so a rewritten file — even one given its old
+    mtime back — is always rescanned. Entries for files that no longer exist are dropped on
+    `save`. A symlinked cache root is refused, as by `gate_cache.RuleCache`."""
+
+    def __init__(self, workspace_root: Path, enabled: bool) -> None:
+        self.workspace_root = workspace_root
+        self.path = workspace_root.parent / _GATE_CACHE_DIR / SCAN_CURSOR_FILENAME
+        self.enabled = enabled and not any(
+            p.is_symlink() for p in (self.path.parent, workspace_root))
+        self.hits = 0
+        self._started_ns = time.time_ns()
+        self._previous: dict[str, Any] = {}
+        self._current: dict[str, Any] = {}
+        if not self.enabled:
+            return
+        try:
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(doc, dict)
+            and doc.get("version") == _SCAN_CURSOR_VERSION
+            and doc.get("code") == _code_fingerprint()
+            and doc.get("workspace_root") == str(workspace_root)
+            and isinstance(doc.get("entries"), dict)
+        ):
+            self._previous = doc["entries"]
+
+    def replay(self, path: Path, compute: Callable[[Path], list[str]]) -> list[str]:
+        if not self.enabled:
+            return compute(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute(path)
+        if not stat.S_ISREG(st.st_mode):
+            return compute(path)
+        identity = [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_dev]
+        key = str(path)
+        entry = self._previous.get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("stat") == identity
+            and isinstance(entry.get("violations"), list)
+            and all(isinstance(v, str) for v in entry["violations"])
+        ):
+            self.hits += 1
+            result = list(entry["violations"])
+        else:
+            result = compute(path)
+        if max(st.st_mtime_ns, st.st_ctime_ns) < self._started_ns - _SCAN_CURSOR_RACY_NS:
+            self._current[key] = {"stat": identity, "violations": result}
+        return list(result)
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        body = json.dumps(
+            {"version": _SCAN_CURSOR_VERSION, "code": _code_fingerprint(),
+             "workspace_root": str(self.workspace_root), "entries": self._current},
+            ensure_ascii=False, separators=(",", ":"), sort_keys=True,
+        ) + "\n"
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                    stream.write(body)
+                os.replace(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # Best effort, as for the gate cache: a read-only checkout costs only the cursor.
+            pass
+
+
 def _normalize_workspace_root_token(workspace_root: str) -> str:
     token = workspace_root.strip().replace("\\", "/")
     token = token.lstrip("./")
@@ -531,7 +721,9 @@ def _orchestration_agent_run_id(orch_dir: Path) -> str | None:
     return None
 
 
-def _live_agent_tmp_run_ids(workspace_root: Path) -> set[str]:
+def _live_agent_tmp_run_ids(
+    workspace_root: Path, inventory: _WorkspaceInventory | None = None
+) -> set[str]:
     """Return agent_run_ids whose `workspace/tmp/<arid>/` directories are
     legitimately exempt from the forbidden-script scan.
 
@@ -660,6 +852,7 @@ def _live_agent_tmp_run_ids(workspace_root: Path) -> set[str]:
                 orch_dir,
                 fresh_within_seconds=ttl_secs,
                 workspace_root=workspace_root,
+                inventory=inventory,
             )
             # Adv-31: also check the orchestration agent's own tmp dir.
             # Between child launches (or during parent-only recovery work),
@@ -672,7 +865,7 @@ def _live_agent_tmp_run_ids(workspace_root: Path) -> set[str]:
             if orch_arid_for_freshness is not None:
                 orch_tmp = workspace_root / "tmp" / orch_arid_for_freshness
                 if orch_tmp.exists():
-                    if _path_recursive_max_mtime(orch_tmp) >= cutoff:
+                    if _path_recursive_max_mtime(orch_tmp, inventory) >= cutoff:
                         per_arid_marker_filter = per_arid_marker_filter | {orch_arid_for_freshness}
             if not per_arid_marker_filter:
                 continue
@@ -817,7 +1010,9 @@ def _live_agent_tmp_run_ids(workspace_root: Path) -> set[str]:
     return live
 
 
-def _scan_workspace_for_forbidden_scripts(workspace_root: Path) -> list[str]:
+def _scan_workspace_for_forbidden_scripts(
+    workspace_root: Path, inventory: _WorkspaceInventory | None = None
+) -> list[str]:
     """Reject *.py under workspace/ EXCEPT inside per-agent tmp dirs of LIVE runs.
 
     workspace/tmp/<agent_run_id>/ is a sanctioned scratch root while the agent
@@ -834,9 +1029,11 @@ def _scan_workspace_for_forbidden_scripts(workspace_root: Path) -> list[str]:
     launched, or stale agent_run_id no longer fails open.
     """
     violations: list[str] = []
+    if inventory is None:
+        inventory = _WorkspaceInventory(workspace_root)
     tmp_root = workspace_root / "tmp"
     tmp_root_present = tmp_root.exists() and tmp_root.is_dir()
-    live_arids = _live_agent_tmp_run_ids(workspace_root) if tmp_root_present else set()
+    live_arids = _live_agent_tmp_run_ids(workspace_root, inventory) if tmp_root_present else set()
     # Adv-32: use the LEXICAL path under workspace/ for the exemption decision,
     # not Path.resolve(). resolve() follows symlinks, so a symlink such as
     # workspace/ir/foo/helper.py -> ../../tmp/<live-arid>/helper.py would
@@ -850,7 +1047,7 @@ def _scan_workspace_for_forbidden_scripts(workspace_root: Path) -> list[str]:
         workspace_root_resolved = workspace_root.resolve(strict=False)
     except OSError:
         workspace_root_resolved = workspace_root
-    for py_path in sorted(workspace_root.rglob("*.py")):
+    for py_path in inventory.named(".py"):
         # Lexical path relative to workspace/.
         try:
             rel_to_ws = py_path.relative_to(workspace_root)
@@ -913,10 +1110,15 @@ def _is_empty_regular_file(path: Path) -> bool:
     return _stat.S_ISREG(st.st_mode) and st.st_size == 0
 
 
-def _scan_workspace_layout(workspace_root: Path) -> list[str]:
+def _scan_workspace_layout(
+    workspace_root: Path, inventory: _WorkspaceInventory | None = None
+) -> list[str]:
     violations: list[str] = []
-    for child in sorted(workspace_root.iterdir()):
-        if not child.is_dir():
+    if inventory is None:
+        inventory = _WorkspaceInventory(workspace_root)
+    for entry in inventory.listing(workspace_root):
+        child = entry.path
+        if not entry.is_dir:
             continue
         if child.name in ALLOWED_WORKSPACE_TOP_LEVEL_DIRS:
             continue
@@ -926,8 +1128,9 @@ def _scan_workspace_layout(workspace_root: Path) -> list[str]:
 
     tmp_root = workspace_root / "tmp"
     if tmp_root.exists() and tmp_root.is_dir():
-        for child in sorted(tmp_root.iterdir()):
-            if not child.is_dir():
+        for entry in inventory.listing(tmp_root):
+            child = entry.path
+            if not entry.is_dir:
                 # Runtime-managed fcntl cleanup sidecar (orchestration_runtime.py
                 # _cleanup_agent_tmp_root locks workspace/tmp/<arid>.lock; the
                 # unauthorized-write guard already exempts it at :6586-6591).
@@ -956,8 +1159,9 @@ def _scan_workspace_layout(workspace_root: Path) -> list[str]:
         if not stage_root.exists() or not stage_root.is_dir():
             continue
 
-        for node_safe_dir in sorted(stage_root.iterdir()):
-            if not node_safe_dir.is_dir():
+        for node_entry in inventory.listing(stage_root):
+            node_safe_dir = node_entry.path
+            if not node_entry.is_dir:
                 continue
             node_safe = node_safe_dir.name
             if not NODE_KEY_SAFE_PATTERN.match(node_safe):
@@ -966,8 +1170,9 @@ def _scan_workspace_layout(workspace_root: Path) -> list[str]:
                 )
                 continue
 
-            for id_dir in sorted(node_safe_dir.iterdir()):
-                if not id_dir.is_dir():
+            for id_entry in inventory.listing(node_safe_dir):
+                id_dir = id_entry.path
+                if not id_entry.is_dir:
                     continue
                 if not SLUG_DATE_SEQ3_PATTERN.match(id_dir.name):
                     violations.append(
@@ -994,7 +1199,11 @@ def validate_with_scope(
     stage: str,
     node_key: str,
     pipeline_id: str,
+    *,
+    scan_cursor: bool = False,
 ) -> tuple[list[str], bool]:
+    """Run every workspace check. `scan_cursor` (the CLI's default) replays each unchanged
+    JSON file's reference-scan result from the previous run (`_ScanCursor`)."""
     violations: list[str] = []
     created_workspace = False
     normalized_workspace_root = _normalize_workspace_root_token(workspace_root)
@@ -1012,12 +1221,13 @@ def validate_with_scope(
         created_workspace = True
 
     if canonical_root.exists() and canonical_root.is_dir():
-        for json_file in sorted(canonical_root.rglob("*.json")):
-            violations.extend(_scan_json_for_violations(json_file))
-
-    if canonical_root.exists() and canonical_root.is_dir():
-        violations.extend(_scan_workspace_for_forbidden_scripts(canonical_root))
-        violations.extend(_scan_workspace_layout(canonical_root))
+        inventory = _WorkspaceInventory(canonical_root)
+        cursor = _ScanCursor(canonical_root, enabled=scan_cursor)
+        for json_file in inventory.named(".json"):
+            violations.extend(cursor.replay(json_file, _scan_json_for_violations))
+        cursor.save()
+        violations.extend(_scan_workspace_for_forbidden_scripts(canonical_root, inventory))
+        violations.extend(_scan_workspace_layout(canonical_root, inventory))
 
     if write_scope_baseline:
         baseline_path = Path(write_scope_baseline)
@@ -1057,7 +1267,7 @@ def validate_with_scope(
     return violations, created_workspace
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--repo-root", default=".")
     parser.add_argument("--workspace-root", default="workspace")
@@ -1069,7 +1279,13 @@ def main() -> int:
     parser.add_argument("--stage", default="")
     parser.add_argument("--node-key", default="")
     parser.add_argument("--pipeline-id", default="")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan every JSON file; neither read nor update the scan cursor "
+        f"({_GATE_CACHE_DIR}/{SCAN_CURSOR_FILENAME}).",
+    )
+    args = parser.parse_args(argv)
 
     repo_root = Path(args.repo_root).resolve()
     violations, created_workspace = validate_with_scope(
@@ -1079,6 +1295,7 @@ def main() -> int:
         stage=args.stage,
         node_key=args.node_key,
         pipeline_id=args.pipeline_id,
+        scan_cursor=not args.no_cache,
     )
     if violations:
         print("workspace root validation: FAIL")
@@ -47,6 +47,7 @@ from zoneinfo import ZoneInfo
 import yaml
 
 from tools.backends import registry as backend_registry
+from tools.compile_cache import ARTIFACT_SET_DIR, CompileCache
 from tools.llm_config import (
     CAP_AGENTIC,
     CAP_PURE,
@@ -63,6 +64,13 @@ from tools.leaf_usage import (
     leaf_usage_unavailable,
     normalize_leaf_usage,
 )
+from tools.hooks.client import HOOK_SERVER_SOCKET_ENV
+from tools.hooks.server import (
+    bind_hook_server_launch,
+    ensure_hook_server,
+    hook_server_enabled,
+)
+from tools.runtime_service import run_runtime
 
 
 def _provider_command_base(entry: ResolvedLeafEntry) -> list[str]:
@@ -3688,11 +3696,10 @@ class Conductor:
             # the child blocks forever on read() instead of failing. An empty reply is a
             # clean dispatch-time error ("requires --reply-text or --reply-from-stdin").
             input = ""
-        proc = subprocess.run(
-            ["python3", "tools/orchestration_runtime.py", *args],
-            cwd=self.repo_root, env=self.env, text=True, capture_output=True, check=False,
-            input=input,
-        )
+        # `METDSL_RUNTIME_MODE=resident` serves the call from a warm worker instead of a
+        # fresh interpreter; the CLI contract (argv in, exit code + JSON stdout out) is the
+        # same either way (tools/runtime_service.py).
+        proc = run_runtime(self.repo_root, self.env, args, input=input)
         if proc.returncode != 0:
             detail = proc.stderr.strip() or proc.stdout.strip() or f"exit={proc.returncode}"
             raise RuntimeError(f"runtime {args[0]} failed: {detail}")
@@ -4456,6 +4463,7 @@ class Conductor:
                     f"cannot launch sandboxed leaf — executable not found "
                     f"(bwrap missing on this host?): {exc}") from exc
             raise
+        self._bind_hook_server_launch(child_env, process.pid)
         self._feed_prompt_stdin(process, prompt_text)
         # The ONE place the claude leaf is waited on, and therefore the only place the cap has to
         # be armed: a deterministic substep never reaches spawn_leaf, the usage-reset wait happens
@@ -4768,6 +4776,7 @@ class Conductor:
         )
         assert process.stdout is not None
         assert process.stderr is not None
+        self._bind_hook_server_launch(child_env, process.pid)
         self._feed_prompt_stdin(process, prompt_text)
         # Set when the conductor gives up on the streams: the reader threads survive the call
         # (see the abandon path below), and this is what stops them appending — and reading —
@@ -5560,6 +5569,40 @@ class Conductor:
             json.dumps(graph, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
         return None
 
+    def _snapshot_content_digest_inputs(self, refs: NodeRefs) -> None:
+        """Capture the node's content-digest derivation inputs (`tools/content_digest.py`) at
+        Compile start, for `_write_content_digest` to bind to the IR this compile certifies. A
+        spec edit made while the leaf runs then shows up as a stale record, not a silently
+        re-keyed one. Best-effort: an underivable input leaves no snapshot."""
+        from tools import content_digest
+        kind, _, rest = refs.node_key.partition("/")
+        if not hasattr(self, "_content_digest_inputs"):
+            self._content_digest_inputs: dict[str, dict[str, Any] | None] = {}
+        self._content_digest_inputs[refs.node_key] = content_digest.derivation_inputs(
+            self.repo_root, refs.spec_path, spec_kind=kind, spec_id=refs.spec_id)
+
+    def _write_content_digest(self, refs: NodeRefs) -> None:
+        """Author `<ir_ref>/content_digest.json` host-side once Compile has passed (R6 proper).
+
+        The record carries the node's Merkle derivation key — over its `controlled_spec.md`,
+        `tests.md`, `deps.yaml` and its dependencies' keys — and the digests of the IR and
+        target profile it certified. Readiness (`_dependency_resolution_freshness`) compares it
+        with today's derivation, so `--with-deps` skips a node whose content is unchanged and
+        re-runs exactly the cone below a changed one. Sister of `_write_dependency_graph`; the
+        sidecar lives under the leaf-non-writable `<ir_ref>/`. Best-effort: a node without a
+        record keeps the version-granularity freshness check, so a failure here only emits."""
+        from tools import content_digest
+        derived = getattr(self, "_content_digest_inputs", {}).pop(refs.node_key, None)
+        record = content_digest.build_record(
+            self.repo_root, refs.spec_path, node_key=refs.node_key,
+            ir_dir=self.repo_root / refs.ir_ref, derived=derived)
+        if record is None:
+            self.emit("content_digest_skipped", node_key=refs.node_key)
+            return
+        path = self.repo_root / refs.ir_ref / content_digest.SIDECAR_NAME
+        path.write_text(
+            json.dumps(record, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
     def _write_dependency_surface(self, refs: NodeRefs) -> list[dict[str, Any]]:
         """Author `<ir_ref>/dependency_surface.json` host-side at Compile start: for each COMPONENT
         direct dependency, its published operation NAME surface (`published_operations` + a `source`
@@ -5995,6 +6038,19 @@ class Conductor:
         names and the staged source filenames stay in lockstep."""
         return [spec_id_of(nk) for nk in self._dependency_closure_nodes(refs)]
 
+    @staticmethod
+    def _compile_rule_flags(tc: dict[str, str]) -> tuple[str, str]:
+        """The compiler and (unexpanded) flags the conductor-authored control file compiles
+        with. Build's compile cache keys on the same pair, so it is derived in one place."""
+        # The optional toolchain.compiler pins FC (a Fujitsu frt build only needs this IR
+        # field plus a run_syntax_check adapter); unset keeps the gfortran default.
+        fc = tc["compiler"] or "gfortran"
+        flags = f"-std={tc['standard']} -O2"
+        if tc["backend"] == "openmp":
+            flags += " -fopenmp"
+        flags += " -J$(OBJDIR) -I$(OBJDIR)"
+        return fc, flags
+
     def _write_makefile(self, refs: NodeRefs) -> None:
         """Author the `src/Makefile` host-side (runtime-owned), deterministically.
 
@@ -6008,7 +6064,8 @@ class Conductor:
         post_generate validators still run against this file as a safety net.
 
         Imposes `BIN ?= <spec_id>_runner` (overridable so Build/Validate.execute can pin the
-        canonical binary name) and FFLAGS derived from toolchain.standard + target.backend.
+        canonical binary name) and pins (`:=`) FFLAGS derived from toolchain.standard +
+        target.backend, the flags Build's compile cache keys on.
 
         A non-empty dependency closure (Model B, docs/design) emits per-dep object rules +
         a `DEP_OBJS` link list; the conductor stages each `<dep>_model.f90` into `$(OBJDIR)`
@@ -6018,7 +6075,6 @@ class Conductor:
         """
         tc = self._read_toolchain(refs)
         language = tc["language"]
-        standard = tc["standard"]
         build_system = tc["build_system"]
         if not self._core_authors_control_file(build_system, language):
             # A toolchain the neutral core has no control-file writer for keeps LLM authoring.
@@ -6027,10 +6083,7 @@ class Conductor:
             # double-owned. `_read_toolchain` has already lowered both values, and it does not
             # strip — which the predicate relies on, so do not normalize again here.
             return
-        backend = tc["backend"]
-        # The optional toolchain.compiler pins FC (a Fujitsu frt build only needs this IR
-        # field plus a run_syntax_check adapter); unset keeps the gfortran default.
-        fc = tc["compiler"] or "gfortran"
+        fc, flags = self._compile_rule_flags(tc)
 
         model = f"{refs.spec_id}_model"
         runner = f"{refs.spec_id}_runner"
@@ -6046,10 +6099,6 @@ class Conductor:
         # <case_id>...`). The runner takes the spec path positionally but does not
         # read it, so the `SPEC ?=` default is a harmless placeholder.
         cases_default = " ".join(self.read_case_ids(refs))
-        flags = f"-std={standard} -O2"
-        if backend == "openmp":
-            flags += " -fopenmp"
-        flags += " -J$(OBJDIR) -I$(OBJDIR)"
 
         # Dependency closure (Model B). Empty for leaf nodes -> the blocks
         # below collapse to "" and the leaf template is emitted byte-for-byte.
@@ -6094,6 +6143,8 @@ class Conductor:
 # FC is pinned with := (not ?=): make ships a built-in FC=f77 (origin default), and ?= does
 # NOT override a default-origin variable, so `FC ?= gfortran` would silently leave FC=f77.
 # The pinned value is impl_defaults.toolchain.compiler when the spec sets it, else gfortran.
+# The flags are pinned too: a host environment must not change what Build compiles with,
+# since its compile cache keys on exactly these flags.
 # The dirs/BIN stay ?= because Build/Validate.execute inject them via command line / env.
 # SPEC/CASES stay ?= because Validate.execute injects them via the make-test env so the
 # `make test` re-run invokes the runner identically to run_program (`--cases <spec> <ids>`);
@@ -6102,7 +6153,7 @@ FC      := {fc}
 OBJDIR  ?= .
 BINDIR  ?= .
 RUNDIR  ?= .
-FFLAGS  ?= {flags}
+FFLAGS  := {flags}
 
 BIN ?= {exe}
 SPEC ?= spec.ir.yaml
@@ -6314,11 +6365,7 @@ clean:
         before make), a `bundle:` / `glue:` source is a filename in the src/ cwd. Objects live
         under `$(OBJDIR)`; the conservative total prerequisite order comes from the graph."""
         tc = self._read_toolchain(refs)
-        fc = tc["compiler"] or "gfortran"
-        flags = f"-std={tc['standard']} -O2"
-        if tc["backend"] == "openmp":
-            flags += " -fopenmp"
-        flags += " -J$(OBJDIR) -I$(OBJDIR)"
+        fc, flags = self._compile_rule_flags(tc)
         exe = self._resolve_exe_name(refs)
         cases_default = " ".join(self.read_case_ids(refs))
 
@@ -6346,7 +6393,7 @@ FC      := {fc}
 OBJDIR  ?= .
 BINDIR  ?= .
 RUNDIR  ?= .
-FFLAGS  ?= {flags}
+FFLAGS  := {flags}
 
 BIN ?= {exe}
 SPEC ?= spec.ir.yaml
@@ -7412,6 +7459,16 @@ clean:
         names.update((e.api_key_env or "").strip() for e in cfg.entries.values())
         return frozenset(n for n in names if n)
 
+    def _bind_hook_server_launch(self, child_env: dict[str, str], pid: int) -> None:
+        """Tie the warm hook server's registration of this leaf to the process just spawned.
+
+        The server answers a hook only for a caller descending from that process, so until
+        this lands — or if it fails — the leaf's hooks run cold, exactly as without a server.
+        """
+        child_arid = (child_env.get("METDSL_CHILD_AGENT_RUN_ID") or "").strip()
+        if child_arid and child_env.get(HOOK_SERVER_SOCKET_ENV):
+            bind_hook_server_launch(self.repo_root, self.orchestration_id, child_arid, pid)
+
     def _child_env(self, child_arid: str,
                    entry: ResolvedLeafEntry | None = None) -> dict[str, str]:
         entry = entry if entry is not None else self.entry_for(None, None)
@@ -7444,6 +7501,17 @@ clean:
         # session-index token with the authoritative thread id.
         env["METDSL_CHILD_AGENT_RUN_ID"] = child_arid
         env["TMPDIR"] = str(self.repo_root / "workspace" / "tmp" / child_arid)
+        # Opt-in warm hook server (`METDSL_HOOK_SERVER=1`, tools/hooks/server.py): one per
+        # orchestration, started on the first launch. The hook shim falls back to the cold
+        # policy CLI whenever the socket is absent or silent, so a server that did not come
+        # up, or could not register this launch's agent_run_id, only leaves this variable
+        # unset. The registration is bound to the leaf's pid once it is spawned
+        # (`_bind_hook_server_launch`).
+        if hook_server_enabled(self.env):
+            socket_path = ensure_hook_server(self.repo_root, self.orchestration_id, self.env,
+                                             agent_run_id=child_arid)
+            if socket_path is not None:
+                env[HOOK_SERVER_SOCKET_ENV] = str(socket_path)
         # Lift the claude leaf's output ceiling off the CLI default (see LEAF_MAX_OUTPUT_TOKENS:
         # thinking is billed against it, so the default truncates a hard leaf mid-think). Set
         # here — not in `.claude/settings.json` — so it stays a property of the CONDUCTOR'S leaf
@@ -8099,6 +8167,61 @@ clean:
             staged.append(self._rel(model_src))
         return staged
 
+    def _dependency_compile_cache(self, refs: NodeRefs,
+                                  staged: list[str]) -> CompileCache | None:
+        """Build's compile cache over the staged closure (empty for a leaf, which still
+        publishes its own artifact set through it), or None when the conductor does not
+        author the node's control file.
+
+        Units follow `_stage_dependency_sources` (deepest first, the staged basename equal to the
+        certified source's) and the control file's dependency rules, which compile each
+        staged source to the object of the same stem; the compiler and flags are the ones those
+        rules carry (`_compile_rule_flags`)."""
+        tc = self._read_toolchain(refs)
+        if not self._core_authors_control_file(tc["build_system"], tc["language"]):
+            return None
+        fc, flags = self._compile_rule_flags(tc)
+        units = [(Path(ref).name, f"{Path(ref).stem}.o") for ref in staged]
+        return CompileCache(self.repo_root, units, compiler=fc, flags=flags)
+
+    def _dependency_artifact_sets(self, refs: NodeRefs) -> dict[str, Path]:
+        """Staged source name -> the `ARTIFACT_SET_DIR` beside the dependency binary that
+        source is staged from: the same latest-binary selection as `_stage_dependency_sources`.
+        A dependency whose binary or source does not resolve is simply absent; its staged
+        source is compiled (or taken from the compile cache)."""
+        from tools.orchestration_runtime import (
+            _certified_binary_meta,
+            _latest_pipeline_dir,
+            _model_source_from_binary_meta,
+        )
+        sets: dict[str, Path] = {}
+        for nk in self._dependency_closure_nodes(refs):
+            pipe_dir = _latest_pipeline_dir(
+                self.repo_root / "workspace" / "pipelines" / node_key_safe(nk))
+            sel = _certified_binary_meta(pipe_dir) if pipe_dir is not None else None
+            if sel is None:
+                continue
+            model_src = _model_source_from_binary_meta(pipe_dir, spec_id_of(nk), sel[1])
+            if model_src is not None:
+                sets[model_src.name] = sel[0].parent / ARTIFACT_SET_DIR
+        return sets
+
+    def _publish_artifact_set(self, refs: NodeRefs, compile_cache: CompileCache,
+                              obj_dir: Path) -> str | None:
+        """Publish the node's own model unit beside its binary_meta.json, for its dependents'
+        Builds; returns the set's ref, or None when nothing was published. The source is
+        named as a dependent's `_stage_dependency_sources` will resolve it from this binary."""
+        from tools.orchestration_runtime import _model_source_from_binary_meta
+        model_src = _model_source_from_binary_meta(
+            self.repo_root / refs.pipeline_ref, refs.spec_id,
+            {"source_source_id": refs.source_id})
+        if model_src is None:
+            return None
+        target = self.repo_root / refs.binary_dir() / ARTIFACT_SET_DIR
+        if not compile_cache.publish(target, obj_dir, model_src, f"{model_src.stem}.o"):
+            return None
+        return self._rel(target)
+
     def _build_inproc(self, refs: NodeRefs, child_arid: str, cap_token: str) -> dict[str, str]:
         """Deterministic Build: in-process compile_project + binary_meta + post_build gate."""
         import sys as _sys
@@ -8126,7 +8249,18 @@ clean:
         # failure raises -> _run_deterministic_substep catches it as a transport fail_closed
         # (build precondition: the dependency must be built ready first). The transient OBJDIR
         # stage never touches canonical src/ (phase_02 §41 carve-out).
-        self._stage_dependency_sources(refs, obj_dir)
+        staged = self._stage_dependency_sources(refs, obj_dir)
+        # The closure's objects from a previous Build of any node, where source, compiler,
+        # flags and the deeper units' interfaces all match (tools/compile_cache.py); make then
+        # finds them up to date and compiles only what missed.
+        compile_cache = self._dependency_compile_cache(refs, staged)
+        # A dependency whose certified binary published its artifact set under this toolchain
+        # is linked from that set instead (`_publish_artifact_set`); the rest fall back to the
+        # compile cache, then to compiling the staged source.
+        if compile_cache is not None and staged:
+            compile_cache.prime(obj_dir, self._dependency_artifact_sets(refs))
+        # A set left by an earlier Build under this binary_id must not outlive it.
+        shutil.rmtree(self.repo_root / refs.binary_dir() / ARTIFACT_SET_DIR, ignore_errors=True)
 
         result = tool_compile_project({
             "project_dir": str(src_dir),
@@ -8158,6 +8292,10 @@ clean:
         binary_missing = ok and not (bin_dir / exe).is_file()
         if binary_missing:
             ok = False
+        artifact_set_ref = None
+        if ok and compile_cache is not None:
+            compile_cache.store(obj_dir)
+            artifact_set_ref = self._publish_artifact_set(refs, compile_cache, obj_dir)
         # `command_log_ref` from the handler is cwd-relative (`_path_to_ref` uses
         # Path.cwd()), which is unreliable for the in-process caller — derive it from
         # our repo_root + the known canonical placement instead. Make's in-source build
@@ -8206,6 +8344,10 @@ clean:
             "failure_source_refs": [],
             "failure_excerpt": None,
         }
+        if compile_cache is not None and staged:
+            binary_meta["compile_cache"] = compile_cache.report()
+        if artifact_set_ref is not None:
+            binary_meta["artifact_set_ref"] = artifact_set_ref
         if binary_missing:
             # Makefile build-rule defect -> restart (regenerate the Makefile).
             binary_meta["failure_category"] = "make_error"
@@ -8249,6 +8391,9 @@ clean:
                     "failure_category": "validate_post_build_violation",
                     "failure_excerpt": "\n".join((gate.stdout + gate.stderr).splitlines()[-50:]),
                 })
+                # A failed binary publishes nothing for its dependents.
+                if binary_meta.pop("artifact_set_ref", None) is not None:
+                    shutil.rmtree(bdir / ARTIFACT_SET_DIR, ignore_errors=True)
                 meta_path.write_text(
                     json.dumps(binary_meta, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
                 stderr += "\n[post_build gate fail]\n" + gate.stdout + gate.stderr
@@ -8269,6 +8414,13 @@ clean:
             here, so gate_meta is NOT written and the substep returns rc 1 (transport
             fail_closed) — fail_closed dominates a co-occurring lint content-fail, the same order
             as the pre-merge sequential substeps, only surfaced sooner.
+          - lint and syntax run CONCURRENTLY (two threads; each spends its time in a child
+            process), so the gate costs max(lint, syntax) rather than the sum on every generate
+            attempt and warm repair turn. They share no state: separate evidence files, separate
+            staging dirs, and command_log.jsonl appends are serialized by the tool. Both are
+            joined before anything is read, and their results are taken in the fixed order
+            lint -> syntax, so when both raise it is lint's error that surfaces, exactly as when
+            they ran in sequence.
           - static (_gate_static_check): runs ONLY when lint AND syntax both pass. The
             post_generate certifier hard-fails on lint/syntax evidence whose ok flag is not true,
             so running it over a dirty source would double-report the same defect; skip is
@@ -8281,8 +8433,14 @@ clean:
         determine_substep_status reads gate_meta.gate_status. The DRIFT GUARD
         (test_mcp_grant_table_matches_conductor_call_sites) walks the `self._gate_*_check(` calls
         BELOW to derive this substep's gated-tool set, so keep them as explicit method calls."""
-        lint = self._gate_lint_check(refs, child_arid, cap_token)
-        syntax = self._gate_syntax_check(refs, child_arid, cap_token)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="generate-gate") as pool:
+            lint_future = pool.submit(lambda: self._gate_lint_check(refs, child_arid, cap_token))
+            syntax_future = pool.submit(
+                lambda: self._gate_syntax_check(refs, child_arid, cap_token))
+        # The `with` exit joined both checkers; read them in the canonical order.
+        lint = lint_future.result()
+        syntax = syntax_future.result()
         lint_ok = lint.get("status") == "pass"
         syntax_ok = syntax.get("status") == "pass"
         if lint_ok and syntax_ok:
@@ -9068,13 +9226,60 @@ clean:
             "Canonical: phase_02_generate.md / phase_04_validate.md §43."
         )
 
+    @staticmethod
+    def _execute_parallelism(impl: dict[str, Any]) -> dict[str, Any]:
+        """Validate.execute's threads per rank and OpenMP affinity, from the IR knob layer
+        (`impl_defaults.backend_overrides.openmp`: `num_threads`, `places`, `proc_bind`).
+
+        The thread count is read by the same rule the host-rendered runner bakes into
+        `perf.json#parallelism` (the literal `num_threads`, `max(1, int(...))`, 1 when absent or
+        unreadable), so the environment the run gets and the parallelism its evidence reports
+        agree; `_parallelism_mismatch` records a runner for which they do not. Affinity is passed through only when it is a string; run_program
+        refuses a value OpenMP would not accept."""
+        overrides = impl.get("backend_overrides") if isinstance(impl, dict) else None
+        omp = overrides.get("openmp") if isinstance(overrides, dict) else None
+        omp = omp if isinstance(omp, dict) else {}
+        try:
+            threads = max(1, int(omp.get("num_threads")))
+        except (TypeError, ValueError):
+            threads = 1
+        policy: dict[str, Any] = {"threads_per_rank": threads}
+        for knob in ("places", "proc_bind"):
+            value = omp.get(knob)
+            if isinstance(value, str) and value.strip():
+                policy[knob] = value.strip()
+        return policy
+
+    @staticmethod
+    def _parallelism_mismatch(node_dir: Path, applied: dict[str, Any]) -> dict[str, Any]:
+        """Where the promoted `perf.json#parallelism` disagrees with the policy run_program applied.
+
+        perf.json is the runner's evidence and is left as the runner wrote it: a runner whose
+        rendered thread count (or, when it reports them, `places` / `proc_bind`) differs from
+        the environment the run was given is a finding, not something the host restates. Keyed
+        by field, each `{"reported": ..., "applied": ...}`; empty when they agree. A missing or
+        malformed perf.json is left for the post_execute gate to report."""
+        perf = _read_json(node_dir / "perf.json")
+        reported = perf.get("parallelism") if isinstance(perf, dict) else None
+        if not isinstance(reported, dict):
+            return {}
+        mismatch: dict[str, Any] = {}
+        for field in ("threads_per_rank", "places", "proc_bind"):
+            if field not in reported and field != "threads_per_rank":
+                continue
+            if reported.get(field) != applied.get(field):
+                mismatch[field] = {"reported": reported.get(field),
+                                   "applied": applied.get(field)}
+        return mismatch
+
     @staticmethod
     def _author_quality_check(node_dir: Path, run_diag: dict[str, Any],
                               qc_diag: dict[str, Any], run_cmd_id: str | None,
                               qc_cmd_id: str | None, preset: str,
-                              threads: int) -> str:
+                              threads: int, qc_threads: int | None = None) -> str:
         """quality_check.json = deterministic value-equality of run_program vs the
-        make-test re-run (per phase_04 §4-1). Returns the top-level status."""
+        make-test re-run (per phase_04 §4-1). Returns the top-level status.
+        `qc_threads` is the re-run's pinned thread count (None: the make default)."""
         def _check_map(d: dict[str, Any]) -> dict[str, Any]:
             return {k: (v.get("status") if isinstance(v, dict) else v)
                     for k, v in (d.get("checks") or {}).items()}
@@ -9103,11 +9308,13 @@ clean:
                 "reference": {"source": "run_program", "command_id": run_cmd_id,
                               "threads_per_rank": threads, "verdict": run_verdict},
                 "candidate": {"source": f"run_quality_checks/{preset}", "command_id": qc_cmd_id,
-                              "threads_per_rank": "make_default", "verdict": qc_verdict},
+                              "threads_per_rank": ("make_default" if qc_threads is None
+                                                   else qc_threads),
+                              "verdict": qc_verdict},
                 "diagnostics_checks_match": checks_match,
                 "per_case_verdict_match": per_case,
             },
-            "notes": ("conductor in-process: run_program (threads_per_rank=1) and "
+            "notes": (f"conductor in-process: run_program (threads_per_rank={threads}) and "
                       f"{preset} re-run diagnostics checks and verdicts compared."),
         }
         (node_dir / "quality_check.json").write_text(
@@ -9135,7 +9342,12 @@ clean:
         toolchain = (impl.get("toolchain") or {}) if isinstance(impl, dict) else {}
         target = (impl.get("target") or {}) if isinstance(impl, dict) else {}
         target_class = str(target.get("class") or "cpu")
-        threads = 1
+        parallelism = self._execute_parallelism(impl)
+        threads = parallelism["threads_per_rank"]
+        # phase_04 §4-1 compares a single-thread run against a threaded one. A threaded
+        # primary run therefore pins the make-test re-run to one thread; a single-thread
+        # primary run leaves the re-run on the make default, as before.
+        qc_threads = 1 if threads > 1 else None
         self._require_make_build_system(
             str(toolchain.get("build_system") or "make"), "validate.execute")
 
@@ -9185,6 +9397,8 @@ clean:
             "command": [str(binary), "--cases", str(ir_spec), *case_ids],
             "target": {"class": target_class},
             "threads_per_rank": threads,
+            **{f"omp_{knob}": parallelism[knob]
+               for knob in ("places", "proc_bind") if knob in parallelism},
             "command_log_path": str(cmd_log),
             "capture_limit": _FULL_CAPTURE_LIMIT,
             **gate_args,
@@ -9218,6 +9432,7 @@ clean:
             "env": {"OBJDIR": str(obj_tmp), "BINDIR": str(bin_dir),
                     "RUNDIR": str(qc_tmp), "BIN": str(exe),
                     "SPEC": str(ir_spec), "CASES": " ".join(case_ids)},
+            **({"threads_per_rank": qc_threads} if qc_threads is not None else {}),
             "command_log_path": str(qc_cmd_log),
             "capture_limit": _FULL_CAPTURE_LIMIT,
             **gate_args,
@@ -9241,7 +9456,7 @@ clean:
         qc_diag = _read_json(qc_tmp / "diagnostics.json") or {}
         qc_status = self._author_quality_check(
             node_dir, run_diag, qc_diag, res_run.get("command_id"),
-            res_qc.get("command_id"), "make_test", threads)
+            res_qc.get("command_id"), "make_test", threads, qc_threads)
 
         (node_dir / "stdout.log").write_text(stdout, encoding="utf-8")
         (node_dir / "stderr.log").write_text(stderr, encoding="utf-8")
@@ -9276,10 +9491,17 @@ clean:
                 "target_class": target_class,
                 "backend": str(toolchain.get("backend") or "openmp"),
                 "threads_per_rank": threads,
-                "openmp_env": {"OMP_NUM_THREADS": str(threads), "OMP_THREAD_LIMIT": str(threads)},
+                "openmp_env": res_run.get("openmp_env") or {
+                    "OMP_NUM_THREADS": str(threads), "OMP_THREAD_LIMIT": str(threads)},
+                "parallelism": {**parallelism,
+                                "source": "impl_defaults.backend_overrides.openmp"},
+                "host_cpu_count": os.cpu_count(),
             },
             "status": "pass" if qc_status == "pass" else "fail",
         }
+        if target_class == "cpu":
+            trial_meta["environment"]["parallelism_mismatch"] = self._parallelism_mismatch(
+                node_dir, parallelism)
         (node_dir / "trial_meta.json").write_text(
             json.dumps(trial_meta, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
@@ -10956,6 +11178,9 @@ clean:
             # catalog. Best-effort: a resolution gap yields `unresolved` entries; the L3 gate is
             # inert where the surface is unresolved.
             dep_surface = tuple(self._write_dependency_surface(refs))
+            # Snapshot the node's content-digest inputs before any compile leaf reads them, so the
+            # record written when Compile passes binds the IR to the inputs it was built from.
+            self._snapshot_content_digest_inputs(refs)
 
         outcomes: list[SubstepOutcome] = []
         if preseat is not None:
@@ -11676,6 +11901,8 @@ clean:
                           result=outcome.status,
                           elapsed_seconds=round(time.monotonic() - phase_started, 2))
             if outcome.status == "pass":
+                if phase == "compile":
+                    self._write_content_digest(refs)
                 # validate advanced: a later, unrelated execute failure should start its
                 # escalation count fresh (C2 backstop counter).
                 if phase == "validate" and hasattr(self, "_validate_execute_fail_count"):
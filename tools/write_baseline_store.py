@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Compact, deduplicated storage for the runtime's write baselines.
+
+A write baseline is the `{repo-relative path: "sha256:<hex>"}` map of every repository
+file at one agent run's launch (`agents/<arid>/run_write_baseline.*`) or at orchestration
+init (`orchestration_run_write_baseline.*`). As JSON, every baseline repeats every path
+and a 71-character hex digest, and consecutive runs' baselines are nearly identical, so
+they dominate the orchestration directory and each terminal diff parses one in full.
+
+This module stores them in two layers:
+
+  * a SHARED BASE, `write_baselines/<sha256>.bin` under the orchestration root: a full
+    table, named by the digest of its own bytes and therefore immutable — a base is
+    never rewritten, only superseded;
+  * a per-baseline DELTA file holding only the entries that differ from the base it
+    names (added or changed) plus the base paths that no longer exist.
+
+`save_baseline` writes a new base only when the delta against the current one would
+exceed `_REBASE_FRACTION` of the table; otherwise a run's baseline costs a few entries.
+`load_baseline` returns exactly the dict that was saved; bases are memoised in-process by
+their name, which is safe because a named base cannot change.
+
+File layout (both layers)::
+
+    MAGIC  uint32 header length  header JSON
+    zlib("\\0".join(sorted entry paths + sorted removed paths))
+    32 raw digest bytes per entry, in path order
+
+The header carries the counts, the base name (null in a base) and, under `literals`,
+any entry whose value is not a well-formed `sha256:<64 hex>` (e.g. `sha256:missing` for a
+file that vanished mid-walk), whose digest slot is then zero-filled. Paths are compressed
+as one block rather than prefix-coded entry by entry so decoding stays inside zlib,
+`bytes.split` and `bytes.hex` instead of a per-entry Python loop.
+
+`python3 tools/orchestration_runtime.py export-write-baseline` prints any baseline in
+the legacy JSON form for audits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Mapping
+
+MAGIC = b"MDWBASE1"
+BASE_DIRNAME = "write_baselines"
+CURRENT_BASE_FILENAME = "CURRENT"
+# A delta larger than this fraction of the full table is replaced by a new base.
+_REBASE_FRACTION = 0.125
+_DIGEST_BYTES = 32
+_HEADER_LEN = struct.Struct(">I")
+_SHA256_VALUE_RE = re.compile(r"sha256:[0-9a-f]{64}")
+_BASE_NAME_RE = re.compile(r"[0-9a-f]{64}")
+_BASE_CACHE: dict[str, dict[str, str]] = {}
+_BASE_CACHE_MAX = 8
+
+
+class BaselineFormatError(ValueError):
+    """A baseline file is truncated, corrupt, or names a base that is missing."""
+
+
+def encode(
+    files: Mapping[str, str],
+    *,
+    removed: list[str] | tuple[str, ...] = (),
+    header: Mapping[str, Any] | None = None,
+) -> bytes:
+    paths = sorted(files)
+    literals: dict[str, str] = {}
+    digests = bytearray()
+    for index, path in enumerate(paths):
+        value = files[path]
+        if _SHA256_VALUE_RE.fullmatch(value):
+            digests += bytes.fromhex(value[7:])
+        else:
+            literals[str(index)] = value
+            digests += bytes(_DIGEST_BYTES)
+    removed_paths = sorted(removed)
+    blob = zlib.compress("\0".join(paths + removed_paths).encode("utf-8"), 6)
+    head = json.dumps(
+        {
+            **dict(header or {}),
+            "count": len(paths),
+            "removed_count": len(removed_paths),
+            "literals": literals,
+            "paths_bytes": len(blob),
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return b"".join((MAGIC, _HEADER_LEN.pack(len(head)), head, blob, bytes(digests)))
+
+
+def decode(data: bytes) -> tuple[dict[str, Any], dict[str, str], list[str]]:
+    """Return `(header, files, removed)` from one encoded file."""
+    if not data.startswith(MAGIC) or len(data) < len(MAGIC) + _HEADER_LEN.size:
+        raise BaselineFormatError("not a write baseline file")
+    offset = len(MAGIC)
+    (head_len,) = _HEADER_LEN.unpack_from(data, offset)
+    offset += _HEADER_LEN.size
+    try:
+        header = json.loads(data[offset:offset + head_len].decode("utf-8"))
+        offset += head_len
+        count = int(header["count"])
+        removed_count = int(header["removed_count"])
+        blob_len = int(header["paths_bytes"])
+        literals = {int(k): str(v) for k, v in dict(header.get("literals") or {}).items()}
+        joined = zlib.decompress(data[offset:offset + blob_len]).decode("utf-8")
+    except (KeyError, TypeError, ValueError, zlib.error) as exc:
+        raise BaselineFormatError(f"corrupt write baseline header: {exc}") from exc
+    offset += blob_len
+    names = joined.split("\0") if joined else []
+    digest_hex = data[offset:].hex()
+    if len(names) != count + removed_count or len(digest_hex) != count * 2 * _DIGEST_BYTES:
+        raise BaselineFormatError("write baseline table is truncated")
+    step = 2 * _DIGEST_BYTES
+    files = {
+        names[i]: literals[i] if i in literals else "sha256:" + digest_hex[i * step:(i + 1) * step]
+        for i in range(count)
+    }
+    return header, files, names[count:]
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _load_base(base_dir: Path, name: str) -> dict[str, str]:
+    cached = _BASE_CACHE.get(name)
+    if cached is not None:
+        return cached
+    if not _BASE_NAME_RE.fullmatch(name):
+        raise BaselineFormatError(f"invalid write baseline base name: {name!r}")
+    path = base_dir / f"{name}.bin"
+    try:
+        data = path.read_bytes()
+    except OSError as exc:
+        raise BaselineFormatError(f"write baseline base missing: {path}") from exc
+    if hashlib.sha256(data).hexdigest() != name:
+        raise BaselineFormatError(f"write baseline base does not match its name: {path}")
+    _header, files, _removed = decode(data)
+    if len(_BASE_CACHE) >= _BASE_CACHE_MAX:
+        _BASE_CACHE.pop(next(iter(_BASE_CACHE)))
+    _BASE_CACHE[name] = files
+    return files
+
+
+def _current_base(base_dir: Path) -> tuple[str, dict[str, str]] | None:
+    try:
+        name = (base_dir / CURRENT_BASE_FILENAME).read_text(encoding="utf-8").strip()
+        return name, _load_base(base_dir, name)
+    except (OSError, BaselineFormatError):
+        return None
+
+
+def save_baseline(path: Path, base_dir: Path, payload: Mapping[str, Any]) -> None:
+    """Write `payload` (the JSON baseline document, with its `files` map) to `path`."""
+    files: dict[str, str] = dict(payload["files"])
+    header = {k: v for k, v in payload.items() if k != "files"}
+    current = _current_base(base_dir)
+    if current is not None:
+        name, base = current
+        delta = {p: d for p, d in files.items() if base.get(p) != d}
+        removed = [p for p in base if p not in files]
+        if len(delta) + len(removed) <= _REBASE_FRACTION * max(len(files), 1):
+            _atomic_write_bytes(path, encode(delta, removed=removed, header={**header, "base": name}))
+            return
+    data = encode(files, header={"base": None})
+    name = hashlib.sha256(data).hexdigest()
+    base_path = base_dir / f"{name}.bin"
+    if not base_path.exists():
+        _atomic_write_bytes(base_path, data)
+    # Last writer wins: any named base is a valid one to delta against.
+    _atomic_write_bytes(base_dir / CURRENT_BASE_FILENAME, f"{name}\n".encode("utf-8"))
+    _atomic_write_bytes(path, encode({}, header={**header, "base": name}))
+
+
+def load_baseline(path: Path, base_dir: Path) -> dict[str, Any]:
+    """The JSON baseline document `save_baseline` was given for `path`."""
+    header, delta, removed = decode(Path(path).read_bytes())
+    name = header.get("base")
+    files = dict(_load_base(base_dir, str(name))) if name is not None else {}
+    for rel in removed:
+        files.pop(rel, None)
+    files.update(delta)
+    doc = {
+        k: v
+        for k, v in header.items()
+        if k not in {"base", "count", "removed_count", "literals", "paths_bytes"}
+    }
+    doc["files"] = files
+    return doc
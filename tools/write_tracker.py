@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""inotify-based write tracking for a leaf's child window (opt-in).
+
+Terminal write validation asks "which repository files did this child change?" and
+answers it by diffing a full launch-time snapshot against a full terminal snapshot —
+O(repository) even for a leaf that wrote two files. With
+`METDSL_WRITE_TRACKING=inotify`, `record_launch` instead starts one watcher per child
+(`python3 tools/write_tracker.py watch ...`) BEFORE the launch baseline is taken. The
+watcher puts an inotify watch on every directory of the repository outside the diff's
+exempt prefixes, follows directories as they are created or moved in, and records every
+path an event names. The runtime then rehashes only those candidates against the launch
+baseline (`orchestration_runtime._tracked_changed_paths`), so the validators receive the
+same changed-path list the full diff would have produced.
+
+Protocol, all through `agents/<arid>/write_tracker.json` (runtime-owned, exempt from the
+diff, written atomically by the watcher):
+
+  * `status: ready` once every watch is installed — the runtime waits for it before it
+    snapshots the baseline, so no write can fall between the two;
+  * SIGUSR1 asks for a checkpoint (the watcher drains its queue, rewrites the state with
+    `seq + 1` and keeps running) — used by `deactivate-child`;
+  * SIGTERM asks for the final drain (`status: final`) — used by terminal validation;
+  * `complete: false` with a `reason` whenever the candidate set cannot be trusted: the
+    kernel queue overflowed, a watch could not be added (`max_user_watches`), or the
+    watcher outlived `--max-seconds`. The runtime then falls back to the full diff.
+
+What inotify cannot see, stated so nobody mistakes this for the stronger check: writes
+through a shared `mmap` and writes through a hard link whose other name lies outside the
+watched tree raise no event on the watched name. That is why this backend is opt-in, why
+the full diff still runs as a periodic cross-check, and why any disagreement the
+cross-check finds is resolved in favour of the full diff.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import json
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+WRITE_TRACKING_ENV = "METDSL_WRITE_TRACKING"
+WRITE_TRACKING_DIFF = "diff"
+WRITE_TRACKING_INOTIFY = "inotify"
+WRITE_TRACKING_MODES = (WRITE_TRACKING_DIFF, WRITE_TRACKING_INOTIFY)
+STATE_FILENAME = "write_tracker.json"
+# Waiting for the initial watch set: one inotify_add_watch per directory, so a workspace
+# with tens of thousands of directories takes seconds, not minutes.
+READY_TIMEOUT_SECONDS = 60.0
+ACK_TIMEOUT_SECONDS = 10.0
+# A watcher whose child never terminalized (a crashed driver) must not outlive the run.
+DEFAULT_MAX_SECONDS = 12 * 3600
+_POLL_SECONDS = 0.25
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+    | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def write_tracking_mode(env: dict[str, str] | os._Environ[str]) -> str:
+    """The write-tracking backend `env` selects; unset means the full diff."""
+    value = str(env.get(WRITE_TRACKING_ENV) or "").strip().lower()
+    if not value:
+        return WRITE_TRACKING_DIFF
+    if value not in WRITE_TRACKING_MODES:
+        raise ValueError(
+            f"{WRITE_TRACKING_ENV}={value!r} is not one of {', '.join(WRITE_TRACKING_MODES)}")
+    return value
+
+
+class _Inotify:
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self.fd = fd
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), ctypes.c_uint32(mask))
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch {path}: {os.strerror(err)}")
+        return wd
+
+    def read(self) -> list[tuple[int, int, str]]:
+        events: list[tuple[int, int, str]] = []
+        while True:
+            try:
+                buf = os.read(self.fd, 1 << 16)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, name))
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class WriteTracker:
+    """The watch set over `repo_root` and the candidate paths its events named."""
+
+    def __init__(self, repo_root: Path, ignored_prefixes: Iterable[str]) -> None:
+        self.repo_root = Path(repo_root)
+        self.ignored_prefixes = tuple(ignored_prefixes)
+        self.paths: set[str] = set()
+        self.dirs: set[str] = set()
+        self.complete = True
+        self.reason: str | None = None
+        self._wd_to_rel: dict[int, str] = {}
+        self._inotify = _Inotify()
+
+    @property
+    def fd(self) -> int:
+        return self._inotify.fd
+
+    def _ignored(self, rel_dir: str) -> bool:
+        return bool(rel_dir) and f"{rel_dir}/".startswith(self.ignored_prefixes)
+
+    def _invalidate(self, reason: str) -> None:
+        if self.complete:
+            self.complete = False
+            self.reason = reason
+
+    def watch_tree(self, rel_dir: str, *, report_files: bool) -> None:
+        """Watch `rel_dir` and every directory below it; with `report_files`, also record
+        every file already there (a directory created or moved in after the walk)."""
+        stack = [rel_dir]
+        while stack:
+            rel = stack.pop()
+            if self._ignored(rel):
+                continue
+            abs_dir = self.repo_root / rel if rel else self.repo_root
+            try:
+                wd = self._inotify.add_watch(str(abs_dir), _WATCH_MASK)
+            except OSError as exc:
+                if exc.errno in {errno.ENOENT, errno.ENOTDIR, errno.EACCES}:
+                    continue
+                self._invalidate(str(exc))
+                return
+            self._wd_to_rel[wd] = rel
+            try:
+                with os.scandir(abs_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                child = f"{rel}/{entry.name}" if rel else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    stack.append(child)
+                elif report_files:
+                    self.paths.add(child)
+
+    def handle(self, events: list[tuple[int, int, str]]) -> None:
+        for wd, mask, name in events:
+            if mask & IN_Q_OVERFLOW:
+                self._invalidate("inotify event queue overflowed")
+                continue
+            if mask & IN_IGNORED:
+                self._wd_to_rel.pop(wd, None)
+                continue
+            rel_dir = self._wd_to_rel.get(wd)
+            if rel_dir is None:
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                if rel_dir:
+                    self.dirs.add(rel_dir)
+                continue
+            if not name:
+                continue
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            if mask & IN_ISDIR:
+                if self._ignored(rel):
+                    continue
+                self.dirs.add(rel)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files written into the new directory before its watch exists raise
+                    # no event; the scan in watch_tree reports them instead.
+                    self.watch_tree(rel, report_files=True)
+                continue
+            self.paths.add(rel)
+
+    def drain(self) -> None:
+        self.handle(self._inotify.read())
+
+    def close(self) -> None:
+        self._inotify.close()
+
+
+def state_path(orchestration_root: Path, agent_run_id: str) -> Path:
+    # Resolved: the path is also the watcher's identity on its argv (`_is_our_watcher`), so
+    # every process must spell it the same way.
+    return Path(orchestration_root).resolve() / "agents" / agent_run_id / STATE_FILENAME
+
+
+def _write_state(path: Path, doc: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(doc, fh, ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def read_state(path: Path) -> dict[str, Any] | None:
+    try:
+        doc = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return doc if isinstance(doc, dict) else None
+
+
+def watch(repo_root: Path, state: Path, ignored_prefixes: list[str], *,
+          max_seconds: float) -> int:
+    """Watcher main loop (the `watch` subcommand)."""
+    requests = {"checkpoint": False, "final": False}
+    signal.signal(signal.SIGUSR1, lambda *_: requests.__setitem__("checkpoint", True))
+    signal.signal(signal.SIGTERM, lambda *_: requests.__setitem__("final", True))
+    base = {"pid": os.getpid(), "seq": 0}
+    try:
+        tracker = WriteTracker(repo_root, ignored_prefixes)
+        tracker.watch_tree("", report_files=False)
+    except OSError as exc:
+        _write_state(state, {**base, "status": "failed", "complete": False,
+                             "reason": str(exc), "paths": [], "dirs": []})
+        return 1
+
+    def dump(status: str, seq: int) -> None:
+        _write_state(state, {**base, "seq": seq, "status": status,
+                             "complete": tracker.complete, "reason": tracker.reason,
+                             "paths": sorted(tracker.paths), "dirs": sorted(tracker.dirs)})
+
+    seq = 0
+    dump("ready", seq)
+    deadline = time.monotonic() + max_seconds
+    try:
+        while True:
+            readable, _, _ = select.select([tracker.fd], [], [], _POLL_SECONDS)
+            if readable:
+                tracker.drain()
+            if requests["final"] or time.monotonic() >= deadline:
+                tracker.drain()
+                if not requests["final"]:
+                    tracker._invalidate(f"watcher expired after {max_seconds:.0f}s")
+                dump("final", seq + 1)
+                return 0
+            if requests["checkpoint"]:
+                requests["checkpoint"] = False
+                tracker.drain()
+                seq += 1
+                dump("checkpoint", seq)
+    finally:
+        tracker.close()
+
+
+def _is_our_watcher(pid: int, state: Path) -> bool:
+    """Guard against signalling a recycled pid: the process must be this watcher."""
+    try:
+        cmdline = Path(f"/proc/{pid}/cmdline").read_bytes().split(b"\0")
+    except OSError:
+        return False
+    return os.fsencode(str(state)) in cmdline
+
+
+def start(repo_root: Path, orchestration_root: Path, agent_run_id: str,
+          ignored_prefixes: Iterable[str], *,
+          timeout: float = READY_TIMEOUT_SECONDS) -> bool:
+    """Start the watcher for one child and wait until every watch is installed.
+
+    False means the child runs untracked (no inotify, watch limit, slow start) and its
+    terminal validation takes the full diff.
+    """
+    state = state_path(orchestration_root, agent_run_id)
+    try:
+        state.unlink()
+    except FileNotFoundError:
+        pass
+    argv = [sys.executable, str(Path(__file__).resolve()), "watch",
+            "--repo-root", str(repo_root), "--state", str(state),
+            "--max-seconds", str(DEFAULT_MAX_SECONDS)]
+    for prefix in ignored_prefixes:
+        argv += ["--ignore-prefix", prefix]
+    proc = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        doc = read_state(state)
+        if doc is not None and doc.get("status") in {"ready", "failed"}:
+            return doc.get("status") == "ready"
+        if proc.poll() is not None:
+            return False
+        time.sleep(0.02)
+    stop(state)
+    return False
+
+
+def collect(orchestration_root: Path, agent_run_id: str, *, final: bool,
+            timeout: float = ACK_TIMEOUT_SECONDS) -> dict[str, Any] | None:
+    """Ask the child's watcher for its candidate set; None when it has none to give.
+
+    `final=True` ends the watcher. A watcher that already delivered its final set cannot
+    see later writes, so a second collection (a retried `record-agent-run`) is None too.
+    """
+    state = state_path(orchestration_root, agent_run_id)
+    doc = read_state(state)
+    if doc is None or doc.get("status") not in {"ready", "checkpoint"}:
+        return None
+    pid = doc.get("pid")
+    seq = doc.get("seq")
+    if not isinstance(pid, int) or not isinstance(seq, int) or not _is_our_watcher(pid, state):
+        return None
+    try:
+        os.kill(pid, signal.SIGTERM if final else signal.SIGUSR1)
+    except OSError:
+        return None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        fresh = read_state(state)
+        if fresh is not None and isinstance(fresh.get("seq"), int) and fresh["seq"] > seq:
+            if not fresh.get("complete"):
+                return None
+            return fresh
+        time.sleep(0.02)
+    return None
+
+
+def stop(state: Path, *, timeout: float = ACK_TIMEOUT_SECONDS) -> None:
+    """End the watcher without collecting its set. Returns once it has written its final
+    state or exited, so a later `collect` cannot find it still live and take its set."""
+    doc = read_state(state)
+    pid = doc.get("pid") if doc else None
+    if not isinstance(pid, int) or not _is_our_watcher(pid, state):
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        return
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        fresh = read_state(state)
+        if fresh is None or fresh.get("status") not in {"ready", "checkpoint"}:
+            return
+        if not _is_our_watcher(pid, state):
+            return
+        time.sleep(0.02)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    watch_parser = subparsers.add_parser("watch", help="Run one child's watcher (internal).")
+    watch_parser.add_argument("--repo-root", required=True)
+    watch_parser.add_argument("--state", required=True)
+    watch_parser.add_argument("--ignore-prefix", action="append", default=[])
+    watch_parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
+    args = parser.parse_args(argv)
+    return watch(Path(args.repo_root), Path(args.state), list(args.ignore_prefix),
+                 max_seconds=args.max_seconds)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())